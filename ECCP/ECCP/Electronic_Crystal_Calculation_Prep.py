@@ -52,12 +52,17 @@ from ECCP.ECCP.write_dimers_to_disk
 
 from ECCP.ECCP.write_ECCP_process_submit_scripts                                             import write_ECCP_process_ATC_submit_script, write_ECCP_process_RE_submit_script, write_ECCP_process_FC_submit_script, write_ECCP_process_EET_submit_script, write_ECCP_process_Eigendata_submit_script, write_ECCP_process_ICT_submit_script
 
+from ECCP.ECCP.write_slurm_array_scripts                                                     import write_slurm_array_scripts
+
 from ECCP.ECCP.write_results_document                                                        import write_results_document
 
+from ECCP.ECCP.stage_cache_methods.stage_cache                                               import get_crystal_key, get_stage_key, load_stage_from_cache, save_stage_to_cache
+from ECCP.ECCP.stage_profiler_methods.Stage_Profiler                                         import Stage_Profiler
+
 no_of_char_in_divides = 57
 divide_string = '.'+'-'*no_of_char_in_divides+'.'
 
-def ECCP(filepath, bonds_to_ignore=None, make_molecule_method='component_assembly_approach', molecule_equivalence_method={'method': 'invariance_method', 'type': 'combination'}, make_dimer_method={'method': 'nearest_atoms_method', 'max_dimer_distance': 8.0}, dimer_equivalence_method={'method': 'invariance_method', 'type': 'combination'}, environment_settings={'include_environment_where_possible': False, 'environment_radius': 8.0}, include_hydrogens_in_neighbour_analysis=False, include_hydrogens_in_uniqueness_analysis=False, remove_solvents=False, atc_file_creation_information=None, re_file_creation_information=None, fc_file_creation_information=None, eet_file_creation_information=None, ict_file_creation_information=None, overall_folder_suffix_name='', run_excited_state_from_optimised_ground_structure=False, no_of_cpus=1):
+def ECCP(filepath, bonds_to_ignore=None, make_molecule_method='component_assembly_approach', molecule_equivalence_method={'method': 'invariance_method', 'type': 'combination'}, make_dimer_method={'method': 'nearest_atoms_method', 'max_dimer_distance': 8.0}, dimer_equivalence_method={'method': 'invariance_method', 'type': 'combination'}, environment_settings={'include_environment_where_possible': False, 'environment_radius': 8.0}, include_hydrogens_in_neighbour_analysis=False, include_hydrogens_in_uniqueness_analysis=False, remove_solvents=False, atc_file_creation_information=None, re_file_creation_information=None, fc_file_creation_information=None, eet_file_creation_information=None, ict_file_creation_information=None, overall_folder_suffix_name='', run_excited_state_from_optimised_ground_structure=False, make_slurm_job_arrays=False, use_stage_cache=False, no_of_cpus=1):
 	"""
 	The Electronic Crystal Calculation Prep (ECCP) Program is designed to:
 
@@ -131,6 +136,10 @@ def ECCP(filepath, bonds_to_ignore=None, make_molecule_method='component_assembl
 		This is the suffix to add to the ECCP_Data name if you want to distinguish it in any way. If you set this to something, the overall folder name will be given as 'ECCP_Data_'+str(overall_folder_suffix_name). Default: ''
 	run_excited_state_from_optimised_ground_structure : bool.
 		This boolean indicates if you want to run the excited state calculation from the optimised ground state calculation for reorganisation energy calculations. True if you do, False if you want to run the excited state calculation from the original structure (Default: False).
+	make_slurm_job_arrays : bool.
+		This boolean indicates if you want to write a slurm array script (and index file) for each job family (ATC, EET and Eigendata jobs), so that each job family can be submitted to slurm as a few array jobs rather than as many individual jobs (Default: False).
+	use_stage_cache : bool.
+		This boolean indicates if you want to save the results of the heavy stages of ECCP (processing the crystal, neighbouring molecules, dimers, unique molecules and unique dimers) to the ECCP_Stage_Cache folder. If ECCP is run again, only the stages whose crystal or settings have changed are recalculated. All stages are recalculated if the version of ECCP or SUMELF changes, but not if the code is changed within the same version. The cache is used even if the ECCP_Information files have been removed, so also remove the ECCP_Stage_Cache folder if you want to force the stages to be recalculated (Default: False).
 	no_of_cpus : int.
 		This is the number of cpus available to use on this program. In most cases this should just be set to 1 cpu, however for very large system you may want to implement multiple cpus.
 
@@ -217,6 +226,7 @@ def ECCP(filepath, bonds_to_ignore=None, make_molecule_method='component_assembl
 	unique_eet_calc_jobs_path             = str(Unique_EET_Calc_Jobs_folder)+'/'+str(subfolder_name)
 	all_eigendata_calc_jobs_path          = str(All_Eigendata_Calc_Jobs_folder)+'/'+str(subfolder_name)
 	unique_eigendata_calc_jobs_path       = str(Unique_Eigendata_Calc_Jobs_folder)+'/'+str(subfolder_name)
+	path_to_stage_cache_folder            = (ECCP_Data_path+'/'+'ECCP_Stage_Cache'+'/'+subfolder_name) if use_stage_cache else None
 	
 	# ----------------------------------------------------------------------------------------- #
 	# Second, obtain the data from the ``ECCP_Information`` folder.
@@ -273,6 +283,10 @@ def ECCP(filepath, bonds_to_ignore=None, make_molecule_method='component_assembl
 	logging.basicConfig(filename=ECCP_Data_path+'/'+"ECCP_logfile.log", filemode="w", format=Log_Format, level=logging.NOTSET)
 	logger = logging.getLogger()
 
+	# 4.1: Create the profiler for recording the time and memory taken by each stage of ECCP. This is written to ECCP_Data/ECCP_Profiles.
+	make_folder(ECCP_Data_path+'/'+'ECCP_Profiles')
+	stage_profiler = Stage_Profiler(ECCP_Data_path+'/'+'ECCP_Profiles'+'/'+subfolder_name+'_profile.json', filename, no_of_cpus)
+
 	# ----------------------------------------------------------------------------------------- #
 	# ----------------------------------------------------------------------------------------- #
 	# ----------------------------------------------------------------------------------------- #
@@ -284,54 +298,67 @@ def ECCP(filepath, bonds_to_ignore=None, make_molecule_method='component_assembl
 	print(divide_string)
 
 	# Fifth, read in the crystal file in the ASE.
+	stage_profiler.start_stage('process_crystal')
 	if not have_ECCP_Information_crystal_file:
 		crystal = read_crystal(filepath)
 
-	# Sixth, make sure that the periodic boundary condition of the crystal is set to true.
-	crystal.set_pbc(True)
+	# 5.1: Obtain the list of bonds in the crystal to ignore if given.
+	if isinstance(bonds_to_ignore,str):
+		bonds_to_ignore = convert_bonds_to_ignore_file_to_list(bonds_to_ignore)
 
-	# Seventh, remove some of the unnecessary attributes from the crystal
-	crystal = remove_unwanted_entries(crystal)
+	# 5.2: Obtain the key for the molecules stage, and check if the molecules in this crystal have been obtained before with the same settings.
+	molecules_stage_key = get_stage_key('molecules', get_crystal_key(crystal), bonds_to_ignore, make_molecule_method, remove_solvents)
+	has_molecules_stage, molecules_stage_results = load_stage_from_cache(path_to_stage_cache_folder, 'molecules', molecules_stage_key)
+	if has_molecules_stage:
+		molecules, molecule_graphs, SolventsList, crystal, crystal_graph, unitcelllatticevectors = molecules_stage_results
+	else:
 
-	# Eighth, get the graph of the crystal.
-	#crystal, crystal_graph = obtain_graph(crystal, name='crystal', no_of_cpus=no_of_cpus)
-	crystal_graph = obtain_graph(crystal, name='crystal', no_of_cpus=no_of_cpus)
+		# Sixth, make sure that the periodic boundary condition of the crystal is set to true.
+		crystal.set_pbc(True)
 
-	# Ninth, obtain the list of bonds in the crystal to ignore if given.
-	if isinstance(bonds_to_ignore,str):
-		bonds_to_ignore = convert_bonds_to_ignore_file_to_list(bonds_to_ignore)
+		# Seventh, remove some of the unnecessary attributes from the crystal
+		crystal = remove_unwanted_entries(crystal)
 
-	# Tenth, we will now process the crystal and obtain the molecules in the crystal and other molecule and crystal data. 
-	print('Processing Crystal: Obtaining the molecules in the crystal')
-	molecules, molecule_graphs, SolventsList, symmetry_operations, unitcelllatticevectors = process_crystal(crystal, crystal_graph=crystal_graph, take_shortest_distance=True, no_of_cpus=no_of_cpus, logger=logger, bonds_to_ignore=bonds_to_ignore)
+		# Eighth, get the graph of the crystal.
+		#crystal, crystal_graph = obtain_graph(crystal, name='crystal', no_of_cpus=no_of_cpus)
+		crystal_graph = obtain_graph(crystal, name='crystal', no_of_cpus=no_of_cpus)
 
-	# Eleventh, remove unwanted entries from molecules
-	for molecule_name in sorted(molecules.keys()):
-		molecules[molecule_name] = remove_unwanted_entries(molecules[molecule_name])
+		# Ninth, we will now process the crystal and obtain the molecules in the crystal and other molecule and crystal data. 
+		print('Processing Crystal: Obtaining the molecules in the crystal')
+		molecules, molecule_graphs, SolventsList, symmetry_operations, unitcelllatticevectors = process_crystal(crystal, crystal_graph=crystal_graph, take_shortest_distance=True, no_of_cpus=no_of_cpus, logger=logger, bonds_to_ignore=bonds_to_ignore)
 
-	# Twelfth, if there are no entries in SolventsList, this may mean that the solvents have not been recorded in the crystal file
-	#        This method will determine which molecules are solvents in the crystal. 
-	if len(SolventsList) == 0:
-		solvent_components = [molecule_name for molecule_name in molecule_graphs.keys() if is_solvent(molecule_graphs[molecule_name])]
+		# Tenth, remove unwanted entries from molecules
+		for molecule_name in sorted(molecules.keys()):
+			molecules[molecule_name] = remove_unwanted_entries(molecules[molecule_name])
 
-	# Thirteenth, remove solvents if you do not want to include solvents in your input files for further calculations in Gaussian/ORCA
-	if remove_solvents:
-		print('Removing Solvents from the Crystal')
-		molecules, molecule_graphs = remove_solvents_from_molecules_dict(molecules, molecule_graphs, SolventsList)
-		SolventsList = []
+		# Eleventh, if there are no entries in SolventsList, this may mean that the solvents have not been recorded in the crystal file
+		#        This method will determine which molecules are solvents in the crystal. 
+		if len(SolventsList) == 0:
+			solvent_components = [molecule_name for molecule_name in molecule_graphs.keys() if is_solvent(molecule_graphs[molecule_name])]
 
-	# Fourteenth, get the extra molecules in the crystal that exist due to symmetry operations in the spacegroup.
-	print('Obtaining molecules from the crystal that exist due to spacegroup symmetries.')
-	molecules, molecule_graphs, crystal, crystal_graph, SolventsList = get_spacegroup_molecules(molecules, molecule_graphs, SolventsList, symmetry_operations, unitcelllatticevectors)
+		# Twelfth, remove solvents if you do not want to include solvents in your input files for further calculations in Gaussian/ORCA
+		if remove_solvents:
+			print('Removing Solvents from the Crystal')
+			molecules, molecule_graphs = remove_solvents_from_molecules_dict(molecules, molecule_graphs, SolventsList)
+			SolventsList = []
 
-	# Fifteenth, remove unwanted entries from the crystal and it's associated molecules.
-	crystal = remove_unwanted_entries(crystal)
-	for molecule_name in sorted(molecules.keys()):
-		molecules[molecule_name] = remove_unwanted_entries(molecules[molecule_name])
+		# Thirteenth, get the extra molecules in the crystal that exist due to symmetry operations in the spacegroup.
+		print('Obtaining molecules from the crystal that exist due to spacegroup symmetries.')
+		molecules, molecule_graphs, crystal, crystal_graph, SolventsList = get_spacegroup_molecules(molecules, molecule_graphs, SolventsList, symmetry_operations, unitcelllatticevectors)
+
+		# Fourteenth, remove unwanted entries from the crystal and it's associated molecules.
+		crystal = remove_unwanted_entries(crystal)
+		for molecule_name in sorted(molecules.keys()):
+			molecules[molecule_name] = remove_unwanted_entries(molecules[molecule_name])
+
+		# Fifteenth, centre the molecules in the middle of the origin unit cell
+		centre_molecules(molecules)
+
+		# Sixteenth, save the molecules in this crystal to the stage cache.
+		save_stage_to_cache(path_to_stage_cache_folder, 'molecules', molecules_stage_key, (molecules, molecule_graphs, SolventsList, crystal, crystal_graph, unitcelllatticevectors))
 
-	# Sixteenth, centre the molecules in the middle of the origin unit cell
-	centre_molecules(molecules)
 	print('All molecules in the crystal have been identified.')
+	stage_profiler.end_stage('process_crystal', source=('stage_cache' if has_molecules_stage else 'calculated'), no_of_atoms_in_crystal=len(crystal), no_of_molecules=len(molecules), no_of_solvents=len(SolventsList))
 
 	# ----------------------------------------------------------------------------------------- #
 	# ----------------------------------------------------------------------------------------- #
@@ -345,8 +372,15 @@ def ECCP(filepath, bonds_to_ignore=None, make_molecule_method='component_assembl
 
 	# Seventeenth, get the neighbourhood_molecules information needed for running the dimer method. 
 	print('Determining neighbours between molecules in the crystal.')
+	stage_profiler.start_stage('get_neighbouring_molecules')
+	neighbours_stage_key = get_stage_key('neighbouring_molecules', molecules_stage_key, make_dimer_method, environment_settings, include_hydrogens_in_neighbour_analysis)
 	if not has_neighbouring_molecules:
-		neighbourhood_molecules_for_dimer_method, neighbourhood_molecules_for_environment_method = get_neighbouring_molecules(molecules, molecule_graphs, make_dimer_method=make_dimer_method, environment_settings=environment_settings, include_hydrogens_in_neighbour_analysis=include_hydrogens_in_neighbour_analysis, no_of_cpus=no_of_cpus)
+		has_neighbours_stage, neighbours_stage_results = load_stage_from_cache(path_to_stage_cache_folder, 'neighbouring_molecules', neighbours_stage_key)
+		if has_neighbours_stage:
+			neighbourhood_molecules_for_dimer_method, neighbourhood_molecules_for_environment_method = neighbours_stage_results
+		else:
+			neighbourhood_molecules_for_dimer_method, neighbourhood_molecules_for_environment_method = get_neighbouring_molecules(molecules, molecule_graphs, make_dimer_method=make_dimer_method, environment_settings=environment_settings, include_hydrogens_in_neighbour_analysis=include_hydrogens_in_neighbour_analysis, no_of_cpus=no_of_cpus)
+			save_stage_to_cache(path_to_stage_cache_folder, 'neighbouring_molecules', neighbours_stage_key, (neighbourhood_molecules_for_dimer_method, neighbourhood_molecules_for_environment_method))
 	else:
 		print('Obtaining "neighbours between molecules" data from ECCP_Information folder.')
 		neighbourhood_molecules_for_dimer_method = convert_dimer_details_to_neighbourhood_molecules_for_dimer_method(dimer_details, molecules, unitcelllatticevectors, make_dimer_method)
@@ -358,6 +392,7 @@ def ECCP(filepath, bonds_to_ignore=None, make_molecule_method='component_assembl
 	# Nineteenth, sort the dimers in neighbourhood_molecules_for_dimer_method. 
 	#             Sorting format: (distance between molecules, mol1_index, mol2_index, unit_cell_i, unit_cell_j, unit_cell_k)
 	neighbourhood_molecules_for_dimer_method.sort(key=lambda x: (x[4], x[0], x[1], x[2][0], x[2][1], x[2][2]))
+	stage_profiler.end_stage('get_neighbouring_molecules', source=('ECCP_Information' if has_neighbouring_molecules else ('stage_cache' if has_neighbours_stage else 'calculated')), no_of_molecules=len(molecules), no_of_neighbouring_pairs_for_dimers=len(neighbourhood_molecules_for_dimer_method), no_of_neighbouring_pairs_for_environment=len(neighbourhood_molecules_for_environment_method))
 
 	# NOTE: Will probably need order the neighbourhood_molecules_for_environment_method when created.
 
@@ -384,7 +419,9 @@ def ECCP(filepath, bonds_to_ignore=None, make_molecule_method='component_assembl
 	all_molecules_folderpath                  = path_to_eccp_folder+'/'+'All_Molecules'
 	all_molecules_with_environment_folderpath = path_to_eccp_folder+'/'+'All_Molecules_with_environment'
 	all_molecules_names                     = list(molecules.keys())
-	write_molecules_to_disk(all_molecules_names, all_molecules_names, molecules, molecule_graphs, neighbouring_molecules_about_molecules, SolventsList, all_molecules_folderpath, all_molecules_with_environment_folderpath, all_atc_calc_jobs_path, all_re_calc_jobs_path, all_fc_calc_jobs_path, all_calc_parameters_for_ATCs=all_calc_parameters_for_ATCs, all_calc_parameters_for_multiwfn=all_calc_parameters_for_multiwfn, all_calc_parameters_for_REs=all_calc_parameters_for_REs, all_calc_parameters_for_FCs=all_calc_parameters_for_FCs, all_submission_information_for_ATCs=all_submission_information_for_ATCs, all_submission_information_for_multiwfn=all_submission_information_for_multiwfn, all_submission_information_for_REs=all_submission_information_for_REs, all_submission_information_for_FCs=all_submission_information_for_FCs, get_molecule_atcs=get_molecule_atcs, get_molecule_res=get_molecule_res, get_molecule_fcs=get_molecule_fcs, run_excited_state_from_optimised_ground_structure=run_excited_state_from_optimised_ground_structure)
+	stage_profiler.start_stage('write_all_molecules')
+	write_molecules_to_disk(all_molecules_names, all_molecules_names, molecules, molecule_graphs, neighbouring_molecules_about_molecules, SolventsList, all_molecules_folderpath, all_molecules_with_environment_folderpath, all_atc_calc_jobs_path, all_re_calc_jobs_path, all_fc_calc_jobs_path, all_calc_parameters_for_ATCs=all_calc_parameters_for_ATCs, all_calc_parameters_for_multiwfn=all_calc_parameters_for_multiwfn, all_calc_parameters_for_REs=all_calc_parameters_for_REs, all_calc_parameters_for_FCs=all_calc_parameters_for_FCs, all_submission_information_for_ATCs=all_submission_information_for_ATCs, all_submission_information_for_multiwfn=all_submission_information_for_multiwfn, all_submission_information_for_REs=all_submission_information_for_REs, all_submission_information_for_FCs=all_submission_information_for_FCs, get_molecule_atcs=get_molecule_atcs, get_molecule_res=get_molecule_res, get_molecule_fcs=get_molecule_fcs, run_excited_state_from_optimised_ground_structure=run_excited_state_from_optimised_ground_structure, no_of_cpus=no_of_cpus)
+	stage_profiler.end_stage('write_all_molecules', no_of_molecules=len(all_molecules_names))
 
 	# -----------------------------------------------------------------------------------------
 
@@ -420,14 +457,22 @@ def ECCP(filepath, bonds_to_ignore=None, make_molecule_method='component_assembl
 
 		# Twenty-seventh, get the unique molecules if desired.
 		print('Getting Unique Molecules')
+		stage_profiler.start_stage('get_unique_molecules')
 		if not has_unique_molecules:
-			structurally_unique_molecules_names, structurally_equivalent_molecule_groups, conformationally_unique_molecules_names, conformationally_equivalent_molecule_groups, structurally_equivalent_molecule_pairs = get_unique_molecules(molecules, simple_molecule_graphs, crystal, molecule_equivalence_method=molecule_equivalence_method, neighbouring_molecules_about_molecules=neighbouring_molecules_about_molecules, include_hydrogens_in_uniqueness_analysis=include_hydrogens_in_uniqueness_analysis, no_of_cpus=no_of_cpus)
+			unique_molecules_stage_key = get_stage_key('unique_molecules', neighbours_stage_key, molecule_equivalence_method, include_hydrogens_in_uniqueness_analysis)
+			has_unique_molecules_stage, unique_molecules_stage_results = load_stage_from_cache(path_to_stage_cache_folder, 'unique_molecules', unique_molecules_stage_key)
+			if has_unique_molecules_stage:
+				structurally_unique_molecules_names, structurally_equivalent_molecule_groups, conformationally_unique_molecules_names, conformationally_equivalent_molecule_groups, structurally_equivalent_molecule_pairs = unique_molecules_stage_results
+			else:
+				structurally_unique_molecules_names, structurally_equivalent_molecule_groups, conformationally_unique_molecules_names, conformationally_equivalent_molecule_groups, structurally_equivalent_molecule_pairs = get_unique_molecules(molecules, simple_molecule_graphs, crystal, molecule_equivalence_method=molecule_equivalence_method, neighbouring_molecules_about_molecules=neighbouring_molecules_about_molecules, include_hydrogens_in_uniqueness_analysis=include_hydrogens_in_uniqueness_analysis, no_of_cpus=no_of_cpus)
+				save_stage_to_cache(path_to_stage_cache_folder, 'unique_molecules', unique_molecules_stage_key, (structurally_unique_molecules_names, structurally_equivalent_molecule_groups, conformationally_unique_molecules_names, conformationally_equivalent_molecule_groups, structurally_equivalent_molecule_pairs))
 		else:
 			print('Reading Unique Molecules from Equivalence_Group_Information/Structurally_Equivalent_Molecule_Groups.txt and Equivalence_Group_Information/Conformationally_Equivalent_Molecule_Groups.txt')
 			structurally_unique_molecules_names, structurally_equivalent_molecule_groups, conformationally_unique_molecules_names, conformationally_equivalent_molecule_groups = convert_existing_unique_molecule_data_from_ECCP_Information(structurally_equivalent_molecule_groups, conformationally_equivalent_molecule_groups, len(molecules))
 			# Note: We have already got structurally_equivalent_molecule_pairs. 
 		print('No of structurally unique individual molecules: '+str(len(structurally_unique_molecules_names)))
 		print('No of conformationally unique individual molecules: '+str(len(conformationally_unique_molecules_names)))
+		stage_profiler.end_stage('get_unique_molecules', source=('ECCP_Information' if has_unique_molecules else ('stage_cache' if has_unique_molecules_stage else 'calculated')), no_of_molecules=len(molecules), no_of_structurally_unique_molecules=len(structurally_unique_molecules_names), no_of_conformationally_unique_molecules=len(conformationally_unique_molecules_names), no_of_structurally_equivalent_molecule_pairs=len(structurally_equivalent_molecule_pairs))
 
 		# Twenty-eighth, Remove unwanted entries from molecules
 		for mol_name in molecules.keys():
@@ -437,7 +482,9 @@ def ECCP(filepath, bonds_to_ignore=None, make_molecule_method='component_assembl
 		print('Writing unique molecules to '+str(path_to_eccp_folder))
 		unique_molecules_folderpath                  = path_to_eccp_folder+'/'+'Unique_Molecules'
 		unique_molecules_with_environment_folderpath = path_to_eccp_folder+'/'+'Unique_Molecules_with_environment'
-		write_molecules_to_disk(structurally_unique_molecules_names, conformationally_unique_molecules_names, molecules, molecule_graphs, neighbouring_molecules_about_molecules, SolventsList, unique_molecules_folderpath, unique_molecules_with_environment_folderpath, unique_atc_calc_jobs_path, unique_re_calc_jobs_path, unique_fc_calc_jobs_path, all_calc_parameters_for_ATCs=all_calc_parameters_for_ATCs, all_calc_parameters_for_multiwfn=all_calc_parameters_for_multiwfn, all_calc_parameters_for_REs=all_calc_parameters_for_REs, all_calc_parameters_for_FCs=all_calc_parameters_for_FCs, all_submission_information_for_ATCs=all_submission_information_for_ATCs, all_submission_information_for_multiwfn=all_submission_information_for_multiwfn, all_submission_information_for_REs=all_submission_information_for_REs, all_submission_information_for_FCs=all_submission_information_for_FCs, get_molecule_atcs=get_molecule_atcs, get_molecule_res=get_molecule_res, get_molecule_fcs=get_molecule_fcs, run_excited_state_from_optimised_ground_structure=run_excited_state_from_optimised_ground_structure)
+		stage_profiler.start_stage('write_unique_molecules')
+		write_molecules_to_disk(structurally_unique_molecules_names, conformationally_unique_molecules_names, molecules, molecule_graphs, neighbouring_molecules_about_molecules, SolventsList, unique_molecules_folderpath, unique_molecules_with_environment_folderpath, unique_atc_calc_jobs_path, unique_re_calc_jobs_path, unique_fc_calc_jobs_path, all_calc_parameters_for_ATCs=all_calc_parameters_for_ATCs, all_calc_parameters_for_multiwfn=all_calc_parameters_for_multiwfn, all_calc_parameters_for_REs=all_calc_parameters_for_REs, all_calc_parameters_for_FCs=all_calc_parameters_for_FCs, all_submission_information_for_ATCs=all_submission_information_for_ATCs, all_submission_information_for_multiwfn=all_submission_information_for_multiwfn, all_submission_information_for_REs=all_submission_information_for_REs, all_submission_information_for_FCs=all_submission_information_for_FCs, get_molecule_atcs=get_molecule_atcs, get_molecule_res=get_molecule_res, get_molecule_fcs=get_molecule_fcs, run_excited_state_from_optimised_ground_structure=run_excited_state_from_optimised_ground_structure, no_of_cpus=no_of_cpus)
+		stage_profiler.end_stage('write_unique_molecules', no_of_structurally_unique_molecules=len(structurally_unique_molecules_names), no_of_conformationally_unique_molecules=len(conformationally_unique_molecules_names))
 		if get_molecule_res:
 			write_ECCP_process_RE_submit_script(Unique_RE_Calc_Jobs_folder,  all_submission_information_for_REs)
 		if get_molecule_fcs:
@@ -467,13 +514,20 @@ def ECCP(filepath, bonds_to_ignore=None, make_molecule_method='component_assembl
 
 	# Thirty-first, obtain all dimers of molecules in the crystal. 
 	print('Getting All Dimers')
+	stage_profiler.start_stage('get_dimers')
 	
 	# 32.1: Make sure that the neighbourhood_molecules_for_dimer_method list is sorted by shortest_distance
 	neighbourhood_molecules_for_dimer_method.sort(key=lambda x: (x[4], x[0], x[1], x[2][0], x[2][1], x[2][2]))
 	
 	# 32.2: Obtain the information about all the dimers recorded by ECCP (either in the current ECCP run or from the ECCP_Information file).
+	dimers_stage_key = get_stage_key('dimers', neighbours_stage_key)
 	if not has_neighbouring_molecules:
-		all_dimers_info = get_dimers(molecules, molecule_graphs, neighbourhood_molecules_for_dimer_method=neighbourhood_molecules_for_dimer_method, no_of_cpus=no_of_cpus)
+		has_dimers_stage, dimers_stage_results = load_stage_from_cache(path_to_stage_cache_folder, 'dimers', dimers_stage_key)
+		if has_dimers_stage:
+			all_dimers_info = dimers_stage_results
+		else:
+			all_dimers_info = get_dimers(molecules, molecule_graphs, neighbourhood_molecules_for_dimer_method=neighbourhood_molecules_for_dimer_method, no_of_cpus=no_of_cpus)
+			save_stage_to_cache(path_to_stage_cache_folder, 'dimers', dimers_stage_key, all_dimers_info)
 	else:
 		print('Obtaining dimer details from ECCP_Information folder.')
 		all_dimers_info = convert_dimer_details_to_all_dimers_info_method(dimer_details, neighbourhood_molecules_for_dimer_method)
@@ -483,6 +537,7 @@ def ECCP(filepath, bonds_to_ignore=None, make_molecule_method='component_assembl
 	
 	# 32.4: Record the total number of dimers in the list.
 	print('Total no. of dimers: '+str(len(all_dimers_info)))
+	stage_profiler.end_stage('get_dimers', source=('ECCP_Information' if has_neighbouring_molecules else ('stage_cache' if has_dimers_stage else 'calculated')), no_of_neighbouring_pairs=len(neighbourhood_molecules_for_dimer_method), no_of_dimers=len(all_dimers_info))
 
 	# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
@@ -502,7 +557,9 @@ def ECCP(filepath, bonds_to_ignore=None, make_molecule_method='component_assembl
 	all_dimers_folderpath                  = path_to_eccp_folder+'/'+'All_Dimers'
 	all_dimers_with_environment_folderpath = path_to_eccp_folder+'/'+'All_Dimers_with_environment'
 	all_dimers_info_names                  = list(all_dimers_info.keys())
-	write_dimers_to_disk(all_dimers_info_names, all_dimers_info, molecules, molecule_graphs, neighbouring_molecules_about_dimers, SolventsList, all_dimers_folderpath, all_dimers_with_environment_folderpath, all_eet_calc_jobs_path, all_eigendata_calc_jobs_path, all_calc_parameters_for_EETs=all_calc_parameters_for_EETs, all_submission_information_for_EETs=all_submission_information_for_EETs, all_calc_parameters_for_ICTs=all_calc_parameters_for_ICTs, all_submission_information_for_ICTs=all_submission_information_for_ICTs, get_dimer_eets=get_dimer_eets, get_dimer_icts=get_dimer_icts)
+	stage_profiler.start_stage('write_all_dimers')
+	write_dimers_to_disk(all_dimers_info_names, all_dimers_info, molecules, molecule_graphs, neighbouring_molecules_about_dimers, SolventsList, all_dimers_folderpath, all_dimers_with_environment_folderpath, all_eet_calc_jobs_path, all_eigendata_calc_jobs_path, all_calc_parameters_for_EETs=all_calc_parameters_for_EETs, all_submission_information_for_EETs=all_submission_information_for_EETs, all_calc_parameters_for_ICTs=all_calc_parameters_for_ICTs, all_submission_information_for_ICTs=all_submission_information_for_ICTs, get_dimer_eets=get_dimer_eets, get_dimer_icts=get_dimer_icts, no_of_cpus=no_of_cpus)
+	stage_profiler.end_stage('write_all_dimers', no_of_dimers=len(all_dimers_info_names))
 
 	# Thirty-seventh, if there are unique dimers: 
 	if obtain_unique_dimers_bool:
@@ -510,13 +567,21 @@ def ECCP(filepath, bonds_to_ignore=None, make_molecule_method='component_assembl
 
 		# Thirty-eighth, obtain the unique, non-symmetric dimers of molecules in the crystal.  
 		print('Getting Unique Dimers')
+		stage_profiler.start_stage('get_unique_dimers')
 		if not has_unique_dimers:
-			unique_dimers_names, structurally_equivalent_dimer_groups, structurally_equivalent_dimer_pairs = get_unique_dimers(all_dimers_info, molecules, simple_molecule_graphs, dimer_equivalence_method=dimer_equivalence_method, neighbouring_molecules_about_dimers=neighbouring_molecules_about_dimers, include_hydrogens_in_uniqueness_analysis=include_hydrogens_in_uniqueness_analysis, no_of_cpus=no_of_cpus)
+			unique_dimers_stage_key = get_stage_key('unique_dimers', dimers_stage_key, dimer_equivalence_method, include_hydrogens_in_uniqueness_analysis)
+			has_unique_dimers_stage, unique_dimers_stage_results = load_stage_from_cache(path_to_stage_cache_folder, 'unique_dimers', unique_dimers_stage_key)
+			if has_unique_dimers_stage:
+				unique_dimers_names, structurally_equivalent_dimer_groups, structurally_equivalent_dimer_pairs = unique_dimers_stage_results
+			else:
+				unique_dimers_names, structurally_equivalent_dimer_groups, structurally_equivalent_dimer_pairs = get_unique_dimers(all_dimers_info, molecules, simple_molecule_graphs, dimer_equivalence_method=dimer_equivalence_method, neighbouring_molecules_about_dimers=neighbouring_molecules_about_dimers, include_hydrogens_in_uniqueness_analysis=include_hydrogens_in_uniqueness_analysis, crystal=crystal, no_of_cpus=no_of_cpus)
+				save_stage_to_cache(path_to_stage_cache_folder, 'unique_dimers', unique_dimers_stage_key, (unique_dimers_names, structurally_equivalent_dimer_groups, structurally_equivalent_dimer_pairs))
 		else:
 			print('Reading Unique Dimers from Structurally_Equivalent_Dimer_Groups.txt')
 			unique_dimers_names, structurally_equivalent_dimer_groups = convert_existing_unique_dimer_data_from_ECCP_Information(structurally_equivalent_dimer_groups, len(all_dimers_info))
 			# Note: We have already got structurally_equivalent_dimer_pairs. 
 		print('No of unique dimers: '+str(len(unique_dimers_names)))
+		stage_profiler.end_stage('get_unique_dimers', source=('ECCP_Information' if has_unique_dimers else ('stage_cache' if has_unique_dimers_stage else 'calculated')), no_of_dimers=len(all_dimers_info), no_of_unique_dimers=len(unique_dimers_names), no_of_structurally_equivalent_dimer_pairs=len(structurally_equivalent_dimer_pairs))
 
 		# Thirty-ninth, remove unwanted entries from molecules
 		for mol_name in molecules.keys():
@@ -526,13 +591,26 @@ def ECCP(filepath, bonds_to_ignore=None, make_molecule_method='component_assembl
 		print('Writing unique dimers to '+str(path_to_eccp_folder))
 		unique_dimers_folderpath                  = path_to_eccp_folder+'/'+'Unique_Dimers'
 		unique_dimers_with_environment_folderpath = path_to_eccp_folder+'/'+'Unique_Dimers_with_environment'
-		write_dimers_to_disk(unique_dimers_names, all_dimers_info, molecules, molecule_graphs, neighbouring_molecules_about_dimers, SolventsList, unique_dimers_folderpath, unique_dimers_with_environment_folderpath, unique_eet_calc_jobs_path, unique_eigendata_calc_jobs_path, all_calc_parameters_for_EETs=all_calc_parameters_for_EETs, all_submission_information_for_EETs=all_submission_information_for_EETs, all_calc_parameters_for_ICTs=all_calc_parameters_for_ICTs, all_submission_information_for_ICTs=all_submission_information_for_ICTs, get_dimer_eets=get_dimer_eets, get_dimer_icts=get_dimer_icts)
+		stage_profiler.start_stage('write_unique_dimers')
+		write_dimers_to_disk(unique_dimers_names, all_dimers_info, molecules, molecule_graphs, neighbouring_molecules_about_dimers, SolventsList, unique_dimers_folderpath, unique_dimers_with_environment_folderpath, unique_eet_calc_jobs_path, unique_eigendata_calc_jobs_path, all_calc_parameters_for_EETs=all_calc_parameters_for_EETs, all_submission_information_for_EETs=all_submission_information_for_EETs, all_calc_parameters_for_ICTs=all_calc_parameters_for_ICTs, all_submission_information_for_ICTs=all_submission_information_for_ICTs, get_dimer_eets=get_dimer_eets, get_dimer_icts=get_dimer_icts, no_of_cpus=no_of_cpus)
+		stage_profiler.end_stage('write_unique_dimers', no_of_unique_dimers=len(unique_dimers_names))
 		if get_dimer_eets:
 			write_ECCP_process_EET_submit_script(Unique_EET_Calc_Jobs_folder, all_submission_information_for_EETs)
 		if get_dimer_icts:
 			write_ECCP_process_Eigendata_submit_script(Unique_Eigendata_Calc_Jobs_folder, all_submission_information_for_ICTs)
 			write_ECCP_process_ICT_submit_script      (Unique_Eigendata_Calc_Jobs_folder, all_submission_information_for_ICTs)
 
+	# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+	# If desired, write slurm array scripts for each job family, so that these jobs can be submitted to slurm as a few array jobs.
+	if make_slurm_job_arrays:
+		print('Writing slurm array scripts for each job family.')
+		job_family_paths  = ([all_atc_calc_jobs_path,       unique_atc_calc_jobs_path]       if get_molecule_atcs else [])
+		job_family_paths += ([all_eet_calc_jobs_path,       unique_eet_calc_jobs_path]       if get_dimer_eets    else [])
+		job_family_paths += ([all_eigendata_calc_jobs_path, unique_eigendata_calc_jobs_path] if get_dimer_icts    else [])
+		for job_family_path in job_family_paths:
+			write_slurm_array_scripts(job_family_path)
+
 	# ----------------------------------------------------------------------------------------- #
 	# ----------------------------------------------------------------------------------------- #
 	# ----------------------------------------------------------------------------------------- #
@@ -558,7 +636,9 @@ def ECCP(filepath, bonds_to_ignore=None, make_molecule_method='component_assembl
 	document_info['structurally_equivalent_dimer_pairs']        = None if not obtain_unique_dimers_bool else structurally_equivalent_dimer_pairs
 	
 	# 41.4: Write the results document (ECCP_Information.txt). 
+	stage_profiler.start_stage('write_results_document')
 	write_results_document(**document_info)
+	stage_profiler.end_stage('write_results_document', no_of_dimers=len(all_dimers_info))
 	
 	# Forty-second, conclude with finishing remarks.
 	print('Finishing running ECCP upon: '+str(filename))
@@ -14,38 +14,23 @@ def check_dimer_duplication(neighbourhood_molecules_for_dimer_method):
 		This is the information from dimers_details in the format of (mol1_name, mol2_name, (UCV(i), UCV(j), UCV(k)), np.array(DV(x), DV(y), DV(z))))
 	"""
 
-	# First, initialise a list for recording if there are duplicate dimers in neighbourhood_molecules_for_dimer_method
-	duplicate_dimers = []
+	# First, place the index of each dimer into a dictionary based on its key, given as (mol1_name, mol2_name, (UCV(i), UCV(j), UCV(k))).
+	#        * Dimers with the same key are duplicates, so all duplicates are found with one pass through neighbourhood_molecules_for_dimer_method. 
+	dimer_indices_by_key = {}
+	for index, (mol1_index, mol2_index, UC_ijk, displacement_of_m2, distance) in enumerate(neighbourhood_molecules_for_dimer_method):
 
-	# Second, for each dimer in neighbourhood_molecules_for_dimer_method
-	for index1 in range(len(neighbourhood_molecules_for_dimer_method)):
+		# 1.1: Make sure that the components of UC_ijk are all ints
+		dimer_key = (mol1_index, mol2_index, tuple([int(value) for value in UC_ijk]))
 
-		# Third, obtain the components from neighbourhood_molecules_for_dimer_method[index1]
-		d1_mol1_index, d1_mol2_index, d1_UC_ijk, d1_displacement_of_m2, d1_distance = neighbourhood_molecules_for_dimer_method[index1]
+		# 1.2: Record the index of this dimer under its key. 
+		dimer_indices_by_key.setdefault(dimer_key, []).append(index)
 
-		# Fourth, for each other dimer in neighbourhood_molecules_for_dimer_method
-		for index2 in range(index1+1,len(neighbourhood_molecules_for_dimer_method)):
+	# Second, obtain the groups of dimers that have the same key.
+	duplicate_dimers = {dimer_key: dimer_indices for dimer_key, dimer_indices in dimer_indices_by_key.items() if len(dimer_indices) > 1}
 
-			# Fifth, obtain the components from neighbourhood_molecules_for_dimer_method[index2]
-			d2_mol1_index, d2_mol2_index, d2_UC_ijk, d2_displacement_of_m2, d2_distance = neighbourhood_molecules_for_dimer_method[index2]
-
-			# Sixth, make sure that the components of d1_UC_ijk are all floats
-			d1_UC_ijk = tuple([int(value) for value in d1_UC_ijk])
-			d2_UC_ijk = tuple([int(value) for value in d2_UC_ijk])
-
-			# Seventh, perform comparisons between both dimers
-			same_mol1     = d1_mol1_index        == d2_mol1_index
-			same_mol2     = d1_mol2_index        == d2_mol2_index
-			same_UC_ijk   = d1_UC_ijk            == d2_UC_ijk
-			#same_distance = round(d1_distance,4) == round(d2_distance,4)
-
-			# Eighth, if all of these are the same, we have a duplicate dimers
-			if same_mol1 and same_mol2 and same_UC_ijk:
-				duplicate_dimers.append((d1_mol1_index, d1_mol2_index, d1_UC_ijk))
-
-	# Ninth, report any dimers that are duplicates
+	# Third, report any dimers that are duplicates
 	if len(duplicate_dimers) > 0:
 		to_string  = 'Error: There are duplicate dimer in the neighbourhood_molecules_for_dimer_method list.\n'
-		to_string += 'Duplicate dimers in neighbourhood_molecules_for_dimer_method: '+str(duplicate_dimers)+'\n'
+		to_string += 'Duplicate dimers in neighbourhood_molecules_for_dimer_method (given as (mol1_name, mol2_name, UC_ijk): indices in list): '+str(duplicate_dimers)+'\n'
 		to_string += 'Check this.'
-		raise Exception(to_string)
\ No newline at end of file
+		raise Exception(to_string)
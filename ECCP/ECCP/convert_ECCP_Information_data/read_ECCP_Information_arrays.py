@@ -0,0 +1,95 @@
+"""
+read_ECCP_Information_arrays.py, Geoffrey Weal, 17/10/26
+
+This method is designed to read the dimer and equivalence group information from ECCP_Information_Arrays.npz, if it can be used.
+"""
+import os, json
+import numpy as np
+
+from ECCP.ECCP.write_results_document_method.write_ECCP_Information_arrays import arrays_filename, manifest_filename, arrays_version
+from ECCP.ECCP.write_results_document_method.write_ECCP_Information_arrays import get_file_fingerprint
+
+def read_ECCP_Information_arrays(path_to_eccp_folder):
+	"""
+	This method is designed to read the dimer and equivalence group information from ECCP_Information_Arrays.npz.
+
+	A section is only read if the text files it was written alongside have not changed since. If they have (or the arrays can not be read), that section is not given, and the text files should be read instead.
+
+	Parameters
+	----------
+	path_to_eccp_folder : str.
+		This is the path to the ECCP_Information data.
+
+	Returns
+	-------
+	ECCP_Information_arrays_data : dict.
+		This is the information that could be read from the arrays, given in the same format as from the text files. Contains the 'dimer_details', 'unique_molecules' and 'unique_dimers' sections where they could be read.
+	"""
+
+	# First, initialise the dictionary for holding the information read from the arrays.
+	ECCP_Information_arrays_data = {}
+
+	# Second, read the manifest, and check that the arrays are the version and file that the manifest describes.
+	manifest_filepath = path_to_eccp_folder+'/'+manifest_filename
+	arrays_filepath   = path_to_eccp_folder+'/'+arrays_filename
+	if not (os.path.exists(manifest_filepath) and os.path.exists(arrays_filepath)):
+		return ECCP_Information_arrays_data
+	try:
+		with open(manifest_filepath, 'r') as manifest_file:
+			manifest = json.load(manifest_file)
+	except (OSError, ValueError):
+		return ECCP_Information_arrays_data
+	if not ((manifest.get('version') == arrays_version) and (manifest.get('arrays_file') == get_file_fingerprint(arrays_filepath))):
+		return ECCP_Information_arrays_data
+
+	# Third, obtain the sections whose text files have not changed since the arrays were written.
+	sections = [section for section, text_file_fingerprints in manifest.get('sections', {}).items() if all([(get_file_fingerprint(path_to_eccp_folder+'/'+text_filename) == fingerprint) for text_filename, fingerprint in text_file_fingerprints.items()])]
+	if len(sections) == 0:
+		return ECCP_Information_arrays_data
+
+	# Fourth, read the arrays from disk.
+	with np.load(arrays_filepath) as arrays_file:
+		arrays = {array_name: arrays_file[array_name] for array_name in arrays_file.files}
+
+	# Fifth, obtain dimer_details, given as {dimer name: (mol1 name, mol2 name, UCV(i), UCV(j), UCV(k), DV(x), DV(y), DV(z), move_COM(x), move_COM(y), move_COM(z))}.
+	if 'dimer_details' in sections:
+		dimer_details = {}
+		for dimer_name, molecule_names, unit_cell_displacement, displacement, move_centre_of_mass_by in zip(arrays['dimer_names'].tolist(), arrays['dimer_molecule_names'].tolist(), arrays['unit_cell_displacement'].tolist(), arrays['displacement'].tolist(), arrays['move_centre_of_mass_by'].tolist()):
+			dimer_details[dimer_name] = tuple(molecule_names + unit_cell_displacement + displacement + move_centre_of_mass_by)
+		ECCP_Information_arrays_data['dimer_details'] = dimer_details
+
+	# Sixth, obtain the structurally and conformationally equivalent molecule groups and pairs.
+	if 'unique_molecules' in sections:
+		ECCP_Information_arrays_data['structurally_equivalent_molecule_groups']     = get_equivalence_groups_from_arrays(arrays, 'structurally_equivalent_molecule_groups')
+		ECCP_Information_arrays_data['conformationally_equivalent_molecule_groups'] = get_equivalence_groups_from_arrays(arrays, 'conformationally_equivalent_molecule_groups')
+		ECCP_Information_arrays_data['structurally_equivalent_molecule_pairs']      = [tuple(pair) for pair in arrays['structurally_equivalent_molecule_pairs'].tolist()]
+
+	# Seventh, obtain the structurally equivalent dimer groups and pairs.
+	if 'unique_dimers' in sections:
+		ECCP_Information_arrays_data['structurally_equivalent_dimer_groups'] = get_equivalence_groups_from_arrays(arrays, 'structurally_equivalent_dimer_groups')
+		ECCP_Information_arrays_data['structurally_equivalent_dimer_pairs']  = [tuple(pair) for pair in arrays['structurally_equivalent_dimer_pairs'].tolist()]
+
+	# Eighth, return the information read from the arrays.
+	return ECCP_Information_arrays_data
+
+def get_equivalence_groups_from_arrays(arrays, name):
+	"""
+	This method will obtain equivalence groups from the arrays, in the list form given in the text files.
+
+	Parameters
+	----------
+	arrays : dict.
+		These are the arrays read from ECCP_Information_Arrays.npz.
+	name : str.
+		This is the name of the equivalence groups.
+
+	Returns
+	-------
+	equivalence_groups_list : list of lists
+		These are the equivalence groups, where each group is a sorted list of the individuals in the group.
+	"""
+	individual_names = arrays[name+'_names'].tolist()
+	offsets          = arrays[name+'_offsets'].tolist()
+	return [individual_names[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+# ---------------------------------------------------------------------------------------------------------------
@@ -14,6 +14,8 @@ from SUMELF import get_equivalent_molecule_group_data
 from SUMELF import get_equivalent_dimer_group_data
 from SUMELF import check_consistancy_between_files
 
+from ECCP.ECCP.convert_ECCP_Information_data.read_ECCP_Information_arrays import read_ECCP_Information_arrays
+
 def read_data_from_ECCP_Information(path_to_eccp_folder, make_dimer_method, environment_settings):
 	"""
 	This method is designed to record all the information from the ECCP Information folder.
@@ -75,40 +77,56 @@ def read_data_from_ECCP_Information(path_to_eccp_folder, make_dimer_method, envi
 		# 6.2: Add crystal to ECCP_Information_data.
 		ECCP_Information_data['crystal'] = crystal
 
-	# Seventh, if you have information about the neighbours around each molecule in the crystal, get it from file. 
+	# Seventh, read the information that can be quickly obtained from the ECCP_Information_Arrays.npz file.
+	#          * If this file does not exist, or if the text files have changed since it was written, the information is read from the text files instead.
+	ECCP_Information_arrays_data = read_ECCP_Information_arrays(path_to_eccp_folder) if any([has_neighbouring_molecules, has_unique_molecules, has_unique_dimers]) else {}
+
+	# Eighth, if you have information about the neighbours around each molecule in the crystal, get it from file. 
 	if has_neighbouring_molecules:
 
-		# 7.1: Get dimer_details from file.
-		dimer_details = get_dimer_details_data(path_to_eccp_folder, eccp_information)
+		# 8.1: Get dimer_details from file.
+		if 'dimer_details' in ECCP_Information_arrays_data:
+			dimer_details = ECCP_Information_arrays_data['dimer_details']
+		else:
+			dimer_details = get_dimer_details_data(path_to_eccp_folder, eccp_information)
 
-		# 7.2: Add eccp_information to ECCP_Information_data.
+		# 8.2: Add eccp_information to ECCP_Information_data.
 		ECCP_Information_data['dimer_details'] = dimer_details
 
-	# Eighth, if the structural and conformational equivalent molecule groups have been recorded, read them from file. 
+	# Ninth, if the structural and conformational equivalent molecule groups have been recorded, read them from file. 
 	if has_unique_molecules:
 
-		# 8.1: Get structural and conformational equivalent molecule groups from file.
-		structurally_equivalent_molecule_groups, conformationally_equivalent_molecule_groups, structurally_equivalent_molecule_pairs = get_equivalent_molecule_group_data(path_to_eccp_folder, eccp_information)
+		# 9.1: Get structural and conformational equivalent molecule groups from file.
+		if 'structurally_equivalent_molecule_groups' in ECCP_Information_arrays_data:
+			structurally_equivalent_molecule_groups     = ECCP_Information_arrays_data['structurally_equivalent_molecule_groups']
+			conformationally_equivalent_molecule_groups = ECCP_Information_arrays_data['conformationally_equivalent_molecule_groups']
+			structurally_equivalent_molecule_pairs      = ECCP_Information_arrays_data['structurally_equivalent_molecule_pairs']
+		else:
+			structurally_equivalent_molecule_groups, conformationally_equivalent_molecule_groups, structurally_equivalent_molecule_pairs = get_equivalent_molecule_group_data(path_to_eccp_folder, eccp_information)
 
-		# 8.2: Add eccp_information to ECCP_Information_data.
+		# 9.2: Add eccp_information to ECCP_Information_data.
 		ECCP_Information_data['structurally_equivalent_molecule_groups']     = structurally_equivalent_molecule_groups
 		ECCP_Information_data['conformationally_equivalent_molecule_groups'] = conformationally_equivalent_molecule_groups
 		ECCP_Information_data['structurally_equivalent_molecule_pairs']      = structurally_equivalent_molecule_pairs
 
-	# Ninth, if the structural equivalent dimer groups have been recorded, read them from file. 
+	# Tenth, if the structural equivalent dimer groups have been recorded, read them from file. 
 	if has_unique_dimers:
 
-		# 9.1: Get structural equivalent dimer groups from file. 
-		structurally_equivalent_dimer_groups, structurally_equivalent_dimer_pairs = get_equivalent_dimer_group_data(path_to_eccp_folder, eccp_information)
+		# 10.1: Get structural equivalent dimer groups from file. 
+		if 'structurally_equivalent_dimer_groups' in ECCP_Information_arrays_data:
+			structurally_equivalent_dimer_groups = ECCP_Information_arrays_data['structurally_equivalent_dimer_groups']
+			structurally_equivalent_dimer_pairs  = ECCP_Information_arrays_data['structurally_equivalent_dimer_pairs']
+		else:
+			structurally_equivalent_dimer_groups, structurally_equivalent_dimer_pairs = get_equivalent_dimer_group_data(path_to_eccp_folder, eccp_information)
 
-		# 9.2: Add eccp_information to ECCP_Information_data.
+		# 10.2: Add eccp_information to ECCP_Information_data.
 		ECCP_Information_data['structurally_equivalent_dimer_groups'] = structurally_equivalent_dimer_groups
 		ECCP_Information_data['structurally_equivalent_dimer_pairs']  = structurally_equivalent_dimer_pairs
 
-	# Tenth, check that all the files are consistent with each other. 
+	# Eleventh, check that all the files are consistent with each other. 
 	check_consistancy_between_files(have_ECCP_Information_file, have_ECCP_Information_crystal_file, has_neighbouring_molecules, has_unique_molecules, has_unique_dimers, **ECCP_Information_data)
 
-	# Eleventh, return booleans for determining what data is contained in the ECCP_Information folder, and all the information from it.
+	# Twelfth, return booleans for determining what data is contained in the ECCP_Information folder, and all the information from it.
 	return have_ECCP_Information_crystal_file, has_neighbouring_molecules, has_unique_molecules, has_unique_dimers, ECCP_Information_data
 
 
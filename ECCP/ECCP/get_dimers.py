@@ -3,6 +3,8 @@ general_methods.py, Geoffrey Weal, 17/2/22
 
 This script includes methods for obtaining dimers.
 """
+import numpy as np
+from ase import Atoms
 from tqdm import trange
 from SUMELF import centre_molecule_in_cell
 
@@ -25,8 +27,8 @@ def get_dimers(molecules, molecule_graphs, neighbourhood_molecules_for_dimer_met
 
 	Returns
 	-------
-	dimer_pairs : list
-		This is a list of all the dimers identified, given as the tuple (index of molecule 1 in molecules list, index of molecule 1 in molecules list, molecule 1, molecule 2). 
+	dimer_pairs : dict.
+		This is a dictionary of all the dimers identified, given as {dimer name: (name of molecule 1, name of molecule 2, unit cell ijk displacement of molecule 2, displacement of molecule 2, displacement of dimer COM, shortest distance between molecules in dimer)}. No coordinates are stored, the dimer can be made from this when needed (see make_dimer in SUMELF). 
 	"""
 
 	# First, make sure that the neighbourhood_molecules_for_dimer_method list is sorted by shortest_distance
@@ -38,46 +40,48 @@ def get_dimers(molecules, molecule_graphs, neighbourhood_molecules_for_dimer_met
 	# Third, get the cell points of the super cell around the origin unit cell with reach 1 
 	crystal_cell_lattice = molecules[first_molecule_name].get_cell()
 
-	# Fourth, initialise a dictionary for holding all the dimers found in this crystal, given the user inputs. 
+	# Fourth, obtain the elements, masses and positions of each molecule once, rather than copying each molecule for every dimer.
+	#        * Only these are needed to centre each dimer. The full dimer is only made when it is needed (such as when writing it to disk with make_dimer).
+	molecules_numbers   = {mol_name: molecule.get_atomic_numbers() for mol_name, molecule in molecules.items()}
+	molecules_masses    = {mol_name: molecule.get_masses()         for mol_name, molecule in molecules.items()}
+	molecules_positions = {mol_name: molecule.get_positions()      for mol_name, molecule in molecules.items()}
+	crystal_cell_pbc    = molecules[first_molecule_name].get_pbc()
+
+	# Fifth, initialise a dictionary for holding all the dimers found in this crystal, given the user inputs. 
+	#        * Each dimer is only recorded by the names of its molecules and how molecule 2 is displaced, not as an ase.Atoms object. 
 	dimer_pairs = {}
 
-	# Fifth, make all the dimers found using the displacements found, and then centre the dimer as close to the centre
+	# Sixth, make all the dimers found using the displacements found, and then centre the dimer as close to the centre
 	#        of the unit cell as possible while retaining the original periodic positions of the molecules in the dimer. 
 	for dimer_index in trange(len(neighbourhood_molecules_for_dimer_method), unit='dimer'):
 
-		# 5.1: Get information for constructing a dimer from neighbourhood_molecules_for_dimer_method[dimer_index]
+		# 6.1: Get information for constructing a dimer from neighbourhood_molecules_for_dimer_method[dimer_index]
 		mol_name1, mol_name2, unit_cell_displacement, displacement, shortest_distance = neighbourhood_molecules_for_dimer_method[dimer_index]
 
-		# 5.2: Make a copy of the two molecules to use in the dimer. 
-		molecule1 = molecules[mol_name1].copy()
-		molecule2 = molecules[mol_name2].copy()
-
-		# 5.3: Translate molecule 2 by the displacement amount
-		molecule2.set_positions(molecule2.get_positions() + displacement)
-
-		# 5.4: Make the ase.Atoms object for the dimer based on the two monomers
-		dimer_pair_molecules = molecule1 + molecule2
+		# 6.2: Make a temporary ase.Atoms object of the dimer that only contains the elements, masses and positions of the atoms in the dimer.
+		#      * Molecule 2 is translated by the displacement amount.
+		dimer_pair_molecules = Atoms(numbers=np.concatenate((molecules_numbers[mol_name1], molecules_numbers[mol_name2])), positions=np.concatenate((molecules_positions[mol_name1], molecules_positions[mol_name2] + displacement)), masses=np.concatenate((molecules_masses[mol_name1], molecules_masses[mol_name2])), cell=crystal_cell_lattice, pbc=crystal_cell_pbc)
 
-		# 5.5: Determine the displacement needed to move the centre of the dimer to the origin
+		# 6.3: Determine the displacement needed to move the centre of the dimer to the origin
 		move_centre_of_mass_by = centre_molecule_in_cell(dimer_pair_molecules, crystal_cell_lattice, move_molecule=False, dimer_index=dimer_index)
 
-		# 5.6: Make a tuple to hold all the information to create the dimer. 
+		# 6.4: Make a tuple to hold all the information to create the dimer. 
 		dimer_pair = (mol_name1, mol_name2, unit_cell_displacement, displacement, move_centre_of_mass_by, shortest_distance)
 
-		# 5.7: Get the name of the dimer
+		# 6.5: Get the name of the dimer
 		dimer_name = dimer_index + 1
 
-		# 5.8: Check that dimer_name is not already in the dimer_pairs dictionary
+		# 6.6: Check that dimer_name is not already in the dimer_pairs dictionary
 		if dimer_name in dimer_pairs:
 			raise Exception(f'Error: dimer_name is already in dimer_pairs: {dimer_pairs}')
 
-		# 5.9: Append the information about how to make the dimer using dimer_pairs
+		# 6.7: Append the information about how to make the dimer using dimer_pairs
 		dimer_pairs[dimer_name] = dimer_pair
 
-		# 5.10: Update neighbourhood_molecules_for_dimer_method to include the dimers name:
+		# 6.8: Update neighbourhood_molecules_for_dimer_method to include the dimers name:
 		#neighbourhood_molecules_for_dimer_method[dimer_index] = tuple([dimer_name] + list(neighbourhood_molecules_for_dimer_method[dimer_index]))
 
-	# Sixth, return the list of dimers.
+	# Seventh, return the list of dimers.
 	return dimer_pairs
 
 
@@ -34,8 +34,8 @@ def get_neighbouring_molecules_about_molecules(environment_settings, neighbourho
 	raise Exception('Check this method, as have not used it before.')
 
 	# Third, go through the neighbourhood_molecules_for_environment_method and record which molecules neighbour which origin cell molecules. 
-	for mol_name1, mol_name2, unit_cell_displacement, displacement, shortest_distance in neighbourhood_molecules_for_environment_method:
-		neighbouring_molecules_about_molecules.setdefault(mol_name1,[]).append((mol_name2, unit_cell_displacement, displacement, shortest_distance))
+	for mol_name1, neighbour_table in get_neighbour_tables(neighbourhood_molecules_for_environment_method).items():
+		neighbouring_molecules_about_molecules[mol_name1] = [neighbour for _, neighbour in neighbour_table]
 
 	# Fourth, return neighbouring_molecules_about_molecules
 	return neighbouring_molecules_about_molecules
@@ -69,58 +69,88 @@ def get_neighbouring_molecules_about_dimers(environment_settings, neighbourhood_
 	if not include_environment_in_dimer_calcs:
 		return neighbouring_molecules_about_dimers
 
-	raise Exception('Never needed to use this method, Check this before using.')
+	raise Exception('Error: Obtaining the molecules that neighbour each dimer (include_environment_in_dimer_calcs = True in environment_settings) has never been used. Check get_neighbouring_molecules_about_dimers and get_neighbour_tables in get_neighbouring_molecules_about_system.py before using this setting.')
 
-	# Second, go through the neighbourhood_molecules_for_environment_method and record which molecules neighbour which origin cell molecules. 
+	# Third, obtain the table of the molecules that neighbour each origin cell molecule.
+	#        * This means that only the neighbours of mol_name1 and mol_name2 are looked through for each dimer, rather than every entry in neighbourhood_molecules_for_environment_method.
+	neighbour_tables = get_neighbour_tables(neighbourhood_molecules_for_environment_method)
+
+	# Fourth, go through the neighbours of each molecule in each dimer, and record which molecules neighbour the dimer. 
 	for dimer_name, mol_name1, mol_name2, dimer_unit_cell_displacement, dimer_displacement, dimer_shortest_distance in neighbourhood_molecules_for_dimer_method:
 
-		# 2.1: Obtain the dimer key that describes the details of the dimer. 
+		# 4.1: Obtain the dimer key that describes the details of the dimer, and the dictionary to record the molecules that neighbour this dimer.
 		dimer_key = (mol_name1, mol_name2, dimer_unit_cell_displacement)
+		neighbours_about_dimer = neighbouring_molecules_about_dimers.setdefault(dimer_key,{})
+
+		# 4.2: Obtain the neighbours of mol_name1 and mol_name2, in the order they are given in neighbourhood_molecules_for_environment_method.
+		#      * If a molecule neighbours both mol_name1 and mol_name2, the first entry for it in neighbourhood_molecules_for_environment_method is used.
+		neighbours_of_dimer_molecules  = [(neighbour_index, 1, neighbour) for neighbour_index, neighbour in neighbour_tables.get(mol_name1,[])]
+		neighbours_of_dimer_molecules += [(neighbour_index, 2, neighbour) for neighbour_index, neighbour in neighbour_tables.get(mol_name2,[])]
+		neighbours_of_dimer_molecules.sort(key=lambda x: (x[0], x[1]))
 
-		# 2.2: Look through each neighbour in the neighbourhood dictionary. 
-		for neighbour_mol_name1, neighbour_mol_name2, neighbour_unit_cell_displacement, neighbour_displacement, neighbour_shortest_distance in neighbourhood_molecules_for_environment_method: 
+		# 4.3: Look through each neighbour of mol_name1 and mol_name2. 
+		for _, dimer_molecule_number, (neighbour_mol_name2, neighbour_unit_cell_displacement, neighbour_displacement, neighbour_shortest_distance) in neighbours_of_dimer_molecules:
 
-			# 2.2.1: If mol_name1 == neighbour_mol_name1, then neighbour_mol_name2 surrounds mol_name1
-			if (mol_name1 == neighbour_mol_name1):
+			# 4.3.1: If dimer_molecule_number == 1, then neighbour_mol_name2 surrounds mol_name1
+			if dimer_molecule_number == 1:
 
-				# 2.2.1.1: Create the tuple which describes the neighbouring molecule we are exploring.
+				# 4.3.1.1: Create the tuple which describes the neighbouring molecule we are exploring.
 				neighbour_information = (neighbour_mol_name2, neighbour_unit_cell_displacement)
 
 				if (neighbour_mol_name2 == mol_name2) and all([(v1 == v2) for (v1,v2) in zip(neighbour_unit_cell_displacement, dimer_unit_cell_displacement)]):
-					# 2.2.1.2: If this statement is true, neighbour mol 2 is dimer mol 2, so we dont want to include this molecule in the dimer neighbours list. 
+					# 4.3.1.2: If this statement is true, neighbour mol 2 is dimer mol 2, so we dont want to include this molecule in the dimer neighbours list. 
 					pass
-				elif (dimer_key in neighbouring_molecules_about_dimers.keys()) and (neighbour_information in neighbouring_molecules_about_dimers[dimer_key].keys()):
-					# 2.2.1.3: If this statement is true, we already have included this molecule in the neighbour list, dont't need to double count it.
+				elif neighbour_information in neighbours_about_dimer:
+					# 4.3.1.3: If this statement is true, we already have included this molecule in the neighbour list, dont't need to double count it.
 					pass
 				else:
-					# 2.2.1.4: Include this molecule with details given in neighbour_information in neighbouring_molecules_about_dimers for this dimer.
-					neighbouring_molecules_about_dimers.setdefault(dimer_key,{})[neighbour_information] = neighbour_displacement
+					# 4.3.1.4: Include this molecule with details given in neighbour_information in neighbouring_molecules_about_dimers for this dimer.
+					neighbours_about_dimer[neighbour_information] = neighbour_displacement
 
-			# 2.2.2: If mol_name2 == neighbour_mol_name1, then neighbour_mol_name2 surrounds mol_name2
-			if (mol_name2 == neighbour_mol_name1):
+			# 4.3.2: If dimer_molecule_number == 2, then neighbour_mol_name2 surrounds mol_name2
+			else:
 
-				# 2.2.2.1: Create the tuple which describes the neighbouring molecule we are exploring.
+				# 4.3.2.1: Create the tuple which describes the neighbouring molecule we are exploring.
 				neighbour_of_dm2_unit_cell_displacement = tuple([v1+v2 for (v1,v2) in zip(dimer_unit_cell_displacement, neighbour_unit_cell_displacement)])
 				neighbour_information = (neighbour_mol_name2, neighbour_of_dm2_unit_cell_displacement)
 
 				if (neighbour_mol_name2 == mol_name1) and all([(v1 == v2) for (v1,v2) in zip(neighbour_of_dm2_unit_cell_displacement, (0,0,0))]):
-					# 2.2.2.2: If the following is true, neighbour mol 2 is dimer mol 1, so we dont want to include this molecule in the dimer neighbours list. 
+					# 4.3.2.2: If the following is true, neighbour mol 2 is dimer mol 1, so we dont want to include this molecule in the dimer neighbours list. 
 					# Note: Because dimer1 is in the origin, neighbour 2 is mol_name 1 if dimer_unit_cell_displacement + neighbour_unit_cell_displacement = (0,0,0)
 					pass
-				elif (dimer_key in neighbouring_molecules_about_dimers.keys()) and (neighbour_information in neighbouring_molecules_about_dimers[dimer_key].keys()):
-					# 2.2.2.3: If this statement is true, we already have included this molecule in the neighbour list, dont't need to double count it.
+				elif neighbour_information in neighbours_about_dimer:
+					# 4.3.2.3: If this statement is true, we already have included this molecule in the neighbour list, dont't need to double count it.
 					pass
 				else:
-					# 2.2.2.4: Include this molecule with details given in neighbour_information in neighbouring_molecules_about_dimers for this dimer.
-					#neighbour_of_dm2_displacement_test = convert_ijk_to_displacement_vector(neighbour_of_dm2_unit_cell_displacement, crystal_cell_lattice)
-					neighbour_of_dm2_displacement = dimer_displacement + neighbour_displacement
-					neighbouring_molecules_about_dimers.setdefault(dimer_key,{})[neighbour_information] = neighbour_of_dm2_displacement
+					# 4.3.2.4: Include this molecule with details given in neighbour_information in neighbouring_molecules_about_dimers for this dimer.
+					neighbours_about_dimer[neighbour_information] = dimer_displacement + neighbour_displacement
 
-	import pdb; pdb.set_trace()
+		# 4.4: Do not record dimers that have no neighbouring molecules.
+		if len(neighbours_about_dimer) == 0:
+			del neighbouring_molecules_about_dimers[dimer_key]
 
-	# Third, return neighbouring_molecules_about_dimers
+	# Fifth, return neighbouring_molecules_about_dimers
 	return neighbouring_molecules_about_dimers
 
+def get_neighbour_tables(neighbourhood_molecules_for_environment_method):
+	"""
+	This method will give the molecules that neighbour each origin cell molecule in the crystal.
+
+	Parameters
+	----------
+	neighbourhood_molecules_for_environment_method : list
+		This is the list of all the information about the neighbouring molecules in the crystal. 
+
+	Returns
+	-------
+	neighbour_tables : dict.
+		These are the molecules that neighbour each origin cell molecule, given as {mol_name1: [(index in neighbourhood_molecules_for_environment_method, (mol_name2, unit_cell_displacement, displacement, shortest_distance)), ...]}.
+	"""
+	neighbour_tables = {}
+	for neighbour_index, (mol_name1, mol_name2, unit_cell_displacement, displacement, shortest_distance) in enumerate(neighbourhood_molecules_for_environment_method):
+		neighbour_tables.setdefault(mol_name1,[]).append((neighbour_index, (mol_name2, unit_cell_displacement, displacement, shortest_distance)))
+	return neighbour_tables
+
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - 
 
 
@@ -0,0 +1,94 @@
+"""
+Nearest_Atoms_Search_Engine.py, Geoffrey Weal, 17/10/26
+
+This script is designed to determine if any atom in one molecule is within some distance of any atom in another (translated) molecule, using a KD-tree rather than comparing every pair of atoms.
+"""
+import numpy as np
+from scipy.spatial import cKDTree
+
+class Nearest_Atoms_Search_Engine:
+	"""
+	This object is designed to quickly determine the shortest distance between the atoms of two molecules, where the second molecule is translated by some displacement.
+
+	A KD-tree is built once for the first molecule of each neighbouring pair (keyed by the name of the molecule), and the translated positions of the second molecule are then queried against this KD-tree in a single vectorised call.
+
+	Parameters
+	----------
+	max_distance : float.
+		This is the maximum distance that atoms in two molecules can be within each other for the two molecules to be considered neighbouring. Given in Å.
+	"""
+	def __init__(self, max_distance):
+
+		# First, save the input variables.
+		self.max_distance = max_distance
+
+		# Second, we will only look for atoms within this distance.
+		#         * A small amount is added on so that distances that round (to 4 d.p.) to max_distance are still found.
+		self.distance_upper_bound = max_distance + 1e-4
+
+		# Third, initialise the dictionary for holding the KD-trees of the molecules.
+		self.kd_trees = {}
+
+	# -----------------------------------------------------------------------------------------------------------------------
+
+	def get_kd_tree(self, mol_name, positions):
+		"""
+		This method will return the KD-tree for molecule mol_name, creating it if it has not been created yet.
+
+		Parameters
+		----------
+		mol_name : int
+			This is the name of the molecule.
+		positions : numpy.array
+			These are the positions of atoms in the molecule.
+
+		Returns
+		-------
+		kd_tree : scipy.spatial.cKDTree
+			This is the KD-tree of the positions of atoms in the molecule.
+		"""
+		if not (mol_name in self.kd_trees):
+			self.kd_trees[mol_name] = cKDTree(np.asarray(positions, dtype=float))
+		return self.kd_trees[mol_name]
+
+	# -----------------------------------------------------------------------------------------------------------------------
+
+	def are_molecules_within_max_distance(self, mol_name1, positions1, positions2, displacement):
+		"""
+		This method will determine if two molecules are within max_distance of each other.
+
+		Parameters
+		----------
+		mol_name1 : int
+			This is the name of molecule 1. This is used to reuse the KD-tree of molecule 1 across all displacements of molecule 2.
+		positions1 : numpy.array
+			These are the positions of atoms in molecule 1.
+		positions2 : numpy.array
+			These are the positions of atoms in molecule 2.
+		displacement : numpy.array
+			This is the displacement to move molecule 2 by.
+
+		Returns
+		-------
+		are_molecules_within_max_neighbour_distance : bool.
+			True if these two molecules are within max_distance of each other. False if not.
+		shortest_distance : float
+			This is the shortest distance between the two molecules (rounded to 4 d.p.). This is given as infinity if no atoms are within max_distance of each other.
+		"""
+
+		# First, obtain the KD-tree for molecule 1.
+		kd_tree = self.get_kd_tree(mol_name1, positions1)
+
+		# Second, obtain the distance from each atom in the displaced molecule 2 to the closest atom in molecule 1.
+		#         * Atoms with no neighbours within distance_upper_bound will be given a distance of infinity.
+		distances, _ = kd_tree.query(np.asarray(positions2, dtype=float) + displacement, k=1, distance_upper_bound=self.distance_upper_bound)
+
+		# Third, determine the shortest distance between the two molecules.
+		shortest_distance = float(distances.min()) if (len(distances) > 0) else float('inf')
+		if not (shortest_distance == float('inf')):
+			shortest_distance = round(shortest_distance, 4)
+
+		# Fourth, determine if the distance is less than the maximum distance
+		return (shortest_distance <= self.max_distance), shortest_distance
+
+# ---------------------------------------------------------------------------------------------------------------------------
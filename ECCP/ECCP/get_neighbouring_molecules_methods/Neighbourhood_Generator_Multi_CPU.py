@@ -7,15 +7,13 @@ Used for Multi-CPU nighbourhood methods.
 """
 import numpy as np
 
-from ECCP.ECCP.get_neighbouring_molecules_methods.Neighbourhood_Generator_supporting_methods.get_wrapped_complete_components_ijk_lengths import get_wrapped_complete_components_ijk_lengths
-from SUMELF import remove_hydrogens
 from SUMELF import Cell_Generator, convert_ijk_to_displacement_vector
 
 class Neighbourhood_Generator_Multi_CPU:
 	"""
 	This object is designed to generator all the neighbours that are possible between molecules in a crystal. 
 
-	Used for Multi-CPU neighbourhood methods.
+	Used for Multi-CPU neighbourhood methods. This object is only given the positions and ijk placements of the two molecules (rather than the molecules and their graphs), so that it can be made from the arrays held in shared memory. 
 
 	Parameters
 	----------
@@ -23,40 +21,32 @@ class Neighbourhood_Generator_Multi_CPU:
 		This is the name of molecule 1.
 	mol_name2 : int
 		This is the name of molecule 2.
-	molecule1 : ase.Atoms object
-		This is the ase.Atoms object for molecule 1. 
-	molecule2 : ase.Atoms object
-		This is the ase.Atoms object for molecule 2. 
-	molecule_graph1 : networkx.Graph
-		This is the graph that recording the bonding structure in molecule 1. 
-	molecule_graph2 : networkx.Graph
-		This is the graph that recording the bonding structure in molecule 2. 
+	positions1 : numpy.array
+		These are the positions of the atoms in molecule 1, with hydrogens removed. 
+	positions2 : numpy.array
+		These are the positions of the atoms in molecule 2, with hydrogens removed. 
+	molecule_1_translations : list of (int, int, int)
+		These are the sorted ijk placements of the components of wrapped molecule 1 (see get_wrapped_complete_components_ijk_lengths). 
+	molecule_2_translations : list of (int, int, int)
+		These are the sorted ijk placements of the components of wrapped molecule 2 (see get_wrapped_complete_components_ijk_lengths). 
 	crystal_cell_lattice : numpy.array
 		This is the matrix of the unit cell for the crystal.
 	"""
-	def __init__(self, mol_name1, mol_name2, molecule1, molecule2, molecule_graph1, molecule_graph2, crystal_cell_lattice):
+	def __init__(self, mol_name1, mol_name2, positions1, positions2, molecule_1_translations, molecule_2_translations, crystal_cell_lattice):
 
 		# First, save the input variables
 		self.mol_name1            = mol_name1
 		self.mol_name2            = mol_name2
-		self.molecule1            = molecule1
-		self.molecule2            = molecule2
-		self.molecule_graph1      = molecule_graph1
-		self.molecule_graph2      = molecule_graph2
 		self.crystal_cell_lattice = crystal_cell_lattice
 		self.origin_cell_point    = np.array((0,0,0))
 
-		# Second, obtain the ijk placements of the components of the wrapped molecule. 
-		self.molecule_1_translations = sorted(get_wrapped_complete_components_ijk_lengths(molecule1, molecule_graph1, crystal_cell_lattice))
-		self.molecule_2_translations = sorted(get_wrapped_complete_components_ijk_lengths(molecule2, molecule_graph2, crystal_cell_lattice))
+		# Second, save the ijk placements of the components of the wrapped molecules. 
+		self.molecule_1_translations = molecule_1_translations
+		self.molecule_2_translations = molecule_2_translations
 
-		# Third, remove all hydrogen from the molecule, as we dont want to include hydeogens in our analysis
-		self.molecule1_with_no_hydrogens = remove_hydrogens(molecule1)
-		self.molecule2_with_no_hydrogens = remove_hydrogens(molecule2)
-
-		# Fourth, get the positions of the molecules with no hydrogens.
-		self.positions1 = self.molecule1_with_no_hydrogens.get_positions()
-		self.positions2 = self.molecule2_with_no_hydrogens.get_positions()
+		# Third, save the positions of the molecules with no hydrogens.
+		self.positions1 = positions1
+		self.positions2 = positions2
 
 	# -----------------------------------------------------------------------------------------------------------------------
 
@@ -0,0 +1,104 @@
+"""
+Shared_Array_Arena.py, Geoffrey Weal, 17/10/26
+
+This object is designed to hold numpy arrays in shared memory, so that multiprocessing workers can read them without each task needing to be sent (pickled) a copy of the data.
+"""
+import numpy as np
+from multiprocessing import shared_memory
+
+class Shared_Array_Arena:
+	"""
+	This object is designed to hold numpy arrays in a single block of shared memory.
+
+	The workers are only given the layout of the arena (see get_layout), which is small, and then attach to the arena using attach_shared_array_arena.
+
+	Parameters
+	----------
+	arrays : dict. of numpy.arrays
+		These are the arrays to place in shared memory, given as {name of array: array}.
+	"""
+	def __init__(self, arrays):
+
+		# First, determine where each array will be placed in the shared memory block.
+		#        * Each array is placed on an 8 byte boundary.
+		self.layout = {}
+		total_no_of_bytes = 0
+		for array_name, array in arrays.items():
+			array = np.ascontiguousarray(array)
+			self.layout[array_name] = (total_no_of_bytes, array.shape, array.dtype.str)
+			total_no_of_bytes += -(-array.nbytes // 8) * 8
+
+		# Second, create the shared memory block.
+		self.shared_memory = shared_memory.SharedMemory(create=True, size=max(total_no_of_bytes, 1))
+
+		# Third, copy each array into the shared memory block.
+		self.arrays = get_arrays_from_shared_memory(self.shared_memory, self.layout)
+		for array_name, array in arrays.items():
+			self.arrays[array_name][...] = array
+
+	def get_layout(self):
+		"""
+		This method will give the information needed by a worker to attach to this arena.
+
+		Returns
+		-------
+		arena_layout : tuple
+			This is given as (name of the shared memory block, {name of array: (offset in bytes, shape, dtype)}).
+		"""
+		return (self.shared_memory.name, self.layout)
+
+	def close(self):
+		"""
+		This method will release the shared memory block. This should only be called after all the workers have finished.
+		"""
+		self.arrays = {}
+		self.shared_memory.close()
+		self.shared_memory.unlink()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+# ---------------------------------------------------------------------------------------------------------------
+
+def attach_shared_array_arena(arena_layout):
+	"""
+	This method is designed to allow a worker to attach to a Shared_Array_Arena.
+
+	Parameters
+	----------
+	arena_layout : tuple
+		This is the layout of the arena, given by Shared_Array_Arena.get_layout.
+
+	Returns
+	-------
+	attached_shared_memory : multiprocessing.shared_memory.SharedMemory
+		This is the shared memory block. This needs to be kept for as long as the arrays are used.
+	arrays : dict. of numpy.arrays
+		These are the arrays in the arena. These should only be read from.
+	"""
+	shared_memory_name, layout = arena_layout
+	attached_shared_memory = shared_memory.SharedMemory(name=shared_memory_name)
+	return attached_shared_memory, get_arrays_from_shared_memory(attached_shared_memory, layout)
+
+def get_arrays_from_shared_memory(block_of_shared_memory, layout):
+	"""
+	This method is designed to obtain numpy arrays that view a block of shared memory.
+
+	Parameters
+	----------
+	block_of_shared_memory : multiprocessing.shared_memory.SharedMemory
+		This is the shared memory block.
+	layout : dict.
+		This is the position of each array in the block, given as {name of array: (offset in bytes, shape, dtype)}.
+
+	Returns
+	-------
+	arrays : dict. of numpy.arrays
+		These are the arrays that view the shared memory block.
+	"""
+	return {array_name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=block_of_shared_memory.buf, offset=offset) for array_name, (offset, shape, dtype) in layout.items()}
+
+# ---------------------------------------------------------------------------------------------------------------
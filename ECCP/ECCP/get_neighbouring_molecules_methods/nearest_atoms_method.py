@@ -3,15 +3,18 @@ general_methods.py, Geoffrey Weal, 17/2/22
 
 This script includes methods for obtaining neighbours by looking for molecules with non-hydrogen atoms within the vicinity of each other.
 """
-import sys
+import numpy as np
 from tqdm import tqdm
 
 import multiprocessing as mp
-from tqdm.contrib.concurrent import process_map
+from multiprocessing.util import Finalize
 
-from SUMELF import get_distance, make_folder, remove_folder
+from SUMELF import remove_hydrogens
 from ECCP.ECCP.get_neighbouring_molecules_methods.Neighbourhood_Generator           import Neighbourhood_Generator
 from ECCP.ECCP.get_neighbouring_molecules_methods.Neighbourhood_Generator_Multi_CPU import Neighbourhood_Generator_Multi_CPU
+from ECCP.ECCP.get_neighbouring_molecules_methods.Nearest_Atoms_Search_Engine       import Nearest_Atoms_Search_Engine
+from ECCP.ECCP.get_neighbouring_molecules_methods.Shared_Array_Arena                import Shared_Array_Arena, attach_shared_array_arena
+from ECCP.ECCP.get_neighbouring_molecules_methods.Neighbourhood_Generator_supporting_methods.get_wrapped_complete_components_ijk_lengths import get_wrapped_complete_components_ijk_lengths
 
 def get_neighbours_nearest_atoms_method(molecules, molecule_graphs, max_distance, include_hydrogens_in_neighbour_analysis=False, no_of_cpus=1):
 	"""
@@ -53,6 +56,9 @@ def obtain_neighbours_with_multi_cpu(molecules, molecule_graphs, max_distance, n
 	"""
 	This method will obtain the molecules in the neighbourhood of molecules in the origin unit cell. 
 
+	The positions (without hydrogens) and the ijk placements of the wrapped components of each molecule are obtained once and placed in shared memory. 
+	Each task is then only given the indices of the two molecules to examine, rather than copies of the molecules and their graphs. 
+
 	Parameters
 	----------
 	molecules : list of ase.Atoms objects.
@@ -70,100 +76,171 @@ def obtain_neighbours_with_multi_cpu(molecules, molecule_graphs, max_distance, n
 		This is a list of all the molecules that neighbour each other within the vicinity given by max_distance.
 	"""
 
-	# First, create the manager to save lists to
-	with mp.Manager() as manager:
+	# First, obtain the names of the molecules and the cell of the crystal.
+	mol_names = sorted(molecules.keys())
+	crystal_cell_lattice = np.array(molecules[mol_names[0]].get_cell())
+
+	# Second, obtain the arrays that hold the information about all the molecules. 
+	molecule_arrays = get_molecule_arrays(molecules, molecule_graphs, mol_names, crystal_cell_lattice)
+
+	# Third, obtain the number of neighbourhood sets.
+	no_of_neighbourhood_sets = int((len(mol_names) * (len(mol_names) + 1)) / 2)
+
+	# Fourth, place the arrays in shared memory, and obtain the neighbouring molecules over the pool of workers.
+	#         * Each worker attaches to the shared memory once when it starts.
+	#         * Results are returned in the same order as the tasks.
+	with Shared_Array_Arena(molecule_arrays) as molecule_arena:
+		with mp.Pool(processes=no_of_cpus, initializer=set_molecule_arena_for_worker, initargs=(molecule_arena.get_layout(), mol_names, max_distance)) as pool:
+			input_values = tqdm(get_inputs(len(mol_names)), total=no_of_neighbourhood_sets, desc='Obtaining neighbouring pairs of molecules', unit='calc')
+			chunksize = max(no_of_neighbourhood_sets // (no_of_cpus * 8), 1)
+			neighbourhood_molecules_info = []
+			for neighbourhood_molecules_info_for_pair in pool.imap(obtain_neighbours_method_for_multi_cpu, input_values, chunksize=chunksize):
+				neighbourhood_molecules_info += neighbourhood_molecules_info_for_pair
+			# Let the workers exit normally so that each worker closes its attachment to the shared memory.
+			pool.close()
+			pool.join()
+
+	# Fifth, return neighbourhood_molecules_info
+	return neighbourhood_molecules_info
+
+def get_molecule_arrays(molecules, molecule_graphs, mol_names, crystal_cell_lattice):
+	"""
+	This method is designed to obtain the arrays that hold the information about all the molecules, to be placed in shared memory.
 
-		# Second, create the list to collect information on the neighbouring molecules in the crystal. 
-		neighbourhood_molecules_info = manager.list()
+	The information about molecule mol_names[index] is given by array[offsets[index]:offsets[index+1]]
+
+	Parameters
+	----------
+	molecules : list of ase.Atoms objects.
+		These are all the individual molecules identified in the crystal that you want to determine neighbours for.
+	molecule_graphs : list of networkx.graph
+		This is a list of all the networkx graphs that describe the bonding system for each molecule. 
+	mol_names : list
+		These are the sorted names of the molecules.
+	crystal_cell_lattice : numpy.array
+		This is the matrix of the unit cell for the crystal.
 
-		# Third, obtain the number of neighbourhood sets.
-		no_of_neighbourhood_sets = int((len(molecules) * (len(molecules) + 1)) / 2)
+	Returns
+	-------
+	molecule_arrays : dict. of numpy.arrays
+		These are the arrays that hold the positions (without hydrogens) and the ijk placements of the wrapped components of each molecule, as well as the cell of the crystal.
+	"""
 
-		# Fourth, write warning message to the user.
-		print('Obtaining neighbourhoods between molecules (Please wait until after 100%, as the process will still be running.)', file=sys.stderr)
+	# First, obtain the positions of each molecule with no hydrogens, as we dont want to include hydeogens in our analysis.
+	all_positions = [remove_hydrogens(molecules[mol_name]).get_positions() for mol_name in mol_names]
 
-		# Fifth, obtain the input value generator. 
-		input_values = tqdm(get_inputs(molecules, molecule_graphs, max_distance, neighbourhood_molecules_info), total=no_of_neighbourhood_sets, desc='Obtaining neighbouring pairs of molecules', unit='calc')
+	# Second, obtain the ijk placements of the components of each wrapped molecule.
+	#         * These are obtained once for each molecule here, rather than for every pair of molecules.
+	all_translations = [np.array(sorted(get_wrapped_complete_components_ijk_lengths(molecules[mol_name], molecule_graphs[mol_name], crystal_cell_lattice)), dtype=int).reshape(-1,3) for mol_name in mol_names]
 
-		# Sixth, run the multiprocessing jobs.
-		#process_map(obtain_neighbours_method_for_multi_cpu, get_inputs(molecules, molecule_graphs, max_distance, neighbourhood_molecules_info), total=no_of_neighbourhood_sets, desc='Obtaining neighbouring pairs of molecules', unit='calc', max_workers=no_of_cpus)
-		pool = mp.Pool(processes=no_of_cpus)
-		pool.map_async(obtain_neighbours_method_for_multi_cpu, input_values)
-		pool.close()
-		pool.join()
+	# Third, concatenate the information from all molecules into single arrays.
+	molecule_arrays = {}
+	molecule_arrays['positions']            = np.concatenate(all_positions).reshape(-1,3)
+	molecule_arrays['positions_offsets']    = np.cumsum([0]+[len(positions) for positions in all_positions])
+	molecule_arrays['translations']         = np.concatenate(all_translations).reshape(-1,3)
+	molecule_arrays['translations_offsets'] = np.cumsum([0]+[len(translations) for translations in all_translations])
+	molecule_arrays['crystal_cell_lattice'] = np.array(crystal_cell_lattice, dtype=float)
 
-		# Seventh, save the list from a multiprocessing Manager list to a regular list
-		neighbourhood_molecules_info = list(neighbourhood_molecules_info)
-		
-	# Eighth, return neighbourhood_molecules_info
-	return neighbourhood_molecules_info
+	# Fourth, return molecule_arrays
+	return molecule_arrays
 
-def get_inputs(molecules, molecule_graphs, max_distance, neighbourhood_molecules_info):
+def get_inputs(no_of_molecules):
 	"""
 	This method a generator designed to obtain the inputs for obtaining neighbours with multiple CPUs.
 
 	Parameters
 	----------
-	molecules : list of ase.Atoms objects.
-		These are all the individual molecules identified in the crystal that you want to determine neighbours for.
-	molecule_graphs : list of networkx.graph
-		This is a list of all the networkx graphs that describe the bonding system for each molecule. 
-	max_distance : float.
-		This is the maximum distance that atoms in two molecules can be within each other for the two molecules to be considered neighbouring. Given in Å. 
-	neighbourhood_molecules_info : list
-		This is a list of all the molecules that neighbour each other within the vicinity given by max_distance.
+	no_of_molecules : int
+		This is the number of molecules in the crystal. 
+
+	Returns
+	-------
+	index1 : int
+		This is the index of molecule 1 in the sorted list of molecule names.
+	index2 : int
+		This is the index of molecule 2 in the sorted list of molecule names. This could be the same molecule as index1, but will be displaced to a different position.
 	"""
+	for index1 in range(no_of_molecules):
+		for index2 in range(index1,no_of_molecules): 
+			yield (index1, index2)
 
-	# First, obtain the names of the molecules.
-	mol_names = sorted(molecules.keys())
+# ---------------------------------------------------------------------------------------------------------------
 
-	# Second, get the first molecule/monomer. 
-	for index1 in range(len(mol_names)):
+# This holds the information about the molecules for each worker. This is set when each worker starts by set_molecule_arena_for_worker.
+worker_molecule_arena = {}
+
+def set_molecule_arena_for_worker(arena_layout, mol_names, max_distance):
+	"""
+	This method is run when each worker starts, and attaches the worker to the shared memory that holds the information about the molecules.
 
-		# Third, obtain the molecule name, the molecule, and the associated graph of molecule mol_name1
-		mol_name1       = mol_names[index1]
-		molecule1       = molecules[mol_name1]
-		molecule_graph1 = molecule_graphs[mol_name1]
+	Parameters
+	----------
+	arena_layout : tuple
+		This is the layout of the Shared_Array_Arena holding the molecule arrays.
+	mol_names : list
+		These are the sorted names of the molecules.
+	max_distance : float.
+		This is the maximum distance that atoms in two molecules can be within each other for the two molecules to be considered neighbouring. Given in Å. 
+	"""
+	attached_shared_memory, molecule_arrays = attach_shared_array_arena(arena_layout)
+	worker_molecule_arena['shared_memory']   = attached_shared_memory
+	worker_molecule_arena['molecule_arrays'] = molecule_arrays
+	worker_molecule_arena['mol_names']       = mol_names
+	worker_molecule_arena['max_distance']    = max_distance
 
-		# Fourth, get the second molecule/monomer. This could be the same molecule as index1, but will be displaced to a different position.
-		for index2 in range(index1,len(molecules)): 
+	# Close the attachment of this worker to the shared memory when the worker exits.
+	Finalize(None, close_molecule_arena_for_worker, exitpriority=10)
 
-			# Fifth, obtain the molecule name, the molecule, and the associated graph of molecule mol_name2
-			mol_name2       = mol_names[index2]
-			molecule2       = molecules[mol_name2]
-			molecule_graph2 = molecule_graphs[mol_name2]
+def close_molecule_arena_for_worker():
+	"""
+	This method is run when each worker exits, and closes the attachment of the worker to the shared memory that holds the information about the molecules.
 
-			# Sixth, yield the inputs.
-			yield (mol_name1, mol_name2, molecule1, molecule2, molecule_graph1, molecule_graph2, max_distance, neighbourhood_molecules_info)
+	The arrays that view the shared memory are removed first, as the shared memory can not be closed while they exist.
+	"""
+	worker_molecule_arena.pop('molecule_arrays', None)
+	attached_shared_memory = worker_molecule_arena.pop('shared_memory', None)
+	if attached_shared_memory is not None:
+		attached_shared_memory.close()
 
 def obtain_neighbours_method_for_multi_cpu(input_variables):
 	"""
-	This method will obtain neighbourhood information between molecules in the crystal based on the distances the closest atoms in each molecule. 
+	This method will obtain neighbourhood information between two molecules in the crystal based on the distances the closest atoms in each molecule. 
 
 	Parameters
 	----------
-	molecules : list of ase.Atoms objects.
-		These are all the individual molecules identified in the crystal that you want to determine neighbours for.
-	molecule_graphs : list of networkx.graph
-		This is a list of all the networkx graphs that describe the bonding system for each molecule. 
-	max_distance : float.
-		This is the maximum distance that atoms in two molecules can be within each other for the two molecules to be considered neighbouring. Given in Å. 
-	no_of_cpus : int.
-		This is the number of cpus available to use on this program. In most cases this should just be set to 1 cpu, however for very large system you may want to implement multiple cpus.
+	input_variables : (int, int)
+		These are the indices of molecule 1 and molecule 2 in the sorted list of molecule names.
+
+	Returns
+	-------
 	neighbourhood_molecules_info : list
-		This is a list of all the molecules that neighbour each other within the vicinity given by max_distance.
+		This is a list of all the neighbouring pairs of molecule 1 and molecule 2 within the vicinity given by max_distance.
 	"""
 
-	# First, obtain the variables for processing from the input_variables list.
-	mol_name1, mol_name2, molecule1, molecule2, molecule_graph1, molecule_graph2, max_distance, neighbourhood_molecules_info = input_variables
-
-	# Second, create the neighbourhood generator that will create all the neighbouring pairs between molecules that could exist in the crystal.
-	neighbourhood_generator_object = Neighbourhood_Generator_Multi_CPU(mol_name1, mol_name2, molecule1, molecule2, molecule_graph1, molecule_graph2, molecule1.get_cell())
+	# First, obtain the variables for processing from the input_variables and the shared memory.
+	index1, index2  = input_variables
+	molecule_arrays = worker_molecule_arena['molecule_arrays']
+	mol_names       = worker_molecule_arena['mol_names']
+	positions, positions_offsets       = molecule_arrays['positions'],    molecule_arrays['positions_offsets']
+	translations, translations_offsets = molecule_arrays['translations'], molecule_arrays['translations_offsets']
+
+	# Second, obtain the positions and ijk placements of molecule 1 and molecule 2.
+	positions1 = positions[positions_offsets[index1]:positions_offsets[index1+1]]
+	positions2 = positions[positions_offsets[index2]:positions_offsets[index2+1]]
+	molecule_1_translations = [tuple(int(value) for value in translation) for translation in translations[translations_offsets[index1]:translations_offsets[index1+1]]]
+	molecule_2_translations = [tuple(int(value) for value in translation) for translation in translations[translations_offsets[index2]:translations_offsets[index2+1]]]
+
+	# Third, create the neighbourhood generator that will create all the neighbouring pairs between molecules that could exist in the crystal.
+	neighbourhood_generator_object = Neighbourhood_Generator_Multi_CPU(mol_names[index1], mol_names[index2], positions1, positions2, molecule_1_translations, molecule_2_translations, molecule_arrays['crystal_cell_lattice'])
 	neighbourhood_generator = neighbourhood_generator_object.generator()
 
-	# Third, obtain the list of molecules that are neighbours. These are molecules that are within max_distance distance of each other. 
-	obtain_neighbours(neighbourhood_generator, max_distance, 'Neighbourhood_Generator_Multi_CPU', neighbourhood_molecules_info)
-			
+	# Fourth, obtain the list of molecules that are neighbours. These are molecules that are within max_distance distance of each other. 
+	neighbourhood_molecules_info = []
+	obtain_neighbours(neighbourhood_generator, worker_molecule_arena['max_distance'], 'Neighbourhood_Generator_Multi_CPU', neighbourhood_molecules_info)
+
+	# Fifth, return the neighbouring pairs of molecule 1 and molecule 2.
+	return neighbourhood_molecules_info
+
 # ===============================================================================================================
 # ===============================================================================================================
 # ===============================================================================================================
@@ -225,53 +302,23 @@ def obtain_neighbours(neighbourhood_generator, max_distance, generator_type, nei
 		This list is for recording information about which molecules neighbour each other in the crystal. 
 	"""
 
-	# First, identify neighbouring pairs of molecules based on if there are any atoms in each molecule that are within max_distance distance of each other
+	# First, create the search engine for determining if atoms in each molecule are within max_distance of each other.
+	#        * This will hold a KD-tree for each molecule so that each KD-tree is only created once. 
+	nearest_atoms_search_engine = Nearest_Atoms_Search_Engine(max_distance)
+
+	# Second, identify neighbouring pairs of molecules based on if there are any atoms in each molecule that are within max_distance distance of each other
 	for mol_name1, mol_name2, positions1, positions2, displacement, unit_cell_displacement in neighbourhood_generator:
 		
-		# Second, if any atom between each molecule is within max_distance, you have a neighbouring pair. 
-		are_molecules_within_max_neighbour_distance, shortest_distance = determine_if_molecules_within_max_distance(positions1, positions2, displacement, max_distance)
+		# Third, if any atom between each molecule is within max_distance, you have a neighbouring pair. 
+		are_molecules_within_max_neighbour_distance, shortest_distance = nearest_atoms_search_engine.are_molecules_within_max_distance(mol_name1, positions1, positions2, displacement)
 		if are_molecules_within_max_neighbour_distance:
 			neighbourhood_molecules_info.append((mol_name1, mol_name2, unit_cell_displacement, displacement, shortest_distance))
 
-		# Third, send the result of if the neighbouring pair of molecules was accepted or not back to the generator.
+		# Fourth, send the result of if the neighbouring pair of molecules was accepted or not back to the generator.
 		end_of_for_loop_check = neighbourhood_generator.send(are_molecules_within_max_neighbour_distance)
 		if not (end_of_for_loop_check == 'Go to get_neighbours method for loop'):
 			raise Exception(f'Communication error of {generator_type} generator with this for loop.')
 
-# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-
-def determine_if_molecules_within_max_distance(positions1, positions2, displacement, max_distance):
-	"""
-	This method will determine if two molecules are within max_distance of each other. 
-
-	Parameters
-	----------
-	positions1 : numpy.array
-		These are the positions of atoms in molecule 1.
-	positions2 : numpy.array
-		These are the positions of atoms in molecule 2.
-	displacement : numpy.array
-		This is the displacement to move molecule 2 by.
-	max_distance : float.
-		This is the maximum distance that atoms in two molecules can be within each other for the two molecules to be considered neighbouring. Given in Å. 
-
-	Returns
-	-------
-	True if these two molecules are within max_distance of each other. False if not. 
-	"""
-
-	# First, determine the shortest distance between the two molecules.
-	shortest_distance = float('inf')
-	for pos_index1 in range(len(positions1)):
-		for pos_index2 in range(len(positions2)):
-			distance = round(get_distance(positions1[pos_index1], positions2[pos_index2] + displacement), 4)
-			# If we have found a distance that is less than max_distance, then these two molcules are a neighbouring pair.
-			if (distance <= shortest_distance):
-				shortest_distance = distance
-
-	# Second, determine if the distance is less than the maximum distance
-	return (shortest_distance <= max_distance), shortest_distance			
-
 # ===============================================================================================================
 # ===============================================================================================================
 # ===============================================================================================================
@@ -0,0 +1,238 @@
+"""
+get_spacegroup_equivalent_dimers.py, Geoffrey Weal, 17/10/26
+
+This script is designed to group together dimers that are images of each other under the space group symmetry operations of the crystal.
+
+Dimers that are images of each other under a space group operation are always structurally equivalent, so only one dimer from each group (the symmetry-inequivalent dimers) needs to be compared using the more expensive equivalence methods.
+"""
+import numpy as np
+
+from pymatgen.io.ase import AseAtomsAdaptor
+from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+
+from ECCP.ECCP.get_unique_molecules_methods.Disjoint_Set import Disjoint_Set
+
+def get_spacegroup_equivalent_dimers(all_dimers_info, molecules, crystal, symprec=0.01):
+	"""
+	This method is designed to group together dimers that are images of each other under the space group symmetry operations of the crystal.
+
+	Parameters
+	----------
+	all_dimers_info : dict.
+		These are the dimers in the crystal, given as {dimer name: (name of molecule 1, name of molecule 2, unit cell ijk displacement of molecule 2, displacement of molecule 2, displacement of dimer COM, shortest distance between molecules in dimer)}
+	molecules : dict. of ase.Atoms
+		These are the molecules that make up the dimers.
+	crystal : ase.Atoms
+		This is the crystal.
+	symprec : float
+		This is the tolerance used to obtain the space group of the crystal and to match atoms between molecules (in Å). Default: 0.01
+
+	Returns
+	-------
+	spacegroup_equivalent_dimer_groups : dict.
+		These are the groups of dimers that are images of each other under the space group operations, given as {symmetry-inequivalent dimer name: sorted list of the names of the dimers in its group (including itself)}. The number of dimers in each group is the multiplicity of that dimer.
+	"""
+
+	# First, obtain the space group operations of the crystal, given in fractional coordinates.
+	structure = AseAtomsAdaptor.get_structure(crystal)
+	spacegroup_analyzer = SpacegroupAnalyzer(structure, symprec=symprec)
+	symmetry_operations = [(symmetry_operation.rotation_matrix, symmetry_operation.translation_vector) for symmetry_operation in spacegroup_analyzer.get_symmetry_operations(cartesian=False)]
+	print('Space group of crystal: '+str(spacegroup_analyzer.get_space_group_symbol())+' ('+str(len(symmetry_operations))+' symmetry operations)')
+
+	# Second, group together the dimers that are images of each other under these symmetry operations.
+	return get_dimer_groups_from_symmetry_operations(all_dimers_info, molecules, np.array(crystal.get_cell()), symmetry_operations, symprec=symprec)
+
+def get_dimer_groups_from_symmetry_operations(all_dimers_info, molecules, cell, symmetry_operations, symprec=0.01):
+	"""
+	This method is designed to group together dimers that are images of each other under the given symmetry operations.
+
+	For a dimer made of molecule 1 and molecule 2 (in unit cell c), if a symmetry operation maps
+		* molecule 1 onto molecule 1' (in unit cell L1), and
+		* molecule 2 onto molecule 2' (in unit cell L2),
+	then the dimer is mapped onto the dimer made of molecule 1' and molecule 2' (in unit cell L2 + R.c - L1), where R is the rotation matrix of the symmetry operation.
+
+	Parameters
+	----------
+	all_dimers_info : dict.
+		These are the dimers in the crystal (see get_spacegroup_equivalent_dimers).
+	molecules : dict. of ase.Atoms
+		These are the molecules that make up the dimers.
+	cell : numpy.array
+		These are the lattice vectors of the crystal, given as a 3x3 array of row vectors.
+	symmetry_operations : list of (numpy.array, numpy.array)
+		These are the symmetry operations of the crystal, given as (rotation matrix, translation vector) in fractional coordinates.
+	symprec : float
+		This is the tolerance used to match atoms between molecules (in Å). Default: 0.01
+
+	Returns
+	-------
+	spacegroup_equivalent_dimer_groups : dict.
+		These are the groups of dimers that are images of each other (see get_spacegroup_equivalent_dimers).
+	"""
+
+	# First, determine which molecule (and which unit cell) each molecule is mapped onto by each symmetry operation.
+	molecule_images = get_molecule_images(molecules, cell, symmetry_operations, symprec)
+
+	# Second, record the name of each dimer by (name of molecule 1, name of molecule 2, unit cell ijk displacement of molecule 2).
+	#         * The same dimer is also given by (name of molecule 2, name of molecule 1, -(unit cell ijk displacement of molecule 2)).
+	dimer_names_by_ijk = {}
+	for dimer_name in sorted(all_dimers_info.keys()):
+		mol_name1, mol_name2, unit_cell_displacement = all_dimers_info[dimer_name][:3]
+		unit_cell_displacement = tuple(int(round(value)) for value in unit_cell_displacement)
+		dimer_names_by_ijk.setdefault((mol_name1, mol_name2, unit_cell_displacement), dimer_name)
+		dimer_names_by_ijk.setdefault((mol_name2, mol_name1, tuple(-value for value in unit_cell_displacement)), dimer_name)
+
+	# Third, join together each dimer with its image under each symmetry operation.
+	dimer_groups = Disjoint_Set(sorted(all_dimers_info.keys()))
+	for dimer_name in sorted(all_dimers_info.keys()):
+		mol_name1, mol_name2, unit_cell_displacement = all_dimers_info[dimer_name][:3]
+		unit_cell_displacement = np.array([int(round(value)) for value in unit_cell_displacement])
+		for (rotation_matrix, translation_vector), images_of_molecules in zip(symmetry_operations, molecule_images):
+
+			# 3.1: Obtain the molecules that molecule 1 and molecule 2 are mapped onto by this symmetry operation.
+			#      * If either molecule is not mapped onto a molecule in the crystal, this symmetry operation is not used for this dimer.
+			if (images_of_molecules[mol_name1] is None) or (images_of_molecules[mol_name2] is None):
+				continue
+			image_mol_name1, image_cell1 = images_of_molecules[mol_name1]
+			image_mol_name2, image_cell2 = images_of_molecules[mol_name2]
+
+			# 3.2: Obtain the unit cell ijk displacement of molecule 2 in the image of this dimer.
+			image_unit_cell_displacement = image_cell2 + np.dot(np.rint(rotation_matrix).astype(int), unit_cell_displacement) - image_cell1
+
+			# 3.3: If the image of this dimer is one of the dimers in the crystal, join them together.
+			image_dimer_name = dimer_names_by_ijk.get((image_mol_name1, image_mol_name2, tuple(int(value) for value in image_unit_cell_displacement)), None)
+			if image_dimer_name is not None:
+				dimer_groups.union(dimer_name, image_dimer_name)
+
+	# Fourth, return the groups of dimers, where each group is represented by the dimer with the lowest name.
+	spacegroup_equivalent_dimer_groups = {}
+	for dimer_names in dimer_groups.get_groups().values():
+		dimer_names = sorted(dimer_names)
+		spacegroup_equivalent_dimer_groups[dimer_names[0]] = dimer_names
+	return spacegroup_equivalent_dimer_groups
+
+def expand_spacegroup_equivalent_dimer_pairs(equivalent_dimer_pairs, spacegroup_equivalent_dimer_groups):
+	"""
+	This method is designed to give all the pairs of equivalent dimers, given the pairs of equivalent symmetry-inequivalent dimers and the groups of dimers that are images of each other under the space group operations.
+
+	Every dimer in a group is equivalent to every other dimer in its group, and to every dimer in the groups of the symmetry-inequivalent dimers that its symmetry-inequivalent dimer is equivalent to.
+
+	Parameters
+	----------
+	equivalent_dimer_pairs : list of (int, int)
+		These are the pairs of symmetry-inequivalent dimers that are equivalent to each other.
+	spacegroup_equivalent_dimer_groups : dict.
+		These are the groups of dimers that are images of each other (see get_spacegroup_equivalent_dimers).
+
+	Returns
+	-------
+	all_equivalent_dimer_pairs : list of (int, int)
+		These are all the pairs of dimers that are equivalent to each other, given as (lower dimer name, higher dimer name) in sorted order.
+	"""
+
+	# First, add all the pairs of dimers within each group.
+	all_equivalent_dimer_pairs = set()
+	for dimer_names in spacegroup_equivalent_dimer_groups.values():
+		for index1 in range(len(dimer_names)):
+			for index2 in range(index1+1, len(dimer_names)):
+				all_equivalent_dimer_pairs.add((dimer_names[index1], dimer_names[index2]))
+
+	# Second, add all the pairs of dimers between the groups of each pair of equivalent symmetry-inequivalent dimers.
+	for dimer_name1, dimer_name2 in equivalent_dimer_pairs:
+		for group_dimer_name1 in spacegroup_equivalent_dimer_groups[dimer_name1]:
+			for group_dimer_name2 in spacegroup_equivalent_dimer_groups[dimer_name2]:
+				if not (group_dimer_name1 == group_dimer_name2):
+					all_equivalent_dimer_pairs.add((min(group_dimer_name1, group_dimer_name2), max(group_dimer_name1, group_dimer_name2)))
+
+	# Third, return all the pairs of equivalent dimers.
+	return sorted(all_equivalent_dimer_pairs)
+
+# ----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def get_molecule_images(molecules, cell, symmetry_operations, symprec):
+	"""
+	This method is designed to determine which molecule (and which unit cell) each molecule is mapped onto by each symmetry operation.
+
+	Parameters
+	----------
+	molecules : dict. of ase.Atoms
+		These are the molecules in the crystal.
+	cell : numpy.array
+		These are the lattice vectors of the crystal, given as a 3x3 array of row vectors.
+	symmetry_operations : list of (numpy.array, numpy.array)
+		These are the symmetry operations of the crystal, given as (rotation matrix, translation vector) in fractional coordinates.
+	symprec : float
+		This is the tolerance used to match atoms between molecules (in Å).
+
+	Returns
+	-------
+	molecule_images : list of dict.
+		For each symmetry operation, this gives {molecule name: (name of the molecule it is mapped onto, unit cell ijk that it is mapped into as a numpy.array)}. This is None for a molecule if it is not mapped onto any molecule.
+	"""
+
+	# First, obtain the elements, fractional positions and centres (in fractional coordinates) of each molecule.
+	inverse_cell = np.linalg.inv(cell)
+	mol_names = sorted(molecules.keys())
+	molecules_elements             = {mol_name: np.array(molecules[mol_name].get_chemical_symbols()) for mol_name in mol_names}
+	molecules_fractional_positions = {mol_name: np.dot(molecules[mol_name].get_positions(), inverse_cell) for mol_name in mol_names}
+	molecules_fractional_centres   = {mol_name: molecules_fractional_positions[mol_name].mean(axis=0) for mol_name in mol_names}
+	molecules_compositions         = {mol_name: tuple(sorted(molecules_elements[mol_name])) for mol_name in mol_names}
+
+	# Second, for each symmetry operation, determine which molecule each molecule is mapped onto.
+	molecule_images = []
+	for rotation_matrix, translation_vector in symmetry_operations:
+		images_of_molecules = {}
+		for mol_name in mol_names:
+
+			# 2.1: Apply the symmetry operation to this molecule.
+			image_fractional_positions = np.dot(molecules_fractional_positions[mol_name], np.transpose(rotation_matrix)) + translation_vector
+			image_fractional_centre    = image_fractional_positions.mean(axis=0)
+
+			# 2.2: Find the molecule that this image lies on top of.
+			#      * The centre of a molecule is mapped onto the centre of its image, so first check that the centres lie on top of each other (up to a lattice translation).
+			#      * Then check that every atom in the image lies on top of an atom of the same element in the other molecule.
+			images_of_molecules[mol_name] = None
+			for other_mol_name in mol_names:
+				if not (molecules_compositions[mol_name] == molecules_compositions[other_mol_name]):
+					continue
+				unit_cell_translation = np.rint(image_fractional_centre - molecules_fractional_centres[other_mol_name])
+				if np.linalg.norm(np.dot(image_fractional_centre - unit_cell_translation - molecules_fractional_centres[other_mol_name], cell)) > symprec:
+					continue
+				if are_atoms_on_top_of_each_other(molecules_elements[mol_name], np.dot(image_fractional_positions - unit_cell_translation, cell), molecules_elements[other_mol_name], np.dot(molecules_fractional_positions[other_mol_name], cell), symprec):
+					images_of_molecules[mol_name] = (other_mol_name, unit_cell_translation.astype(int))
+					break
+
+		molecule_images.append(images_of_molecules)
+
+	# Third, return the images of each molecule under each symmetry operation.
+	return molecule_images
+
+def are_atoms_on_top_of_each_other(elements1, positions1, elements2, positions2, symprec):
+	"""
+	This method is designed to determine if every atom in one molecule lies on top of an atom of the same element in another molecule.
+
+	Parameters
+	----------
+	elements1 : numpy.array of str.
+		These are the elements of the atoms in molecule 1.
+	positions1 : numpy.array
+		These are the positions of the atoms in molecule 1.
+	elements2 : numpy.array of str.
+		These are the elements of the atoms in molecule 2.
+	positions2 : numpy.array
+		These are the positions of the atoms in molecule 2.
+	symprec : float
+		This is the tolerance used to match atoms (in Å).
+
+	Returns
+	-------
+	True if every atom in molecule 1 lies on top of a different atom of the same element in molecule 2, False if not.
+	"""
+	distances = np.linalg.norm(positions1[:,np.newaxis,:] - positions2[np.newaxis,:,:], axis=2)
+	distances[elements1[:,np.newaxis] != elements2[np.newaxis,:]] = np.inf
+	nearest_atoms = np.argmin(distances, axis=1)
+	if np.any(distances[np.arange(len(nearest_atoms)), nearest_atoms] > symprec):
+		return False
+	return len(set(nearest_atoms.tolist())) == len(nearest_atoms)
+
+# ----------------------------------------------------------------------------------------------------------------------------------------------------------
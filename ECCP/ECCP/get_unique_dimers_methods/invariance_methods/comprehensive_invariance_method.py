@@ -54,7 +54,7 @@ def remove_equivalent_dimers_comprehensive_invariance_method(dimers, molecules,
 
 	# Third, determine how the names of molecules can be interchanged to give the same molecule.
 	print('Comprehensive Dimer Method: Examining equivalent atoms between the '+str(len(non_hydrogen_graphs))+' molecules identified. This can take a while with large and complex molecules and molecules with several branches.')
-	equivalent_molecule_names = get_equivalent_molecule_names(non_hydrogen_graphs, include_comparisons_with_itself=True, no_of_cpus=no_of_cpus)
+	equivalent_molecule_names = get_equivalent_molecule_names(non_hydrogen_graphs, include_comparisons_with_itself=True)
 
 	# Fourth, this will indicate if this method will probably take too long to perform. (May need to check to see if this is giving good predictions).
 	determine_number_of_permutations_of_dimers(equivalent_molecule_names)
@@ -10,7 +10,6 @@ from tqdm import trange, tqdm
 import multiprocessing as mp
 from tqdm.contrib.concurrent import process_map
 
-from copy import deepcopy
 from itertools import product
 
 from SUMELF import GraphMatcher, remove_hydrogens
@@ -217,7 +216,7 @@ def compare_two_dimers_generator_way1(em_indices_d2_m1_to_d1_m1, em_indices_d2_m
         # Second, Rearrange the atoms in molecule 1 of dimer 2. This allows the indices of molecule 1 of dimer 2 to be match to molecule 1 of dimer 1.
         idx_d2_m1                                       = get_permutated_indices_list(comparison1)
         d2_m1_reordered_elements                        = [d2_m1_original_elements[index] for index in idx_d2_m1]
-        d2_m1_reordered_positions                       = deepcopy(d2_m1_original_positions)[idx_d2_m1, :]
+        d2_m1_reordered_positions                       = d2_m1_original_positions[idx_d2_m1, :]
         d2_m1_reordered_no_H_attached_to_nonH_atoms     = [d2_m1_no_H_attached_to_nonH_atoms[index] for index in idx_d2_m1]
 
         # Third, for each way that molecule 2 of dimer 2 can be mapped onto molecule 2 or dimer 1.
@@ -226,7 +225,7 @@ def compare_two_dimers_generator_way1(em_indices_d2_m1_to_d1_m1, em_indices_d2_m
             # Fourth, rearrange the atoms in molecule 2 of dimer 2. This allows the indices of molecule 2 of dimer 2 to be match to molecule 2 of dimer 1.
             idx_d2_m2                                   = get_permutated_indices_list(comparison2)
             d2_m2_reordered_elements                    = [d2_m2_original_elements[index] for index in idx_d2_m2]
-            d2_m2_reordered_positions                   = deepcopy(d2_m2_original_positions)[idx_d2_m2, :]
+            d2_m2_reordered_positions                   = d2_m2_original_positions[idx_d2_m2, :]
             d2_m2_reordered_no_H_attached_to_nonH_atoms = [d2_m2_no_H_attached_to_nonH_atoms[index] for index in idx_d2_m2]
 
             # Fifth, get the elements and positions of atoms in d2 for d2 = d2_m1 + d2_m2 (this is because for this comparison, d2_m1 goes with d1_m1, and d2_m2 goes with d1_m2)
@@ -432,7 +431,7 @@ def compare_two_dimers_generator_way2(em_indices_d2_m1_to_d1_m2, em_indices_d2_m
         # Second, Rearrange the atoms in molecule 1 of dimer 2. This allows the indices of molecule 1 of dimer 2 to be match to molecule 2 of dimer 1.
         idx_d2_m1                                       = get_permutated_indices_list(comparison1)
         d2_m1_reordered_elements                        = [d2_m1_original_elements[index] for index in idx_d2_m1]
-        d2_m1_reordered_positions                       = deepcopy(d2_m1_original_positions)[idx_d2_m1, :]
+        d2_m1_reordered_positions                       = d2_m1_original_positions[idx_d2_m1, :]
         d2_m1_reordered_no_H_attached_to_nonH_atoms     = [d2_m1_no_H_attached_to_nonH_atoms[index] for index in idx_d2_m1]
 
         # Third, for each way that molecule 2 of dimer 2 can be mapped onto molecule 1 or dimer 1.
@@ -441,7 +440,7 @@ def compare_two_dimers_generator_way2(em_indices_d2_m1_to_d1_m2, em_indices_d2_m
             # Fourth, rearrange the atoms in molecule 2 of dimer 2. This allows the indices of molecule 2 of dimer 2 to be match to molecule 1 of dimer 1.
             idx_d2_m2                                   = get_permutated_indices_list(comparison2)
             d2_m2_reordered_elements                    = [d2_m2_original_elements[index] for index in idx_d2_m2]
-            d2_m2_reordered_positions                   = deepcopy(d2_m2_original_positions)[idx_d2_m2, :]
+            d2_m2_reordered_positions                   = d2_m2_original_positions[idx_d2_m2, :]
             d2_m2_reordered_no_H_attached_to_nonH_atoms = [d2_m2_no_H_attached_to_nonH_atoms[index] for index in idx_d2_m2]
 
             # Fifth, get the elements and positions of atoms in d2 for d2 = d2_m2 + d2_m1 (this is because d2_m2 goes with d1_m1 here, and d2_m1 goes with d1_m2)
@@ -8,46 +8,42 @@ def determine_number_of_permutations_of_dimers(equivalent_molecule_atom_indices_
 	"""
 	This method is designed to warn the user if the dimer comparisons proceedure will take a long time. 
 
+	The number of ways to map dimer 2 onto dimer 1 is the product of the number of ways to map each molecule in dimer 2 onto its molecule in dimer 1. 
+	As two molecules can only be mapped onto each other if they are the same type of molecule, this is the product of the sizes of the automorphism groups of the two types of molecules in the dimers. 
+	So the number of permutations only need to be determined for each pair of types of molecules, rather than for every pair of dimers.
+
 	Parameters
 	----------
-	equivalent_molecule_atom_indices_comparison : dict.
+	equivalent_molecule_atom_indices_comparison : Equivalent_Molecule_Names
 		This is all the ways that two molecules in non_hydrogen_graphs can map onto each other. 
 	"""
 
-	# First, use equivalent_molecule_atom_indices_comparison to determine the total number of permutations of mapping molecules onto each other that may need to be performed.  
-	permutations_of_indices_in_molecules = {key: len(value) for key, value in equivalent_molecule_atom_indices_comparison.items()}
+	# First, obtain the names of the molecules of each type, along with the number of ways that a molecule of that type can map onto itself.  
+	molecule_types = equivalent_molecule_atom_indices_comparison.get_molecule_types()
 
-	# Second, determine the total number of permutations of mapping dimers onto each other that may need to be performed. 
-	permutations_of_indices_in_dimers = {}
-	for (key1a, key1b) in permutations_of_indices_in_molecules.keys():
-		no_of_perm_molecule1_d1_to_d2 = permutations_of_indices_in_molecules[(key1a, key1b)]
-		for (key2a, key2b) in equivalent_molecule_atom_indices_comparison.keys():
-			no_of_perm_molecule2_d1_to_d2 = permutations_of_indices_in_molecules[(key2a, key2b)]
-			permutations_of_indices_in_dimers[((key1a+1, key1b+1),(key2a+1, key2b+1))] = no_of_perm_molecule1_d1_to_d2 * no_of_perm_molecule2_d1_to_d2
+	# Second, determine the total number of permutations of mapping dimers onto each other that may need to be performed for each pair of types of molecules. 
+	permutations_of_indices_in_dimers = []
+	for index1 in range(len(molecule_types)):
+		mol_names1, no_of_perm_molecule1_d1_to_d2 = molecule_types[index1]
+		for index2 in range(index1, len(molecule_types)):
+			mol_names2, no_of_perm_molecule2_d1_to_d2 = molecule_types[index2]
+			permutations_of_indices_in_dimers.append((mol_names1, mol_names2, no_of_perm_molecule1_d1_to_d2 * no_of_perm_molecule2_d1_to_d2))
 
 	# Third, report any issues. Note: 4096 is 64^2
-	if any([(pid > 4096) for pid in permutations_of_indices_in_dimers.values()]):
+	if any([(pid > 4096) for _, _, pid in permutations_of_indices_in_dimers]):
 		print('----------------------------------------------')
 		print('WARNING FROM INVARIENCE METHOD')
 		print('The invarience method works by determining how to rotate and reflect a dimer ontop of another dimer to determine if the two dimers are variants of each other.')
 		print('However in order to do this, the method needs to determine which atom index in dimer 1 goes with which atom index in dimer 2.')
 		print('It is likely this process will take a long time due to the number of permutations of atom indices of dimer 2 to be rearranged to make a rotational and reflective comparison with dimer 2')
 		print()
-		print('Permutations of indices in molecules (reasonable max is about 64) (given also as (prime number: abundance, ...):')
-		for (mol1_name, mol2_name) in sorted(permutations_of_indices_in_molecules.keys()):
-			if mol1_name == mol2_name:
-				no_of_perms = permutations_of_indices_in_molecules[ (mol1_name, mol2_name) ]
-				print('Molecule '+str(mol1_name)+' with itself: '+str(no_of_perms)+' '+str(get_prime_number_composite(no_of_perms)))
-		for (mol1_name, mol2_name) in sorted(permutations_of_indices_in_molecules.keys()):
-			if mol1_name >= mol2_name: 
-				continue
-			no_of_perms = permutations_of_indices_in_molecules[ (mol1_name, mol2_name) ]
-			print('Molecule '+str(mol1_name)+' with Molecule '+str(mol2_name)+': '+str(no_of_perms)+' '+str(get_prime_number_composite(no_of_perms)))
+		print('Permutations of indices in each type of molecule (reasonable max is about 64) (given also as (prime number: abundance, ...):')
+		for mol_names, no_of_perms in molecule_types:
+			print('Molecules '+str([mol_name+1 for mol_name in mol_names])+': '+str(no_of_perms)+' '+str(get_prime_number_composite(no_of_perms)))
 		print()
-		print('Permutations of indices in dimers (reasonable max is about 4096) given also as (prime number: abundance, ...):')
-		for (mol1_name, mol2_name) in sorted(permutations_of_indices_in_dimers.keys()):
-			no_of_perms = permutations_of_indices_in_dimers[ (mol1_name, mol2_name) ]
-			print('Dimer '+str(mol1_name)+' with Dimer '+str(mol2_name)+': '+str(no_of_perms)+' '+str(get_prime_number_composite(no_of_perms)))
+		print('Permutations of indices in dimers made of each pair of types of molecules (reasonable max is about 4096) given also as (prime number: abundance, ...):')
+		for mol_names1, mol_names2, no_of_perms in permutations_of_indices_in_dimers:
+			print('Dimers of Molecules '+str([mol_name+1 for mol_name in mol_names1])+' with Molecules '+str([mol_name+1 for mol_name in mol_names2])+': '+str(no_of_perms)+' '+str(get_prime_number_composite(no_of_perms)))
 		print('----------------------------------------------')
 
 # ------------------------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,183 @@
+"""
+get_dimer_fingerprints.py, Geoffrey Weal, 17/10/26
+
+This script is designed to give each dimer a cheap fingerprint that does not change if the dimer is translated, rotated, or reflected.
+
+These fingerprints are used to quickly rule out pairs of dimers that can not be symmetric to each other, so that the expensive symmetry tests are only performed on pairs of dimers that could be symmetric.
+"""
+import numpy as np
+
+def get_dimer_fingerprints(dimers, non_hydrogen_molecules_elements, non_hydrogen_molecules_positions):
+    """
+    This method is designed to obtain the fingerprint of each dimer in the dimers dictionary.
+
+    Parameters
+    ----------
+    dimers : dict.
+        This is a dictionary of dimer information, given as (name of molecule 1 in dimer, name of molecule 2 in dimer, unit cell ijk displacement of molecule 2, unit cell displacement of molecule 2, displacement of dimer COM, shortest distance between molecules in dimer)
+    non_hydrogen_molecules_elements : dict. of lists of str.
+        These are the element of all the molecules that can make up the dimers.
+    non_hydrogen_molecules_positions :  dict. of 2d numpy.arrays
+        These are the positions of all the molecules that can make up the dimers.
+
+    Returns
+    -------
+    dimer_fingerprints : dict.
+        This is the fingerprint of each dimer, given as (composition, separation between the centres of the molecules, sorted distances between the atoms of molecule 1 and molecule 2, eigenvalues of the gyration tensor, largest distance of an atom from the centre of the dimer).
+    """
+    dimer_fingerprints = {}
+    for dimer_name, (m1_name, m2_name, _, displacement, _, _) in dimers.items():
+        m1_positions = np.asarray(non_hydrogen_molecules_positions[m1_name], dtype=float)
+        m2_positions = np.asarray(non_hydrogen_molecules_positions[m2_name], dtype=float) + displacement
+        dimer_fingerprints[dimer_name] = get_dimer_fingerprint(non_hydrogen_molecules_elements[m1_name], m1_positions, non_hydrogen_molecules_elements[m2_name], m2_positions)
+    return dimer_fingerprints
+
+def get_dimer_fingerprint(m1_elements, m1_positions, m2_elements, m2_positions):
+    """
+    This method is designed to obtain the fingerprint of a dimer.
+
+    Every part of the fingerprint is the same if the dimer is translated, rotated, or reflected, or if molecule 1 and molecule 2 in the dimer are swapped around.
+
+    Parameters
+    ----------
+    m1_elements : list of str.
+        These are the elements of the atoms in molecule 1 of the dimer.
+    m1_positions : 2D numpy.array
+        These are the positions of the atoms in molecule 1 of the dimer.
+    m2_elements : list of str.
+        These are the elements of the atoms in molecule 2 of the dimer.
+    m2_positions : 2D numpy.array
+        These are the positions of the atoms in molecule 2 of the dimer.
+
+    Returns
+    -------
+    composition : tuple
+        These are the sorted elements of each molecule in the dimer.
+    centre_separation : float
+        This is the distance between the centres of molecule 1 and molecule 2.
+    distance_spectrum : numpy.array
+        These are the sorted distances between each atom in molecule 1 and each atom in molecule 2.
+    gyration_eigenvalues : numpy.array
+        These are the sorted eigenvalues of the gyration tensor of the dimer.
+    max_radius : float
+        This is the largest distance of an atom in the dimer from the centre of the dimer.
+    """
+
+    # First, obtain the composition of the dimer.
+    composition = tuple(sorted([tuple(sorted(m1_elements)), tuple(sorted(m2_elements))]))
+
+    # Second, obtain the distance between the centres of molecule 1 and molecule 2.
+    centre_separation = float(np.linalg.norm(m2_positions.mean(axis=0) - m1_positions.mean(axis=0)))
+
+    # Third, obtain the sorted distances between each atom in molecule 1 and each atom in molecule 2.
+    distance_spectrum = np.sort(np.linalg.norm(m2_positions[np.newaxis,:,:] - m1_positions[:,np.newaxis,:], axis=2), axis=None)
+
+    # Fourth, obtain the eigenvalues of the gyration tensor of the dimer, and the largest distance of an atom from the centre of the dimer.
+    dimer_positions = np.concatenate([m1_positions, m2_positions])
+    dimer_positions = dimer_positions - dimer_positions.mean(axis=0)
+    gyration_eigenvalues = np.linalg.eigvalsh(np.dot(dimer_positions.T, dimer_positions) / len(dimer_positions))
+    max_radius = float(np.max(np.linalg.norm(dimer_positions, axis=1)))
+
+    # Fifth, return the fingerprint of the dimer.
+    return composition, centre_separation, distance_spectrum, gyration_eigenvalues, max_radius
+
+# ----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def get_candidate_dimer_pairs(dimer_names, dimer_fingerprints, max_distance_disparity):
+    """
+    This method is designed to obtain the pairs of dimers that could be symmetric to each other based on their fingerprints.
+
+    Dimers are placed into buckets based on their composition, and are sorted within each bucket by the separation between the centres of their molecules.
+    Only dimers in the same bucket with similar separations have the rest of their fingerprints compared.
+
+    Parameters
+    ----------
+    dimer_names : list
+        These are the names of the dimers, in the order they are compared in.
+    dimer_fingerprints : dict.
+        This is the fingerprint of each dimer (see get_dimer_fingerprint).
+    max_distance_disparity : float
+        This is the maximum difference in relative positions of atoms between dimer 1 and dimer 2 to be considered equivalent/identical
+
+    Returns
+    -------
+    candidate_dimer_pairs : list of (int, int)
+        These are the pairs of indices of dimers in dimer_names that could be symmetric to each other, given as (lower index, higher index) in sorted order.
+    """
+
+    # First, if two dimers are symmetric, every atom in dimer 2 is within max_distance_disparity of its atom in dimer 1 (after rotating/reflecting dimer 2 onto dimer 1).
+    #        * The centres of each molecule can then move by at most max_distance_disparity, so the centre separations can differ by at most 2*max_distance_disparity.
+    #        * Likewise, each distance between two atoms can differ by at most 2*max_distance_disparity.
+    distance_tolerance = 2.0 * max_distance_disparity
+
+    # Second, place the dimers into buckets based on their composition.
+    buckets = {}
+    for dimer_index, dimer_name in enumerate(dimer_names):
+        buckets.setdefault(dimer_fingerprints[dimer_name][0], []).append(dimer_index)
+
+    # Third, compare the fingerprints of dimers in the same bucket that have similar centre separations.
+    candidate_dimer_pairs = []
+    for dimer_indices in buckets.values():
+        dimer_indices = sorted(dimer_indices, key=lambda dimer_index: dimer_fingerprints[dimer_names[dimer_index]][1])
+        for position1, index1 in enumerate(dimer_indices):
+            fingerprint1 = dimer_fingerprints[dimer_names[index1]]
+            for index2 in dimer_indices[position1+1:]:
+                fingerprint2 = dimer_fingerprints[dimer_names[index2]]
+                if fingerprint2[1] - fingerprint1[1] > distance_tolerance:
+                    break
+                if could_dimers_be_symmetric(fingerprint1, fingerprint2, max_distance_disparity):
+                    candidate_dimer_pairs.append((min(index1, index2), max(index1, index2)))
+
+    # Fourth, return the pairs of dimers that could be symmetric, in the same order that all pairs of dimers would be compared in.
+    candidate_dimer_pairs.sort()
+    return candidate_dimer_pairs
+
+def could_dimers_be_symmetric(fingerprint1, fingerprint2, max_distance_disparity):
+    """
+    This method is designed to determine if two dimers could be symmetric to each other based on their fingerprints.
+
+    This method will never say that two symmetric dimers are not symmetric. It can say two dimers could be symmetric when they are not, which is checked later by the full symmetry tests.
+
+    Parameters
+    ----------
+    fingerprint1 : tuple
+        This is the fingerprint of dimer 1 (see get_dimer_fingerprint).
+    fingerprint2 : tuple
+        This is the fingerprint of dimer 2 (see get_dimer_fingerprint).
+    max_distance_disparity : float
+        This is the maximum difference in relative positions of atoms between dimer 1 and dimer 2 to be considered equivalent/identical
+
+    Returns
+    -------
+    True if the two dimers could be symmetric to each other, False if they are definitely not symmetric.
+    """
+
+    # First, obtain the fingerprints of the two dimers.
+    composition1, centre_separation1, distance_spectrum1, gyration_eigenvalues1, max_radius1 = fingerprint1
+    composition2, centre_separation2, distance_spectrum2, gyration_eigenvalues2, max_radius2 = fingerprint2
+    distance_tolerance = 2.0 * max_distance_disparity
+
+    # Second, the two dimers must contain the same molecules.
+    if not (composition1 == composition2):
+        return False
+
+    # Third, the separation between the centres of the molecules in each dimer must be similar.
+    if abs(centre_separation1 - centre_separation2) > distance_tolerance:
+        return False
+
+    # Fourth, the sorted distances between the atoms of molecule 1 and molecule 2 in each dimer must be similar.
+    if not (len(distance_spectrum1) == len(distance_spectrum2)):
+        return False
+    if np.any(np.abs(distance_spectrum1 - distance_spectrum2) > distance_tolerance):
+        return False
+
+    # Fifth, the eigenvalues of the gyration tensor of each dimer must be similar.
+    #        * Each atom moves by at most 2*max_distance_disparity relative to the centre of the dimer, so each eigenvalue can change by at most 2*max_radius*(2*max_distance_disparity) + (2*max_distance_disparity)^2.
+    gyration_tolerance = 2.0 * max(max_radius1, max_radius2) * distance_tolerance + distance_tolerance**2.0
+    if np.any(np.abs(gyration_eigenvalues1 - gyration_eigenvalues2) > gyration_tolerance):
+        return False
+
+    # Sixth, the two dimers could be symmetric.
+    return True
+
+# ----------------------------------------------------------------------------------------------------------------------------------------------------------
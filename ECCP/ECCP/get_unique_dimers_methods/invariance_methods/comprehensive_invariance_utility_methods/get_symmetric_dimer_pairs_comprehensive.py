@@ -4,20 +4,13 @@ get_symmetric_dimer_pairs_comprehensive.py, Geoffrey Weal, 7/2/24
 This script is designed to determine which dimers in the dimers list are symmetric to each other.
 
 """
-import sys
 import numpy as np
-from ctypes import c_bool
-from tqdm import trange, tqdm
+from tqdm import tqdm
 
 import multiprocessing as mp
-from tqdm.contrib.concurrent import process_map
-
-from copy import deepcopy
-from itertools import product
-
-from SUMELF import GraphMatcher, remove_hydrogens
 
 from ECCP.ECCP.get_unique_dimers_methods.invariance_methods.comprehensive_invariance_utility_methods.are_two_dimers_symmetric import are_two_dimers_symmetric_way1, are_two_dimers_symmetric_way2
+from ECCP.ECCP.get_unique_dimers_methods.invariance_methods.comprehensive_invariance_utility_methods.get_dimer_fingerprints   import get_dimer_fingerprints, get_candidate_dimer_pairs
 
 def get_symmetric_dimer_pairs_comprehensive(dimers, non_hydrogen_molecules_elements, non_hydrogen_molecules_positions, all_no_of_H_on_atoms_in_molecule, equivalent_molecule_atom_indices_comparison, max_distance_disparity, neighbouring_molecules_about_dimers, non_hydrogen_molecules, no_of_cpus=1):
     """
@@ -46,7 +39,7 @@ def get_symmetric_dimer_pairs_comprehensive(dimers, non_hydrogen_molecules_eleme
 
     Returns
     -------
-    symmetric_dimer_pairs : list object (either a list or a multiprocessing.Manager.list)
+    symmetric_dimer_pairs : list
         This list is designed to store all the symmetric dimers identified from this program.
     """
 
@@ -56,16 +49,21 @@ def get_symmetric_dimer_pairs_comprehensive(dimers, non_hydrogen_molecules_eleme
     # First, tell the user what you are doing. 
     print('Comparing translational, rotational, and reflective invarience between dimers. '+str(len(dimers))+' dimers to be examined. This can take a while with large and complex dimers.')
 
-    # Second, get the number of comparisons that will be performed. 
-    nn = int((len(dimers)*(len(dimers)-1))/2)
+    # Second, obtain the pairs of dimers that could be symmetric to each other, based on a cheap fingerprint of each dimer. 
+    #         * Pairs of dimers that are obviously not symmetric are not compared using the expensive symmetry tests.
+    dimer_names = sorted(dimers.keys())
+    dimer_fingerprints = get_dimer_fingerprints(dimers, non_hydrogen_molecules_elements, non_hydrogen_molecules_positions)
+    candidate_dimer_pairs = get_candidate_dimer_pairs(dimer_names, dimer_fingerprints, max_distance_disparity)
+    nn = len(candidate_dimer_pairs)
+    print('Of the '+str(int((len(dimers)*(len(dimers)-1))/2))+' pairs of dimers, '+str(nn)+' pairs could be symmetric and will be compared.')
 
-    if True: # no_of_cpus == 1: # If you are using a single cpu, do not use multiprocessing methods
+    if (no_of_cpus == 1) or (nn <= 1): # If you are using a single cpu, do not use multiprocessing methods
 
         # Third, initialise the list to store all the symmetric dimers in.
         symmetric_dimer_pairs = []
     
-        # Forth, initialise the tqdm progress bar to show the user the progress
-        pbar = tqdm(get_inputs(dimers, non_hydrogen_molecules_elements, non_hydrogen_molecules_positions, all_no_of_H_on_atoms_in_molecule, equivalent_molecule_atom_indices_comparison, max_distance_disparity, neighbouring_molecules_about_dimers, non_hydrogen_molecules, symmetric_dimer_pairs, no_of_cpus), total=nn, unit='dimer pair')
+        # Fourth, initialise the tqdm progress bar to show the user the progress
+        pbar = tqdm(get_inputs(dimers, candidate_dimer_pairs, non_hydrogen_molecules_elements, non_hydrogen_molecules_positions, all_no_of_H_on_atoms_in_molecule, equivalent_molecule_atom_indices_comparison, max_distance_disparity, neighbouring_molecules_about_dimers, non_hydrogen_molecules, symmetric_dimer_pairs, no_of_cpus), total=nn, unit='dimer pair')
 
         # Fifth, for each pair of dimers in the dimers list to compare.
         for input_data in pbar:
@@ -85,26 +83,22 @@ def get_symmetric_dimer_pairs_comprehensive(dimers, non_hydrogen_molecules_eleme
 
     else:
 
-        # Seventh, create the manager to save lists to
-        with mp.Manager() as manager:
+        # Seventh, split the pairs of dimers to compare into chunks. Each worker is given a chunk of pairs at a time, rather than one pair at a time.
+        chunk_size = max(int(np.ceil(nn / (no_of_cpus * number_of_chunks_per_cpu))), 1)
+        chunks_of_candidate_dimer_pairs = [candidate_dimer_pairs[index:index+chunk_size] for index in range(0, nn, chunk_size)]
 
-            # Eighth, inialise the boolean object. This is an object that can be saved to rather than a bool.
-            symmetric_dimer_pairs = manager.list()
+        # Eighth, obtain the data that all workers need to compare dimers. This is given to each worker once when the worker is started, rather than with every pair of dimers.
+        comparison_data = (dimers, non_hydrogen_molecules_elements, non_hydrogen_molecules_positions, all_no_of_H_on_atoms_in_molecule, equivalent_molecule_atom_indices_comparison, max_distance_disparity, neighbouring_molecules_about_dimers, non_hydrogen_molecules)
 
-            # Ninth, write a message for the user
-            print('Comparing dimers (Please wait until after 100%, as the process will still be running.)', file=sys.stderr)
-
-            # Tenth, perform compare_two_dimers on each way that dimer 2 can be mapped onto dimer 1 using multiprocessing. 
-            #process_map(get_symmetric_dimer_pairs_single_process, get_inputs(dimers, non_hydrogen_molecules_elements, non_hydrogen_molecules_positions, all_no_of_H_on_atoms_in_molecule, equivalent_molecule_atom_indices_comparison, max_distance_disparity, neighbouring_molecules_about_dimers, non_hydrogen_molecules, symmetric_dimer_pairs), total=nn, unit='dimer pair', desc="Comparing dimers", max_workers=no_of_cpus)
-            pool = mp.Pool(processes=no_of_cpus)
-            pool.map_async(get_symmetric_dimer_pairs_single_process, tqdm(get_inputs(dimers, non_hydrogen_molecules_elements, non_hydrogen_molecules_positions, all_no_of_H_on_atoms_in_molecule, equivalent_molecule_atom_indices_comparison, max_distance_disparity, neighbouring_molecules_about_dimers, non_hydrogen_molecules, symmetric_dimer_pairs, no_of_cpus), total=nn, unit='dimer pair', desc="Comparing dimers"))
-            pool.close()
-            pool.join()
-
-            # Eleventh, get the bool. value from found_dimer_match
-            symmetric_dimer_pairs = list(symmetric_dimer_pairs)
+        # Ninth, compare the chunks of dimer pairs over the pool of workers. Each worker returns the symmetric dimer pairs it found in each chunk.
+        symmetric_dimer_pairs = []
+        with mp.Pool(processes=no_of_cpus, initializer=set_comparison_data_for_worker, initargs=(comparison_data,)) as pool:
+            with tqdm(total=nn, unit='dimer pair', desc='Comparing dimers') as pbar:
+                for number_of_pairs_compared, symmetric_dimer_pairs_in_chunk in pool.imap_unordered(get_symmetric_dimer_pairs_in_chunk, chunks_of_candidate_dimer_pairs):
+                    symmetric_dimer_pairs += symmetric_dimer_pairs_in_chunk
+                    pbar.update(number_of_pairs_compared)
 
-    # Twelfth, sort the dimers.
+    # Tenth, sort the dimers.
     symmetric_dimer_pairs.sort()
 
     # Return symmetric_dimer_pairs
@@ -114,6 +108,50 @@ def get_symmetric_dimer_pairs_comprehensive(dimers, non_hydrogen_molecules_eleme
 # ----------------------------------------------------------------------------------------------------------------------------------------------------------
 # ----------------------------------------------------------------------------------------------------------------------------------------------------------
 
+number_of_chunks_per_cpu = 8
+comparison_data_for_worker = None
+def set_comparison_data_for_worker(comparison_data):
+    """
+    This method is run once when each worker is started. It stores the data needed to compare dimers in the worker, so that this data does not need to be sent with every chunk of dimer pairs.
+
+    Parameters
+    ----------
+    comparison_data : tuple
+        This is (dimers, non_hydrogen_molecules_elements, non_hydrogen_molecules_positions, all_no_of_H_on_atoms_in_molecule, equivalent_molecule_atom_indices_comparison, max_distance_disparity, neighbouring_molecules_about_dimers, non_hydrogen_molecules). This data should only be read by the worker.
+    """
+    global comparison_data_for_worker
+    comparison_data_for_worker = comparison_data
+
+def get_symmetric_dimer_pairs_in_chunk(chunk_of_candidate_dimer_pairs):
+    """
+    This method is designed to compare a chunk of dimer pairs in a worker.
+
+    Parameters
+    ----------
+    chunk_of_candidate_dimer_pairs : list of (int, int)
+        These are the pairs of indices of dimers (in the sorted names of dimers) to compare.
+
+    Returns
+    -------
+    number_of_pairs_compared : int
+        This is the number of dimer pairs compared in this chunk.
+    symmetric_dimer_pairs : list of (int, int)
+        These are the names of the dimer pairs in this chunk that are symmetric to each other.
+    """
+
+    # First, obtain the data stored in this worker when it was started.
+    dimers, non_hydrogen_molecules_elements, non_hydrogen_molecules_positions, all_no_of_H_on_atoms_in_molecule, equivalent_molecule_atom_indices_comparison, max_distance_disparity, neighbouring_molecules_about_dimers, non_hydrogen_molecules = comparison_data_for_worker
+
+    # Second, compare each pair of dimers in this chunk.
+    symmetric_dimer_pairs = []
+    for input_data in get_inputs(dimers, chunk_of_candidate_dimer_pairs, non_hydrogen_molecules_elements, non_hydrogen_molecules_positions, all_no_of_H_on_atoms_in_molecule, equivalent_molecule_atom_indices_comparison, max_distance_disparity, neighbouring_molecules_about_dimers, non_hydrogen_molecules, symmetric_dimer_pairs, 1):
+        get_symmetric_dimer_pairs_single_process(input_data)
+
+    # Third, return the symmetric dimer pairs found in this chunk.
+    return len(chunk_of_candidate_dimer_pairs), symmetric_dimer_pairs
+
+# ----------------------------------------------------------------------------------------------------------------------------------------------------------
+
 shortest_distance_between_dimers_max_threshold_limit = 0.1
 def get_symmetric_dimer_pairs_single_process(input_data):
     """
@@ -224,7 +262,7 @@ def get_symmetric_dimer_pairs_single_process(input_data):
 
 # ----------------------------------------------------------------------------------------------------------------------------------------------------------
 
-def get_inputs(dimers, non_hydrogen_molecules_elements, non_hydrogen_molecules_positions, all_no_of_H_on_atoms_in_molecule, equivalent_molecule_atom_indices_comparison, max_distance_disparity, neighbouring_molecules_about_dimers, non_hydrogen_molecules, symmetric_dimer_pairs, no_of_cpus):
+def get_inputs(dimers, candidate_dimer_pairs, non_hydrogen_molecules_elements, non_hydrogen_molecules_positions, all_no_of_H_on_atoms_in_molecule, equivalent_molecule_atom_indices_comparison, max_distance_disparity, neighbouring_molecules_about_dimers, non_hydrogen_molecules, symmetric_dimer_pairs, no_of_cpus):
     """
     This generator is designed to return all the input methods required for the get_symmetric_dimer_pairs_single_process method. 
 
@@ -232,6 +270,8 @@ def get_inputs(dimers, non_hydrogen_molecules_elements, non_hydrogen_molecules_p
     ----------
     dimers : list
         This is a list of dimer information, given as (index/name of dimer, name of molecule 1 in dimer, name of molecule 2 in dimer, unit cell ijk displacement of molecule 2, unit cell displacement of molecule 2, displacement of dimer COM)
+    candidate_dimer_pairs : list of (int, int)
+        These are the pairs of indices of dimers (in the sorted names of dimers) that could be symmetric to each other. Only these pairs of dimers are yielded.
 
     non_hydrogen_molecules_elements : list
         These are the element of all the molecules that can make up the dimers.
@@ -311,51 +351,53 @@ def get_inputs(dimers, non_hydrogen_molecules_elements, non_hydrogen_molecules_p
     # First, obtain the names of the dimers you have collected.
     dimer_names = sorted(dimers.keys())
 
-    # Second, for each dimer in the dimers list.
-    for index1 in range(len(dimer_names)):
+    # Second, for each pair of dimers that could be symmetric to each other.
+    previous_index1 = None
+    for index1, index2 in candidate_dimer_pairs:
 
-        # Third, obtain the name of the first dimer.
-        dimer1_name = dimer_names[index1]
+        # 2.1: Only obtain the information about the first dimer if it is different to the first dimer in the previous pair.
+        if not (index1 == previous_index1):
+            previous_index1 = index1
 
-        # Fourth, obtain the names of the molecules in the dimer, as well as the displacement of molecule 2 in dimer 1, and the centre of mass molecule to move dimer 2 by. 
-        d1_m1_name, d1_m2_name, _, dist1, move_com_by_1, d1_shortest_distance = dimers[dimer1_name]
+            # Third, obtain the name of the first dimer.
+            dimer1_name = dimer_names[index1]
 
-        # Fifth, obtain the elements, positions, and number of hydrogens bound to "heavy" atoms in molecule 1 of dimer 1
-        d1_m1_original_elements           = non_hydrogen_molecules_elements [d1_m1_name]
-        d1_m1_original_positions          = non_hydrogen_molecules_positions[d1_m1_name] + move_com_by_1
-        d1_m1_no_H_attached_to_nonH_atoms = all_no_of_H_on_atoms_in_molecule[d1_m1_name]
+            # Fourth, obtain the names of the molecules in the dimer, as well as the displacement of molecule 2 in dimer 1, and the centre of mass molecule to move dimer 2 by. 
+            d1_m1_name, d1_m2_name, _, dist1, move_com_by_1, d1_shortest_distance = dimers[dimer1_name]
 
-        # Sixth, obtain the elements, positions, and number of hydrogens bound to "heavy" atoms in molecule 2 of dimer 1
-        d1_m2_original_elements           = non_hydrogen_molecules_elements [d1_m2_name]
-        d1_m2_original_positions          = non_hydrogen_molecules_positions[d1_m2_name] + move_com_by_1 + dist1
-        d1_m2_no_H_attached_to_nonH_atoms = all_no_of_H_on_atoms_in_molecule[d1_m2_name]
+            # Fifth, obtain the elements, positions, and number of hydrogens bound to "heavy" atoms in molecule 1 of dimer 1
+            d1_m1_original_elements           = non_hydrogen_molecules_elements [d1_m1_name]
+            d1_m1_original_positions          = non_hydrogen_molecules_positions[d1_m1_name] + move_com_by_1
+            d1_m1_no_H_attached_to_nonH_atoms = all_no_of_H_on_atoms_in_molecule[d1_m1_name]
 
-        # Seventh, obtain the elements, positions, and number of hydrogens bound to "heavy" atoms in dimer 1 (by concaternating molecule 1 and molecule 2 together in dimer 1)
-        d1_elements                       = d1_m1_original_elements + d1_m2_original_elements
-        d1_positions                      = np.concatenate([d1_m1_original_positions,d1_m2_original_positions])
-        d1_no_H_attached_to_nonH_atoms    = d1_m1_no_H_attached_to_nonH_atoms + d1_m2_no_H_attached_to_nonH_atoms
+            # Sixth, obtain the elements, positions, and number of hydrogens bound to "heavy" atoms in molecule 2 of dimer 1
+            d1_m2_original_elements           = non_hydrogen_molecules_elements [d1_m2_name]
+            d1_m2_original_positions          = non_hydrogen_molecules_positions[d1_m2_name] + move_com_by_1 + dist1
+            d1_m2_no_H_attached_to_nonH_atoms = all_no_of_H_on_atoms_in_molecule[d1_m2_name]
 
-        # Eighth, for every other dimer in the dimers list (that has a higher indice than dimer1_name)
-        for index2 in range(index1+1,len(dimer_names)):
+            # Seventh, obtain the elements, positions, and number of hydrogens bound to "heavy" atoms in dimer 1 (by concaternating molecule 1 and molecule 2 together in dimer 1)
+            d1_elements                       = d1_m1_original_elements + d1_m2_original_elements
+            d1_positions                      = np.concatenate([d1_m1_original_positions,d1_m2_original_positions])
+            d1_no_H_attached_to_nonH_atoms    = d1_m1_no_H_attached_to_nonH_atoms + d1_m2_no_H_attached_to_nonH_atoms
 
-            # Ninth, obtain the name of the second dimer.
-            dimer2_name = dimer_names[index2]
+        # Eighth, obtain the name of the second dimer.
+        dimer2_name = dimer_names[index2]
 
-            # Tenth, obtain the name of the molecules in the dimer, as well as the displacement of molecule 2 in dimer 1, and the centre of mass molecule to move dimer 2 by. 
-            d2_m1_name, d2_m2_name, _, dist2, move_com_by_2, d2_shortest_distance = dimers[dimer2_name]
+        # Ninth, obtain the name of the molecules in the dimer, as well as the displacement of molecule 2 in dimer 1, and the centre of mass molecule to move dimer 2 by. 
+        d2_m1_name, d2_m2_name, _, dist2, move_com_by_2, d2_shortest_distance = dimers[dimer2_name]
 
-            # Eleventh, obtain the elements, positions, and number of hydrogens bound to "heavy" atoms in molecule 1 of dimer 2
-            d2_m1_original_elements           = non_hydrogen_molecules_elements [d2_m1_name]
-            d2_m1_original_positions          = non_hydrogen_molecules_positions[d2_m1_name] + move_com_by_2
-            d2_m1_no_H_attached_to_nonH_atoms = all_no_of_H_on_atoms_in_molecule[d2_m1_name]
+        # Tenth, obtain the elements, positions, and number of hydrogens bound to "heavy" atoms in molecule 1 of dimer 2
+        d2_m1_original_elements           = non_hydrogen_molecules_elements [d2_m1_name]
+        d2_m1_original_positions          = non_hydrogen_molecules_positions[d2_m1_name] + move_com_by_2
+        d2_m1_no_H_attached_to_nonH_atoms = all_no_of_H_on_atoms_in_molecule[d2_m1_name]
 
-            # Twelfth, obtain the elements, positions, and number of hydrogens bound to "heavy" atoms in molecule 1 of dimer 2
-            d2_m2_original_elements           = non_hydrogen_molecules_elements [d2_m2_name]
-            d2_m2_original_positions          = non_hydrogen_molecules_positions[d2_m2_name] + move_com_by_2 + dist2
-            d2_m2_no_H_attached_to_nonH_atoms = all_no_of_H_on_atoms_in_molecule[d2_m2_name]
+        # Eleventh, obtain the elements, positions, and number of hydrogens bound to "heavy" atoms in molecule 2 of dimer 2
+        d2_m2_original_elements           = non_hydrogen_molecules_elements [d2_m2_name]
+        d2_m2_original_positions          = non_hydrogen_molecules_positions[d2_m2_name] + move_com_by_2 + dist2
+        d2_m2_no_H_attached_to_nonH_atoms = all_no_of_H_on_atoms_in_molecule[d2_m2_name]
 
-            # Finally, yield input data.
-            yield (dimer1_name, d1_m1_name, d1_m2_name), (dimer2_name, d2_m1_name, d2_m2_name), (d1_elements, d1_positions, d1_no_H_attached_to_nonH_atoms), (d2_m1_original_elements, d2_m1_original_positions, d2_m1_no_H_attached_to_nonH_atoms), (d2_m2_original_elements, d2_m2_original_positions, d2_m2_no_H_attached_to_nonH_atoms), (d1_shortest_distance, d2_shortest_distance), (equivalent_molecule_atom_indices_comparison, max_distance_disparity, neighbouring_molecules_about_dimers, non_hydrogen_molecules), symmetric_dimer_pairs, no_of_cpus
+        # Finally, yield input data.
+        yield (dimer1_name, d1_m1_name, d1_m2_name), (dimer2_name, d2_m1_name, d2_m2_name), (d1_elements, d1_positions, d1_no_H_attached_to_nonH_atoms), (d2_m1_original_elements, d2_m1_original_positions, d2_m1_no_H_attached_to_nonH_atoms), (d2_m2_original_elements, d2_m2_original_positions, d2_m2_no_H_attached_to_nonH_atoms), (d1_shortest_distance, d2_shortest_distance), (equivalent_molecule_atom_indices_comparison, max_distance_disparity, neighbouring_molecules_about_dimers, non_hydrogen_molecules), symmetric_dimer_pairs, no_of_cpus
 
 # ----------------------------------------------------------------------------------------------------------------------------------------------------------
 # ----------------------------------------------------------------------------------------------------------------------------------------------------------
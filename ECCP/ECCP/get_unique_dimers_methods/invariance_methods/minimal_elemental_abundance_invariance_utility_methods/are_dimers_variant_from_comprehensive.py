@@ -4,7 +4,6 @@ are_dimers_variant_from_comprehensive.py, Geoffrey Weal, 9/2/24
 This method will check that the elements in each molecule are the same and that the two dimers are rotationally variant. 
 """
 import numpy as np
-from copy import deepcopy
 import multiprocessing as mp
 
 from SUMELF import GraphMatcher
@@ -212,7 +211,7 @@ def get_inputs(em_indices_d2_m1_to_d1_m1, em_indices_d2_m2_to_d1_m2,  d1_m1_orig
 		# Third, rearrange the element and position indices for d2_m1
 		idx_d2_m1                                       = get_permutated_indices_list(comparison1)
 		d2_m1_reordered_elements                        = [d2_m1_original_elements[index] for index in idx_d2_m1]
-		d2_m1_reordered_positions                       = deepcopy(d2_m1_original_positions)[idx_d2_m1, :]
+		d2_m1_reordered_positions                       = d2_m1_original_positions[idx_d2_m1, :]
 		d2_m1_no_H_attached_to_nonH_atoms_reordered     = [d2_m1_no_H_attached_to_nonH_atoms[index] for index in idx_d2_m1]
 
 		# Fourth, for each permutation of indices between d1 and d2 for m2.
@@ -221,7 +220,7 @@ def get_inputs(em_indices_d2_m1_to_d1_m1, em_indices_d2_m2_to_d1_m2,  d1_m1_orig
 			# Fifth, rearrange the element and position indices for d2_m2
 			idx_d2_m2                                   = get_permutated_indices_list(comparison2)
 			d2_m2_reordered_elements                    = [d2_m2_original_elements[index] for index in idx_d2_m2]
-			d2_m2_reordered_positions                   = deepcopy(d2_m2_original_positions)[idx_d2_m2, :]
+			d2_m2_reordered_positions                   = d2_m2_original_positions[idx_d2_m2, :]
 			d2_m2_no_H_attached_to_nonH_atoms_reordered = [d2_m2_no_H_attached_to_nonH_atoms[index] for index in idx_d2_m2]
 
 			# Sixth, get the elements and positions of atoms in d2 for d2 = d2_m1+d2_m2
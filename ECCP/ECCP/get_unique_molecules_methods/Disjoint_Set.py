@@ -0,0 +1,103 @@
+"""
+Disjoint_Set.py, Geoffrey Weal, 17/10/26
+
+This object is a disjoint set (union-find), used to quickly gather individuals (molecules or dimers) that are connected by equivalent pairs into groups.
+"""
+
+class Disjoint_Set:
+	"""
+	This object is a disjoint set (union-find) with path compression and union by size.
+
+	Joining two individuals and finding the group that an individual is in both take (almost) constant time, so grouping n equivalent pairs takes (almost) linear time.
+
+	Parameters
+	----------
+	individuals_names : list
+		These are the names of the individuals to place into the disjoint set. Each individual starts in a group on its own. Default: ()
+	"""
+	def __init__(self, individuals_names=()):
+		self.parents = {}
+		self.sizes   = {}
+		for individual_name in individuals_names:
+			self.add(individual_name)
+
+	def add(self, individual_name):
+		"""
+		This method will add an individual to the disjoint set in a group on its own, if it is not already in the disjoint set.
+
+		Parameters
+		----------
+		individual_name : object
+			This is the name of the individual.
+		"""
+		if not (individual_name in self.parents):
+			self.parents[individual_name] = individual_name
+			self.sizes[individual_name]   = 1
+
+	def find(self, individual_name):
+		"""
+		This method will find the root individual of the group that individual_name is in.
+
+		Parameters
+		----------
+		individual_name : object
+			This is the name of the individual.
+
+		Returns
+		-------
+		root_name : object
+			This is the name of the root individual of the group.
+		"""
+
+		# First, find the root of the group.
+		self.add(individual_name)
+		root_name = individual_name
+		while not (self.parents[root_name] == root_name):
+			root_name = self.parents[root_name]
+
+		# Second, point every individual along the path directly to the root (path compression).
+		while not (self.parents[individual_name] == root_name):
+			self.parents[individual_name], individual_name = root_name, self.parents[individual_name]
+
+		# Third, return the root of the group.
+		return root_name
+
+	def union(self, individual1_name, individual2_name):
+		"""
+		This method will join the groups that individual1_name and individual2_name are in.
+
+		Parameters
+		----------
+		individual1_name : object
+			This is the name of the first individual.
+		individual2_name : object
+			This is the name of the second individual.
+		"""
+
+		# First, find the roots of the groups of both individuals.
+		root1_name = self.find(individual1_name)
+		root2_name = self.find(individual2_name)
+		if root1_name == root2_name:
+			return
+
+		# Second, attach the smaller group to the larger group (union by size).
+		if self.sizes[root1_name] < self.sizes[root2_name]:
+			root1_name, root2_name = root2_name, root1_name
+		self.parents[root2_name] = root1_name
+		self.sizes[root1_name] += self.sizes[root2_name]
+
+	def get_groups(self):
+		"""
+		This method will give all the groups in the disjoint set.
+
+		Returns
+		-------
+		groups : dict.
+			These are the groups in the disjoint set, given as {root name: list of the names of individuals in the group}. Individuals are given in the order they were added.
+		"""
+		groups = {}
+		for individual_name in self.parents.keys():
+			groups.setdefault(self.find(individual_name), []).append(individual_name)
+		return groups
+
+# ---------------------------------------------------------------------------------------------------------------
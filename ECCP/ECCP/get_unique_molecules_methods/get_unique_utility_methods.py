@@ -3,9 +3,10 @@ get_unique_utility_methods.py, Geoffrey Weal, 19/3/2024
 
 This script is designed to provide methods for get_unique_molecules.py and get_unique_dimers.py
 """
-from copy import deepcopy
 from collections import Counter
 
+from ECCP.ECCP.get_unique_molecules_methods.Disjoint_Set import Disjoint_Set
+
 def get_equivalent_pair_names(original_equivalent_pairs, all_individuals_names):
 	"""
 	This method is designed to determine which pairs can be assigned to a collective set of individuals that are equivalent to each other. 
@@ -29,83 +30,45 @@ def get_equivalent_pair_names(original_equivalent_pairs, all_individuals_names):
 		A list of unique individuals.
 	"""
 
-	# First, make a copy of the original_equivalent_pairs to use for this method. 
-	equivalent_pairs = sorted(deepcopy(original_equivalent_pairs))
+	# First, obtain the equivalent pairs in sorted order, as well as a set of the equivalent pairs for quickly checking if a pair is equivalent. 
+	equivalent_pairs = sorted(set([tuple(sorted(equivalent_pair)) for equivalent_pair in original_equivalent_pairs]))
+	equivalent_pairs_set = set(equivalent_pairs)
 
-	# Second, initialise a list that contains all the groups of equivalent individuals
-	equivalent_individuals_groups = []
+	# Second, use a disjoint set to gather the individuals that are connected by equivalent pairs into connected groups.
+	#         * Individuals in different connected groups can never be in the same equivalence group, so each connected group can be examined on its own.
+	disjoint_set = Disjoint_Set()
+	for indiv1, indiv2 in equivalent_pairs:
+		disjoint_set.union(indiv1, indiv2)
+	equivalent_pairs_in_connected_groups = {}
+	for indiv1, indiv2 in equivalent_pairs:
+		equivalent_pairs_in_connected_groups.setdefault(disjoint_set.find(indiv1), []).append((indiv1, indiv2))
+	connected_groups = disjoint_set.get_groups()
 
 	# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - 
-	# Third, go through each pair in equivalent_pairs and put them into groups
+	# Third, go through each connected group and make the equivalence groups from it.
 	# * Each individual in a group is equivalent to EVERY OTHER individual in the group.
 	# * If this can not be done, the individual that can not fit into a group will be put into a new group containing itself.
+	# * Equivalence groups are given in the order of the first equivalent pair that made them.
+	equivalent_individuals_groups_with_first_pair = []
+	for root_name, equivalent_pairs_in_connected_group in equivalent_pairs_in_connected_groups.items():
 
-	# 3.1: This section is designed to create equivalence groups from individuals in equivalent_pairs.
-	#      If an individual from (indiv1, indiv2) can not be placed in a equivalence group, then
-	#        * It might be placed in another equivalence group during the second for loop, or
-	#        * It may be in a group on it's own, which in this case it will be left for step 3.4.
-	#
-	#      For each individual in equivalent_pairs
-	for indiv1, indiv2 in equivalent_pairs:
+		# 3.1: If every individual in the connected group is equivalent to every other individual in it, the connected group is an equivalence group.
+		#      * This is the usual case, as equivalence is normally transitive.
+		connected_group = connected_groups[root_name]
+		if len(equivalent_pairs_in_connected_group) == (len(connected_group)*(len(connected_group)-1))//2:
+			equivalent_individuals_groups_with_first_pair.append((equivalent_pairs_in_connected_group[0], list(connected_group)))
+			continue
+
+		# 3.2: Otherwise, go through each pair in the connected group and put them into groups.
+		equivalent_individuals_groups_with_first_pair += get_equivalence_groups_in_connected_group(equivalent_pairs_in_connected_group, equivalent_pairs_set)
+
+	# 3.3: Obtain the equivalence groups in the order of the first equivalent pair that made them.
+	equivalent_individuals_groups = [equivalent_individuals_group for _, equivalent_individuals_group in sorted(equivalent_individuals_groups_with_first_pair, key=lambda group_with_first_pair: group_with_first_pair[0])]
 
-		# 3.2: Find if (indiv1, indiv2) can be added to a group in equivalent_individuals_groups. 
-		for unique_mol_name, equivalent_individuals_group in enumerate(equivalent_individuals_groups):
-
-			# 3.2.1: Determine if the individuals in this individual pair are already both in equivalent_individuals_group
-			is_indiv1_in_equivalent_individuals_group = indiv1 in equivalent_individuals_group
-			is_indiv2_in_equivalent_individuals_group = indiv2 in equivalent_individuals_group
-
-			# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-			# 3.2.2: If indiv1 and indiv2 are in equivalent_individuals_group, we can move on as we have figured out 
-			#        the equivalency of these two individuals.
-			if is_indiv1_in_equivalent_individuals_group and is_indiv2_in_equivalent_individuals_group:
-				break
-
-			# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-			# 3.2.3: If indiv1 is in equivalent_individuals_group, check if indiv2 could be added to equivalent_individuals_group.
-			if is_indiv1_in_equivalent_individuals_group:
-
-				# 3.2.3.1: If indiv2 is equivalent to all individuals in equivalent_individuals_group, then add it to this equivalence group.
-				#          * If not, make a new equivalence set for indiv2.
-				if check_indiv_is_equivalent_to_all_enteries_in_equivalent_individuals_group(indiv2, equivalent_individuals_group, equivalent_pairs):
-					equivalent_individuals_groups[unique_mol_name].append(indiv2)
-
-				# 3.2.3.2: We have found the equivalence group that indiv1 is in, so either indiv2 has been added to 
-				#          equivalent_individuals_groups[unique_mol_name] or not.
-				#          * If it has been added, good
-				#          * If it has not been added, we will leave it till the end of the loop, where we have determined 
-				#            if it is already apart of an equivalance group or a new equivalance group needs to be created
-				#            with it in it. 
-				break
-
-			# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-			# 3.2.4: If indiv2 is in equivalent_individuals_group, check if indiv2 could be added to equivalent_individuals_group
-			if is_indiv2_in_equivalent_individuals_group:
-
-				# 3.2.4.1: If indiv1 is equivalent to all individuals in equivalent_individuals_group, then add it to this equivalence group
-				#          * If not, make a new equivalence set for indiv1
-				if check_indiv_is_equivalent_to_all_enteries_in_equivalent_individuals_group(indiv1, equivalent_individuals_group, equivalent_pairs):
-					equivalent_individuals_groups[unique_mol_name].append(indiv1)
-
-				# 3.2.4.2: We have found the equivalent individual group that indiv2 is in, so either indiv1 has been added to 
-				#          equivalent_individuals_groups[unique_mol_name] or not
-				#          * If it has been added, good
-				#          * If it has not been added, we will leave it till the end of the loop, where we have determined 
-				#            if it is already apart of an equivalance group or a new equivalance group needs to be created
-				#            with it in it. 
-				break
-
-		else:
-
-			# 3.3: We have not found neither indiv1 or indiv2 in equivalent_individuals_groups, so make a new equivalence group for these individuals.
-			equivalent_individuals_groups.append([indiv1, indiv2])
-
-	# 3.4: Add any individuals that were not included in equivalent_pairs. This means these individuals are the only individuals in their own equivalency group. 
+	# 3.4: Add any individuals that are not in an equivalence group. This means these individuals are the only individuals in their own equivalency group. 
+	individuals_in_equivalent_individuals_groups = set([indiv for equivalent_individuals_group in equivalent_individuals_groups for indiv in equivalent_individuals_group])
 	for individual_no in all_individuals_names:
-		for equivalent_individuals_group in equivalent_individuals_groups:
-			if individual_no in equivalent_individuals_group:
-				break
-		else:
+		if not (individual_no in individuals_in_equivalent_individuals_groups):
 			equivalent_individuals_groups.append([individual_no])
 
 	# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - 
@@ -149,6 +112,57 @@ def get_equivalent_pair_names(original_equivalent_pairs, all_individuals_names):
 
 # ---------------------------------------------------------------------------------------------------------------
 
+def get_equivalence_groups_in_connected_group(equivalent_pairs_in_connected_group, equivalent_pairs_set):
+	"""
+	This method is designed to make equivalence groups from a connected group where not every individual is equivalent to every other individual.
+
+	Parameters
+	----------
+	equivalent_pairs_in_connected_group : list of (int,int)
+		These are the equivalent pairs in the connected group, in sorted order.
+	equivalent_pairs_set : set of (int,int)
+		These are all the equivalent pairs, used for quickly checking if a pair is equivalent.
+
+	Returns
+	-------
+	equivalent_individuals_groups_with_first_pair : list of ((int,int), list of int)
+		These are the equivalence groups made, along with the first equivalent pair that made each group.
+	"""
+
+	# First, initialise the list of equivalence groups, and a dictionary of which equivalence group each individual is in.
+	equivalent_individuals_groups_with_first_pair = []
+	group_index_of_individuals = {}
+
+	# Second, for each pair of individuals in the connected group.
+	for indiv1, indiv2 in equivalent_pairs_in_connected_group:
+
+		# 2.1: Find the first equivalence group that indiv1 or indiv2 is in.
+		group_indices = [group_index_of_individuals[indiv] for indiv in (indiv1, indiv2) if (indiv in group_index_of_individuals)]
+
+		# 2.2: If neither indiv1 or indiv2 are in an equivalence group, make a new equivalence group for these individuals.
+		if len(group_indices) == 0:
+			group_index_of_individuals[indiv1] = group_index_of_individuals[indiv2] = len(equivalent_individuals_groups_with_first_pair)
+			equivalent_individuals_groups_with_first_pair.append(((indiv1, indiv2), [indiv1, indiv2]))
+			continue
+		group_index = min(group_indices)
+		equivalent_individuals_group = equivalent_individuals_groups_with_first_pair[group_index][1]
+
+		# 2.3: Obtain the individual that is not in this equivalence group. If both individuals are in this group, we have already figured out the equivalency of these two individuals.
+		new_indiv = indiv2 if (group_index_of_individuals.get(indiv1, None) == group_index) else indiv1
+		if new_indiv in group_index_of_individuals:
+			continue
+
+		# 2.4: If new_indiv is equivalent to all individuals in equivalent_individuals_group, then add it to this equivalence group.
+		#      * If not, it might be placed in another equivalence group by a later pair, or it will be placed in a group on its own at the end.
+		if check_indiv_is_equivalent_to_all_enteries_in_equivalent_individuals_group(new_indiv, equivalent_individuals_group, equivalent_pairs_set):
+			equivalent_individuals_group.append(new_indiv)
+			group_index_of_individuals[new_indiv] = group_index
+
+	# Third, return the equivalence groups made, along with the first equivalent pair that made each group.
+	return equivalent_individuals_groups_with_first_pair
+
+# ---------------------------------------------------------------------------------------------------------------
+
 def check_indiv_is_equivalent_to_all_enteries_in_equivalent_individuals_group(new_indiv, equivalent_individuals_group, equivalent_pairs):
 	"""
 	This method will check that new_indiv is equivalent to all molecules in equivalent_individuals_group by 
@@ -160,7 +174,7 @@ def check_indiv_is_equivalent_to_all_enteries_in_equivalent_individuals_group(ne
 		This is the molecule we want to check if it is equivalent to all molecules in equivalent_individuals_group./
 	equivalent_individuals_group : list of int.
 		This is the equivalent group we want to check if all molecules in it are equivalent to new_indiv
-	equivalent_pairs : list of (int, int). 
+	equivalent_pairs : set of (int, int). 
 		These are all the equivalent pairs of molecules in the crystal. 
 
 	Returns
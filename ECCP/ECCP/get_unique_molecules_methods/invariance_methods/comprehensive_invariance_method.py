@@ -54,7 +54,7 @@ def remove_equivalent_molecules_comprehensive_invariance_method(unique_molecule_
 
 	# Third, determine how the indices of molecules can be interchanged to give the same molecule.
 	print('Examining equivalent atoms between the '+str(len(non_hydrogen_graphs))+' molecules identified. This can take a while with large and complex molecules.')
-	equivalent_molecule_indices = get_equivalent_molecule_names(non_hydrogen_graphs, include_comparisons_with_itself=False, no_of_cpus=no_of_cpus)
+	equivalent_molecule_indices = get_equivalent_molecule_names(non_hydrogen_graphs, include_comparisons_with_itself=False)
 
 	# Fourth, determine which pairs of molecules are symmetric.
 	print('Comparing translational, rotational, and reflective invarience between molecules. '+str(len(unique_molecule_names))+' molecules to be examined. This can take a while with large and complex molecules.')
@@ -4,7 +4,6 @@ get_symmetric_molecule_pairs_comprehensive.py, Geoffrey Weal, 11/2/24
 
 This script is designed to determine all the spatially symmetric molecules in the unique_molecules_names list. 
 """
-from copy import deepcopy
 
 import multiprocessing as mp
 
@@ -219,7 +218,7 @@ def get_inputs(molecule_1_information, molecule_2_information, em_indices_m2_to_
         # 3.1: Reorder the atoms in molecule 2 to allign with atoms in molecule 1. 
         idx_m2                                  = get_permutated_indices_list(comparison)
         molecule2_elements_reordered            = [molecule2_elements[index] for index in idx_m2]
-        molecule2_positions_reordered           = deepcopy(molecule2_positions)[idx_m2, :]
+        molecule2_positions_reordered           = molecule2_positions[idx_m2, :]
         no_of_H_on_atoms_in_molecule2_reordered = [no_of_H_on_atoms_in_molecule2[index] for index in idx_m2]
 
         # 3.2: Make a tuple of the names of the molecules being compared against each other.
@@ -7,7 +7,6 @@ If this happens, we will default to the main component of the comprehensive inva
 
 This code is based various pieces of code from ECCP/ECCP/get_unique_molecules_methods/set_of_invariance_methods/comprehensive_invariance_method.py
 """
-from copy import deepcopy
 import multiprocessing as mp
 
 from SUMELF import GraphMatcher
@@ -257,7 +256,7 @@ def compare_two_molecules_in_two_index_configurations_single_process(input_data)
     # Second, reorder the positions and elements of molecule 2
     idx_m2                                  = get_permutated_indices_list(comparison)
     molecule2_elements_reordered            = [m2_original_elements[index] for index in idx_m2]
-    molecule2_distances_reordered           = deepcopy(m2_original_positions)[idx_m2, :]
+    molecule2_distances_reordered           = m2_original_positions[idx_m2, :]
     no_of_H_on_atoms_in_molecule2_reordered = [no_of_H_on_atoms_in_molecule2[index] for index in idx_m2]
 
     # Third, determine if this configuration of molecule 2 means that molecules 1 and 2 are variant.
@@ -0,0 +1,137 @@
+"""
+get_automorphism_groups.py, Geoffrey Weal, 17/10/26
+
+This script is designed to obtain all the ways that molecules can be mapped onto each other, by only obtaining the automorphism group (all the ways a molecule can be mapped onto itself) once for each type of molecule.
+
+If molecule 1 and molecule 2 are both the same type of molecule as a representative molecule R, then every way to map molecule 1 onto molecule 2 is given by
+	(one mapping of R onto molecule 2) o (an automorphism of R) o (one mapping of molecule 1 onto R)
+So rather than enumerating every mapping for every pair of molecules, only one mapping is needed for each molecule, along with the automorphism group of R.
+"""
+from SUMELF import GraphMatcher
+
+def get_molecule_isomorphism_classes(graphs, graph_hashes):
+	"""
+	This method is designed to determine the type of each molecule, and one way of mapping the representative molecule of that type onto the molecule.
+
+	The automorphism groups are only kept for the molecules given here, so that the graphs of molecules from previous crystals are not held in memory.
+
+	Parameters
+	----------
+	graphs : dict. of networkx.Graphs
+		These are the graphs of the molecules, where hydrogens have been removed and added to attached atoms as node features.
+	graph_hashes : dict. of str.
+		This is the canonical hash for each graph in graphs.
+
+	Returns
+	-------
+	molecule_isomorphism_classes : dict.
+		This is the type of each molecule, given as {molecule name: (canonical graph hash, index of type in automorphism_groups[canonical graph hash], mapping of the representative molecule onto this molecule)}.
+	automorphism_groups : dict.
+		These are the automorphism groups of each type of molecule, given as {canonical graph hash: list of (representative graph, automorphisms of the representative graph)}.
+			* Graphs with different canonical hashes are never the same type of molecule.
+			* More than one type of molecule is recorded for a hash in the rare case that two different graphs have the same hash.
+	"""
+	automorphism_groups = {}
+	molecule_isomorphism_classes = {}
+	for mol_name in sorted(graphs.keys()):
+		molecule_isomorphism_classes[mol_name] = get_molecule_isomorphism_class(graphs[mol_name], graph_hashes[mol_name], automorphism_groups)
+	return molecule_isomorphism_classes, automorphism_groups
+
+def get_molecule_isomorphism_class(graph, graph_hash, automorphism_groups):
+	"""
+	This method is designed to determine the type of a molecule, and one way of mapping the representative molecule of that type onto the molecule.
+
+	If this molecule is not the same type as any molecule in automorphism_groups, this molecule becomes the representative molecule for a new type, and its automorphism group is obtained and added to automorphism_groups.
+
+	Parameters
+	----------
+	graph : networkx.Graph
+		This is the graph of the molecule.
+	graph_hash : str.
+		This is the canonical hash of the graph.
+	automorphism_groups : dict.
+		These are the automorphism groups of each type of molecule found so far (see get_molecule_isomorphism_classes).
+
+	Returns
+	-------
+	graph_hash : str.
+		This is the canonical hash of the graph.
+	class_index : int
+		This is the index of the type of molecule in automorphism_groups[graph_hash].
+	representative_to_molecule : dict.
+		This is one way of mapping the atoms of the representative molecule onto the atoms of this molecule.
+	"""
+
+	# First, check if this molecule is the same type as one of the types of molecules with the same hash found so far.
+	isomorphism_classes = automorphism_groups.setdefault(graph_hash, [])
+	for class_index, (representative_graph, automorphisms) in enumerate(isomorphism_classes):
+		representative_to_molecule = get_an_isomorphism(representative_graph, graph)
+		if representative_to_molecule is not None:
+			return graph_hash, class_index, representative_to_molecule
+
+	# Second, if not, make this molecule the representative molecule of a new type, and obtain its automorphism group.
+	automorphisms = GraphMatcher(graph, graph).get_all_unique_isomorphic_graphs()
+	isomorphism_classes.append((graph, automorphisms))
+
+	# Third, return the type of this molecule. The representative molecule maps onto itself as is.
+	return graph_hash, len(isomorphism_classes)-1, {node: node for node in graph.nodes}
+
+def get_an_isomorphism(graph1, graph2):
+	"""
+	This method is designed to obtain one way of mapping graph1 onto graph2, without enumerating all of them.
+
+	Parameters
+	----------
+	graph1 : networkx.Graph
+		This is the first graph.
+	graph2 : networkx.Graph
+		This is the second graph.
+
+	Returns
+	-------
+	mapping : dict. or None
+		This is one way of mapping the nodes of graph1 onto the nodes of graph2. None if graph1 can not be mapped onto graph2.
+	"""
+	if not (len(graph1) == len(graph2)):
+		return None
+	GM = GraphMatcher(graph1, graph2)
+	return next(GM.isomorphisms_iter(), None)
+
+def get_all_isomorphisms_between_molecules(molecule1_isomorphism_class, molecule2_isomorphism_class, automorphism_groups):
+	"""
+	This method is designed to obtain all the ways that molecule 1 can be mapped onto molecule 2, using the automorphism group of their type of molecule.
+
+	This gives the same mappings as GraphMatcher(molecule1_graph, molecule2_graph).get_all_unique_isomorphic_graphs().
+
+	Parameters
+	----------
+	molecule1_isomorphism_class : tuple
+		This is the type of molecule 1 (see get_molecule_isomorphism_class).
+	molecule2_isomorphism_class : tuple
+		This is the type of molecule 2 (see get_molecule_isomorphism_class).
+	automorphism_groups : dict.
+		These are the automorphism groups of each type of molecule (see get_molecule_isomorphism_classes).
+
+	Returns
+	-------
+	all_unique_matches : list of dict.
+		These are all the ways to map the atoms of molecule 1 onto the atoms of molecule 2.
+	"""
+
+	# First, molecules of different types can not be mapped onto each other.
+	graph_hash1, class_index1, representative_to_molecule1 = molecule1_isomorphism_class
+	graph_hash2, class_index2, representative_to_molecule2 = molecule2_isomorphism_class
+	if not ((graph_hash1 == graph_hash2) and (class_index1 == class_index2)):
+		return []
+
+	# Second, obtain the automorphism group of this type of molecule, and the mapping of molecule 1 onto the representative molecule.
+	representative_graph, automorphisms = automorphism_groups[graph_hash1][class_index1]
+	molecule1_to_representative = {molecule1_node: representative_node for representative_node, molecule1_node in representative_to_molecule1.items()}
+
+	# Third, obtain each way to map molecule 1 onto molecule 2: molecule 1 --> representative --(automorphism)--> representative --> molecule 2.
+	all_unique_matches = []
+	for automorphism in automorphisms:
+		all_unique_matches.append({molecule1_node: representative_to_molecule2[automorphism[representative_node]] for molecule1_node, representative_node in molecule1_to_representative.items()})
+
+	# Fourth, return all the ways to map molecule 1 onto molecule 2.
+	return all_unique_matches
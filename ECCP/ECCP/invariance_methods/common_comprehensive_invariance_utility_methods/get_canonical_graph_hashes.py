@@ -0,0 +1,76 @@
+"""
+get_canonical_graph_hashes.py, Geoffrey Weal, 17/10/26
+
+This script is designed to obtain a canonical hash for each molecule graph, so that only molecules with the same hash need to be compared with the graph matcher.
+"""
+from networkx import Graph, weisfeiler_lehman_graph_hash
+
+def get_canonical_graph_hashes(graphs, iterations=3):
+	"""
+	This method is designed to obtain a canonical hash for each graph in graphs.
+
+	Two graphs that are isomorphic (with the same 'E' and 'H' node features) will always be given the same hash.
+	Two graphs with different hashes are never isomorphic, so these do not need to be compared with the graph matcher.
+
+	Parameters
+	----------
+	graphs : dict of networkx.Graphs
+		This dict contains the graphs that you want to obtain hashes for.
+	iterations : int
+		This is the number of Weisfeiler-Lehman iterations to perform. Default: 3
+
+	Returns
+	-------
+	graph_hashes : dict. of str.
+		This is the canonical hash for each graph in graphs.
+	"""
+	return {name: get_canonical_graph_hash(graph, iterations=iterations) for name, graph in graphs.items()}
+
+def get_canonical_graph_hash(graph, iterations=3):
+	"""
+	This method is designed to obtain the Weisfeiler-Lehman hash of a graph using the 'E' (element) and 'H' (number of hydrogens attached) features of each atom (node).
+
+	Parameters
+	----------
+	graph : networkx.Graph
+		This is the graph to obtain the hash for.
+	iterations : int
+		This is the number of Weisfeiler-Lehman iterations to perform. Default: 3
+
+	Returns
+	-------
+	graph_hash : str.
+		This is the canonical hash for this graph.
+	"""
+
+	# First, create a graph where the 'E' and 'H' features of each node are combined into one node label.
+	#        * The defaults of 'E' and 'H' are the same as those used when matching nodes between graphs (None and 0).
+	labelled_graph = Graph()
+	for node_index, node_features in graph.nodes.items():
+		labelled_graph.add_node(node_index, label=str(node_features.get('E', None))+'_'+str(node_features.get('H', 0)))
+	labelled_graph.add_edges_from(graph.edges.keys())
+
+	# Second, obtain the Weisfeiler-Lehman hash of the graph.
+	graph_hash = weisfeiler_lehman_graph_hash(labelled_graph, node_attr='label', iterations=iterations)
+
+	# Third, return the hash of the graph.
+	return graph_hash
+
+def get_graph_hash_buckets(graph_hashes):
+	"""
+	This method is designed to group the names of graphs together that have the same hash.
+
+	Parameters
+	----------
+	graph_hashes : dict. of str.
+		This is the canonical hash for each graph.
+
+	Returns
+	-------
+	graph_hash_buckets : dict. of lists
+		These are the names of graphs with the same hash, given as {hash: sorted list of names of graphs}.
+	"""
+	graph_hash_buckets = {}
+	for name in sorted(graph_hashes.keys()):
+		graph_hash_buckets.setdefault(graph_hashes[name], []).append(name)
+	return graph_hash_buckets
@@ -1,247 +1,126 @@
 """
 get_equivalent_molecule_names.py, Geoffrey Weal, 7/2/24
 
-This script is designed to obtain all the names between equivalent moleules. 
+This script is designed to obtain all the names between equivalent moleules.
 """
-import sys
-from tqdm import tqdm
+from ECCP.ECCP.invariance_methods.common_comprehensive_invariance_utility_methods.get_canonical_graph_hashes import get_canonical_graph_hashes
+from ECCP.ECCP.invariance_methods.common_comprehensive_invariance_utility_methods.get_automorphism_groups    import get_molecule_isomorphism_classes, get_all_isomorphisms_between_molecules
 
-import multiprocessing as mp
-from tqdm.contrib.concurrent import process_map
-
-from SUMELF import GraphMatcher
-
-def get_equivalent_molecule_names(non_hydrogen_graphs, include_comparisons_with_itself=False, no_of_cpus=1):
+def get_equivalent_molecule_names(non_hydrogen_graphs, include_comparisons_with_itself=False):
     """
-    This method is designed to obtain all the names between equivalent moleules. 
+    This method is designed to obtain all the names between equivalent moleules.
 
     Parameters
     ----------
     non_hydrogen_graphs : dict of networkx.Graphs
         This dict contains all the graphs of the molecules in the crystal, where hydrogens have been removed and added to attached atoms as node features.
     include_comparisons_with_itself : bool.
-        This boolean indicates if the user want to give the ways that a molecule could map onto itself. 
-            * For determining equivalent molecules, we dont want to do this, so set to False
-            * For determining equivalent dimers, we do want to do this, so set this to True.
-    no_of_cpus : int.
-        This is the number of cpus available to use on this program. In most cases this should just be set to 1 cpu, however for very large system you may want to implement multiple cpus.
-
-    Returns
-    -------
-    equivalent_molecule_names : dict.
-        This is all the ways that two molecules in non_hydrogen_graphs can map onto each other. 
-    """
-
-    # First, obtain a list of equivalent_molecule_names
-    # * This list is formated (mol_name1, mol_name2): All the ways that mol_name1 maps onto mol_name2
-    #
-    if no_of_cpus == 1: # If the user want to perform this task with 1 cpu, use standard simple approach.
-        list_of_equivalent_molecule_names = compare__non_hydrogen_graphs__with_one_cpu(non_hydrogen_graphs, include_comparisons_with_itself)
-    else: 
-        list_of_equivalent_molecule_names = compare__non_hydrogen_graphs__multiple_cpu(non_hydrogen_graphs, include_comparisons_with_itself, no_of_cpus)
-
-    # Second, initialise the equivalent_molecule_names dictionary that will hold all the ways that two molecules in non_hydrogen_graphs can map on to each other. 
-    equivalent_molecule_names = {}
-
-    # Third, move data from list_of_equivalent_molecule_names onto equivalent_molecule_names in dictionary format rather than list format.
-    for (mol_name1, mol_name2), all_unique_matches in list_of_equivalent_molecule_names:
-
-        # 3.1: Check that none of the entries in list_of_equivalent_molecule_names has mol_name1
-        if include_comparisons_with_itself: 
-            if mol_name1 > mol_name2: # We have included a comparision of the molecule with itself. This is used for determining symmetric dimers. 
-                import pdb; pdb.set_trace()
-                raise Exception('Error: mol_name 1 is bigger than mol_name 2. This may indicate a programming error. Check this.')
-        else:
-            if mol_name1 >= mol_name2: # We have not included a comparision of the molecule with itself. This is used for determining symmetric molecules. 
-                raise Exception('Error: mol_name 1 is bigger than or equal to mol_name 2. This may indicate a programming error. Check this.')
-
-        # 3.2: Add all_unique_matches to (mol_name1,mol_name2) in equivalent_molecule_names
-        equivalent_molecule_names[(mol_name1,mol_name2)] = all_unique_matches
-
-        # 3.3: If mol_name1 is not equal to mol_name2 (because mol_name1 is larger than mol_name2), then add the reverse connections to equivalent_molecule_names for mapping molecule 2 onto molecule 1
-        if mol_name1 != mol_name2:
-            equivalent_molecule_names[(mol_name2, mol_name1)] = [{v: k for k, v in a_unique_match.items()} for a_unique_match in all_unique_matches]
-
-    # Fourth, return equivalent_molecule_names
-    return equivalent_molecule_names
-
-# ----------------------------------------------------------------------------------------------------------------------------------------------------------
-# ----------------------------------------------------------------------------------------------------------------------------------------------------------
-# ----------------------------------------------------------------------------------------------------------------------------------------------------------
-
-def compare__non_hydrogen_graphs__with_one_cpu(non_hydrogen_graphs, include_comparisons_with_itself):
-    """
-    This method is desiged to compare the molecules in the non_hydrogen_graphs and obtain all the ways that molecules can be mapped onto each other.
-
-    THis method is designed to use only 1 cpu
-
-    Parameters
-    ----------
-    non_hydrogen_graphs : dict of networkx.Graphs
-        This dict contains all the graphs of the molecule, where hydrogens have been removed and added to attached atoms as node features
-    include_comparisons_with_itself : bool.
-        This boolean determines if the user want to give the ways that a molecule could map onto itself. 
+        This boolean indicates if the user want to give the ways that a molecule could map onto itself.
             * For determining equivalent molecules, we dont want to do this, so set to False
             * For determining equivalent dimers, we do want to do this, so set this to True.
 
     Returns
     -------
-    list_of_equivalent_molecule_names : list
-        This is the list to store all the names that map molecule 1 onto molecule 2. 
+    equivalent_molecule_names : Equivalent_Molecule_Names
+        This is all the ways that two molecules in non_hydrogen_graphs can map onto each other, given as {(mol_name1, mol_name2): All the ways that mol_name1 maps onto mol_name2}.
     """
 
-    # First, initialise the list to hold all the ways that molecules in non_hydrogen_graphs can map on to eachother.
-    list_of_equivalent_molecule_names = []
-
-    # Second, create a tqdm instance to notify the user what it is doing
-    no_of_neighbourhood_sets = int((len(non_hydrogen_graphs) * (len(non_hydrogen_graphs) - 1)) / 2)
-    pbar = tqdm(total=no_of_neighbourhood_sets,unit='molecule pair')
-
-    # Third, compare all molecules together in non_hydrogen_graphs
-    for input_data in get_inputs(non_hydrogen_graphs, include_comparisons_with_itself, list_of_equivalent_molecule_names):
-
-        # 3.1: Write output to user.
-        mol_name1 = input_data[0]
-        mol_name2 = input_data[1]
-        if mol_name1 == mol_name2:
-            pbar.set_description('Comparing molecule '+str(mol_name1)+' with itself')
-        else:
-            pbar.set_description('Comparing molecules '+str(mol_name1)+' and '+str(mol_name2))
-
-        # 3.2: Compare mol_name1 and mol_name2 in non_hydrogen_graphs together.
-        compare_two_molecules_single_process(input_data)
-
-        # 3.3: Update pbar, as one job is completed.
-        pbar.update(1)
+    # First, obtain the canonical hash of each molecule.
+    # * Molecules with different hashes can not be mapped onto each other, so only molecules with the same hash need to be compared.
+    graph_hashes = get_canonical_graph_hashes(non_hydrogen_graphs)
 
-    # Fourth, close pbar.
-    pbar.close()
+    # Second, determine the type of each molecule.
+    # * This obtains the automorphism group of each type of molecule once, along with one way to map the representative molecule of that type onto each molecule.
+    molecule_isomorphism_classes, automorphism_groups = get_molecule_isomorphism_classes(non_hydrogen_graphs, graph_hashes)
 
-    # Fifth, return list_of_equivalent_molecule_names
-    return list_of_equivalent_molecule_names
+    # Third, return equivalent_molecule_names.
+    # * The ways that two molecules map onto each other are composed from the automorphism group of their type of molecule when they are needed, rather than being stored for every pair of molecules.
+    return Equivalent_Molecule_Names(molecule_isomorphism_classes, automorphism_groups, include_comparisons_with_itself)
 
-def compare__non_hydrogen_graphs__multiple_cpu(non_hydrogen_graphs, include_comparisons_with_itself, no_of_cpus):
+class Equivalent_Molecule_Names:
     """
-    This method is desiged to compare the molecules in the non_hydrogen_graphs and obtain all the ways that molecules can be mapped onto each other.
+    This class is designed to give all the ways that two molecules can map onto each other, as a dictionary given as {(mol_name1, mol_name2): All the ways that mol_name1 maps onto mol_name2}.
 
-    This method is designed to use multiple cpus. 
+    Storing every way that every pair of molecules can map onto each other takes N^2 x (size of automorphism group) mappings for N molecules.
+    Instead, this class only stores the automorphism group of each type of molecule, and composes the mappings for a pair of molecules when they are asked for.
 
     Parameters
     ----------
-    non_hydrogen_graphs : dict of networkx.Graphs
-        This dict contains all the graphs of the molecule, where hydrogens have been removed and added to attached atoms as node features
+    molecule_isomorphism_classes : dict.
+        This is the type of each molecule (see get_molecule_isomorphism_classes).
+    automorphism_groups : dict.
+        These are the automorphism groups of each type of molecule (see get_molecule_isomorphism_classes).
     include_comparisons_with_itself : bool.
-        This boolean indicates if the user want to give the ways that a molecule could map onto itself. 
-            * For determining equivalent molecules, we dont want to do this, so set to False
-            * For determining equivalent dimers, we do want to do this, so set this to True.
-    no_of_cpus : int.
-        This is the number of cpus available to use on this program. In most cases this should just be set to 1 cpu, however for very large system you may want to implement multiple cpus.
-
-    Returns
-    -------
-    list_of_equivalent_molecule_names : list
-        This is the list to store all the names that map molecule 1 onto molecule 2. 
+        This boolean indicates if the user want to give the ways that a molecule could map onto itself.
     """
-
-    # First, create the manager to save lists to
-    with mp.Manager() as manager:
-
-        # Second, create the list to hold all the ways that molecules in non_hydrogen_graphs can map on to eachother.
-        list_of_equivalent_molecule_names = manager.list()
-
-        # Third, run the multiprocessing jobs.
-        print('Obtaining neighbourhoods between molecules (Please wait until after 100%, as the process will still be running.)', file=sys.stderr)
-        no_of_neighbourhood_sets = int((len(non_hydrogen_graphs) * (len(non_hydrogen_graphs) - 1)) / 2)
-        #process_map(compare_two_molecules_single_process, get_inputs(non_hydrogen_graphs, include_comparisons_with_itself, list_of_equivalent_molecule_names), total=no_of_neighbourhood_sets, desc='Obtaining neighbouring pairs of molecules', unit='calc', max_workers=no_of_cpus)
-        pool = mp.Pool(no_of_cpus)
-        pool.map_async(compare_two_molecules_single_process, tqdm(get_inputs(non_hydrogen_graphs, include_comparisons_with_itself, list_of_equivalent_molecule_names), total=no_of_neighbourhood_sets, desc='Obtaining neighbouring pairs of molecules', unit='calc'))
-        pool.close()
-        pool.join()
-        
-        # Fourth, save the list from a multiprocessing Manager list to a regular list
-        list_of_equivalent_molecule_names = list(list_of_equivalent_molecule_names)
-
-    # Fifth, return list_of_equivalent_molecule_names
-    return list_of_equivalent_molecule_names
-
-# ----------------------------------------------------------------------------------------------------------------------------------------------------------
-
-def compare_two_molecules_single_process(input_data):
-    """
-    This method is designed to perform a single 
-    """
-
-    # First, unpack the data from input_data
-    mol_name1, mol_name2, molecule1_graph, molecule2_graph, list_of_equivalent_molecule_names = input_data
-
-    # Second, create an instance of GraphMatcher
-    GM = GraphMatcher(molecule1_graph, molecule2_graph) # Turn mol1 into mol2
-
-    # Third, determine all the ways that molecule 1 could be mapped onto molecule 2 to (potentially) give the same molecule. 
-    all_unique_matches = GM.get_all_unique_isomorphic_graphs()
-
-    # Fourth, record all these matches in 
-    list_of_equivalent_molecule_names.append(((mol_name1, mol_name2), all_unique_matches))
-
-def get_inputs(non_hydrogen_graphs, include_comparisons_with_itself, list_of_equivalent_molecule_names):
-    """
-    This generator is designed to return all the input methods required for compare_two_molecules_single_cpu
-
-    Parameters
-    ----------
-    non_hydrogen_graphs : dict of networkx.Graphs
-        This dict contains all the graphs of the molecule, where hydrogens have been removed and added to attached atoms as node features.
-    include_comparisons_with_itself : bool.
-        This boolean indicates it the user want to give the ways that a molecule could map onto itself. 
-            * For determining equivalent molecules, we dont want to do this, so set to False
-            * For determining equivalent dimers, we do want to do this, so set this to True.
-    list_of_equivalent_molecule_names : list
-        This is the list to store all the names that map molecule 1 onto molecule 2. 
-
-    Returns
-    -------
-    mol_name1 : int
-        This is the mol_name of molecule 1 in non_hydrogen_graphs
-    mol_name2 : int
-        This is the mol_name of molecule 2 in non_hydrogen_graphs
-    non_hydrogen_graphs : dict of networkx.Graph
-        This is the dict of all the graphs of all molecules in the crystal, where hydrogens have been removed and added to attached atoms as node features.
-    list_of_equivalent_molecule_names : list
-        This is the list to store all the names that map molecule 1 onto molecule 2. 
-    """
-
-    # First, get the names of the molecules in 
-    mol_names = sorted(non_hydrogen_graphs.keys())
-
-    # Second, provide the additional index increment if include_comparisons_with_itself == True.
-    index_increment = 0 if include_comparisons_with_itself else 1
-
-    # Third, for each molecule in non_hydrogen_graphs.
-    for index1 in range(len(mol_names)):
-
-        # Fourth, obtain the name of the first molecule to eexamine.
-        mol_name1 = mol_names[index1]
-
-        # Fifth, make a pointer to the non-hydrogen graph of molecule 1.
-        molecule1_graph = non_hydrogen_graphs[mol_name1]
-
-        # Sixth, for every other molecule in non_hydrogen_graphs.
-        for index2 in range(index1+index_increment, len(mol_names)):
-
-            # Seventh, obtain the name of the first molecule to eexamine.
-            mol_name2 = mol_names[index2]
-
-            # Eighth, make a pointer to the non-hydrogen graph of molecule 2.
-            molecule2_graph = non_hydrogen_graphs[mol_name2]
-
-            # Ninth, yield input variables for compare_two_molecules_single_process
-            yield (mol_name1, mol_name2, molecule1_graph, molecule2_graph, list_of_equivalent_molecule_names)
-
-# ----------------------------------------------------------------------------------------------------------------------------------------------------------
-# ----------------------------------------------------------------------------------------------------------------------------------------------------------
-# ----------------------------------------------------------------------------------------------------------------------------------------------------------
-
-
-
-
-
+    def __init__(self, molecule_isomorphism_classes, automorphism_groups, include_comparisons_with_itself):
+        self.molecule_isomorphism_classes = molecule_isomorphism_classes
+        self.automorphism_groups = automorphism_groups
+        self.include_comparisons_with_itself = include_comparisons_with_itself
+
+    def __getitem__(self, mol_names):
+        """
+        This method will give all the ways that molecule 1 can be mapped onto molecule 2.
+
+        Parameters
+        ----------
+        mol_names : tuple of (int, int)
+            These are the names of molecule 1 and molecule 2.
+
+        Returns
+        -------
+        all_unique_matches : list of dict.
+            These are all the ways to map the atoms of molecule 1 onto the atoms of molecule 2. Empty if molecule 1 can not be mapped onto molecule 2.
+        """
+        if mol_names not in self:
+            raise KeyError(mol_names)
+        mol_name1, mol_name2 = mol_names
+        return get_all_isomorphisms_between_molecules(self.molecule_isomorphism_classes[mol_name1], self.molecule_isomorphism_classes[mol_name2], self.automorphism_groups)
+
+    def __contains__(self, mol_names):
+        if not (isinstance(mol_names, tuple) and (len(mol_names) == 2)):
+            return False
+        mol_name1, mol_name2 = mol_names
+        if (mol_name1 not in self.molecule_isomorphism_classes) or (mol_name2 not in self.molecule_isomorphism_classes):
+            return False
+        return self.include_comparisons_with_itself or (mol_name1 != mol_name2)
+
+    def keys(self):
+        """
+        This generator will give all the pairs of molecules in this dictionary.
+
+        Returns
+        -------
+        mol_names : tuple of (int, int)
+            These are the names of molecule 1 and molecule 2.
+        """
+        mol_names = sorted(self.molecule_isomorphism_classes.keys())
+        for mol_name1 in mol_names:
+            for mol_name2 in mol_names:
+                if (mol_name1 == mol_name2) and (not self.include_comparisons_with_itself):
+                    continue
+                yield (mol_name1, mol_name2)
+
+    def __iter__(self):
+        return self.keys()
+
+    def __len__(self):
+        no_of_molecules = len(self.molecule_isomorphism_classes)
+        return no_of_molecules * no_of_molecules if self.include_comparisons_with_itself else no_of_molecules * (no_of_molecules - 1)
+
+    def get_molecule_types(self):
+        """
+        This method will give the names of the molecules of each type, along with the size of the automorphism group of that type of molecule.
+
+        The number of ways that two molecules can map onto each other is the size of the automorphism group of their type of molecule (or 0 if they are different types of molecules).
+
+        Returns
+        -------
+        molecule_types : list of (list, int)
+            This is the sorted list of the names of the molecules of each type, along with the number of ways that a molecule of that type can map onto itself.
+        """
+        molecule_types = {}
+        for mol_name in sorted(self.molecule_isomorphism_classes.keys()):
+            graph_hash, class_index, _ = self.molecule_isomorphism_classes[mol_name]
+            molecule_types.setdefault((graph_hash, class_index), []).append(mol_name)
+        return [(mol_names, len(self.automorphism_groups[graph_hash][class_index][1])) for (graph_hash, class_index), mol_names in molecule_types.items()]
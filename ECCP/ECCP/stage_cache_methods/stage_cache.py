@@ -0,0 +1,149 @@
+"""
+stage_cache.py, Geoffrey Weal, 17/10/26
+
+This script contains methods for caching the results of the heavy stages of the ECCP program (processing the crystal, getting neighbouring molecules, getting dimers, getting unique molecules, and getting unique dimers).
+
+Each stage is given a key, which is a hash of the crystal and the parameters that the stage depends on, the key of the stage before it, and the versions of ECCP and SUMELF. 
+If the ECCP program is run again and the key of a stage has not changed, the results of that stage are loaded from the cache rather than being recalculated.
+This means that changing the settings of later stages (such as the functional used in the calc input files) does not require the neighbour and uniqueness analysis to be performed again. 
+"""
+import os, json, pickle, hashlib
+import importlib.metadata
+import numpy as np
+from ECCP.ECCP.utilities.write_file_atomically import write_file_atomically
+
+stage_cache_format_version = 2
+
+def get_crystal_key(crystal):
+	"""
+	This method is designed to obtain a hash of the contents of a crystal.
+
+	Parameters
+	----------
+	crystal : ase.Atoms
+		This is the crystal to obtain the hash for.
+
+	Returns
+	-------
+	crystal_key : str.
+		This is the hash of the elements, positions, unit cell and periodic boundary conditions of the crystal.
+	"""
+	crystal_hash = hashlib.sha256()
+	for array in (crystal.get_atomic_numbers(), crystal.get_positions(), np.array(crystal.get_cell()), crystal.get_pbc()):
+		array = np.ascontiguousarray(array)
+		crystal_hash.update(str((array.dtype.str, array.shape)).encode())
+		crystal_hash.update(array.tobytes())
+	return crystal_hash.hexdigest()
+
+def get_stage_key(stage_name, *stage_parameters):
+	"""
+	This method is designed to obtain the key of a stage from the parameters that the stage depends on.
+
+	Parameters
+	----------
+	stage_name : str.
+		This is the name of the stage.
+	stage_parameters : objects
+		These are the parameters that the stage depends on. This should include the key of the stage before this stage, so that if an earlier stage changes, this stage is also recalculated.
+
+	Returns
+	-------
+	stage_key : str.
+		This is the key for this stage.
+	"""
+	stage_information = json.dumps([stage_cache_format_version, get_software_versions(), stage_name, stage_parameters], sort_keys=True, default=repr)
+	return hashlib.sha256(stage_information.encode()).hexdigest()
+
+def get_software_versions():
+	"""
+	This method is designed to obtain the versions of ECCP and SUMELF. 
+
+	These are included in the key of every stage, so that results cached by an older version of ECCP or SUMELF are not used after either has been upgraded.
+
+	Returns
+	-------
+	software_versions : dict.
+		These are the versions of ECCP and SUMELF. The version of SUMELF is None if it can not be found.
+	"""
+	from ECCP import __version__ as ECCP_version
+	import SUMELF
+	SUMELF_version = getattr(SUMELF, '__version__', None)
+	if SUMELF_version is None:
+		try:
+			SUMELF_version = importlib.metadata.version('SUMELF')
+		except importlib.metadata.PackageNotFoundError:
+			SUMELF_version = None
+	return {'ECCP': ECCP_version, 'SUMELF': SUMELF_version}
+
+# ----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def load_stage_from_cache(path_to_stage_cache_folder, stage_name, stage_key):
+	"""
+	This method is designed to load the results of a stage from the cache, if the results were obtained with the same key.
+
+	Parameters
+	----------
+	path_to_stage_cache_folder : str. or None
+		This is the path to the folder that holds the stage cache. If None, the stage cache is not used.
+	stage_name : str.
+		This is the name of the stage.
+	stage_key : str.
+		This is the key for this stage.
+
+	Returns
+	-------
+	found_in_cache : bool.
+		True if the results of this stage were found in the cache. False if not.
+	stage_results : object or None
+		These are the results of this stage, if they were found in the cache.
+	"""
+
+	# First, if the stage cache is not being used, or there is no cache for this stage, the results are not in the cache.
+	if path_to_stage_cache_folder is None:
+		return False, None
+	path_to_stage_file = path_to_stage_cache_folder+'/'+stage_name+'.pickle'
+	if not os.path.exists(path_to_stage_file):
+		return False, None
+
+	# Second, load the cache for this stage.
+	#         * If the file can not be read (for example, if ECCP was stopped while writing it, or it refers to objects that no longer exist), treat it as not being in the cache.
+	try:
+		with open(path_to_stage_file, 'rb') as stage_file:
+			cached_stage_key, stage_results = pickle.load(stage_file)
+	except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError):
+		return False, None
+
+	# Third, only use the cached results if they were obtained with the same key.
+	if not (cached_stage_key == stage_key):
+		return False, None
+
+	# Fourth, return the cached results of this stage.
+	print('Loaded "'+str(stage_name)+'" stage from the stage cache.')
+	return True, stage_results
+
+def save_stage_to_cache(path_to_stage_cache_folder, stage_name, stage_key, stage_results):
+	"""
+	This method is designed to save the results of a stage to the cache.
+
+	Parameters
+	----------
+	path_to_stage_cache_folder : str. or None
+		This is the path to the folder that holds the stage cache. If None, the stage cache is not used.
+	stage_name : str.
+		This is the name of the stage.
+	stage_key : str.
+		This is the key for this stage.
+	stage_results : object
+		These are the results of this stage.
+	"""
+
+	# First, if the stage cache is not being used, do not save anything.
+	if path_to_stage_cache_folder is None:
+		return
+
+	# Second, write the results to disk.
+	os.makedirs(path_to_stage_cache_folder, exist_ok=True)
+	with write_file_atomically(path_to_stage_cache_folder+'/'+stage_name+'.pickle', mode='wb') as stage_file:
+		pickle.dump((stage_key, stage_results), stage_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+# ----------------------------------------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,238 @@
+"""
+Stage_Profiler.py, Geoffrey Weal, 17/10/26
+
+This object is designed to record how long each stage of ECCP takes and how much memory it uses, and to write this to a profile file (ECCP_profile.json).
+
+The peak memory of each stage is obtained on Linux by resetting the peak resident set size of this process (VmHWM) at the start of each stage. resource.getrusage only gives the peak over the lifetime of the process, so on other systems only this is recorded.
+"""
+import sys, json, time
+from datetime import datetime
+from ECCP.ECCP.utilities.write_file_atomically import write_file_atomically
+try:
+	import resource
+except ImportError:
+	resource = None
+
+profile_version = 2
+
+# These are the files used to reset and read the peak resident set size of this process on Linux.
+path_to_clear_refs = '/proc/self/clear_refs'
+path_to_status     = '/proc/self/status'
+
+# This is the largest peak resident set size of this process (in MB) that has been cleared by reset_peak_rss.
+#    * On Linux, resetting VmHWM also resets the peak given by resource.getrusage, so this is needed to give the peak memory over the lifetime of the process.
+peak_rss_before_resets = 0.0
+
+class Stage_Profiler:
+	"""
+	This object is designed to record the wall time, CPU time, peak memory (RSS) and number of items processed for each stage of ECCP.
+
+	Each stage is recorded by calling start_stage before the stage and end_stage after it. The profile is written to disk each time a stage ends, so the profile of the stages that finished is kept even if ECCP stops part way through.
+
+	Stages can overlap (such as process_crystal, which contains the other stages). The peak memory read before each reset is given to all the stages that are running, so each stage is given the peak memory over the whole of that stage.
+
+	Parameters
+	----------
+	path_to_profile_file : str. or None
+		This is the path to write the profile to. If None, the profile is recorded but not written to disk.
+	crystal_name : str.
+		This is the name of the crystal that ECCP is being run on.
+	no_of_cpus : int.
+		This is the number of cpus ECCP has been told to use.
+	"""
+	def __init__(self, path_to_profile_file, crystal_name, no_of_cpus):
+		self.path_to_profile_file = path_to_profile_file
+		self.profile = {'version': profile_version, 'crystal': crystal_name, 'no_of_cpus': no_of_cpus, 'started': datetime.now().isoformat(timespec='seconds'), 'stages': []}
+		self.running_stages = {}
+		self.stage_peak_rss = {}
+		self.can_reset_peak_rss = reset_peak_rss() and (read_peak_rss() is not None)
+		self.total_peak_rss = read_peak_rss() if self.can_reset_peak_rss else None
+		self.start_usage = self.get_usage()
+
+	def start_stage(self, stage_name):
+		"""
+		This method will record the start of a stage.
+
+		Parameters
+		----------
+		stage_name : str.
+			This is the name of the stage.
+		"""
+		if stage_name in self.running_stages:
+			raise Exception('Error: The stage '+str(stage_name)+' has already been started in the profiler.')
+		if self.can_reset_peak_rss:
+			self.update_peak_rss()
+			reset_peak_rss()
+			self.stage_peak_rss[stage_name] = read_peak_rss()
+		self.running_stages[stage_name] = self.get_usage()
+
+	def end_stage(self, stage_name, source='calculated', **counts):
+		"""
+		This method will record the end of a stage, and write the profile to disk.
+
+		Parameters
+		----------
+		stage_name : str.
+			This is the name of the stage.
+		source : str.
+			This indicates where the results of the stage came from, such as 'calculated', 'stage_cache' or 'ECCP_Information'. Default: 'calculated'
+		counts : int
+			These are the number of items processed in this stage, such as no_of_molecules=12 or no_of_dimers=340.
+		"""
+
+		# First, obtain the usage at the start and end of the stage.
+		if not (stage_name in self.running_stages):
+			raise Exception('Error: The stage '+str(stage_name)+' has not been started in the profiler.')
+		start_usage = self.running_stages.pop(stage_name)
+		end_usage   = self.get_usage()
+		self.update_peak_rss()
+		peak_rss = self.stage_peak_rss.pop(stage_name, None)
+
+		# Second, record the information about this stage.
+		self.profile['stages'].append(get_stage_information(stage_name, source, counts, start_usage, end_usage, peak_rss))
+
+		# Third, write the profile to disk.
+		self.write_profile()
+
+	def write_profile(self):
+		"""
+		This method will write the profile to disk as a json file.
+		"""
+
+		# First, record the totals across the whole of the ECCP run so far.
+		self.update_peak_rss()
+		self.profile['total'] = get_stage_information('total', None, {}, self.start_usage, self.get_usage(), self.total_peak_rss)
+
+		# Second, write the profile to disk.
+		if self.path_to_profile_file is None:
+			return
+		with write_file_atomically(self.path_to_profile_file) as profile_file:
+			json.dump(self.profile, profile_file, indent=4)
+
+	def update_peak_rss(self):
+		"""
+		This method will give the peak memory of this process since it was last reset to all the stages that are running, and to the total.
+		"""
+		if not self.can_reset_peak_rss:
+			return
+		peak_rss = read_peak_rss()
+		if peak_rss is None:
+			return
+		for stage_name in self.stage_peak_rss.keys():
+			self.stage_peak_rss[stage_name] = max(self.stage_peak_rss[stage_name], peak_rss)
+		self.total_peak_rss = max(self.total_peak_rss, peak_rss)
+
+	def get_usage(self):
+		"""
+		This method will obtain the current wall time, CPU time and peak memory of this process and its finished child processes (such as multiprocessing workers).
+
+		Returns
+		-------
+		usage : dict.
+			This is the current usage. CPU times are given in seconds, and peak memory over the lifetime of the process is given in MB. Memory values are None if they can not be obtained on this computer.
+		"""
+		usage = {'wall_time': time.perf_counter(), 'cpu_time': time.process_time(), 'children_cpu_time': None, 'process_peak_rss': None, 'children_peak_rss': None}
+		if resource is not None:
+			self_usage     = resource.getrusage(resource.RUSAGE_SELF)
+			children_usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+			usage['children_cpu_time'] = children_usage.ru_utime + children_usage.ru_stime
+			usage['process_peak_rss']  = max(convert_maxrss_to_MB(self_usage.ru_maxrss), peak_rss_before_resets)
+			usage['children_peak_rss'] = convert_maxrss_to_MB(children_usage.ru_maxrss)
+		return usage
+
+# ---------------------------------------------------------------------------------------------------------------
+
+def get_stage_information(stage_name, source, counts, start_usage, end_usage, peak_rss):
+	"""
+	This method will obtain the information about a stage from the usage at the start and end of the stage.
+
+	Parameters
+	----------
+	stage_name : str.
+		This is the name of the stage.
+	source : str. or None
+		This indicates where the results of the stage came from.
+	counts : dict.
+		These are the number of items processed in this stage.
+	start_usage : dict.
+		This is the usage at the start of the stage (see Stage_Profiler.get_usage).
+	end_usage : dict.
+		This is the usage at the end of the stage (see Stage_Profiler.get_usage).
+	peak_rss : float or None
+		This is the peak memory of this process during the stage (in MB). None if this can not be obtained on this computer.
+
+	Returns
+	-------
+	stage_information : dict.
+		This is the information about this stage.
+	"""
+	stage_information = {'stage': stage_name}
+	if source is not None:
+		stage_information['source'] = source
+	stage_information['wall_time_s'] = round(end_usage['wall_time'] - start_usage['wall_time'], 6)
+	stage_information['cpu_time_s']  = round(end_usage['cpu_time']  - start_usage['cpu_time'],  6)
+	stage_information['children_cpu_time_s'] = None if (end_usage['children_cpu_time'] is None) else round(end_usage['children_cpu_time'] - start_usage['children_cpu_time'], 6)
+	stage_information['peak_rss_MB']                  = peak_rss
+	stage_information['process_peak_rss_so_far_MB']   = end_usage['process_peak_rss']
+	stage_information['process_peak_rss_increase_MB'] = None if (end_usage['process_peak_rss'] is None) else round(end_usage['process_peak_rss'] - start_usage['process_peak_rss'], 3)
+	stage_information['children_peak_rss_so_far_MB']  = end_usage['children_peak_rss']
+	stage_information['counts'] = {count_name: int(count) for count_name, count in counts.items()}
+	return stage_information
+
+def convert_maxrss_to_MB(maxrss):
+	"""
+	This method will convert the maximum resident set size given by resource.getrusage to MB.
+
+	Parameters
+	----------
+	maxrss : int
+		This is the maximum resident set size. This is given in bytes on macOS, and in kilobytes on other systems.
+
+	Returns
+	-------
+	maxrss_in_MB : float
+		This is the maximum resident set size in MB.
+	"""
+	if sys.platform == 'darwin':
+		return round(maxrss / (1024.0 ** 2.0), 3)
+	return round(maxrss / 1024.0, 3)
+
+def reset_peak_rss():
+	"""
+	This method will reset the peak resident set size of this process (VmHWM) to the current resident set size. This can only be done on Linux.
+
+	Returns
+	-------
+	was_reset : bool.
+		True if the peak resident set size was reset, False if this can not be done on this computer.
+	"""
+	global peak_rss_before_resets
+	peak_rss = read_peak_rss()
+	try:
+		with open(path_to_clear_refs, 'w') as clear_refs_file:
+			clear_refs_file.write('5')
+	except OSError:
+		return False
+	if peak_rss is not None:
+		peak_rss_before_resets = max(peak_rss_before_resets, peak_rss)
+	return True
+
+def read_peak_rss():
+	"""
+	This method will read the peak resident set size of this process (VmHWM) since it was last reset. This can only be done on Linux.
+
+	Returns
+	-------
+	peak_rss : float or None
+		This is the peak resident set size in MB. None if this can not be obtained on this computer.
+	"""
+	try:
+		with open(path_to_status, 'r') as status_file:
+			for line in status_file:
+				if line.startswith('VmHWM:'):
+					return round(int(line.split()[1]) / 1024.0, 3)
+	except OSError:
+		pass
+	return None
+
+# ---------------------------------------------------------------------------------------------------------------
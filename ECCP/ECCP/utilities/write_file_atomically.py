@@ -0,0 +1,56 @@
+"""
+write_file_atomically.py, Geoffrey Weal, 17/10/26
+
+This script contains methods for writing files to disk so that a half written file is never left on disk.
+"""
+import os
+from contextlib import contextmanager
+from ase.io import write
+
+@contextmanager
+def write_file_atomically(filepath, mode='w'):
+	"""
+	This method will open a temporary file in the same folder as filepath to write to. Once writing has finished, the temporary file is moved to filepath.
+
+	This means that filepath is never left half written if ECCP is stopped while writing, and that other programs reading filepath never read a half written file.
+	If an error occurs while writing, the temporary file is removed and filepath is left as it was.
+
+	Parameters
+	----------
+	filepath : str.
+		This is the path to the file to write.
+	mode : str.
+		This is the mode to open the file with, either 'w' for text files or 'wb' for binary files. Default: 'w'
+
+	Yields
+	------
+	file : file object
+		This is the open temporary file to write to.
+	"""
+	temporary_filepath = filepath+'.'+str(os.getpid())+'.temp'
+	try:
+		with open(temporary_filepath, mode) as file:
+			yield file
+		os.replace(temporary_filepath, filepath)
+	except BaseException:
+		if os.path.exists(temporary_filepath):
+			os.remove(temporary_filepath)
+		raise
+
+# ---------------------------------------------------------------------------------------------------------------
+
+def write_xyz_atomically(filepath, atoms):
+	"""
+	This method will write an ase.Atoms object to disk as an xyz file, so that filepath is never left half written if ECCP is stopped while writing.
+
+	Parameters
+	----------
+	filepath : str.
+		This is the path to write the xyz file to.
+	atoms : ase.Atoms
+		This is the object to write to disk.
+	"""
+	with write_file_atomically(filepath) as xyz_file:
+		write(xyz_file, atoms, format='extxyz')
+
+# ---------------------------------------------------------------------------------------------------------------
@@ -5,12 +5,13 @@ write_dimers_to_disk is designed to save data about the dimer to disk.
 """
 import numpy as np
 import networkx as nx
-from ase.io import write
 from copy import deepcopy
 
 from SUMELF                                                          import make_folder, make_dimer, add_graph_to_ASE_Atoms_object
 
 from ECCP.ECCP.invariance_methods.are_environments_equivalent        import get_environment
+from ECCP.ECCP.utilities.write_file_atomically                       import write_xyz_atomically
+from ECCP.ECCP_Programs.shared_general_methods.process_jobs_in_parallel import process_jobs_in_parallel
 
 from ECCP.ECCP.write_dimers_to_disk_methods.write_EET_gaussian_files import write_EET_gaussian_files
 from ECCP.ECCP.write_dimers_to_disk_methods.write_ICT_gaussian_files import write_ICT_gaussian_files
@@ -18,7 +19,7 @@ from ECCP.ECCP.write_dimers_to_disk_methods.write_ICT_gaussian_files import writ
 from ECCP.ECCP.write_dimers_to_disk_methods.write_EET_orca_files     import write_EET_orca_files
 from ECCP.ECCP.write_dimers_to_disk_methods.write_ICT_orca_files     import write_ICT_orca_files
 
-def write_dimers_to_disk(all_dimers_info_names, all_dimers_info, molecules, molecule_graphs, neighbouring_molecules_about_dimers, SolventsList, dimers_folderpath, dimers_with_environment_folderpath, eet_calc_jobs_path, ict_calc_jobs_path, all_calc_parameters_for_EETs=None, all_submission_information_for_EETs=None, all_calc_parameters_for_ICTs=None, all_submission_information_for_ICTs=None, get_dimer_eets=True, get_dimer_icts=True):
+def write_dimers_to_disk(all_dimers_info_names, all_dimers_info, molecules, molecule_graphs, neighbouring_molecules_about_dimers, SolventsList, dimers_folderpath, dimers_with_environment_folderpath, eet_calc_jobs_path, ict_calc_jobs_path, all_calc_parameters_for_EETs=None, all_submission_information_for_EETs=None, all_calc_parameters_for_ICTs=None, all_submission_information_for_ICTs=None, get_dimer_eets=True, get_dimer_icts=True, no_of_cpus=1):
 	"""
 	This method will save dimer files to disk.
 
@@ -65,115 +66,143 @@ def write_dimers_to_disk(all_dimers_info_names, all_dimers_info, molecules, mole
 	submit_ICTs_in_parallel : bool.
 		This tag indicates if the user wants to submit ICT jobs of different calc parameters from all_calc_parameters in series or parallel. Default: True.
 
+	no_of_cpus : int.
+		This is the number of cpus to use to write the files of the dimers. Default: 1
 	"""
 
-	# Prestep, make a note if EET has been requested at least once.
-	have_requested_EET = False
-
 	# First, make the dimers_folderpath folder if it doesn't already exist
 	make_folder(dimers_folderpath)
 	if len(neighbouring_molecules_about_dimers) > 0:
 		make_folder(dimers_with_environment_folderpath)
 
-	# Second, for each dimer information in the list of dimers
-	for dimer_name in sorted(all_dimers_info_names):
-
-		# Second, get information from the index-th position on the all_dimers_info list
-		mol_name1, mol_name2, unit_cell_displacement, displacement, move_centre_of_mass_by, shortest_distance = all_dimers_info[dimer_name]
-
-		# Third, indicate which monomers are solvents
-		Solvent_name_1 = 'S' if (mol_name1 in SolventsList) else ''
-		Solvent_name_2 = 'S' if (mol_name2 in SolventsList) else ''
+	# Second, make a note if EET has been requested with ORCA. 
+	#         * This is done here rather than for each dimer, so that the note is only given once. 
+	if get_dimer_eets and (all_calc_parameters_for_EETs is not None) and (len(all_dimers_info_names) > 0):
+		for calc_parameters_for_EETs in all_calc_parameters_for_EETs:
+			if ('calc_software' in calc_parameters_for_EETs) and (calc_parameters_for_EETs['calc_software'].lower() == 'orca'):
+				print('Note: There is no EET function in ORCA')
 
-		# Fourth, make all names needed
-		dimer_name_prefix = 'Dimer'+str(dimer_name)
-		full_dimer_name   = dimer_name_prefix+'_M'+str(mol_name1)+Solvent_name_1+'_M'+str(mol_name2)+Solvent_name_2
-		molecule1_name    = dimer_name_prefix+'_Monomer1_M'+str(mol_name1)+Solvent_name_1
-		molecule2_name    = dimer_name_prefix+'_Monomer2_M'+str(mol_name2)+Solvent_name_2
+	# Third, gather the information that is needed to write the files of every dimer.
+	write_inputs = {'all_dimers_info': all_dimers_info, 'molecules': molecules, 'molecule_graphs': molecule_graphs, 'neighbouring_molecules_about_dimers': neighbouring_molecules_about_dimers, 'SolventsList': SolventsList, 'dimers_folderpath': dimers_folderpath, 'dimers_with_environment_folderpath': dimers_with_environment_folderpath, 'eet_calc_jobs_path': eet_calc_jobs_path, 'ict_calc_jobs_path': ict_calc_jobs_path, 'all_calc_parameters_for_EETs': all_calc_parameters_for_EETs, 'all_submission_information_for_EETs': all_submission_information_for_EETs, 'all_calc_parameters_for_ICTs': all_calc_parameters_for_ICTs, 'all_submission_information_for_ICTs': all_submission_information_for_ICTs, 'get_dimer_eets': get_dimer_eets, 'get_dimer_icts': get_dimer_icts}
 
-		# Fifth, copy the molecules just to prevent anything being overwritten in the original_file
-		dimer, molecule1, molecule2 = make_dimer(molecules, mol_name1, mol_name2, displacement, move_centre_of_mass_by)
+	# Fourth, write the files for each dimer in all_dimers_info_names.
+	process_jobs_in_parallel(write_dimer_files, sorted(all_dimers_info_names), no_of_cpus=no_of_cpus, shared_inputs=write_inputs, desc='Writing dimers', unit='dimer')
 
-		# Sixth, mark out which indicies for with which molecule in the dimer. 
-		molecule_1_indices = list(range(len(molecule1)))
-		molecule_2_indices = list(range(len(molecule1),len(molecule1)+len(molecule2)))
-
-		# Seventh, record the fragments that each atom in the dimer belongs to for calc. 
-		fragment1_list = [1]*len(molecule1)
-		fragment2_list = [2]*len(molecule2)
-
-		# Eighth, make the Dimer
-		dimer         = molecule1 + molecule2
-		fragmentlist = fragment1_list + fragment2_list
-		dimer.set_tags(fragmentlist)
+def write_dimer_files(dimer_name, write_inputs):
+	"""
+	This method will write the xyz files of a dimer to disk, along with its EET and ICT files if desired.
 
-		# Ninth, add the graphs (bonding system) of the molecules in the dimer together.
-		molecule1_graph   = deepcopy(molecule_graphs[mol_name1])
-		molecule2_graph   = deepcopy(molecule_graphs[mol_name2])
-		molecule2_mapping = {m2_atom_index: m2_atom_index+len(molecule1_graph) for m2_atom_index in tuple(molecule2_graph.nodes.keys())}
-		molecule2_graph   = nx.relabel_nodes(molecule2_graph, molecule2_mapping)
-		dimer_graph       = nx.compose(molecule1_graph,molecule2_graph)
+	Parameters
+	----------
+	dimer_name : int
+		This is the name of the dimer to write to disk.
+	write_inputs : dict.
+		This is the information that is needed to write the files of every dimer (see write_dimers_to_disk).
+	"""
 
-		# Tenth, add the graph of the dimer back to the dimer before it is saved as an xyz file.
-		add_graph_to_ASE_Atoms_object(dimer, dimer_graph)
-		
-		# Eleventh, assign the bonding system to it and write it as a xyz file. 
-		write(dimers_folderpath+'/'+full_dimer_name+'.xyz', dimer)
-
-		# Twelfth, write the molecules with their environments to file
-		if len(neighbouring_molecules_about_dimers) > 0:
-			raise Exception('Check if this is working when you first run this.')
-			details_of_dimer_to_get_environ_for = (mol_name1, mol_name2, unit_cell_displacement)
-			environment_about_dimer = get_environment(details_of_dimer_to_get_environ_for, neighbouring_molecules_about_dimers, molecules)
-			environment_about_dimer.set_array('NeighboursList', np.array(['-']*len(environment_about_dimer)))
-			dimer_with_environment = dimer.copy() + environment_about_dimer
-			fragmentlist += [3]*len(environment_about_dimer)
-			dimer_with_environment.set_tags(fragmentlist)
-			write(dimers_with_environment_folderpath+'/'+full_dimer_name+'.xyz', dimer_with_environment)
-		else:
-			environment_about_dimer = None
-
-		# Thirteenth, write the EET files for the dimer
-		if get_dimer_eets and (all_calc_parameters_for_EETs is not None):
-			for calc_parameters_for_EETs, submission_information_for_EETs in zip(all_calc_parameters_for_EETs, all_submission_information_for_EETs):
-				if not 'calc_software' in calc_parameters_for_EETs:
-					raise Exception("Error: You need to specify a value for 'calc_software' in calc_parameters_for_EETs.")
-				if   calc_parameters_for_EETs['calc_software'].lower() == 'gaussian':
-					write_EET_gaussian_files(molecule1, molecule2, full_dimer_name, environment_about_dimer, eet_calc_jobs_path, fragmentlist, calc_parameters_for_EETs, submission_information_for_EETs)
-				elif calc_parameters_for_EETs['calc_software'].lower() == 'orca':
-					if not have_requested_EET:
-						print('Note: There is no EET function in ORCA')
-					#raise Exception('Need to write this part.')
-					#write_EET_orca_files    (molecule1, molecule2, full_dimer_name, environment_about_dimer, eet_calc_jobs_path, fragmentlist, calc_parameters_for_EETs, submission_information_for_EETs)
-				else:
-					raise Exception("Error: calc_parameters_for_EETs['calc_software'] needs to be either Gaussian or ORCA. calc_parameters_for_EETs['calc_software'] = "+str(calc_parameters_for_EETs['calc_software']))
-			have_requested_EET = True
-		
-		# Fourteenth, write the ICT files for the dimer
-		if get_dimer_icts  and (all_calc_parameters_for_ICTs is not None):
-			raise Exception('Need to write this part.')
-			'''
-			for original_calc_parameters, original_submission_information in zip(all_calc_parameters_for_EETs, all_submission_information_for_EETs):
-				if   all_calc_parameters_for_ICTs['calc_software'] == 'gaussian':
-					write_ICTs_gaussian_files(dimer, molecule1, molecule2, environment_about_dimer, full_dimer_name, icts_calc_jobs_path, all_calc_parameters_for_ICTs, all_submission_information_for_ICTs)
-				elif all_calc_parameters_for_ICTs['calc_software'] == 'orca':
-					write_ICTs_orca_files    (dimer, molecule1, molecule2, environment_about_dimer, full_dimer_name, icts_calc_jobs_path, all_calc_parameters_for_ICTs, all_submission_information_for_ICTs)
-				else:
-					raise Exception('Error here.')
-			'''
-			#write_ICTs_gaussian_files(dimer, molecule1, molecule2, full_dimer_name, environment_about_dimer, icts_calc_jobs_path, all_calc_parameters_for_ICTs, all_submission_information_for_ICTs)
-
-		# Fiftheenth, add the graph of each molecule in the dimer back to the molecule itself before it is saved.
-		add_graph_to_ASE_Atoms_object(molecule1, deepcopy(molecule_graphs[mol_name1]))
-		add_graph_to_ASE_Atoms_object(molecule2, deepcopy(molecule_graphs[mol_name2]))
-
-		# Sixteenth, save the individual xyz files of each molecule in the dimer
-		make_folder(dimers_folderpath+'/'+full_dimer_name)
-		write(dimers_folderpath+'/'+full_dimer_name+'/'+molecule1_name+'.xyz', molecule1)
-		write(dimers_folderpath+'/'+full_dimer_name+'/'+molecule2_name+'.xyz', molecule2)
-
-		# Seventeenth, save information about the specific dimer. 
-		which_indices_go_with_which_molecule(molecule1_name, molecule2_name, molecule_1_indices, molecule_2_indices, dimers_folderpath+'/'+full_dimer_name, full_dimer_name)
+	# First, obtain the following variables
+	molecules          = write_inputs['molecules']
+	molecule_graphs    = write_inputs['molecule_graphs']
+	SolventsList       = write_inputs['SolventsList']
+	dimers_folderpath  = write_inputs['dimers_folderpath']
+	neighbouring_molecules_about_dimers = write_inputs['neighbouring_molecules_about_dimers']
+	all_calc_parameters_for_EETs        = write_inputs['all_calc_parameters_for_EETs']
+	all_submission_information_for_EETs = write_inputs['all_submission_information_for_EETs']
+
+	# Second, get information from the index-th position on the all_dimers_info list
+	mol_name1, mol_name2, unit_cell_displacement, displacement, move_centre_of_mass_by, shortest_distance = write_inputs['all_dimers_info'][dimer_name]
+
+	# Third, indicate which monomers are solvents
+	Solvent_name_1 = 'S' if (mol_name1 in SolventsList) else ''
+	Solvent_name_2 = 'S' if (mol_name2 in SolventsList) else ''
+
+	# Fourth, make all names needed
+	dimer_name_prefix = 'Dimer'+str(dimer_name)
+	full_dimer_name   = dimer_name_prefix+'_M'+str(mol_name1)+Solvent_name_1+'_M'+str(mol_name2)+Solvent_name_2
+	molecule1_name    = dimer_name_prefix+'_Monomer1_M'+str(mol_name1)+Solvent_name_1
+	molecule2_name    = dimer_name_prefix+'_Monomer2_M'+str(mol_name2)+Solvent_name_2
+
+	# Fifth, copy the molecules just to prevent anything being overwritten in the original_file
+	dimer, molecule1, molecule2 = make_dimer(molecules, mol_name1, mol_name2, displacement, move_centre_of_mass_by)
+
+	# Sixth, mark out which indicies for with which molecule in the dimer. 
+	molecule_1_indices = list(range(len(molecule1)))
+	molecule_2_indices = list(range(len(molecule1),len(molecule1)+len(molecule2)))
+
+	# Seventh, record the fragments that each atom in the dimer belongs to for calc. 
+	fragment1_list = [1]*len(molecule1)
+	fragment2_list = [2]*len(molecule2)
+
+	# Eighth, make the Dimer
+	dimer         = molecule1 + molecule2
+	fragmentlist = fragment1_list + fragment2_list
+	dimer.set_tags(fragmentlist)
+
+	# Ninth, add the graphs (bonding system) of the molecules in the dimer together.
+	molecule1_graph   = deepcopy(molecule_graphs[mol_name1])
+	molecule2_graph   = deepcopy(molecule_graphs[mol_name2])
+	molecule2_mapping = {m2_atom_index: m2_atom_index+len(molecule1_graph) for m2_atom_index in tuple(molecule2_graph.nodes.keys())}
+	molecule2_graph   = nx.relabel_nodes(molecule2_graph, molecule2_mapping)
+	dimer_graph       = nx.compose(molecule1_graph,molecule2_graph)
+
+	# Tenth, add the graph of the dimer back to the dimer before it is saved as an xyz file.
+	add_graph_to_ASE_Atoms_object(dimer, dimer_graph)
+	
+	# Eleventh, assign the bonding system to it and write it as a xyz file. 
+	write_xyz_atomically(dimers_folderpath+'/'+full_dimer_name+'.xyz', dimer)
+
+	# Twelfth, write the molecules with their environments to file
+	if len(neighbouring_molecules_about_dimers) > 0:
+		raise Exception('Check if this is working when you first run this.')
+		details_of_dimer_to_get_environ_for = (mol_name1, mol_name2, unit_cell_displacement)
+		environment_about_dimer = get_environment(details_of_dimer_to_get_environ_for, neighbouring_molecules_about_dimers, molecules)
+		environment_about_dimer.set_array('NeighboursList', np.array(['-']*len(environment_about_dimer)))
+		dimer_with_environment = dimer.copy() + environment_about_dimer
+		fragmentlist += [3]*len(environment_about_dimer)
+		dimer_with_environment.set_tags(fragmentlist)
+		write_xyz_atomically(write_inputs['dimers_with_environment_folderpath']+'/'+full_dimer_name+'.xyz', dimer_with_environment)
+	else:
+		environment_about_dimer = None
+
+	# Thirteenth, write the EET files for the dimer
+	if write_inputs['get_dimer_eets'] and (all_calc_parameters_for_EETs is not None):
+		for calc_parameters_for_EETs, submission_information_for_EETs in zip(all_calc_parameters_for_EETs, all_submission_information_for_EETs):
+			if not 'calc_software' in calc_parameters_for_EETs:
+				raise Exception("Error: You need to specify a value for 'calc_software' in calc_parameters_for_EETs.")
+			if   calc_parameters_for_EETs['calc_software'].lower() == 'gaussian':
+				write_EET_gaussian_files(molecule1, molecule2, full_dimer_name, environment_about_dimer, write_inputs['eet_calc_jobs_path'], fragmentlist, calc_parameters_for_EETs, submission_information_for_EETs)
+			elif calc_parameters_for_EETs['calc_software'].lower() == 'orca':
+				pass
+				#raise Exception('Need to write this part.')
+				#write_EET_orca_files    (molecule1, molecule2, full_dimer_name, environment_about_dimer, eet_calc_jobs_path, fragmentlist, calc_parameters_for_EETs, submission_information_for_EETs)
+			else:
+				raise Exception("Error: calc_parameters_for_EETs['calc_software'] needs to be either Gaussian or ORCA. calc_parameters_for_EETs['calc_software'] = "+str(calc_parameters_for_EETs['calc_software']))
+	
+	# Fourteenth, write the ICT files for the dimer
+	if write_inputs['get_dimer_icts']  and (write_inputs['all_calc_parameters_for_ICTs'] is not None):
+		raise Exception('Need to write this part.')
+		'''
+		for original_calc_parameters, original_submission_information in zip(all_calc_parameters_for_EETs, all_submission_information_for_EETs):
+			if   all_calc_parameters_for_ICTs['calc_software'] == 'gaussian':
+				write_ICTs_gaussian_files(dimer, molecule1, molecule2, environment_about_dimer, full_dimer_name, icts_calc_jobs_path, all_calc_parameters_for_ICTs, all_submission_information_for_ICTs)
+			elif all_calc_parameters_for_ICTs['calc_software'] == 'orca':
+				write_ICTs_orca_files    (dimer, molecule1, molecule2, environment_about_dimer, full_dimer_name, icts_calc_jobs_path, all_calc_parameters_for_ICTs, all_submission_information_for_ICTs)
+			else:
+				raise Exception('Error here.')
+		'''
+		#write_ICTs_gaussian_files(dimer, molecule1, molecule2, full_dimer_name, environment_about_dimer, icts_calc_jobs_path, all_calc_parameters_for_ICTs, all_submission_information_for_ICTs)
+
+	# Fiftheenth, add the graph of each molecule in the dimer back to the molecule itself before it is saved.
+	add_graph_to_ASE_Atoms_object(molecule1, deepcopy(molecule_graphs[mol_name1]))
+	add_graph_to_ASE_Atoms_object(molecule2, deepcopy(molecule_graphs[mol_name2]))
+
+	# Sixteenth, save the individual xyz files of each molecule in the dimer
+	make_folder(dimers_folderpath+'/'+full_dimer_name)
+	write_xyz_atomically(dimers_folderpath+'/'+full_dimer_name+'/'+molecule1_name+'.xyz', molecule1)
+	write_xyz_atomically(dimers_folderpath+'/'+full_dimer_name+'/'+molecule2_name+'.xyz', molecule2)
+
+	# Seventeenth, save information about the specific dimer. 
+	which_indices_go_with_which_molecule(molecule1_name, molecule2_name, molecule_1_indices, molecule_2_indices, dimers_folderpath+'/'+full_dimer_name, full_dimer_name)
 
 # for testing xyz integration grid
 from math import pi
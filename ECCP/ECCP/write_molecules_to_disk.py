@@ -5,13 +5,14 @@ This script will save the individual molecules that are found within a crystal s
 """
 import numpy as np
 from ase import Atoms
-from ase.io import write
 from copy import deepcopy
 
 from SUMELF                                                               import make_folder, add_graph_to_ASE_Atoms_object
 from SUMELF                                                               import check_molecule_against_file
 
 from ECCP.ECCP.invariance_methods.are_environments_equivalent             import get_environment
+from ECCP.ECCP.utilities.write_file_atomically                            import write_xyz_atomically
+from ECCP.ECCP_Programs.shared_general_methods.process_jobs_in_parallel   import process_jobs_in_parallel
 
 from ECCP.ECCP.write_molecules_to_disk_methods.write_ATC_gaussian_files   import write_ATC_gaussian_files
 from ECCP.ECCP.write_molecules_to_disk_methods.write_ATC_orca_files       import write_ATC_orca_files
@@ -25,7 +26,7 @@ from ECCP.ECCP.write_molecules_to_disk_methods.write_RE_orca_SP_files     import
 from ECCP.ECCP.write_molecules_to_disk_methods.write_FC_gaussian_files    import write_FC_gaussian_files
 from ECCP.ECCP.write_molecules_to_disk_methods.write_FC_orca_files        import write_FC_orca_files
 
-def write_molecules_to_disk(structurally_unique_molecules_indices, conformationally_unique_molecules_indices, molecules, molecule_graphs, neighbouring_molecules_about_molecules, SolventsList, molecules_folderpath, molecules_with_environment_folderpath, atc_calc_jobs_path, re_calc_jobs_path, fc_calc_jobs_path, all_calc_parameters_for_ATCs, all_calc_parameters_for_multiwfn, all_calc_parameters_for_REs, all_calc_parameters_for_FCs, all_submission_information_for_ATCs, all_submission_information_for_multiwfn, all_submission_information_for_REs, all_submission_information_for_FCs, get_molecule_atcs=True, get_molecule_res=True, get_molecule_fcs=True, run_excited_state_from_optimised_ground_structure=False):
+def write_molecules_to_disk(structurally_unique_molecules_indices, conformationally_unique_molecules_indices, molecules, molecule_graphs, neighbouring_molecules_about_molecules, SolventsList, molecules_folderpath, molecules_with_environment_folderpath, atc_calc_jobs_path, re_calc_jobs_path, fc_calc_jobs_path, all_calc_parameters_for_ATCs, all_calc_parameters_for_multiwfn, all_calc_parameters_for_REs, all_calc_parameters_for_FCs, all_submission_information_for_ATCs, all_submission_information_for_multiwfn, all_submission_information_for_REs, all_submission_information_for_FCs, get_molecule_atcs=True, get_molecule_res=True, get_molecule_fcs=True, run_excited_state_from_optimised_ground_structure=False, no_of_cpus=1):
 	"""
 	This method will save the individual molecules that are found within a crystal structure to disk.
 
@@ -84,6 +85,9 @@ def write_molecules_to_disk(structurally_unique_molecules_indices, conformationa
 	
 	run_excited_state_from_optimised_ground_structure : bool.
 		This boolean indicates if you want to run the excited state calculation from the optimised ground state calculation for reorganisation energy calculations. True if you do, False if you want to run the excited state calculation from the original structure (Default: False).
+
+	no_of_cpus : int.
+		This is the number of cpus to use to write the files of the molecules. Default: 1
 	"""
 
 	# First, make the folder to place molecule files in.
@@ -91,140 +95,188 @@ def write_molecules_to_disk(structurally_unique_molecules_indices, conformationa
 	if len(neighbouring_molecules_about_molecules) > 0:
 		make_folder(molecules_with_environment_folderpath)
 
-	# Second, for all the structurally unique molecules in the crystal, performing the following:
-	for mol_name in structurally_unique_molecules_indices:
+	# Second, give the multiwfn jobs the same log filenames as the ATC jobs. 
+	#         * This is done here rather than for each molecule, as each write task is given its own copy of all_submission_information_for_multiwfn.
+	if get_molecule_atcs and (all_calc_parameters_for_ATCs is not None):
+		for index in range(len(all_submission_information_for_ATCs)):
+			if 'log_filename' in all_submission_information_for_ATCs[index]:
+				all_submission_information_for_multiwfn[index]['log_filename'] = all_submission_information_for_ATCs[index]['log_filename']
 
-		# ==================================================================================================
-		# Third, obtain the following variables
-		molecule       = molecules[mol_name]
-		molecule_graph = molecule_graphs[mol_name]
+	# Third, gather the information that is needed to write the files of every molecule.
+	write_inputs = {'molecules': molecules, 'molecule_graphs': molecule_graphs, 'neighbouring_molecules_about_molecules': neighbouring_molecules_about_molecules, 'SolventsList': SolventsList, 'molecules_folderpath': molecules_folderpath, 'molecules_with_environment_folderpath': molecules_with_environment_folderpath, 'atc_calc_jobs_path': atc_calc_jobs_path, 're_calc_jobs_path': re_calc_jobs_path, 'fc_calc_jobs_path': fc_calc_jobs_path, 'all_calc_parameters_for_ATCs': all_calc_parameters_for_ATCs, 'all_calc_parameters_for_multiwfn': all_calc_parameters_for_multiwfn, 'all_calc_parameters_for_REs': all_calc_parameters_for_REs, 'all_calc_parameters_for_FCs': all_calc_parameters_for_FCs, 'all_submission_information_for_ATCs': all_submission_information_for_ATCs, 'all_submission_information_for_multiwfn': all_submission_information_for_multiwfn, 'all_submission_information_for_REs': all_submission_information_for_REs, 'all_submission_information_for_FCs': all_submission_information_for_FCs, 'get_molecule_atcs': get_molecule_atcs, 'get_molecule_res': get_molecule_res, 'get_molecule_fcs': get_molecule_fcs, 'run_excited_state_from_optimised_ground_structure': run_excited_state_from_optimised_ground_structure}
 
-		# Fourth, Add details from the molecules graph back to the molecule.
-		molecule_copy = molecule.copy()
-		add_graph_to_ASE_Atoms_object(molecule_copy, deepcopy(molecule_graph))
+	# Fourth, write the xyz and ATC files for all the structurally unique molecules in the crystal.
+	process_jobs_in_parallel(write_structurally_unique_molecule_files, list(structurally_unique_molecules_indices), no_of_cpus=no_of_cpus, shared_inputs=write_inputs, desc='Writing structurally unique molecules', unit='molecule')
 
-		# Fifth, obtain the name of the molecule filename. 
-		molecule_name = 'molecule_'+str(mol_name)
-		if mol_name in SolventsList:
-			molecule_name += 'S'
+	# Fifth, write the RE and FC files for all the conformationally unique molecules in the crystal.
+	#        Note: If a molecule is structurally unique, it will also be conformationally unique.
+	#              A conformationally unique molecule might not be necessarily structurally unique.
+	process_jobs_in_parallel(write_conformationally_unique_molecule_files, list(conformationally_unique_molecules_indices), no_of_cpus=no_of_cpus, shared_inputs=write_inputs, desc='Writing conformationally unique molecules', unit='molecule')
 
-		# Sixth, if there already exists this molecule on file, check if the molecules are the same.
-		check_molecule_against_file(molecule_copy, molecules_folderpath+'/'+molecule_name+'.xyz')
+# ---------------------------------------------------------------------------------------------------------------
 
-		# Seventh, write the molecules to molecules_folderpath as xyz files.
-		write(molecules_folderpath+'/'+molecule_name+'.xyz', molecule_copy)
+def write_structurally_unique_molecule_files(mol_name, write_inputs):
+	"""
+	This method will write the xyz file of a structurally unique molecule to disk, along with its ATC files if desired.
 
-		# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -  
+	Parameters
+	----------
+	mol_name : int
+		This is the name of the molecule to write to disk.
+	write_inputs : dict.
+		This is the information that is needed to write the files of every molecule (see write_molecules_to_disk).
+	"""
 
-		# Eighth, write the molecules with their environments to file
-		if len(neighbouring_molecules_about_molecules) > 0:
+	# First, obtain the following variables
+	molecule       = write_inputs['molecules'][mol_name]
+	molecule_graph = write_inputs['molecule_graphs'][mol_name]
+	neighbouring_molecules_about_molecules = write_inputs['neighbouring_molecules_about_molecules']
+	SolventsList          = write_inputs['SolventsList']
+	molecules_folderpath  = write_inputs['molecules_folderpath']
+	atc_calc_jobs_path    = write_inputs['atc_calc_jobs_path']
+	all_calc_parameters_for_ATCs           = write_inputs['all_calc_parameters_for_ATCs']
+	all_submission_information_for_ATCs    = write_inputs['all_submission_information_for_ATCs']
 
-			# 8.1: Write the molecule file including it's environment.
-			environment_about_molecule = get_environment(mol_name, neighbouring_molecules_about_molecules, molecules)
+	# Second, Add details from the molecules graph back to the molecule.
+	molecule_copy = molecule.copy()
+	add_graph_to_ASE_Atoms_object(molecule_copy, deepcopy(molecule_graph))
 
-			# 8.2: Include no information about the neighbourlist for environmental molecules.
-			environment_about_molecule.set_array('NeighboursList', np.array(['-']*len(environment_about_molecule)))
+	# Third, obtain the name of the molecule filename. 
+	molecule_name = 'molecule_'+str(mol_name)
+	if mol_name in SolventsList:
+		molecule_name += 'S'
 
-			# 8.3: Add the molecules that are apart of the environment to the molecule of interest. 
-			molecule_with_environment = molecule.copy() + environment_about_molecule
+	# Fourth, if there already exists this molecule on file, check if the molecules are the same.
+	check_molecule_against_file(molecule_copy, molecules_folderpath+'/'+molecule_name+'.xyz')
 
-			# 8.4: Indicate which atoms are apart of the molecule and which atoms are apart of the environment. 
-			#molecule_with_environment.set_tags([1]*len(molecule) + [2]*len(environment_about_molecule))
+	# Fifth, write the molecules to molecules_folderpath as xyz files.
+	write_xyz_atomically(molecules_folderpath+'/'+molecule_name+'.xyz', molecule_copy)
 
-			raise Exception('Need to check how this works, and include method for checking Atoms object against that on file if it exists.')
+	# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -  
 
-			# 8.5: If there already exists this molecule on file, check if the molecules are the same.
-			check_molecule_against_file(molecule_copy, molecules_folderpath+'/'+molecule_name+'.xyz')
+	# Sixth, write the molecules with their environments to file
+	if len(neighbouring_molecules_about_molecules) > 0:
 
-			# 8.6: Write the molecule with its environment to disk. 
-			write(molecules_with_environment_folderpath+'/'+molecule_name+'.xyz', molecule_with_environment)
+		# 6.1: Write the molecule file including it's environment.
+		environment_about_molecule = get_environment(mol_name, neighbouring_molecules_about_molecules, write_inputs['molecules'])
 
-		else:
+		# 6.2: Include no information about the neighbourlist for environmental molecules.
+		environment_about_molecule.set_array('NeighboursList', np.array(['-']*len(environment_about_molecule)))
 
-			# 8.7: Do not include the environment around the molecule. 
-			environment_about_molecule = None
+		# 6.3: Add the molecules that are apart of the environment to the molecule of interest. 
+		molecule_with_environment = molecule.copy() + environment_about_molecule
 
-		# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - 
+		# 6.4: Indicate which atoms are apart of the molecule and which atoms are apart of the environment. 
+		#molecule_with_environment.set_tags([1]*len(molecule) + [2]*len(environment_about_molecule))
 
-		# Ninth, write the DFT calculation files related to the ATC if desired.
-		if get_molecule_atcs and (all_calc_parameters_for_ATCs is not None):
+		raise Exception('Need to check how this works, and include method for checking Atoms object against that on file if it exists.')
 
-			# 9.1: Write the ATC input files.
-			for calc_parameters_for_ATCs, submission_information_for_ATCs in zip(all_calc_parameters_for_ATCs, all_submission_information_for_ATCs):
+		# 6.5: If there already exists this molecule on file, check if the molecules are the same.
+		check_molecule_against_file(molecule_copy, molecules_folderpath+'/'+molecule_name+'.xyz')
 
-				# 9.1.1: Make sure that the 'calc_software' tag has been added, as this tells ECCP what DFT program you want to use. 
-				if not 'calc_software' in calc_parameters_for_ATCs:
-					raise Exception("Error: You need to specify a value for 'calc_software' in calc_parameters_for_ATCs.")
+		# 6.6: Write the molecule with its environment to disk. 
+		write_xyz_atomically(write_inputs['molecules_with_environment_folderpath']+'/'+molecule_name+'.xyz', molecule_with_environment)
 
-				# 9.1.2: Create the files for running the program in Gaussian or ORCA. 
-				if   calc_parameters_for_ATCs['calc_software'].lower() == 'gaussian':
-					write_ATC_gaussian_files(molecule_copy, molecule_name, environment_about_molecule, SolventsList, atc_calc_jobs_path, calc_parameters_for_ATCs, submission_information_for_ATCs)
-				elif calc_parameters_for_ATCs['calc_software'].lower() == 'orca':
-					write_ATC_orca_files    (molecule_copy, molecule_name, environment_about_molecule, SolventsList, atc_calc_jobs_path, calc_parameters_for_ATCs, submission_information_for_ATCs)
-				else:
-					raise Exception("Error: calc_parameters_for_ATCs['calc_software'] needs to be either Gaussian or ORCA. calc_parameters_for_ATCs['calc_software'] = "+str(calc_parameters_for_ATCs['calc_software']))
+	else:
 
-			# 9.2: Write the multiwfn input files for the molecules.
-			for index in range(len(all_submission_information_for_ATCs)):
-				if 'log_filename' in all_submission_information_for_ATCs[index]:
-					all_submission_information_for_multiwfn[index]['log_filename'] = all_submission_information_for_ATCs[index]['log_filename']
-			write_ATC_multiwfn_files(molecule_copy, molecule_name, environment_about_molecule, SolventsList, atc_calc_jobs_path, all_calc_parameters_for_multiwfn, all_submission_information_for_multiwfn)
+		# 6.7: Do not include the environment around the molecule. 
+		environment_about_molecule = None
 
-	# Tenth, For all the conformationally unique molecules in the crystal, performing the following:
-	#        Note: If a molecule is structurally unique, it will also be conformationally unique.
-	#              A conformationally unique molecule might not be necessarily structurally unique.
-	for mol_name in conformationally_unique_molecules_indices:
-
-		# Eleventh, obtain the following variables
-		molecule       = molecules[mol_name]
-		molecule_graph = molecule_graphs[mol_name]
-
-		# Twelfth, Add details from the molecules graph back to the molecule.
-		molecule_copy = molecule.copy()
-		add_graph_to_ASE_Atoms_object(molecule_copy, deepcopy(molecule_graph))
-
-		# Thirteenth, write the molecules to molecules_folderpath as xyz files.
-		molecule_name = 'molecule_'+str(mol_name)
-		if mol_name in SolventsList:
-			molecule_name += 'S'
-
-		# Fourteenth, write the reorganisation energy (RE) input file.
-		if get_molecule_res and (all_calc_parameters_for_REs is not None):
-
-			# 14.1: Write the RE input files.
-			for calc_parameters_for_REs, submission_information_for_REs in zip(all_calc_parameters_for_REs, all_submission_information_for_REs):
-
-				# 14.1.1: Make sure that the 'calc_software' tag has been added, as this tells ECCP what DFT program you want to use. 
-				if not 'calc_software' in calc_parameters_for_REs:
-					raise Exception("Error: You need to specify a value for 'calc_software' in calc_parameters_for_REs.")
-
-				# 14.1.2: Create the files for running the program in Gaussian or ORCA. 
-				if   calc_parameters_for_REs['calc_software'].lower() == 'gaussian':
-					write_RE_gaussian_files   (molecule_copy, molecule_name, SolventsList, re_calc_jobs_path, calc_parameters_for_REs, submission_information_for_REs, run_excited_state_from_optimised_ground_structure)
-					write_RE_gaussian_SP_files(molecule_copy, molecule_name, SolventsList, re_calc_jobs_path, calc_parameters_for_REs, submission_information_for_REs)
-				elif calc_parameters_for_REs['calc_software'].lower() == 'orca':
-					write_RE_orca_files       (molecule_copy, molecule_name, SolventsList, re_calc_jobs_path, calc_parameters_for_REs, submission_information_for_REs, run_excited_state_from_optimised_ground_structure)
-					write_RE_orca_SP_files    (molecule_copy, molecule_name, SolventsList, re_calc_jobs_path, calc_parameters_for_REs, submission_information_for_REs)
-				else:
-					raise Exception("Error: calc_parameters_for_REs['calc_software'] needs to be either Gaussian or ORCA. calc_parameters_for_REs['calc_software'] = "+str(calc_parameters_for_REs['calc_software']))
-
-		# Fifteenth, write the Franck-Condon (FC) input files.
-		if get_molecule_fcs and (all_calc_parameters_for_FCs is not None):
-
-			# 15.1: Write the FC input files.
-			for calc_parameters_for_FCs, submission_information_for_FCs in zip(all_calc_parameters_for_FCs, all_submission_information_for_FCs):
-
-				# 15.1.1: Make sure that the 'calc_software' tag has been added, as this tells ECCP what DFT program you want to use. 
-				if not 'calc_software' in calc_parameters_for_FCs:
-					raise Exception("Error: You need to specify a value for 'calc_software' in calc_parameters_for_FCs.")
-
-				# 15.1.2: Create the files for running the program in Gaussian or ORCA. 
-				if   calc_parameters_for_FCs['calc_software'].lower() == 'gaussian':
-					write_FC_gaussian_files(molecule_copy, molecule_name, SolventsList, fc_calc_jobs_path, calc_parameters_for_FCs, submission_information_for_FCs)
-				elif calc_parameters_for_FCs['calc_software'].lower() == 'orca':
-					raise Exception('Write this method for ORCA')
-					pass	# while figuring this out, ignore this part
-					#write_FC_orca_files    (molecule_copy, molecule_name, SolventsList, fc_calc_jobs_path, calc_parameters_for_FCs, submission_information_for_FCs)
-				else:
-					raise Exception("Error: calc_parameters_for_FCs['calc_software'] needs to be either Gaussian or ORCA. calc_parameters_for_FCs['calc_software'] = "+str(calc_parameters_for_FCs['calc_software']))
+	# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - 
+
+	# Seventh, write the DFT calculation files related to the ATC if desired.
+	if write_inputs['get_molecule_atcs'] and (all_calc_parameters_for_ATCs is not None):
+
+		# 7.1: Write the ATC input files.
+		for calc_parameters_for_ATCs, submission_information_for_ATCs in zip(all_calc_parameters_for_ATCs, all_submission_information_for_ATCs):
+
+			# 7.1.1: Make sure that the 'calc_software' tag has been added, as this tells ECCP what DFT program you want to use. 
+			if not 'calc_software' in calc_parameters_for_ATCs:
+				raise Exception("Error: You need to specify a value for 'calc_software' in calc_parameters_for_ATCs.")
+
+			# 7.1.2: Create the files for running the program in Gaussian or ORCA. 
+			if   calc_parameters_for_ATCs['calc_software'].lower() == 'gaussian':
+				write_ATC_gaussian_files(molecule_copy, molecule_name, environment_about_molecule, SolventsList, atc_calc_jobs_path, calc_parameters_for_ATCs, submission_information_for_ATCs)
+			elif calc_parameters_for_ATCs['calc_software'].lower() == 'orca':
+				write_ATC_orca_files    (molecule_copy, molecule_name, environment_about_molecule, SolventsList, atc_calc_jobs_path, calc_parameters_for_ATCs, submission_information_for_ATCs)
+			else:
+				raise Exception("Error: calc_parameters_for_ATCs['calc_software'] needs to be either Gaussian or ORCA. calc_parameters_for_ATCs['calc_software'] = "+str(calc_parameters_for_ATCs['calc_software']))
+
+		# 7.2: Write the multiwfn input files for the molecules.
+		write_ATC_multiwfn_files(molecule_copy, molecule_name, environment_about_molecule, SolventsList, atc_calc_jobs_path, write_inputs['all_calc_parameters_for_multiwfn'], write_inputs['all_submission_information_for_multiwfn'])
+
+def write_conformationally_unique_molecule_files(mol_name, write_inputs):
+	"""
+	This method will write the RE and FC files of a conformationally unique molecule to disk if desired.
+
+	Parameters
+	----------
+	mol_name : int
+		This is the name of the molecule to write to disk.
+	write_inputs : dict.
+		This is the information that is needed to write the files of every molecule (see write_molecules_to_disk).
+	"""
+
+	# First, obtain the following variables
+	molecule       = write_inputs['molecules'][mol_name]
+	molecule_graph = write_inputs['molecule_graphs'][mol_name]
+	SolventsList   = write_inputs['SolventsList']
+	re_calc_jobs_path = write_inputs['re_calc_jobs_path']
+	fc_calc_jobs_path = write_inputs['fc_calc_jobs_path']
+	all_calc_parameters_for_REs        = write_inputs['all_calc_parameters_for_REs']
+	all_calc_parameters_for_FCs        = write_inputs['all_calc_parameters_for_FCs']
+	all_submission_information_for_REs = write_inputs['all_submission_information_for_REs']
+	all_submission_information_for_FCs = write_inputs['all_submission_information_for_FCs']
+	run_excited_state_from_optimised_ground_structure = write_inputs['run_excited_state_from_optimised_ground_structure']
+
+	# Second, Add details from the molecules graph back to the molecule.
+	molecule_copy = molecule.copy()
+	add_graph_to_ASE_Atoms_object(molecule_copy, deepcopy(molecule_graph))
+
+	# Third, write the molecules to molecules_folderpath as xyz files.
+	molecule_name = 'molecule_'+str(mol_name)
+	if mol_name in SolventsList:
+		molecule_name += 'S'
+
+	# Fourth, write the reorganisation energy (RE) input file.
+	if write_inputs['get_molecule_res'] and (all_calc_parameters_for_REs is not None):
+
+		# 4.1: Write the RE input files.
+		for calc_parameters_for_REs, submission_information_for_REs in zip(all_calc_parameters_for_REs, all_submission_information_for_REs):
+
+			# 4.1.1: Make sure that the 'calc_software' tag has been added, as this tells ECCP what DFT program you want to use. 
+			if not 'calc_software' in calc_parameters_for_REs:
+				raise Exception("Error: You need to specify a value for 'calc_software' in calc_parameters_for_REs.")
+
+			# 4.1.2: Create the files for running the program in Gaussian or ORCA. 
+			if   calc_parameters_for_REs['calc_software'].lower() == 'gaussian':
+				write_RE_gaussian_files   (molecule_copy, molecule_name, SolventsList, re_calc_jobs_path, calc_parameters_for_REs, submission_information_for_REs, run_excited_state_from_optimised_ground_structure)
+				write_RE_gaussian_SP_files(molecule_copy, molecule_name, SolventsList, re_calc_jobs_path, calc_parameters_for_REs, submission_information_for_REs)
+			elif calc_parameters_for_REs['calc_software'].lower() == 'orca':
+				write_RE_orca_files       (molecule_copy, molecule_name, SolventsList, re_calc_jobs_path, calc_parameters_for_REs, submission_information_for_REs, run_excited_state_from_optimised_ground_structure)
+				write_RE_orca_SP_files    (molecule_copy, molecule_name, SolventsList, re_calc_jobs_path, calc_parameters_for_REs, submission_information_for_REs)
+			else:
+				raise Exception("Error: calc_parameters_for_REs['calc_software'] needs to be either Gaussian or ORCA. calc_parameters_for_REs['calc_software'] = "+str(calc_parameters_for_REs['calc_software']))
+
+	# Fifth, write the Franck-Condon (FC) input files.
+	if write_inputs['get_molecule_fcs'] and (all_calc_parameters_for_FCs is not None):
+
+		# 5.1: Write the FC input files.
+		for calc_parameters_for_FCs, submission_information_for_FCs in zip(all_calc_parameters_for_FCs, all_submission_information_for_FCs):
+
+			# 5.1.1: Make sure that the 'calc_software' tag has been added, as this tells ECCP what DFT program you want to use. 
+			if not 'calc_software' in calc_parameters_for_FCs:
+				raise Exception("Error: You need to specify a value for 'calc_software' in calc_parameters_for_FCs.")
+
+			# 5.1.2: Create the files for running the program in Gaussian or ORCA. 
+			if   calc_parameters_for_FCs['calc_software'].lower() == 'gaussian':
+				write_FC_gaussian_files(molecule_copy, molecule_name, SolventsList, fc_calc_jobs_path, calc_parameters_for_FCs, submission_information_for_FCs)
+			elif calc_parameters_for_FCs['calc_software'].lower() == 'orca':
+				raise Exception('Write this method for ORCA')
+				pass	# while figuring this out, ignore this part
+				#write_FC_orca_files    (molecule_copy, molecule_name, SolventsList, fc_calc_jobs_path, calc_parameters_for_FCs, submission_information_for_FCs)
+			else:
+				raise Exception("Error: calc_parameters_for_FCs['calc_software'] needs to be either Gaussian or ORCA. calc_parameters_for_FCs['calc_software'] = "+str(calc_parameters_for_FCs['calc_software']))
+
+# ---------------------------------------------------------------------------------------------------------------
 
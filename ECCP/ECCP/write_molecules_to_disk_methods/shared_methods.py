@@ -141,6 +141,29 @@ def slurmSL_header(submitSL, name, mem, partition, constraint, nodelist, time, e
 		submitSL.write('#SBATCH --mail-type=ALL\n')
 	submitSL.write('\n')
 
+# This is the argument given to a reorganisation energy main optimisation submit script by "ECCP submit" if the frequency and single point jobs have already been submitted to slurm with a dependency on the main optimisation job.
+downstream_jobs_already_submitted_argument = 'downstream_jobs_already_submitted'
+
+def submit_downstream_jobs(submitSL, submission_filenames, prefix=''):
+	"""
+	This method will write the commands for submitting the jobs that follow on from this job (such as the frequency and single point jobs that follow a reorganisation energy optimisation) to slurm.
+
+	These jobs are not submitted if this submit script was given the downstream_jobs_already_submitted_argument, as "ECCP submit" will have already submitted these jobs to slurm with a --dependency=afterok on this job.
+
+	Parameters
+	----------
+	submitSL : open()
+		This is the slurm submit file to add commands to.
+	submission_filenames : list of str.
+		These are the names of the submit scripts to submit to slurm once this job has finished.
+	prefix : str.
+		if you want to add a prefix to each line of your code, do it here. Default: ''.
+	"""
+	submitSL.write(prefix+'if ! [[ "${1}" == "'+str(downstream_jobs_already_submitted_argument)+'" ]]; then\n')
+	for submission_filename in submission_filenames:
+		submitSL.write(prefix+'\tsubmit_slurm_job.py '+str(submission_filename)+'\n')
+	submitSL.write(prefix+'fi\n')
+
 def load_gaussian_programs(submitSL, gaussian_version=None, python_version=None):
 	"""
 	This method will allow you to load Gaussian and python in slurm.
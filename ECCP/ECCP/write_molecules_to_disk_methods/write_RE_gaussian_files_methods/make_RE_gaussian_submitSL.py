@@ -4,7 +4,7 @@ make_RE_gaussian_submitSL.py, Geoffrey Weal, 8/5/22
 This method will write the submit.sl file in parallel
 """
 from copy                                                     import deepcopy
-from ECCP.ECCP.write_molecules_to_disk_methods.shared_methods import slurmSL_header, load_gaussian_programs, make_gaussian_temp_folder, remove_gaussian_temp_files
+from ECCP.ECCP.write_molecules_to_disk_methods.shared_methods import slurmSL_header, submit_downstream_jobs, load_gaussian_programs, make_gaussian_temp_folder, remove_gaussian_temp_files
 
 def make_RE_gaussian_submitSL(main_calculation_type_name, optimisation_filename_DFT_main_opt, single_point_filename, local_path, perform_excited_state_calc, run_excited_state_from_optimised_ground_structure, functional, basis_set, gaussian_parameters, cpus_per_task, mem, time, partition='parallel', constraint=None, nodelist=None, exclude=None, email='', python_version='python/3.8.1', gaussian_version='gaussian/g16', temp_folder_path=None):
 	"""
@@ -111,8 +111,7 @@ def make_RE_gaussian_submitSL(main_calculation_type_name, optimisation_filename_
 		submitSL.write('\t# ----------------------------\n')
 		submitSL.write('\t# Submit the Frequency and single point calculations to slurm.\n')
 		submitSL.write('\t\n')
-		submitSL.write('\tsubmit_slurm_job.py '+str(main_calculation_type_name)+'_freq_submit.sl\n')
-		submitSL.write('\tsubmit_slurm_job.py '+str(single_point_name)+'_submit.sl\n')
+		submit_downstream_jobs(submitSL, [str(main_calculation_type_name)+'_freq_submit.sl', str(single_point_name)+'_submit.sl'], prefix='\t')
 		submitSL.write('\t\n')
 
 		# Create and submit the excited state calculation using the ground state calculation if desired
@@ -5,7 +5,7 @@ This method will write the submit.sl file in parallel
 """
 from copy                                                     import deepcopy
 from ECCP.ECCP.write_molecules_to_disk_methods.shared_methods import convert_dict_for_bash_input
-from ECCP.ECCP.write_molecules_to_disk_methods.shared_methods import slurmSL_header, load_gaussian_programs, make_gaussian_temp_folder, remove_gaussian_temp_files
+from ECCP.ECCP.write_molecules_to_disk_methods.shared_methods import slurmSL_header, submit_downstream_jobs, load_gaussian_programs, make_gaussian_temp_folder, remove_gaussian_temp_files
 
 
 def make_RE_gaussian_submitSL_preopt(main_calculation_type_name, optimisation_filename_DFT_main_opt, single_point_filename, local_path, perform_excited_state_calc, functional, basis_set, gaussian_parameters, cpus_per_task, mem, time, partition='parallel', constraint=None, nodelist=None, exclude=None, email='', python_version='python/3.8.1', gaussian_version='gaussian/g16', temp_folder_path=None):
@@ -169,8 +169,7 @@ def make_RE_gaussian_submitSL_preopt(main_calculation_type_name, optimisation_fi
 		submitSL.write('\t\t# ----------------------------\n')
 		submitSL.write('\t\t# Submit the Frequency and single point calculations to slurm.\n')
 		submitSL.write('\t\t\n')
-		submitSL.write('\t\tsubmit_slurm_job.py '+str(main_calculation_type_name)+'_freq_submit.sl\n')
-		submitSL.write('\t\tsubmit_slurm_job.py '+str(single_point_name)+'_submit.sl\n')
+		submit_downstream_jobs(submitSL, [str(main_calculation_type_name)+'_freq_submit.sl', str(single_point_name)+'_submit.sl'], prefix='\t\t')
 		submitSL.write('\t\t\n')
 		submitSL.write('\t\t# ----------------------------\n')
 		submitSL.write('\t\techo "End of job"\n')
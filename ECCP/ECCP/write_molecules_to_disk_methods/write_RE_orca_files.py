@@ -10,7 +10,7 @@ from SUMELF                                                                   im
 from SUMELF                                                                   import obtain_graph
 from ECCP.ECCP.write_molecules_to_disk_methods.write_methods.orca_modified_RE import write_orca_in_RE
 from ECCP.ECCP.write_molecules_to_disk_methods.shared_methods                 import change_folder_name_components, convert_dict_for_bash_input
-from ECCP.ECCP.write_molecules_to_disk_methods.shared_methods                 import slurmSL_header, load_orca_programs, make_orca_temp_folder, remove_orca_temp_files
+from ECCP.ECCP.write_molecules_to_disk_methods.shared_methods                 import slurmSL_header, submit_downstream_jobs, load_orca_programs, make_orca_temp_folder, remove_orca_temp_files
 
 def write_RE_orca_files(molecule, molecule_name, SolventsList, orca_jobs_path, calc_parameters_for_REs, submission_information_for_REs):
 	"""
@@ -265,8 +265,7 @@ def make_RE_orca_submitSL(main_calculation_type_name, optimisation_filename_DFT_
 		submitSL.write('\t# ----------------------------\n')
 		submitSL.write('\t# Submit the Frequency and single point calculations to slurm.\n')
 		submitSL.write('\t\n')
-		submitSL.write('\tsubmit_slurm_job.py '+str(main_calculation_type_name)+'_freq_submit.sl\n')
-		submitSL.write('\tsubmit_slurm_job.py '+str(single_point_name)+'_submit.sl\n')
+		submit_downstream_jobs(submitSL, [str(main_calculation_type_name)+'_freq_submit.sl', str(single_point_name)+'_submit.sl'], prefix='\t')
 		submitSL.write('\t\n')
 		submitSL.write('\t# ----------------------------\n')
 		submitSL.write('\techo "End of job"\n')
@@ -5,7 +5,8 @@ This script includes methods for writing the results from the ECCP method.
 """
 import os
 from SUMELF import make_folder
-from ECCP.ECCP.write_results_document_method.write_all_dimer_information import write_all_dimer_information
+from ECCP.ECCP.write_results_document_method.write_all_dimer_information   import write_all_dimer_information
+from ECCP.ECCP.write_results_document_method.write_ECCP_Information_arrays import write_ECCP_Information_arrays
 
 def write_results_document(molecules : list, SolventsList : list, obtain_unique_molecules_bool : bool, all_dimers_info : list, obtain_unique_dimers_bool : bool, make_dimer_method : dict, environment_settings : dict, structurally_equivalent_molecule_groups : dict, conformationally_equivalent_molecule_groups : dict, structurally_equivalent_molecule_pairs : dict, structurally_equivalent_dimer_groups : dict, structurally_equivalent_dimer_pairs : list, path_to_eccp_folder : str, filename : str):
 	"""
@@ -122,6 +123,9 @@ def write_results_document(molecules : list, SolventsList : list, obtain_unique_
 		write_dimer_equivalence_groups(path_to_eccp_folder+'/'+equivalency_group_folder_name, structurally_equivalent_dimer_groups)
 		write_dimer_equivalence_pairs (path_to_eccp_folder+'/'+equivalency_group_folder_name, structurally_equivalent_dimer_pairs)
 
+	# Tenth, record the dimer and equivalence group information as arrays, so that this information can be quickly loaded if ECCP is rerun on this crystal.
+	write_ECCP_Information_arrays(path_to_eccp_folder, all_dimers_info, obtain_unique_molecules_bool, structurally_equivalent_molecule_groups, conformationally_equivalent_molecule_groups, structurally_equivalent_molecule_pairs, obtain_unique_dimers_bool, structurally_equivalent_dimer_groups, structurally_equivalent_dimer_pairs)
+
 # -------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
 def make_ECCP_Information_file(path_to_eccp_folder, filename, make_dimer_method, environment_settings, molecules, molecule_names_that_are_solvents, obtain_unique_molecules_bool, structurally_unique_molecule_indices, structurally_equivalent_molecule_indices, conformationally_unique_molecule_indices, conformationally_equivalent_molecule_indices, all_dimers_info, dimers_that_contain_solvents, obtain_unique_dimers_bool, structurally_unique_dimer_indices, structurally_equivalent_dimer_indices):
@@ -0,0 +1,125 @@
+"""
+write_ECCP_Information_arrays.py, Geoffrey Weal, 17/10/26
+
+This script will write the dimer and equivalence group information as numpy arrays (ECCP_Information_Arrays.npz), along with a small manifest (ECCP_Information_Arrays.json).
+
+These are written alongside the human readable text files. They allow ECCP to quickly load this information without losing precision when it is rerun on a crystal.
+"""
+import os, json
+import numpy as np
+from ECCP.ECCP.utilities.write_file_atomically import write_file_atomically
+
+arrays_filename   = 'ECCP_Information_Arrays.npz'
+manifest_filename = 'ECCP_Information_Arrays.json'
+arrays_version    = 1
+
+equivalency_group_folder_name = 'Equivalence_Group_Information'
+
+# These are the text files that hold the same information as each section of the arrays, given as {section name: list of text files (relative to the ECCP folder)}.
+#    * The arrays of a section are only used if these text files have not changed since the arrays were written.
+text_files_for_sections = {'dimer_details':    ['All_Dimer_Information.txt'],
+                           'unique_molecules': [equivalency_group_folder_name+'/Structurally_Equivalent_Molecule_Groups.txt', equivalency_group_folder_name+'/Conformationally_Equivalent_Molecule_Groups.txt', equivalency_group_folder_name+'/Structurally_Equivalent_Molecule_Pairs.txt'],
+                           'unique_dimers':    [equivalency_group_folder_name+'/Structurally_Equivalent_Dimer_Groups.txt', equivalency_group_folder_name+'/Structurally_Equivalent_Dimer_Pairs.txt']}
+
+def write_ECCP_Information_arrays(path_to_eccp_folder, all_dimers_info, obtain_unique_molecules_bool, structurally_equivalent_molecule_groups, conformationally_equivalent_molecule_groups, structurally_equivalent_molecule_pairs, obtain_unique_dimers_bool, structurally_equivalent_dimer_groups, structurally_equivalent_dimer_pairs):
+	"""
+	This method will write the dimer and equivalence group information as numpy arrays, along with a manifest of what has been written.
+
+	This method should be run after the text files have been written, as the manifest records the size and modification time of each text file.
+
+	Parameters
+	----------
+	path_to_eccp_folder : str.
+		This is the path to this crystal in the ECCP folder
+	all_dimers_info : dict.
+		This is all the information about all the dimers that have been idenified in the crystal using the settings as given by the user.
+	obtain_unique_molecules_bool : bool.
+		This tag indicates if the user wanted to obtain the unique molecules.
+	structurally_equivalent_molecule_groups : dict.
+		This dictionary contains the structurally equivalent molecule groups, given as --> representative structurally unique molecule: list of structurally equivalent molecules.
+	conformationally_equivalent_molecule_groups : dict.
+		This dictionary contains the conformationally equivalent molecule groups, given as --> representative conformationally unique molecule: list of conformationally equivalent molecules.
+	structurally_equivalent_molecule_pairs : list
+		This list contains all the pairs of structurally equivalent molecules.
+	obtain_unique_dimers_bool : bool.
+		This tag indicates if the user wanted to obtain the unique dimers.
+	structurally_equivalent_dimer_groups : dict.
+		This dictionary contains the structurally equivalent dimer groups, given as --> representative structurally unique dimer: list of structurally equivalent dimers.
+	structurally_equivalent_dimer_pairs : list
+		This list contains all the pairs of structurally equivalent dimers.
+	"""
+
+	# First, initialise the dictionary of arrays to write, and the list of sections that have been included.
+	arrays   = {}
+	sections = []
+
+	# Second, record the information about every dimer as columns.
+	dimer_names = sorted(all_dimers_info.keys())
+	arrays['dimer_names']            = np.array(dimer_names, dtype=int)
+	arrays['dimer_molecule_names']   = np.array([all_dimers_info[dimer_name][0:2] for dimer_name in dimer_names], dtype=int).reshape(-1,2)
+	arrays['unit_cell_displacement'] = np.array([all_dimers_info[dimer_name][2]   for dimer_name in dimer_names], dtype=int).reshape(-1,3)
+	arrays['displacement']           = np.array([all_dimers_info[dimer_name][3]   for dimer_name in dimer_names], dtype=float).reshape(-1,3)
+	arrays['move_centre_of_mass_by'] = np.array([all_dimers_info[dimer_name][4]   for dimer_name in dimer_names], dtype=float).reshape(-1,3)
+	sections.append('dimer_details')
+
+	# Third, record the structurally and conformationally equivalent molecule groups and pairs.
+	if obtain_unique_molecules_bool:
+		add_equivalence_groups_to_arrays(arrays, 'structurally_equivalent_molecule_groups',     structurally_equivalent_molecule_groups)
+		add_equivalence_groups_to_arrays(arrays, 'conformationally_equivalent_molecule_groups', conformationally_equivalent_molecule_groups)
+		arrays['structurally_equivalent_molecule_pairs'] = np.array(sorted(structurally_equivalent_molecule_pairs), dtype=int).reshape(-1,2)
+		sections.append('unique_molecules')
+
+	# Fourth, record the structurally equivalent dimer groups and pairs.
+	if obtain_unique_dimers_bool:
+		add_equivalence_groups_to_arrays(arrays, 'structurally_equivalent_dimer_groups', structurally_equivalent_dimer_groups)
+		arrays['structurally_equivalent_dimer_pairs'] = np.array(sorted(structurally_equivalent_dimer_pairs), dtype=int).reshape(-1,2)
+		sections.append('unique_dimers')
+
+	# Fifth, write the arrays to disk.
+	with write_file_atomically(path_to_eccp_folder+'/'+arrays_filename, mode='wb') as arrays_file:
+		np.savez(arrays_file, **arrays)
+
+	# Sixth, write the manifest, which records the sections written and the text files they were written alongside.
+	manifest = {'version': arrays_version, 'arrays_file': get_file_fingerprint(path_to_eccp_folder+'/'+arrays_filename), 'sections': {}}
+	for section in sections:
+		manifest['sections'][section] = {text_filename: get_file_fingerprint(path_to_eccp_folder+'/'+text_filename) for text_filename in text_files_for_sections[section]}
+	with write_file_atomically(path_to_eccp_folder+'/'+manifest_filename) as manifest_file:
+		json.dump(manifest, manifest_file, indent=4, sort_keys=True)
+
+def add_equivalence_groups_to_arrays(arrays, name, equivalence_groups):
+	"""
+	This method will add equivalence groups to arrays as two columns: the names of the individuals in every group one after the other, and the index in this column where each group starts.
+
+	Parameters
+	----------
+	arrays : dict.
+		This is the dictionary of arrays to add the equivalence groups to.
+	name : str.
+		This is the name of the equivalence groups.
+	equivalence_groups : dict.
+		These are the equivalence groups, given as --> representative unique individual: list of equivalent individuals.
+	"""
+	equivalence_groups_list = [sorted([unique_name] + list(equivalent_names)) for unique_name, equivalent_names in sorted(equivalence_groups.items())]
+	arrays[name+'_names']   = np.array([individual_name for equivalence_group in equivalence_groups_list for individual_name in equivalence_group], dtype=int)
+	arrays[name+'_offsets'] = np.cumsum([0] + [len(equivalence_group) for equivalence_group in equivalence_groups_list]).astype(int)
+
+def get_file_fingerprint(filepath):
+	"""
+	This method will obtain the size and modification time of a file, used to tell if the file has changed.
+
+	Parameters
+	----------
+	filepath : str.
+		This is the path to the file.
+
+	Returns
+	-------
+	fingerprint : list or None
+		This is the size and modification time (in nanoseconds) of the file, given as [size, modification time]. None if the file does not exist.
+	"""
+	if not os.path.exists(filepath):
+		return None
+	file_stat = os.stat(filepath)
+	return [file_stat.st_size, file_stat.st_mtime_ns]
+
+# ---------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,160 @@
+"""
+write_slurm_array_scripts.py, Geoffrey Weal, 17/10/26
+
+This script is designed to create slurm array scripts for a job family (such as all the EET dimer jobs or all the ATC molecule jobs), so that each job family can be submitted to slurm as a handful of array jobs rather than thousands of individual jobs.
+
+Each array script is given with an index file that gives the folder (relative to the job family folder) of each array task. Each array task moves into its folder and runs the submit.sl script in that folder.
+"""
+import os
+
+# This is the largest number of tasks to place in one slurm array (slurm's default MaxArraySize is 1001).
+max_array_size = 1000
+
+# These are the #SBATCH directives that are specific to each job, and so are not used to group jobs together.
+job_specific_sbatch_directives = ['--job-name', '--output', '--error', '--mail-user', '--mail-type']
+
+def write_slurm_array_scripts(calc_jobs_path, submission_filename='submit.sl'):
+	"""
+	This method is designed to create slurm array scripts for all the jobs in calc_jobs_path.
+
+	Jobs are placed in the same array only if their submit.sl scripts request the same resources from slurm (cpus, memory, time, partition, ...).
+
+	Parameters
+	----------
+	calc_jobs_path : str.
+		This is the path to the job family folder (for example, the All_EET_Calc_Jobs folder for a crystal).
+	submission_filename : str.
+		This is the name of the submit script in each job folder. Default: 'submit.sl'
+
+	Returns
+	-------
+	array_submission_filenames : list of str.
+		These are the names of the array scripts that were written to calc_jobs_path.
+	"""
+
+	# First, if there are no jobs in this job family, there is nothing to do.
+	if not os.path.exists(calc_jobs_path):
+		return []
+
+	# Second, obtain all the job folders in this job family, grouped by the resources they request from slurm.
+	job_groups = {}
+	for root, dirs, files in os.walk(calc_jobs_path):
+		dirs.sort()
+		if (submission_filename in files) and (not root == calc_jobs_path):
+			sbatch_directives = get_shared_sbatch_directives(root+'/'+submission_filename)
+			job_groups.setdefault(tuple(sbatch_directives), []).append(os.path.relpath(root, calc_jobs_path))
+			dirs[:] = []
+
+	# Third, write the array scripts and index files for each group of jobs.
+	array_submission_filenames = []
+	job_family_name = '-'.join(calc_jobs_path.rstrip('/').split('/')[-2:])
+	for sbatch_directives, job_folders in job_groups.items():
+		for start_index in range(0, len(job_folders), max_array_size):
+			array_number = len(array_submission_filenames) + 1
+			array_submission_filename, array_index_filename = get_array_filenames(array_number)
+
+			# 3.1: Write the index file, where line N gives the folder of array task N.
+			array_job_folders = job_folders[start_index:start_index+max_array_size]
+			with open(calc_jobs_path+'/'+array_index_filename, 'w') as indexTXT:
+				for job_folder in array_job_folders:
+					indexTXT.write(job_folder+'\n')
+
+			# 3.2: Write the array script.
+			name = job_family_name+'-array_'+str(array_number)
+			make_array_submitSL(calc_jobs_path, array_submission_filename, array_index_filename, name, sbatch_directives, len(array_job_folders), submission_filename)
+			array_submission_filenames.append(array_submission_filename)
+
+	# Fourth, return the names of the array scripts that were written.
+	return array_submission_filenames
+
+# ----------------------------------------------------------------------------------------------------------------------------------
+
+def get_array_filenames(array_number):
+	"""
+	This method will give the names of the array script and its index file.
+
+	Parameters
+	----------
+	array_number : int
+		This is the number of the array in the job family.
+
+	Returns
+	-------
+	array_submission_filename : str.
+		This is the name of the array script.
+	array_index_filename : str.
+		This is the name of the index file for the array script.
+	"""
+	return 'array_submit_'+str(array_number)+'.sl', 'array_index_'+str(array_number)+'.txt'
+
+def get_shared_sbatch_directives(path_to_submitSL):
+	"""
+	This method will obtain the #SBATCH directives in a submit.sl file that are not specific to that job.
+
+	Parameters
+	----------
+	path_to_submitSL : str.
+		This is the path to the submit.sl file.
+
+	Returns
+	-------
+	sbatch_directives : list of str.
+		These are the #SBATCH directives (without comments) that are not specific to this job.
+	"""
+	sbatch_directives = []
+	with open(path_to_submitSL, 'r') as submitSL:
+		for line in submitSL:
+			if not line.startswith('#SBATCH'):
+				continue
+			directive = line.split('#')[1].replace('SBATCH','',1).strip()
+			if any([directive.startswith(job_specific_sbatch_directive) for job_specific_sbatch_directive in job_specific_sbatch_directives]):
+				continue
+			sbatch_directives.append(directive)
+	return sbatch_directives
+
+def make_array_submitSL(calc_jobs_path, array_submission_filename, array_index_filename, name, sbatch_directives, number_of_tasks, submission_filename):
+	"""
+	This method will write the slurm array script.
+
+	Parameters
+	----------
+	calc_jobs_path : str.
+		This is the path to the job family folder to write the array script to.
+	array_submission_filename : str.
+		This is the name of the array script.
+	array_index_filename : str.
+		This is the name of the index file that gives the folder of each array task.
+	name : str.
+		This is the name of the array job.
+	sbatch_directives : list of str.
+		These are the #SBATCH directives shared by all the jobs in this array.
+	number_of_tasks : int
+		This is the number of tasks in the array.
+	submission_filename : str.
+		This is the name of the submit script in each job folder.
+	"""
+	with open(calc_jobs_path+'/'+array_submission_filename, 'w') as submitSL:
+		submitSL.write('#!/bin/bash -e\n')
+		submitSL.write('#SBATCH --job-name=' + str(name) + '\n')
+		for sbatch_directive in sbatch_directives:
+			submitSL.write('#SBATCH ' + str(sbatch_directive) + '\n')
+		submitSL.write('#SBATCH --array=1-' + str(number_of_tasks) + '\n')
+		submitSL.write('#SBATCH --output=slurm-%A_%a.out      # %A and %a are replaced by the array job ID and the array task ID'+'\n')
+		submitSL.write('#SBATCH --error=slurm-%A_%a.err'+'\n')
+		submitSL.write('\n')
+		submitSL.write('# ----------------------------\n')
+		submitSL.write('# Move into the folder of the job for this array task.\n')
+		submitSL.write('\n')
+		submitSL.write('job_folder=$(sed -n "${SLURM_ARRAY_TASK_ID}p" '+str(array_index_filename)+')\n')
+		submitSL.write('cd "${job_folder}"\n')
+		submitSL.write('\n')
+		submitSL.write('# ----------------------------\n')
+		submitSL.write('# Run the submit script of this job, recording its output in the job folder.\n')
+		submitSL.write('\n')
+		submitSL.write('bash -e '+str(submission_filename)+' > slurm-${SLURM_JOB_ID}.out 2> slurm-${SLURM_JOB_ID}.err\n')
+		submitSL.write('\n')
+		submitSL.write('# ----------------------------\n')
+		submitSL.write('echo "End of job"\n')
+		submitSL.write('# ----------------------------\n')
+
+# ----------------------------------------------------------------------------------------------------------------------------------
@@ -8,6 +8,7 @@ from tqdm import tqdm
 
 from ECCP.ECCP_Programs.shared_general_methods.shared_general_methods       import reverse_readline
 from ECCP.ECCP_Programs.Did_Complete_Main_methods.did_finish_calc_on_system import did_finish_calc_on_system
+from ECCP.ECCP_Programs.shared_general_methods.ECCP_Job_Index               import ECCP_Job_Index
 
 # -------------------------------------------------------------------------------
 
@@ -61,77 +62,79 @@ def Did_Complete_Main(general_path):
     errored_jobs = []
 
     # Second, determine all the Gaussian jobs to check. 
+    #         * The job index is used so that only folders whose files have changed since the last time are re-inspected.
     original_path = os.getcwd()
-    pbar = tqdm(os.walk(general_path), unit='Jobs')
-    for root, dirs, files in pbar:
-
-        # 2.1: Sort dirs and files so that things come out in alphabetical order.
-        dirs.sort()
-        files.sort()
-
-        # 2.2: Determine if a .gjf or inp. file is found. If so, we have found a Gaussian/ORCA job.
-        if   ('eGS_gGS_main_preopt.gjf' in files) or ('eGS_gGS_main_opt.gjf' in files):
-            software_type = 'Gaussian'
-            input_file_name      = 'eGS_gGS_main_opt.gjf'
-            output_file_name     = 'eGS_gGS_main_opt.log'
-        elif ('eES_gES_main_preopt.gjf' in files) or ('eES_gES_main_opt.gjf' in files) or ('gaussian_parameters_ES.txt' in files):
-            software_type = 'Gaussian'
-            input_file_name      = 'eES_gES_main_opt.gjf'
-            output_file_name     = 'eES_gES_main_opt.log'
-        elif ('eGS_gGS_main_preopt.inp' in files) or ('eGS_gGS_main_opt.inp' in files):
-            software_type = 'ORCA'
-            input_file_name      = 'eGS_gGS_main_opt.inp'
-            output_file_name     = 'eGS_gGS_main_opt.out'
-        elif ('eES_gES_main_preopt.inp' in files) or ('eES_gES_main_opt.inp' in files) or ('orca_parameters_ES.txt' in files):
-            software_type = 'ORCA'
-            input_file_name      = 'eES_gES_main_opt.inp'
-            output_file_name     = 'eES_gES_main_opt.out'
-        else:
-            for file in files:
-                # Is this a Gaussian Calculation
-                if '.gjf' in file:
-                    software_type = 'Gaussian'
-                    input_file_name      = file
-                    output_file_name     = 'output.log'
-                    break
-                # Is this an ORCA Calculation
-                if '.inp' in file:
-                    software_type = 'ORCA'
-                    input_file_name      = file
-                    output_file_name     = 'output.out'
-                    break
+    with ECCP_Job_Index(general_path) as job_index:
+        pbar = tqdm(job_index.walk(general_path), unit='Jobs')
+        for root, dirs, files in pbar:
+
+            # 2.1: Sort dirs and files so that things come out in alphabetical order.
+            dirs.sort()
+            files.sort()
+
+            # 2.2: Determine if a .gjf or inp. file is found. If so, we have found a Gaussian/ORCA job.
+            if   ('eGS_gGS_main_preopt.gjf' in files) or ('eGS_gGS_main_opt.gjf' in files):
+                software_type = 'Gaussian'
+                input_file_name      = 'eGS_gGS_main_opt.gjf'
+                output_file_name     = 'eGS_gGS_main_opt.log'
+            elif ('eES_gES_main_preopt.gjf' in files) or ('eES_gES_main_opt.gjf' in files) or ('gaussian_parameters_ES.txt' in files):
+                software_type = 'Gaussian'
+                input_file_name      = 'eES_gES_main_opt.gjf'
+                output_file_name     = 'eES_gES_main_opt.log'
+            elif ('eGS_gGS_main_preopt.inp' in files) or ('eGS_gGS_main_opt.inp' in files):
+                software_type = 'ORCA'
+                input_file_name      = 'eGS_gGS_main_opt.inp'
+                output_file_name     = 'eGS_gGS_main_opt.out'
+            elif ('eES_gES_main_preopt.inp' in files) or ('eES_gES_main_opt.inp' in files) or ('orca_parameters_ES.txt' in files):
+                software_type = 'ORCA'
+                input_file_name      = 'eES_gES_main_opt.inp'
+                output_file_name     = 'eES_gES_main_opt.out'
             else:
-                continue
-
-        # 2.3: Print details of where the program is up to:
-        pbar.set_description(root.replace(original_path+'/',''))
-
-        # 2.4: Go through the output.log file to see if the job finished successfully or not.
-        try:
-            job_type, completion_stage, re_details = did_finish_calc_on_system(root, software_type, input_file_name, output_file_name)
-            successfully_analysed_calculations = True
-        except Exception as exception_message:
-            successfully_analysed_calculations = False
-            error_message = exception_message
-
-        # 2.5: Add job path to appropriate list
-        if successfully_analysed_calculations:
-            if job_type == 'ATC':
-                add_to_list(root, completion_stage, atc_jobs_finished_successfully, atc_jobs_finished_unsuccessfully, atc_jobs_not_begun)
-            elif job_type == 'RE':
-                add_to_list((root, re_details), completion_stage, re_jobs_finished_successfully,  re_jobs_finished_unsuccessfully,  re_jobs_not_begun)
-            elif job_type == 'FC':
-                add_to_list(root, completion_stage, fc_jobs_finished_successfully,  fc_jobs_finished_unsuccessfully,  fc_jobs_not_begun)
-            elif job_type == 'EET':
-                add_to_list(root, completion_stage, eet_jobs_finished_successfully, eet_jobs_finished_unsuccessfully, eet_jobs_not_begun)
+                for file in files:
+                    # Is this a Gaussian Calculation
+                    if '.gjf' in file:
+                        software_type = 'Gaussian'
+                        input_file_name      = file
+                        output_file_name     = 'output.log'
+                        break
+                    # Is this an ORCA Calculation
+                    if '.inp' in file:
+                        software_type = 'ORCA'
+                        input_file_name      = file
+                        output_file_name     = 'output.out'
+                        break
+                else:
+                    continue
+
+            # 2.3: Print details of where the program is up to:
+            pbar.set_description(root.replace(original_path+'/',''))
+
+            # 2.4: Go through the output.log file to see if the job finished successfully or not.
+            try:
+                job_type, completion_stage, re_details = job_index.get_job_completion_status(root, files, output_file_name, lambda: did_finish_calc_on_system(root, software_type, input_file_name, output_file_name))
+                successfully_analysed_calculations = True
+            except Exception as exception_message:
+                successfully_analysed_calculations = False
+                error_message = exception_message
+
+            # 2.5: Add job path to appropriate list
+            if successfully_analysed_calculations:
+                if job_type == 'ATC':
+                    add_to_list(root, completion_stage, atc_jobs_finished_successfully, atc_jobs_finished_unsuccessfully, atc_jobs_not_begun)
+                elif job_type == 'RE':
+                    add_to_list((root, re_details), completion_stage, re_jobs_finished_successfully,  re_jobs_finished_unsuccessfully,  re_jobs_not_begun)
+                elif job_type == 'FC':
+                    add_to_list(root, completion_stage, fc_jobs_finished_successfully,  fc_jobs_finished_unsuccessfully,  fc_jobs_not_begun)
+                elif job_type == 'EET':
+                    add_to_list(root, completion_stage, eet_jobs_finished_successfully, eet_jobs_finished_unsuccessfully, eet_jobs_not_begun)
+                else:
+                    unalligned_jobs.append(root)
             else:
-                unalligned_jobs.append(root)
-        else:
-            errored_jobs.append((root,error_message))
+                errored_jobs.append((root,error_message))
 
-        # 2.6: This will prevent the program looking further down the directories.
-        dirs[:] = []
-        files[:] = []
+            # 2.6: This will prevent the program looking further down the directories.
+            dirs[:] = []
+            files[:] = []
 
     # Third, sort each list alphabetically and combine together for easy management of data.
     atc_jobs_results       = (sorted(atc_jobs_finished_successfully), sorted(atc_jobs_finished_unsuccessfully), sorted(atc_jobs_not_begun))
@@ -5,6 +5,8 @@ This method is designed to determine what ECCP Gaussian job we are analysing
 '''
 import os
 
+from ECCP.ECCP_Programs.shared_general_methods.Gaussian_Log_Parser import parse_gaussian_log, header_break_string
+
 def determine_what_the_job_is(path, software_type, output_file_name, input_file_name, break_string='Input orientation:'):
     """
     This method is designed to determine the type of ECCP job that we are examining. 
@@ -56,6 +58,9 @@ def determine_what_the_job_is(path, software_type, output_file_name, input_file_
             return job_type 
 
         # Third, look through the output file to determine what type of calculation is being performed. 
+        #        * The streaming log parser has already looked through the header of the output file for the job type, so use this where possible.
+        if (path_to_file == path_to_output) and (break_string == header_break_string):
+            return parse_gaussian_log(path_to_output).state['job_type']
         with open(path_to_file,'r') as outputLOG:
             path_including_hash = False
             for line in outputLOG:
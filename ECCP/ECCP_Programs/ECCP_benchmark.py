@@ -0,0 +1,125 @@
+'''
+Geoffrey Weal, ECCP_benchmark.py, 17/10/26
+
+This program is designed to benchmark the ECCP preparation pipeline on synthetic molecular crystals of increasing size.
+
+This program does not need any crystal files or quantum chemistry programs. The time and memory taken by each stage for each crystal is added to a results file, so that the scaling of each stage can be compared between versions of ECCP.
+'''
+import tempfile
+from datetime import datetime
+from itertools import product
+
+from ECCP.ECCP_Programs.benchmark_methods.make_synthetic_crystal         import make_synthetic_crystal, symmetry_types
+from ECCP.ECCP_Programs.benchmark_methods.benchmark_pipeline            import benchmark_pipeline
+from ECCP.ECCP_Programs.benchmark_methods.write_benchmark_results       import get_ECCP_version_information, write_benchmark_results, get_stage_wall_times
+from ECCP.ECCP_Programs.shared_general_methods.process_jobs_in_parallel import get_no_of_cpus
+
+# ---------------------------------------------------------------------
+
+class CLICommand:
+    """Will benchmark the ECCP preparation pipeline on synthetic crystals, and record the time taken by each stage to a results file.
+    """
+
+    @staticmethod
+    def add_arguments(parser):
+        parser.add_argument('--molecules', nargs='+', type=int,   help='These are the numbers of molecules in the unit cell of the synthetic crystals. (Default: 2 4 8 16)', default=[2, 4, 8, 16])
+        parser.add_argument('--atoms',     nargs='+', type=int,   help='These are the numbers of atoms in each molecule of the synthetic crystals. (Default: 14 26)', default=[14, 26])
+        parser.add_argument('--symmetry',  nargs='+',             help='These are how the molecules are orientated in the synthetic crystals. Options: '+', '.join(symmetry_types)+'. (Default: translation random)', default=['translation', 'random'], choices=symmetry_types)
+        parser.add_argument('--cutoff',    nargs='+', type=float, help='These are the maximum distances (in Å) between molecules for them to be a dimer. (Default: 8.0)', default=[8.0])
+        parser.add_argument('--repeats',              type=int,   help='This is the number of times to benchmark each synthetic crystal. (Default: 1)', default=1)
+        parser.add_argument('--results',   nargs='?',             help='This is the json file to add the benchmark results to. A csv file of the results is also written with the same name. (Default: ECCP_benchmark_results.json)', default='ECCP_benchmark_results.json')
+        parser.add_argument('--no_write',  action='store_true',   help='Do not benchmark writing the molecule and dimer xyz files to disk.')
+        parser.add_argument('--cpus',      nargs='?',             help='This is the number of cpus to use. (Default: 1)', default=1)
+
+    @staticmethod
+    def run(args):
+        no_of_cpus = get_no_of_cpus(args.cpus)
+        Run_method(args.molecules, args.atoms, args.symmetry, args.cutoff, repeats=args.repeats, path_to_results_file=args.results, write_files=(not args.no_write), no_of_cpus=no_of_cpus)
+
+# ---------------------------------------------------------------------
+
+def Run_method(all_no_of_molecules_per_cell, all_no_of_atoms_per_molecule, all_symmetry, all_max_dimer_distance, repeats=1, path_to_results_file='ECCP_benchmark_results.json', write_files=True, no_of_cpus=1):
+    """
+    This method is the main method for running this program
+
+    Parameters
+    ----------
+    all_no_of_molecules_per_cell : list of int
+        These are the numbers of molecules in the unit cell of the synthetic crystals.
+    all_no_of_atoms_per_molecule : list of int
+        These are the numbers of atoms in each molecule of the synthetic crystals.
+    all_symmetry : list of str.
+        These are how the molecules are orientated in the synthetic crystals.
+    all_max_dimer_distance : list of float
+        These are the maximum distances (in Å) between molecules for them to be a dimer.
+    repeats : int
+        This is the number of times to benchmark each synthetic crystal. Default: 1
+    path_to_results_file : str.
+        This is the json file to add the benchmark results to. Default: 'ECCP_benchmark_results.json'
+    write_files : bool.
+        This tag indicates if writing the molecule and dimer xyz files should be benchmarked. Default: True
+    no_of_cpus : int
+        This is the number of cpus to use. Default: 1
+    """
+
+    # First, record the settings and version of ECCP for this benchmark run.
+    settings = {'no_of_molecules_per_cell': sorted(all_no_of_molecules_per_cell), 'no_of_atoms_per_molecule': sorted(all_no_of_atoms_per_molecule), 'symmetry': sorted(all_symmetry), 'max_dimer_distance': sorted(all_max_dimer_distance), 'repeats': repeats, 'write_files': write_files, 'no_of_cpus': no_of_cpus}
+    benchmark_run = {'date': datetime.now().isoformat(timespec='seconds')}
+    benchmark_run.update(get_ECCP_version_information())
+    benchmark_run['settings'] = settings
+    benchmark_run['crystals'] = []
+    print('----------------------------------------------')
+    print('Benchmarking ECCP '+str(benchmark_run['version'])+((' ('+str(benchmark_run['git_commit'])+')') if (benchmark_run['git_commit'] is not None) else ''))
+    print('Number of CPUs utilised: '+str(no_of_cpus))
+    print('----------------------------------------------')
+
+    # Second, benchmark the pipeline on each synthetic crystal, from the smallest to the largest.
+    for max_dimer_distance, symmetry, no_of_atoms_per_molecule, no_of_molecules_per_cell in product(settings['max_dimer_distance'], settings['symmetry'], settings['no_of_atoms_per_molecule'], settings['no_of_molecules_per_cell']):
+
+        # 2.1: Make the synthetic crystal.
+        crystal, molecules, molecule_graphs = make_synthetic_crystal(no_of_molecules_per_cell, no_of_atoms_per_molecule, symmetry=symmetry)
+        crystal_name = 'synthetic_'+str(symmetry)+'_Z'+str(no_of_molecules_per_cell)+'_N'+str(no_of_atoms_per_molecule)+'_cutoff'+str(max_dimer_distance)
+        make_dimer_method = {'method': 'nearest_atoms_method', 'max_dimer_distance': max_dimer_distance}
+
+        for repeat in range(repeats):
+
+            # 2.2: Benchmark the pipeline on this crystal. Files are written to a temporary folder that is removed afterwards.
+            print('Benchmarking: '+crystal_name+' (repeat '+str(repeat+1)+' of '+str(repeats)+')')
+            with tempfile.TemporaryDirectory(prefix='ECCP_benchmark_') as path_to_write_folder:
+                stages = benchmark_pipeline(crystal, {mol_name: molecule.copy() for mol_name, molecule in molecules.items()}, molecule_graphs, crystal_name, path_to_write_folder, make_dimer_method, write_files=write_files, no_of_cpus=no_of_cpus)
+
+            # 2.3: Record the results for this crystal.
+            benchmark_run['crystals'].append({'name': crystal_name, 'no_of_molecules_per_cell': no_of_molecules_per_cell, 'no_of_atoms_per_molecule': len(molecules[0]), 'symmetry': symmetry, 'max_dimer_distance': max_dimer_distance, 'repeat': repeat, 'no_of_atoms_in_crystal': len(crystal), 'stages': stages})
+
+    # Third, add the results of this run to the results file.
+    previous_benchmark_run = write_benchmark_results(path_to_results_file, benchmark_run)
+
+    # Fourth, print the time taken by each stage, compared to the last run with the same settings.
+    print_benchmark_summary(benchmark_run, previous_benchmark_run)
+    print('Benchmark results have been added to '+str(path_to_results_file))
+
+def print_benchmark_summary(benchmark_run, previous_benchmark_run=None):
+    """
+    This method will print the wall time of each stage for each synthetic crystal, and the change from the previous run with the same settings.
+
+    Parameters
+    ----------
+    benchmark_run : dict.
+        This is the information about this benchmark run.
+    previous_benchmark_run : dict. or None
+        This is the information about the previous benchmark run with the same settings. Default: None
+    """
+    stage_wall_times = get_stage_wall_times(benchmark_run)
+    previous_stage_wall_times = {} if (previous_benchmark_run is None) else get_stage_wall_times(previous_benchmark_run)
+    if previous_benchmark_run is not None:
+        print('Comparing against the run from '+str(previous_benchmark_run['date'])+' (ECCP '+str(previous_benchmark_run['version'])+((', '+str(previous_benchmark_run['git_commit'])) if (previous_benchmark_run['git_commit'] is not None) else '')+')')
+    print('----------------------------------------------')
+    for (no_of_molecules_per_cell, no_of_atoms_per_molecule, symmetry, max_dimer_distance, stage_name), wall_time in stage_wall_times.items():
+        to_string = symmetry+' Z='+str(no_of_molecules_per_cell)+' N='+str(no_of_atoms_per_molecule)+' cutoff='+str(max_dimer_distance)+': '+stage_name+': '+str(round(wall_time, 4))+' s'
+        previous_wall_time = previous_stage_wall_times.get((no_of_molecules_per_cell, no_of_atoms_per_molecule, symmetry, max_dimer_distance, stage_name), None)
+        if (previous_wall_time is not None) and (previous_wall_time > 0.0):
+            to_string += ' ('+str(round(100.0 * (wall_time - previous_wall_time) / previous_wall_time, 1))+'% vs previous)'
+        print(to_string)
+    print('----------------------------------------------')
+
+# ---------------------------------------------------------------------
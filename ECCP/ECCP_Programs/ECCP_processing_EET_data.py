@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 from SUMELF import remove_folder, make_folder
 from ECCP.ECCP_Programs.processing_EET_methods.get_EET_data import get_EET_data
 from ECCP.ECCP_Programs.processing_EET_methods.write_data_to_excel import write_data_to_excel
+from ECCP.ECCP_Programs.shared_general_methods.process_jobs_in_parallel import get_no_of_cpus
 
 # ---------------------------------------------------------------------
 
@@ -20,17 +21,23 @@ class CLICommand:
 
     @staticmethod
     def add_arguments(parser):
-        pass
+        parser.add_argument('--cpus', nargs='?', help='This is the number of cpus to use to process the Gaussian output files. (Default: 1)', default=1)
 
     @staticmethod
     def run(args):
-        Run_method()
+        no_of_cpus = get_no_of_cpus(args.cpus)
+        Run_method(no_of_cpus)
 
 # ---------------------------------------------------------------------
 
-def Run_method():
+def Run_method(no_of_cpus=1):
     """
     This method is the main method for running this program
+
+    Parameters
+    ----------
+    no_of_cpus : int
+        This is the number of cpus to use to process the Gaussian output files. Default: 1
     """
     # General variables for processing data.
     overall_path = os.getcwd()
@@ -48,7 +55,7 @@ def Run_method():
     print('------------------------------------------------')
 
     # First, obtain the electronic coupling data from the Gaussian output.log files. 
-    electronic_coupling_data, issues = get_EET_data(overall_path, log_filename, start_time)
+    electronic_coupling_data, issues = get_EET_data(overall_path, log_filename, start_time, no_of_cpus=no_of_cpus)
 
     # Thirteenth, write the EET to an excel file.
     write_data_to_excel(electronic_coupling_data, eet_data_foldername, individual_eet_data_foldername, start_time)
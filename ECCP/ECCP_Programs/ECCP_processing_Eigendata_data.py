@@ -9,11 +9,12 @@ from datetime import datetime, timedelta
 from SUMELF import remove_folder, make_folder
 
 from ECCP.ECCP_Programs.processing_Eigendata_methods.process_Eigendata_to_disk import process_Eigendata_to_disk
+from ECCP.ECCP_Programs.shared_general_methods.ECCP_Job_Index import ECCP_Job_Index
 
 # ---------------------------------------------------------------------
 
 class CLICommand:
-    """Will process the eigendata and extract from your output.log files and place them in individual txt files.
+    """Will process the eigendata and extract from your output.log files and place them in individual npy and txt files.
     """
 
     @staticmethod
@@ -47,27 +48,28 @@ def Run_method():
     print('Note: This program may take some time if you have recorded eigendata, such as orbital overlap matrices, as these matrices can be very large depending on the number of atoms in your dimer.')
     eigendata = {}
     issues = []
-    for root, dirs, files in os.walk(overall_path):
-        dirs.sort()
+    with ECCP_Job_Index(overall_path) as job_index:
+        for root, dirs, files in job_index.walk(overall_path):
+            dirs.sort()
 
-        # Fourth, check to see if you have these files in your folder. 
-        # If you do, then you are in the right place for obtaining eigendata on your dimer and molecules.
-        if not (('Dimer' in dirs) and ('Monomer_1' in dirs) and ('Monomer_2' in dirs)):
-            continue
+            # Fourth, check to see if you have these files in your folder. 
+            # If you do, then you are in the right place for obtaining eigendata on your dimer and molecules.
+            if not (('Dimer' in dirs) and ('Monomer_1' in dirs) and ('Monomer_2' in dirs)):
+                continue
 
-        # Fifth, indicate that a Gaussian job has been found
-        print('------------------------------------------------')
-        print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+' - Found a Gaussian job: '+str(root))
-        dirs[:]  = []
-        files[:] = []
-
-        # Sixth, process the eigendata.
-        issue = process_Eigendata_to_disk(root, log_filename, start_time)
-        if issue is not None:
-            issues.append(issue)
-            print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+' - Their was an issue with this job.')
+            # Fifth, indicate that a Gaussian job has been found
             print('------------------------------------------------')
-            continue
+            print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+' - Found a Gaussian job: '+str(root))
+            dirs[:]  = []
+            files[:] = []
+
+            # Sixth, process the eigendata.
+            issue = process_Eigendata_to_disk(root, log_filename, start_time)
+            if issue is not None:
+                issues.append(issue)
+                print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+' - Their was an issue with this job.')
+                print('------------------------------------------------')
+                continue
 
     # Seventh, write any issues to the terminal.
     print('------------------------------------------------')
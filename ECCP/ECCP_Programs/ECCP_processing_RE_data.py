@@ -11,6 +11,8 @@ from datetime import datetime, timedelta
 from SUMELF import remove_folder, make_folder
 from ECCP.ECCP_Programs.shared_general_methods.shared_gaussian_methods   import found_a_gaussian_job_that_has_run
 from ECCP.ECCP_Programs.shared_general_methods.shared_orca_methods       import found_an_orca_job_that_has_run
+from ECCP.ECCP_Programs.shared_general_methods.ECCP_Job_Index import ECCP_Job_Index
+from ECCP.ECCP_Programs.shared_general_methods.process_jobs_in_parallel import process_jobs_in_parallel, get_no_of_cpus
 from ECCP.ECCP_Programs.processing_RE_methods.processing_RE_data_methods import found_a_re_jobset
 from ECCP.ECCP_Programs.processing_RE_methods.obtain_gaussian_RE_data    import obtain_gaussian_RE_data
 from ECCP.ECCP_Programs.processing_RE_methods.obtain_orca_RE_data        import obtain_orca_RE_data
@@ -26,6 +28,7 @@ class CLICommand:
     def add_arguments(parser):
         parser.add_argument('--accept_slightly_negative_frequency', nargs='?', help='Will print values with slightly negative frequencies (-100 units). If input value is a number, this is the lowest negative frequency that will be acceptioned. True: -100, (Default: False).')
         parser.add_argument('--analyse_frequencies', nargs='?', help='This indicates if you want to check the frequency calculations to make sure geometric optimisation calculations found a local minimum. (Default: True)')
+        parser.add_argument('--cpus', nargs='?', help='This is the number of cpus to use to process the Gaussian/ORCA output files. (Default: 1)', default=1)
 
     @staticmethod
     def run(args):
@@ -54,8 +57,11 @@ class CLICommand:
         else:
             raise Exception('Error: analyse_frequencies must be either True or False')
 
-        # Third, run method
-        Run_method(lower_limit_negative_frequency, analyse_frequencies)
+        # Third, determine the number of cpus to process the output files with.
+        no_of_cpus = get_no_of_cpus(args.cpus)
+
+        # Fourth, run method
+        Run_method(lower_limit_negative_frequency, analyse_frequencies, no_of_cpus)
 
 def is_a_number(value):
     try:
@@ -68,9 +74,18 @@ def is_a_number(value):
 ground_structure_foldername  = 'ground_structure'
 excited_structure_foldername = 'excited_structure'
 
-def Run_method(lower_limit_negative_frequency, analyse_frequencies):
+def Run_method(lower_limit_negative_frequency, analyse_frequencies, no_of_cpus=1):
     """
     This method is the main method for running this program
+
+    Parameters
+    ----------
+    lower_limit_negative_frequency : float
+        This is the lowest negative frequency that will be accepted.
+    analyse_frequencies : bool.
+        This indicates if you want to check the frequency calculations to make sure geometric optimisation calculations found a local minimum.
+    no_of_cpus : int
+        This is the number of cpus to use to process the Gaussian/ORCA output files. Default: 1
     """
     # First, set general variables for processing data.
     overall_path = os.getcwd()
@@ -87,48 +102,55 @@ def Run_method(lower_limit_negative_frequency, analyse_frequencies):
     start_time = time.time()
     print('------------------------------------------------')
 
-    # Third, obtain the reorganisation energy data from the Gaussian output files. 
+    # Third, find all the reorganisation energy jobsets from the Gaussian/ORCA output files. 
     print('Gathering Reorganisation Energy Data')
-    reorganisation_energy_data = {}
-    issues = []
-    for root, dirs, files in os.walk(overall_path):
-        dirs.sort()
-
-        # 3.1: Determine if their is a Gaussian/ORCA job that has run.
-        if found_a_gaussian_job_that_has_run(root, files) or found_an_orca_job_that_has_run(root, files):
-            # Found a log file and gjf files before finding the ground_structure and excited_structure folders. 
-            # This means we are in a non-reorganisation energy folder, so don't look further into here. 
-            dirs[:] = []
-            files[:] = []
-            continue
-
-        # 3.2: Check to see if we found reorganisation energy data by looking for a folder called ground_structure or excited_structure folders in root
-        found_ground_structure_folder, found_excited_structure_folder = found_a_re_jobset(root)
-
-        # 3.3: If "ground_structure" or "excited_structure" folders exist, process reorganisation energy data.
-        if found_ground_structure_folder or found_excited_structure_folder:
-
-            # 3.3.1: Check to see if the files in this reorganisation folder are Gaussian files.
-            are_gaussian_files_in_ground_state_folder  = found_a_gaussian_job_that_has_run(root+'/'+ground_structure_foldername,  [file for file in os.listdir(root+'/'+ground_structure_foldername)  if os.path.isfile(root+'/'+ground_structure_foldername +'/'+file)])
-            are_gaussian_files_in_excited_state_folder = found_a_gaussian_job_that_has_run(root+'/'+excited_structure_foldername, [file for file in os.listdir(root+'/'+excited_structure_foldername) if os.path.isfile(root+'/'+excited_structure_foldername+'/'+file)])
-
-            # 3.3.2: Check to see if the files in this reorganisation folder are ORCA files.
-            are_orca_files_in_ground_state_folder      = found_an_orca_job_that_has_run(root+'/'+ground_structure_foldername,  [file for file in os.listdir(root+'/'+ground_structure_foldername)  if os.path.isfile(root+'/'+ground_structure_foldername +'/'+file)])
-            are_orca_files_in_excited_state_folder     = found_an_orca_job_that_has_run(root+'/'+excited_structure_foldername, [file for file in os.listdir(root+'/'+excited_structure_foldername) if os.path.isfile(root+'/'+excited_structure_foldername+'/'+file)])
-
-            # 3.3.3: If we are dealing with a Gaussian/ORCA job, obtain information on reorganisation energy. 
-            if       (are_gaussian_files_in_ground_state_folder and are_gaussian_files_in_excited_state_folder) and not (are_orca_files_in_ground_state_folder and are_orca_files_in_excited_state_folder):
-                obtain_gaussian_RE_data(root, reorganisation_energy_data, start_time, ground_structure_foldername, excited_structure_foldername, lower_limit_negative_frequency, analyse_frequencies, issues)
+    jobs = []
+    with ECCP_Job_Index(overall_path) as job_index:
+        for root, dirs, files in job_index.walk(overall_path):
+            dirs.sort()
+
+            # 3.1: Determine if their is a Gaussian/ORCA job that has run.
+            if found_a_gaussian_job_that_has_run(root, files) or found_an_orca_job_that_has_run(root, files):
+                # Found a log file and gjf files before finding the ground_structure and excited_structure folders. 
+                # This means we are in a non-reorganisation energy folder, so don't look further into here. 
                 dirs[:] = []
                 files[:] = []
-            elif not (are_gaussian_files_in_ground_state_folder and are_gaussian_files_in_excited_state_folder) and     (are_orca_files_in_ground_state_folder and are_orca_files_in_excited_state_folder):
-                obtain_orca_RE_data    (root, reorganisation_energy_data, start_time, ground_structure_foldername, excited_structure_foldername, lower_limit_negative_frequency, analyse_frequencies, issues)
-                dirs[:] = []
-                files[:] = []
-            else:
-                print('Note: Some reorganisation energy files in '+str(root)+'have run or running, and some not run yet. Will pass looking at this reorganisation energy dataset for now..')
                 continue
 
+            # 3.2: Check to see if we found reorganisation energy data by looking for a folder called ground_structure or excited_structure folders in root
+            found_ground_structure_folder, found_excited_structure_folder = found_a_re_jobset(root)
+
+            # 3.3: If "ground_structure" or "excited_structure" folders exist, process reorganisation energy data.
+            if found_ground_structure_folder or found_excited_structure_folder:
+
+                # 3.3.1: Check to see if the files in this reorganisation folder are Gaussian files.
+                are_gaussian_files_in_ground_state_folder  = found_a_gaussian_job_that_has_run(root+'/'+ground_structure_foldername,  [file for file in os.listdir(root+'/'+ground_structure_foldername)  if os.path.isfile(root+'/'+ground_structure_foldername +'/'+file)])
+                are_gaussian_files_in_excited_state_folder = found_a_gaussian_job_that_has_run(root+'/'+excited_structure_foldername, [file for file in os.listdir(root+'/'+excited_structure_foldername) if os.path.isfile(root+'/'+excited_structure_foldername+'/'+file)])
+
+                # 3.3.2: Check to see if the files in this reorganisation folder are ORCA files.
+                are_orca_files_in_ground_state_folder      = found_an_orca_job_that_has_run(root+'/'+ground_structure_foldername,  [file for file in os.listdir(root+'/'+ground_structure_foldername)  if os.path.isfile(root+'/'+ground_structure_foldername +'/'+file)])
+                are_orca_files_in_excited_state_folder     = found_an_orca_job_that_has_run(root+'/'+excited_structure_foldername, [file for file in os.listdir(root+'/'+excited_structure_foldername) if os.path.isfile(root+'/'+excited_structure_foldername+'/'+file)])
+
+                # 3.3.3: If we are dealing with a Gaussian/ORCA job, obtain information on reorganisation energy. 
+                if       (are_gaussian_files_in_ground_state_folder and are_gaussian_files_in_excited_state_folder) and not (are_orca_files_in_ground_state_folder and are_orca_files_in_excited_state_folder):
+                    jobs.append(('Gaussian', root, start_time, lower_limit_negative_frequency, analyse_frequencies))
+                    dirs[:] = []
+                    files[:] = []
+                elif not (are_gaussian_files_in_ground_state_folder and are_gaussian_files_in_excited_state_folder) and     (are_orca_files_in_ground_state_folder and are_orca_files_in_excited_state_folder):
+                    jobs.append(('ORCA',     root, start_time, lower_limit_negative_frequency, analyse_frequencies))
+                    dirs[:] = []
+                    files[:] = []
+                else:
+                    print('Note: Some reorganisation energy files in '+str(root)+'have run or running, and some not run yet. Will pass looking at this reorganisation energy dataset for now..')
+                    continue
+
+    # 3.4: Obtain the reorganisation energy data from each jobset, and gather them together in the order the jobsets were found.
+    reorganisation_energy_data = {}
+    issues = []
+    for jobset_reorganisation_energy_data, jobset_issues in process_jobs_in_parallel(obtain_RE_data, jobs, no_of_cpus=no_of_cpus):
+        reorganisation_energy_data.update(jobset_reorganisation_energy_data)
+        issues += jobset_issues
+
     # Fourth, write the EET to an excel file.
     write_data_to_excel(reorganisation_energy_data, re_data_foldername, individual_re_data_foldername, start_time)
 
@@ -179,6 +201,33 @@ def Run_method(lower_limit_negative_frequency, analyse_frequencies):
     print('Total running time (HH:MM:SS): '+str(timedelta(seconds=time.time() - start_time)))
     print('#'*20)
 
+def obtain_RE_data(job):
+    """
+    This method will obtain the reorganisation energy data from a reorganisation energy jobset.
+
+    Parameters
+    ----------
+    job : (str., str., float, float, bool.)
+        This is the software used (Gaussian or ORCA), the path to the jobset, the start time for the process, the lowest negative frequency that will be accepted, and if frequencies are analysed. 
+
+    Returns
+    -------
+    reorganisation_energy_data : dict.
+        This is the reorganisation energy data for this jobset.
+    issues : list
+        These are any issues with this jobset.
+    """
+    software_type, root, start_time, lower_limit_negative_frequency, analyse_frequencies = job
+    reorganisation_energy_data = {}
+    issues = []
+    if software_type == 'Gaussian':
+        obtain_gaussian_RE_data(root, reorganisation_energy_data, start_time, ground_structure_foldername, excited_structure_foldername, lower_limit_negative_frequency, analyse_frequencies, issues)
+    elif software_type == 'ORCA':
+        obtain_orca_RE_data    (root, reorganisation_energy_data, start_time, ground_structure_foldername, excited_structure_foldername, lower_limit_negative_frequency, analyse_frequencies, issues)
+    else:
+        raise Exception('Error: software_type must be either Gaussian or ORCA. software_type = '+str(software_type))
+    return reorganisation_energy_data, issues
+
 # ------------------------------------------------------------------------------------------------------------------------------------------------------------
 
 
@@ -8,10 +8,12 @@ from tqdm import tqdm
 from ase.io import read, write
 
 from ECCP.ECCP_Programs.shared_general_methods.shared_gaussian_methods import folder_contains_RE_files
-from ECCP.ECCP_Programs.shared_general_methods.shared_gaussian_methods import did_gaussian_job_complete, did_gaussian_opt_job_complete
+from ECCP.ECCP_Programs.shared_general_methods.shared_gaussian_methods import did_gaussian_job_complete as did_gaussian_job_complete_uncached, did_gaussian_opt_job_complete as did_gaussian_opt_job_complete_uncached
+from ECCP.ECCP_Programs.shared_general_methods.ECCP_Job_Index          import ECCP_Job_Index
 from ECCP.ECCP_Programs.shared_general_methods.shared_gaussian_methods import gaussian_temp_files_to_remove
 from ECCP.ECCP_Programs.shared_general_methods.shared_gaussian_methods import remove_slurm_output_files
 from ECCP.ECCP_Programs.shared_general_methods.shared_gaussian_methods import found_a_gaussian_job_that_has_run
+from ECCP.ECCP_Programs.shared_general_methods.Gaussian_Log_Parser     import forget_parser
 #from ECCP.Subsidiary_Programs.can_read_data_from_checkpoint_file       import can_read_data_from_checkpoint_file
 
 class CLICommand:
@@ -64,111 +66,115 @@ def Run_method():
     print('----------------------------------------------')
 
     # Third, go through each subdirectory in the parent directory. 
+    #        * The job index is used to avoid re-reading log files that have not changed since they were last checked.
     original_path = os.getcwd()
-    pbar = tqdm(os.walk(current_path), bar_format='')
-    jobs_that_have_been_reset = []
-    for root, dirs, files in pbar:
-
-        pbar.set_description('Reset: '+str(len(jobs_that_have_been_reset))+'; Currently in: '+str(root.replace(original_path+'/','')))
-
-        # 3.1: sort the directory just to make tidying happen in alphabetical order.
-        dirs.sort()
-
-        # 3.2: What type of calculation type are we dealing with
-        contains_RE_files, RE_type = folder_contains_RE_files(root)
-        if contains_RE_files:
-
-            # 3.2.1: We are looking at a reorganisation energy calculation
-            if RE_type == 'GS':
-
-                # 3.2.1.1.1: Determine bool statements to determine if to reset files.
-                reset_GS_GS_main_preopt_job = os.path.exists(root+'/eGS_gGS_main_opt_preopt.log') and not did_gaussian_opt_job_complete(root+'/eGS_gGS_main_opt_preopt.log')[0]
-                reset_GS_GS_main_opt_job    = os.path.exists(root+'/eGS_gGS_main_opt.log')        and not did_gaussian_opt_job_complete(root+'/eGS_gGS_main_opt.log')[0]
-                reset_GS_GS_freq_job        = os.path.exists(root+'/eGS_gGS_freq.log')            and not did_gaussian_job_complete    (root+'/eGS_gGS_freq.log')
-                reset_GS_ES_job             = os.path.exists(root+'/eES_gGS.log')                 and not did_gaussian_job_complete    (root+'/eES_gGS.log')
-
-                # 3.2.1.1.2: Remove the output files of any non-completed gaussian jobs, and slurm files
-                if reset_GS_GS_main_preopt_job:
-                    gjf_was_updated = update_gif_file_from_previous_outputLOG(root, 'eGS_gGS_main_opt_preopt.log', 'eGS_gGS_main_opt_preopt.gjf')
-                    rename_gaussian_output_file(root, output_name='eGS_gGS_main_opt_preopt.log', gjf_was_updated=gjf_was_updated)
-                    remove_slurm_output_files(root)
-                    jobs_that_have_been_reset.append((root, 'eGS_gGS_main_opt_preopt'))
-                if reset_GS_GS_main_opt_job:
-                    gjf_was_updated = update_gif_file_from_previous_outputLOG(root, 'eGS_gGS_main_opt.log', 'eGS_gGS_main_opt.gjf')
-                    rename_gaussian_output_file(root, output_name='eGS_gGS_main_opt.log', gjf_was_updated=gjf_was_updated)
-                    remove_slurm_output_files(root)
-                    jobs_that_have_been_reset.append((root, 'eGS_gGS_main_opt'))
-                if reset_GS_GS_freq_job:
-                    remove_gaussian_file(root, output_name='eGS_gGS_freq.gjf')
-                    remove_gaussian_file(root, output_name='eGS_gGS_freq.log')
-                    remove_slurm_output_files(root)
-                    jobs_that_have_been_reset.append((root, 'eGS_gGS_freq'))
-                if reset_GS_ES_job:
-                    remove_gaussian_file(root, output_name='eES_gGS.gjf')
-                    remove_gaussian_file(root, output_name='eES_gGS.log')
-                    remove_slurm_output_files(root)
-                    jobs_that_have_been_reset.append((root, 'eES_gGS'))
-
-            elif RE_type == 'ES':
-
-                # 3.2.1.2.1: Determine bool statements to determine if to reset files.
-                reset_ES_ES_main_preopt_job = os.path.exists(root+'/eES_gES_main_opt_preopt.log') and not did_gaussian_opt_job_complete(root+'/eES_gES_main_opt_preopt.log')[0]
-                reset_ES_ES_main_opt_job    = os.path.exists(root+'/eES_gES_main_opt.log')        and not did_gaussian_opt_job_complete(root+'/eES_gES_main_opt.log')[0]
-                reset_ES_ES_freq_job        = os.path.exists(root+'/eES_gES_freq.log')            and not did_gaussian_job_complete    (root+'/eES_gES_freq.log')
-                reset_ES_GS_job             = os.path.exists(root+'/eGS_gES.log')                 and not did_gaussian_job_complete    (root+'/eGS_gES.log')
-
-                # 3.2.1.2.2: Did this excited state reorganisation energy finish?
-                if reset_ES_ES_main_preopt_job:
-                    gjf_was_updated = update_gif_file_from_previous_outputLOG(root, 'eES_gES_main_opt_preopt.log', 'eES_gES_main_opt_preopt.gjf')
-                    rename_gaussian_output_file(root, output_name='eES_gES_main_opt_preopt.log', gjf_was_updated=gjf_was_updated)
-                    remove_slurm_output_files(root)
-                    jobs_that_have_been_reset.append((root, 'eES_gES_main_opt_preopt'))
-                if reset_ES_ES_main_opt_job:
-                    gjf_was_updated = update_gif_file_from_previous_outputLOG(root, 'eES_gES_main_opt.log', 'eES_gES_main_opt.gjf')
-                    rename_gaussian_output_file(root, output_name='eES_gES_main_opt.log', gjf_was_updated=gjf_was_updated)
-                    remove_slurm_output_files(root)
-                    jobs_that_have_been_reset.append((root, 'eES_gES_main_opt'))
-                if reset_ES_ES_freq_job:
-                    remove_gaussian_file(root, output_name='eES_gES_freq.gjf')
-                    remove_gaussian_file(root, output_name='eES_gES_freq.log')
-                    remove_slurm_output_files(root)
-                    jobs_that_have_been_reset.append((root, 'eES_gES_freq'))
-                if reset_ES_GS_job:
-                    remove_gaussian_file(root, output_name='eGS_gES.gjf')
-                    remove_gaussian_file(root, output_name='eGS_gES.log')
-                    remove_slurm_output_files(root)
-                    jobs_that_have_been_reset.append((root, 'eGS_gES'))
-
-            else:
-                raise Exception('huh?')
-
-            # 3.2.2: Clean up the temp files while we are at it for any ECCP reorganisation energy calcs, completed or uncompleted.
-            gaussian_temp_files_to_remove(root, files, remove_chk_file=False, remove_fort7_file=True, print_to_display=False) 
-
-            # 3.2.3: Do not need to move further down the subdirectories anymore, remove all dirs and files lists.
-            dirs[:] = []
-            files[:] = []
-
-        if found_a_gaussian_job_that_has_run(root, files): 
-
-            # 3.3.1: We are looking at a non-reorganisation energy ECCP Gaussian calculation.
-            #        If the output.log file shows that the program finished successfully, remove all temp files. 
-            if not did_gaussian_job_complete(root+'/output.log'):
-                #print('Resetting: '+str(root))
+    with ECCP_Job_Index(current_path) as job_index:
+        did_gaussian_job_complete     = job_index.cache_log_check(did_gaussian_job_complete_uncached)
+        did_gaussian_opt_job_complete = job_index.cache_log_check(did_gaussian_opt_job_complete_uncached)
+        pbar = tqdm(job_index.walk(current_path), bar_format='')
+        jobs_that_have_been_reset = []
+        for root, dirs, files in pbar:
+
+            pbar.set_description('Reset: '+str(len(jobs_that_have_been_reset))+'; Currently in: '+str(root.replace(original_path+'/','')))
+
+            # 3.1: sort the directory just to make tidying happen in alphabetical order.
+            dirs.sort()
+
+            # 3.2: What type of calculation type are we dealing with
+            contains_RE_files, RE_type = folder_contains_RE_files(root)
+            if contains_RE_files:
+
+                # 3.2.1: We are looking at a reorganisation energy calculation
+                if RE_type == 'GS':
+
+                    # 3.2.1.1.1: Determine bool statements to determine if to reset files.
+                    reset_GS_GS_main_preopt_job = os.path.exists(root+'/eGS_gGS_main_opt_preopt.log') and not did_gaussian_opt_job_complete(root+'/eGS_gGS_main_opt_preopt.log')[0]
+                    reset_GS_GS_main_opt_job    = os.path.exists(root+'/eGS_gGS_main_opt.log')        and not did_gaussian_opt_job_complete(root+'/eGS_gGS_main_opt.log')[0]
+                    reset_GS_GS_freq_job        = os.path.exists(root+'/eGS_gGS_freq.log')            and not did_gaussian_job_complete    (root+'/eGS_gGS_freq.log')
+                    reset_GS_ES_job             = os.path.exists(root+'/eES_gGS.log')                 and not did_gaussian_job_complete    (root+'/eES_gGS.log')
+
+                    # 3.2.1.1.2: Remove the output files of any non-completed gaussian jobs, and slurm files
+                    if reset_GS_GS_main_preopt_job:
+                        gjf_was_updated = update_gif_file_from_previous_outputLOG(root, 'eGS_gGS_main_opt_preopt.log', 'eGS_gGS_main_opt_preopt.gjf')
+                        rename_gaussian_output_file(root, output_name='eGS_gGS_main_opt_preopt.log', gjf_was_updated=gjf_was_updated)
+                        remove_slurm_output_files(root)
+                        jobs_that_have_been_reset.append((root, 'eGS_gGS_main_opt_preopt'))
+                    if reset_GS_GS_main_opt_job:
+                        gjf_was_updated = update_gif_file_from_previous_outputLOG(root, 'eGS_gGS_main_opt.log', 'eGS_gGS_main_opt.gjf')
+                        rename_gaussian_output_file(root, output_name='eGS_gGS_main_opt.log', gjf_was_updated=gjf_was_updated)
+                        remove_slurm_output_files(root)
+                        jobs_that_have_been_reset.append((root, 'eGS_gGS_main_opt'))
+                    if reset_GS_GS_freq_job:
+                        remove_gaussian_file(root, output_name='eGS_gGS_freq.gjf')
+                        remove_gaussian_file(root, output_name='eGS_gGS_freq.log')
+                        remove_slurm_output_files(root)
+                        jobs_that_have_been_reset.append((root, 'eGS_gGS_freq'))
+                    if reset_GS_ES_job:
+                        remove_gaussian_file(root, output_name='eES_gGS.gjf')
+                        remove_gaussian_file(root, output_name='eES_gGS.log')
+                        remove_slurm_output_files(root)
+                        jobs_that_have_been_reset.append((root, 'eES_gGS'))
+
+                elif RE_type == 'ES':
+
+                    # 3.2.1.2.1: Determine bool statements to determine if to reset files.
+                    reset_ES_ES_main_preopt_job = os.path.exists(root+'/eES_gES_main_opt_preopt.log') and not did_gaussian_opt_job_complete(root+'/eES_gES_main_opt_preopt.log')[0]
+                    reset_ES_ES_main_opt_job    = os.path.exists(root+'/eES_gES_main_opt.log')        and not did_gaussian_opt_job_complete(root+'/eES_gES_main_opt.log')[0]
+                    reset_ES_ES_freq_job        = os.path.exists(root+'/eES_gES_freq.log')            and not did_gaussian_job_complete    (root+'/eES_gES_freq.log')
+                    reset_ES_GS_job             = os.path.exists(root+'/eGS_gES.log')                 and not did_gaussian_job_complete    (root+'/eGS_gES.log')
+
+                    # 3.2.1.2.2: Did this excited state reorganisation energy finish?
+                    if reset_ES_ES_main_preopt_job:
+                        gjf_was_updated = update_gif_file_from_previous_outputLOG(root, 'eES_gES_main_opt_preopt.log', 'eES_gES_main_opt_preopt.gjf')
+                        rename_gaussian_output_file(root, output_name='eES_gES_main_opt_preopt.log', gjf_was_updated=gjf_was_updated)
+                        remove_slurm_output_files(root)
+                        jobs_that_have_been_reset.append((root, 'eES_gES_main_opt_preopt'))
+                    if reset_ES_ES_main_opt_job:
+                        gjf_was_updated = update_gif_file_from_previous_outputLOG(root, 'eES_gES_main_opt.log', 'eES_gES_main_opt.gjf')
+                        rename_gaussian_output_file(root, output_name='eES_gES_main_opt.log', gjf_was_updated=gjf_was_updated)
+                        remove_slurm_output_files(root)
+                        jobs_that_have_been_reset.append((root, 'eES_gES_main_opt'))
+                    if reset_ES_ES_freq_job:
+                        remove_gaussian_file(root, output_name='eES_gES_freq.gjf')
+                        remove_gaussian_file(root, output_name='eES_gES_freq.log')
+                        remove_slurm_output_files(root)
+                        jobs_that_have_been_reset.append((root, 'eES_gES_freq'))
+                    if reset_ES_GS_job:
+                        remove_gaussian_file(root, output_name='eGS_gES.gjf')
+                        remove_gaussian_file(root, output_name='eGS_gES.log')
+                        remove_slurm_output_files(root)
+                        jobs_that_have_been_reset.append((root, 'eGS_gES'))
+
+                else:
+                    raise Exception('huh?')
+
+                # 3.2.2: Clean up the temp files while we are at it for any ECCP reorganisation energy calcs, completed or uncompleted.
+                gaussian_temp_files_to_remove(root, files, remove_chk_file=False, remove_fort7_file=True, print_to_display=False) 
+
+                # 3.2.3: Do not need to move further down the subdirectories anymore, remove all dirs and files lists.
+                dirs[:] = []
+                files[:] = []
+
+            if found_a_gaussian_job_that_has_run(root, files): 
+
+                # 3.3.1: We are looking at a non-reorganisation energy ECCP Gaussian calculation.
+                #        If the output.log file shows that the program finished successfully, remove all temp files. 
+                if not did_gaussian_job_complete(root+'/output.log'):
+                    #print('Resetting: '+str(root))
                 
-                # 3.3.1.1: Remove temp files as well as any results files like output.log files
-                remove_gaussian_file(root, output_name='output.log')
-                remove_slurm_output_files(root)
-                jobs_that_have_been_reset.append((root, 'output'))
+                    # 3.3.1.1: Remove temp files as well as any results files like output.log files
+                    remove_gaussian_file(root, output_name='output.log')
+                    remove_slurm_output_files(root)
+                    jobs_that_have_been_reset.append((root, 'output'))
 
-            # 3.3.2: Clean up the temp files while we are at it for any ECCP calcs, completed or uncompleted.
-            gaussian_temp_files_to_remove(root, files, remove_chk_file=False, remove_fort7_file=False, print_to_display=False)
+                # 3.3.2: Clean up the temp files while we are at it for any ECCP calcs, completed or uncompleted.
+                gaussian_temp_files_to_remove(root, files, remove_chk_file=False, remove_fort7_file=False, print_to_display=False)
 
-            # 3.3.3: Do not need to move further down the subdirectories anymore, remove all dirs and files lists.
-            dirs[:] = []
-            files[:] = []
+                # 3.3.3: Do not need to move further down the subdirectories anymore, remove all dirs and files lists.
+                dirs[:] = []
+                files[:] = []
 
-        pbar.set_description('Reset: '+str(len(jobs_that_have_been_reset))+'; Currently in: '+str(root.replace(original_path+'/','')))
+            pbar.set_description('Reset: '+str(len(jobs_that_have_been_reset))+'; Currently in: '+str(root.replace(original_path+'/','')))
 
     # Fourth, print out which jobs have finished. 
     print('----------------------------------------------')
@@ -278,6 +284,9 @@ def rename_gaussian_output_file(root, output_name='output.log', gjf_was_updated=
         This is the name of the output file 
     """
 
+    # Forget the log parser for this output file, as the output file is being reset.
+    forget_parser(root+'/'+output_name)
+
     if not gjf_was_updated:
         os.remove(root+'/'+output_name)
         return 
@@ -317,6 +326,7 @@ def remove_gaussian_file(root, output_name='output.log'):
     output_name : str.
         This is the name of the output file 
     """
+    forget_parser(root+'/'+output_name)
     if output_name in os.listdir(root):
         os.remove(root+'/'+output_name)
 
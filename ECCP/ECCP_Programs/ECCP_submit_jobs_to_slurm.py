@@ -4,15 +4,16 @@ Geoffrey Weal, Run_Adsorber_submitSL_slurm.py, 16/06/2021
 This program is designed to submit all sl files called submit.sl to slurm.
 '''
 import os
-from subprocess import Popen, PIPE, TimeoutExpired
 
 from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm_settings_methods.settings_methods                     import check_submit_settingsTXT, change_settings, read_submit_settingsTXT_file
 from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm_methods.determine_quantum_computing_software_type     import determine_quantum_computing_software_type
 from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm_methods.ECCP_submit_gaussian_jobs_to_slurm            import general_gaussian_submission, RE_GStructure_gaussian_submission, RE_EStructure_gaussian_submission
 from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm_methods.ECCP_submit_orca_jobs_to_slurm                import general_orca_submission, RE_GStructure_orca_submission, RE_EStructure_orca_submission
-from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm_methods.check_max_jobs_in_queue_after_next_submission import check_max_jobs_in_queue_after_next_submission
-from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm_methods.countdown                                     import countdown
-from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm_methods.wait_for_pending_slurm_job_queue_decrease     import wait_for_pending_slurm_job_queue_decrease
+from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm_methods.get_array_tasks_to_submit                     import get_array_submission_filenames, get_array_tasks_to_submit, get_array_task_ranges
+from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm_methods.get_RE_dependent_submission_filenames         import get_RE_dependent_submission_filenames
+from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm_methods.Slurm_Backend                                 import Slurm_Backend
+from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm_methods.Slurm_Submission_Engine                       import Slurm_Submission_Engine
+from ECCP.ECCP_Programs.shared_general_methods.ECCP_Job_Index                                           import ECCP_Job_Index
 
 # Get the path to the settings script.
 this_scripts_path = os.path.dirname(os.path.abspath(__file__))
@@ -64,7 +65,7 @@ class CLICommand:
 
 # =========================================================================================================================================
 
-def Run_method(are_RE_jobs_running_currently, run_solvents):
+def Run_method(are_RE_jobs_running_currently, run_solvents, backend=None):
     '''
     This program is designed to submit all sl files called submit.sl to slurm.
 
@@ -72,6 +73,10 @@ def Run_method(are_RE_jobs_running_currently, run_solvents):
     ----------
     are_RE_jobs_running_currently : bool.
         This tag indicates if any ECCP jobs are currently running on slurm.
+    run_solvents : bool.
+        This tag indicates if solvent jobs should be submitted.
+    backend : Slurm_Backend or Fake_Slurm_Backend
+        This is the object used to look at the slurm queue and submit jobs. Default: Slurm_Backend()
     '''
 
     print('###########################################################################')
@@ -83,198 +88,26 @@ def Run_method(are_RE_jobs_running_currently, run_solvents):
     print('###########################################################################')
 
     # Second, read the settings from the settings file. 
-    Max_jobs_in_queue_at_any_one_time, Max_jobs_pending_in_queue_from_ECCP_mass_submit, Max_jobs_running_in_queue_from_ECCP_mass_submit, time_to_wait_before_next_submission, time_to_wait_max_queue, time_to_wait_before_next_submission_due_to_temp_submission_issue, number_of_consecutive_error_before_exitting, time_to_wait_before_next_submission_due_to_not_waiting_between_submissions = read_submit_settingsTXT_file(path_to_settings_txt_file)
-    wait_between_submissions = False
+    Max_jobs_in_queue_at_any_one_time, Max_jobs_pending_in_queue_from_ECCP_mass_submit, Max_jobs_running_in_queue_from_ECCP_mass_submit, time_to_wait_before_next_submission, time_to_wait_before_next_submission_due_to_temp_submission_issue, number_of_consecutive_error_before_exitting = read_submit_settingsTXT_file(path_to_settings_txt_file)
 
     if are_RE_jobs_running_currently:
         print('Will assume that RE jobs are currently running')
     else:
         print('Will assume that RE jobs are not currently running, and will also submit frequency calculations and single point calculations if the main optimisation has completed satisfactory.')
-
-    # Third, indicate if there will be a small wait between jobs.
-    if wait_between_submissions == True:
-        print('This program will wait one minute between submitting jobs.')
-    else:
-        print('This program will not wait between submitting jobs.')
     print('Will begin to search for submit.sl and other .sl files.')
     print('***************************************************************************')
 
+    # Third, set up the engine for submitting jobs to slurm in batches.
+    #         * The slurm queue is only looked at once every time_to_wait_before_next_submission seconds.
+    if backend is None:
+        backend = Slurm_Backend()
+    submission_engine = Slurm_Submission_Engine(backend, Max_jobs_in_queue_at_any_one_time, Max_jobs_pending_in_queue_from_ECCP_mass_submit, Max_jobs_running_in_queue_from_ECCP_mass_submit, time_to_wait_before_next_submission, number_of_consecutive_error_before_exitting, time_to_wait_before_next_submission_due_to_temp_submission_issue)
+
     # Fourth, time to submit all the GA scripts! Lets get this stuff going!
-    if not wait_between_submissions:
-        max_consec_counter = 250
-        consec_counter = 0
-    errors_list = []
-    error_counter = 0
     path = os.getcwd()
-    for (dirpath, dirnames, filenames) in os.walk(path):
-        dirnames.sort()
-        filenames.sort()
-
-        # 4.1: Determine if the following submit scripts are in this folder
-        is_submitSL_in_filenames                    =  'submit.sl'                  in filenames
-
-        is_eGS_gGS_main_opt_submitSL_in_filenames   =  'eGS_gGS_main_opt_submit.sl' in filenames
-        is_eGS_gGS_freq_submitSL_in_filenames       =  'eGS_gGS_freq_submit.sl'     in filenames
-        is_eES_gGS_submitSL_in_filenames            =  'eES_gGS_submit.sl'          in filenames
-
-        is_eES_gES_main_opt_submitSL_in_filenames   = ('eES_gES_main_opt_submit.sl' in filenames)
-        is_eES_gES_freq_submitSL_in_filenames       =  'eES_gES_freq_submit.sl'     in filenames
-        is_eGS_gES_submitSL_in_filenames            =  'eGS_gES_submit.sl'          in filenames
-
-        # 4.2: If there is a submit file to submit, submit it.        
-        if any([is_submitSL_in_filenames, is_eGS_gGS_main_opt_submitSL_in_filenames, is_eGS_gGS_freq_submitSL_in_filenames, is_eES_gGS_submitSL_in_filenames, is_eES_gES_main_opt_submitSL_in_filenames, is_eES_gES_freq_submitSL_in_filenames, is_eGS_gES_submitSL_in_filenames]):
-            
-            # 4.2.1, determine what calculations we are looking at.
-            software_type = determine_quantum_computing_software_type(dirpath, filenames)
-
-            # 4.2.2: Figure out which submit files in the folder should be submitted to slurm.
-            submission_filenames = []
-            if is_submitSL_in_filenames:
-                # Submitting either ATC or EET calculation.
-                if software_type == 'Gaussian':
-                    submission_filenames += general_gaussian_submission(filenames, are_RE_jobs_running_currently)
-                elif software_type == 'ORCA':
-                    submission_filenames += general_orca_submission(filenames, are_RE_jobs_running_currently)
-                else:
-                    raise Exception('ERROR: Could not determine what software will be used in this submission file.')
-
-            elif (is_eGS_gGS_main_opt_submitSL_in_filenames or is_eGS_gGS_freq_submitSL_in_filenames or is_eES_gGS_submitSL_in_filenames):
-                # Submitting ground structure reorganisation calculations.
-                if software_type == 'Gaussian':
-                    submission_filenames += RE_GStructure_gaussian_submission(filenames, dirpath, are_RE_jobs_running_currently)
-                elif software_type == 'ORCA':
-                    submission_filenames += RE_GStructure_orca_submission(filenames, dirpath, are_RE_jobs_running_currently)
-                else:
-                    raise Exception('ERROR: Could not determine what software will be used in this submission file.')
-
-            elif (is_eES_gES_main_opt_submitSL_in_filenames or is_eES_gES_freq_submitSL_in_filenames or is_eGS_gES_submitSL_in_filenames):
-                # Submitting excited structure reorganisation calculations.
-                if software_type == 'Gaussian':
-                    submission_filenames += RE_EStructure_gaussian_submission(filenames, dirpath, are_RE_jobs_running_currently)
-                elif software_type == 'ORCA':
-                    submission_filenames += RE_EStructure_orca_submission(filenames, dirpath, are_RE_jobs_running_currently)
-                else:
-                    raise Exception('ERROR: Could not determine what software will be used in this submission file.')
-
-            # 4.2.3: If we do not have jobs to submit to slurm, move on. 
-            if len(submission_filenames) == 0:
-                dirnames[:] = []
-                filenames[:] = []
-                continue
-
-            # ====================================================================================================
-            # 4.4: Submit the jobs to slurm
-            for submission_filename in submission_filenames:
-
-                # ----------------------------------------------------------------
-                # 4.4.1: Determine if it is the right time to submit jobs
-                print('*****************************************************************************')
-                while True:
-                    reached_max_jobs, number_in_queue = check_max_jobs_in_queue_after_next_submission(dirpath, Max_jobs_in_queue_at_any_one_time)
-                    if reached_max_jobs:
-                        print('-----------------------------------------------------------------------------')
-                        print('You can not have any more jobs in the queue before submitting the mass_sub. Will wait a bit of time for some of them to complete')
-                        print('Number of Jobs in the queue = '+str(number_in_queue))
-                        countdown(time_to_wait_before_next_submission)
-                        print('-----------------------------------------------------------------------------')
-                    else:
-                        print('The number of jobs in the queue currently is: '+str(number_in_queue))
-                        break
-                
-                # 4.4.2: Submit the jobs
-                os.chdir(dirpath)
-                name = dirpath.replace(path, '').split('/', -1)[1:]
-                
-                # If you dont want to run solvents, check if this is a solvent molecule. 
-                if not run_solvents:
-                    if name[-3].endswith('S'): # Prevent solvents from running
-                        continue
-                
-                name = "_".join(str(x) for x in name)
-                print("Submitting " + str(name) + " to slurm.")
-                print('Submission .sl file found in: '+str(os.getcwd()))
-                print('Submission filename: '+str(submission_filename))
-                error_counter = 0
-                while True:
-                    if error_counter == number_of_consecutive_error_before_exitting:
-                        break
-                    else:
-                        submitting_command = ['sbatch', str(submission_filename)]
-                        proc = Popen(submitting_command, stdout=PIPE, stderr=PIPE) # shell=True, 
-                        try:
-                            if not (proc.wait(timeout=(2*60)) == 0): # 120 seconds
-                                # A problem occurred during the submission. Report this and wait a bit before trying again.
-                                error_counter += 1
-                                if error_counter == number_of_consecutive_error_before_exitting:
-                                    print('----------------------------------------------')
-                                    print('Error in submitting submit script to slurm.')
-                                    print('I got '+str(number_of_consecutive_error_before_exitting)+" consecutive errors. Something must not be working right somewhere. I'm going to stop here just in case something is not working.")
-                                    print('')
-                                    print('The following submit.sl scripts WERE NOT SUBMITTED TO SLURM')
-                                    print('')
-                                else:
-                                    stdout, stderr = proc.communicate()
-                                    print('----------------------------------------------')
-                                    print('Error in submitting submit script to slurm. This error was:')
-                                    print(stderr)
-                                    print('Number of consecutive errors: '+str(error_counter))
-                                    print('Run_submitSL_slurm.py will retry submitting this job to slurm after '+str(time_to_wait_before_next_submission_due_to_temp_submission_issue)+' seconds of wait time')
-                                    print('----------------------------------------------')
-                                    countdown(time_to_wait_before_next_submission_due_to_temp_submission_issue)
-                            else:
-                                # Submission successful, report this and move on.
-                                stdout, stderr = proc.communicate()
-                                job_number = int(stdout.decode("utf-8").replace('Submitted batch job',''))
-                                print("Submitted " + str(name) + " to slurm: "+str(job_number))
-                                # Wait until the running and pending queue for this program is available to move on.
-                                wait_for_pending_slurm_job_queue_decrease(job_number, Max_jobs_pending_in_queue_from_ECCP_mass_submit, Max_jobs_running_in_queue_from_ECCP_mass_submit)
-                                break
-                        except TimeoutExpired:
-                            # A problem occurred during the submission, sbatch timedout. Report this and wait a bit before trying again.
-                            proc.kill()
-                            error_counter += 1
-                            if error_counter == number_of_consecutive_error_before_exitting:
-                                print('----------------------------------------------')
-                                print('Error in submitting submit script to slurm. Job timed-out after 2 minutes.')
-                                print('I got '+str(number_of_consecutive_error_before_exitting)+" consecutive errors. Something must not be working right somewhere. I'm going to stop here just in case something is not working.")
-                                print('')
-                                print('The following submit.sl scripts WERE NOT SUBMITTED TO SLURM')
-                                print('')
-                            else:
-                                print('----------------------------------------------')
-                                print('Error in submitting submit script to slurm. Job timed-out after 2 minutes.')
-                                print('Number of consecutive errors: '+str(error_counter))
-                                print('Run_submitSL_slurm.py will retry submitting this job to slurm after '+str(time_to_wait_before_next_submission_due_to_temp_submission_issue)+' seconds of wait time')
-                                print('----------------------------------------------')
-                                countdown(time_to_wait_before_next_submission_due_to_temp_submission_issue)
-
-                # 4.4.3: Check that there were any errors, and wait until it is possible to submit another job without going over the maximum limit for this user.
-                if error_counter == number_of_consecutive_error_before_exitting:
-                    print(dirpath)
-                    errors_list.append(dirpath)
-                else:
-                    if wait_between_submissions:
-                        reached_max_jobs, number_in_queue = check_max_jobs_in_queue_after_next_submission(dirpath)
-                        print('The number of jobs in the queue after submitting job is currently is: '+str(number_in_queue))
-                        #print('Will wait for '+str(time_to_wait_max_queue)+' to give time between consecutive submissions')
-                        countdown(time_to_wait_max_queue)
-                        print('*****************************************************************************')
-
-                # 4.4.4: If you are waiting between 
-                dirnames[:] = []
-                filenames[:] = []
-                if not wait_between_submissions:
-                    if consec_counter >= max_consec_counter:
-                        print('----------------------------------------------')
-                        print('As you are not waiting between consecutive submissions, it is good practise to wait for a minute at some stage')
-                        print(str(max_consec_counter) +' have been submitted consecutively. Will not wait for '+str(time_to_wait_before_next_submission_due_to_not_waiting_between_submissions)+' s before continuing')
-                        print('----------------------------------------------')
-                        countdown(time_to_wait_before_next_submission_due_to_not_waiting_between_submissions)
-                        consec_counter = 0
-                    else:
-                        consec_counter += 1
-
-            # ====================================================================================================
+    with ECCP_Job_Index(path) as job_index:
+        jobs_to_submit = get_jobs_to_submit(path, job_index, are_RE_jobs_running_currently, run_solvents, max_number_of_tasks_per_array=submission_engine.get_max_number_of_jobs_that_can_be_submitted_at_once())
+        errors_list = submission_engine.submit_jobs(jobs_to_submit, record_submission=job_index.record_submission)
 
     # Fifth, check out if there were any issues that meant that this program has to finish prematurally. 
     if len(errors_list) > 0:
@@ -299,6 +132,152 @@ def Run_method(are_RE_jobs_running_currently, run_solvents):
 
 # ------------------------------------------------------------------------------------------------
 
+def get_jobs_to_submit(path, job_index, are_RE_jobs_running_currently, run_solvents, max_number_of_tasks_per_array=None):
+    '''
+    This method will go through the folders in path and yield the submit scripts that need to be submitted to slurm.
+
+    Parameters
+    ----------
+    path : str.
+        This is the root directory to search through for submit scripts.
+    job_index : ECCP_Job_Index
+        This is the job index, used to walk through the folders in path.
+    are_RE_jobs_running_currently : bool.
+        This tag indicates if any ECCP jobs are currently running on slurm.
+    run_solvents : bool.
+        This tag indicates if solvent jobs should be submitted.
+    max_number_of_tasks_per_array : int or None
+        This is the maximum number of tasks to give in one array submission. Arrays with more tasks than this are submitted as several array submissions, so that each one can fit in the slurm queue and within the pending limit. If None, arrays are not split. Default: None
+
+    Yields
+    ------
+    dirpath : str.
+        This is the folder that contains the submit script.
+    submission_filename : str.
+        This is the name of the submit script.
+    name : str.
+        This is the name of the job.
+    sbatch_arguments : list of str.
+        These are any extra arguments to give to sbatch (used to give the tasks to run for slurm array scripts).
+    number_of_tasks : int
+        This is the number of slurm tasks that this submission adds to the queue.
+    dependent_submission_filenames : list of str.
+        These are the submit scripts in dirpath to submit as dependent jobs of this job (used to chain the reorganisation energy optimisation, frequency and single point jobs).
+    '''
+    array_job_folders = set()
+    for (dirpath, dirnames, filenames) in job_index.walk(path):
+        dirnames.sort()
+        filenames.sort()
+
+        # Preamble, if this folder contains slurm array scripts, submit the tasks of these arrays whose jobs need to be run.
+        #           * The submit.sl scripts in the job folders of these arrays will not be submitted individually.
+        #           * If you dont want to run solvents, the tasks of solvent molecules are not submitted.
+        #           * Arrays with more than max_number_of_tasks_per_array tasks are split into several array submissions.
+        for array_submission_filename in get_array_submission_filenames(filenames):
+            task_ids, job_folders = get_array_tasks_to_submit(dirpath, array_submission_filename, are_RE_jobs_running_currently)
+            array_job_folders.update([os.path.abspath(job_folder) for job_folder in job_folders])
+            if not run_solvents:
+                task_ids = [task_id for task_id in task_ids if not is_solvent_job_folder(path, os.path.normpath(job_folders[task_id-1]))]
+            name = "_".join(dirpath.replace(path, '').split('/', -1)[1:]+[array_submission_filename.replace('.sl','')])
+            number_of_tasks_per_array = max(len(task_ids) if (max_number_of_tasks_per_array is None) else int(max_number_of_tasks_per_array), 1)
+            for index in range(0, len(task_ids), number_of_tasks_per_array):
+                array_task_ids = task_ids[index:index+number_of_tasks_per_array]
+                yield dirpath, array_submission_filename, name, ['--array='+get_array_task_ranges(array_task_ids)], len(array_task_ids), []
+
+        # First, determine if the following submit scripts are in this folder
+        is_submitSL_in_filenames                    =  'submit.sl'                  in filenames
+
+        is_eGS_gGS_main_opt_submitSL_in_filenames   =  'eGS_gGS_main_opt_submit.sl' in filenames
+        is_eGS_gGS_freq_submitSL_in_filenames       =  'eGS_gGS_freq_submit.sl'     in filenames
+        is_eES_gGS_submitSL_in_filenames            =  'eES_gGS_submit.sl'          in filenames
+
+        is_eES_gES_main_opt_submitSL_in_filenames   = ('eES_gES_main_opt_submit.sl' in filenames)
+        is_eES_gES_freq_submitSL_in_filenames       =  'eES_gES_freq_submit.sl'     in filenames
+        is_eGS_gES_submitSL_in_filenames            =  'eGS_gES_submit.sl'          in filenames
+
+        # Second, if there is no submit file to submit, move on.
+        if not any([is_submitSL_in_filenames, is_eGS_gGS_main_opt_submitSL_in_filenames, is_eGS_gGS_freq_submitSL_in_filenames, is_eES_gGS_submitSL_in_filenames, is_eES_gES_main_opt_submitSL_in_filenames, is_eES_gES_freq_submitSL_in_filenames, is_eGS_gES_submitSL_in_filenames]):
+            continue
+
+        # Third, determine what calculations we are looking at.
+        software_type = determine_quantum_computing_software_type(dirpath, filenames)
+
+        # Fourth, figure out which submit files in the folder should be submitted to slurm.
+        submission_filenames = []
+        if is_submitSL_in_filenames:
+            # Submitting either ATC or EET calculation.
+            if software_type == 'Gaussian':
+                submission_filenames += general_gaussian_submission(filenames, are_RE_jobs_running_currently)
+            elif software_type == 'ORCA':
+                submission_filenames += general_orca_submission(filenames, are_RE_jobs_running_currently)
+            else:
+                raise Exception('ERROR: Could not determine what software will be used in this submission file.')
+
+        elif (is_eGS_gGS_main_opt_submitSL_in_filenames or is_eGS_gGS_freq_submitSL_in_filenames or is_eES_gGS_submitSL_in_filenames):
+            # Submitting ground structure reorganisation calculations.
+            if software_type == 'Gaussian':
+                submission_filenames += RE_GStructure_gaussian_submission(filenames, dirpath, are_RE_jobs_running_currently)
+            elif software_type == 'ORCA':
+                submission_filenames += RE_GStructure_orca_submission(filenames, dirpath, are_RE_jobs_running_currently)
+            else:
+                raise Exception('ERROR: Could not determine what software will be used in this submission file.')
+
+        elif (is_eES_gES_main_opt_submitSL_in_filenames or is_eES_gES_freq_submitSL_in_filenames or is_eGS_gES_submitSL_in_filenames):
+            # Submitting excited structure reorganisation calculations.
+            if software_type == 'Gaussian':
+                submission_filenames += RE_EStructure_gaussian_submission(filenames, dirpath, are_RE_jobs_running_currently)
+            elif software_type == 'ORCA':
+                submission_filenames += RE_EStructure_orca_submission(filenames, dirpath, are_RE_jobs_running_currently)
+            else:
+                raise Exception('ERROR: Could not determine what software will be used in this submission file.')
+
+        # Fifth, if this job is part of a slurm array, its submit.sl script has already been submitted with the array.
+        if os.path.abspath(dirpath) in array_job_folders:
+            submission_filenames = [submission_filename for submission_filename in submission_filenames if not (submission_filename == 'submit.sl')]
+
+        # Sixth, do not need to move further down the subdirectories anymore.
+        filenames_in_folder = list(filenames)
+        dirnames[:] = []
+        filenames[:] = []
+
+        # Seventh, if you dont want to run solvents, check if this is a solvent molecule. 
+        if (not run_solvents) and is_solvent_job_folder(path, dirpath):
+            continue
+        name = "_".join(str(x) for x in dirpath.replace(path, '').split('/', -1)[1:])
+
+        # Eighth, if a reorganisation energy main optimisation is being submitted, submit its frequency and single point jobs as dependent jobs of it.
+        #         * These will start as soon as the main optimisation has completed successfully.
+        dependent_submission_filenames = {}
+        for submission_filename in submission_filenames:
+            dependent_submission_filenames[submission_filename] = get_RE_dependent_submission_filenames(dirpath, filenames_in_folder, submission_filename)
+        all_dependent_submission_filenames = sum(dependent_submission_filenames.values(), [])
+        submission_filenames = [submission_filename for submission_filename in submission_filenames if not (submission_filename in all_dependent_submission_filenames)]
+
+        # Ninth, yield the submit scripts in this folder to submit to slurm.
+        for submission_filename in submission_filenames:
+            yield dirpath, submission_filename, name, [], 1, dependent_submission_filenames[submission_filename]
+
+def is_solvent_job_folder(path, dirpath):
+    '''
+    This method will determine if a job folder is for a solvent molecule.
+
+    Parameters
+    ----------
+    path : str.
+        This is the path to the folder that jobs are being submitted from.
+    dirpath : str.
+        This is the path to the job folder.
+
+    Returns
+    -------
+    is_solvent : bool.
+        True if this job folder is for a solvent molecule.
+    '''
+    name = dirpath.replace(path, '').split('/', -1)[1:]
+    return (len(name) >= 3) and name[-3].endswith('S')
+
+# ------------------------------------------------------------------------------------------------
+
 
 
 
@@ -0,0 +1,141 @@
+"""
+Fake_Slurm_Backend.py, Geoffrey Weal, 17/10/26
+
+This object is a local stand-in for slurm, so that the slurm submission engine can be run and checked without a slurm cluster.
+"""
+
+class Fake_Slurm_Backend:
+    """
+    This object is designed to pretend to be slurm.
+
+    Each time the queue is looked at (get_queue_snapshot), every job in the queue moves forward by one polling interval.
+    Jobs are pending for number_of_intervals_pending intervals, then running for number_of_intervals_running intervals, then leave the queue.
+    Jobs submitted with '--dependency=afterok:<job id>' stay pending until the job they depend on has left the queue.
+    Jobs submitted with '--array=<task ids>' are given as one entry for each task in the queue (as squeue -r does), with all the tasks of the array moving through the queue together.
+
+    Parameters
+    ----------
+    number_of_intervals_pending : int
+        This is the number of polling intervals that a job is pending for. Default: 1
+    number_of_intervals_running : int
+        This is the number of polling intervals that a job is running for. Default: 2
+    number_of_other_jobs_in_queue : int
+        This is the number of other jobs (not submitted by the submission engine) that are always in the queue. Default: 0
+    failed_submission_numbers : list of int
+        These are the submission attempts (starting from 1) that will fail, to imitate sbatch failing. Default: no failures.
+    """
+    def __init__(self, number_of_intervals_pending=1, number_of_intervals_running=2, number_of_other_jobs_in_queue=0, failed_submission_numbers=()):
+
+        # First, save the input variables.
+        self.number_of_intervals_pending = number_of_intervals_pending
+        self.number_of_intervals_running = number_of_intervals_running
+        self.number_of_other_jobs_in_queue = number_of_other_jobs_in_queue
+        self.failed_submission_numbers = set(failed_submission_numbers)
+
+        # Second, initialise the fake queue, given as {job id: number of intervals the job has been in the queue}, the jobs each job depends on, and the task ids of each array job.
+        self.queue = {}
+        self.dependencies = {}
+        self.array_task_ids = {}
+        self.next_job_number = 1
+
+        # Third, record the number of times that squeue and sbatch have been called, the jobs that have been submitted, and the order that jobs started running in.
+        self.number_of_squeue_calls = 0
+        self.number_of_sbatch_calls = 0
+        self.submitted_jobs = []
+        self.start_order = []
+
+    def get_queue_snapshot(self):
+        """
+        This method will move every job in the fake queue forward by one polling interval, and return the jobs in the fake queue.
+
+        Returns
+        -------
+        queue_snapshot : list of (str., str.)
+            These are the (job id, state) of each job in the fake queue.
+        """
+        self.number_of_squeue_calls += 1
+
+        # First, move each job in the queue forward by one interval, removing any jobs that have finished.
+        #        * Jobs whose dependencies are still in the queue do not move forward.
+        for job_number in sorted(self.queue.keys()):
+            if any([(dependency in self.queue) for dependency in self.dependencies.get(job_number, [])]):
+                continue
+            self.queue[job_number] += 1
+            if self.queue[job_number] == self.number_of_intervals_pending:
+                self.start_order.append(job_number)
+            if self.queue[job_number] >= self.number_of_intervals_pending + self.number_of_intervals_running:
+                del self.queue[job_number]
+
+        # Second, obtain the state of each job in the queue.
+        queue_snapshot = [('other'+str(index), 'R') for index in range(self.number_of_other_jobs_in_queue)]
+        for job_number, number_of_intervals in sorted(self.queue.items()):
+            state = 'PD' if (number_of_intervals < self.number_of_intervals_pending) else 'R'
+            if job_number in self.array_task_ids:
+                queue_snapshot += [(str(job_number)+'_'+str(task_id), state) for task_id in self.array_task_ids[job_number]]
+            else:
+                queue_snapshot.append((str(job_number), state))
+
+        # Third, return the snapshot of the fake queue.
+        return queue_snapshot
+
+    def submit(self, dirpath, submission_filename, sbatch_arguments=(), script_arguments=()):
+        """
+        This method will add a job to the fake queue.
+
+        Parameters
+        ----------
+        dirpath : str.
+            This is the folder that the submit script is in.
+        submission_filename : str.
+            This is the name of the submit script.
+        sbatch_arguments : list of str.
+            These are any extra arguments that would be given to sbatch. Default: ()
+        script_arguments : list of str.
+            These are any arguments that would be given to the submit script itself. Default: ()
+
+        Returns
+        -------
+        job_number : int
+            This is the fake slurm job id of the submitted job.
+        """
+        self.number_of_sbatch_calls += 1
+
+        # First, fail this submission if requested.
+        if self.number_of_sbatch_calls in self.failed_submission_numbers:
+            raise Exception('Error: fake sbatch failure for submission '+str(self.number_of_sbatch_calls)+'.')
+
+        # Second, add the job to the fake queue, along with the jobs it depends on.
+        job_number = self.next_job_number
+        self.next_job_number += 1
+        self.queue[job_number] = 0
+        for sbatch_argument in sbatch_arguments:
+            if sbatch_argument.startswith('--dependency=afterok:'):
+                self.dependencies[job_number] = [int(dependency) for dependency in sbatch_argument.replace('--dependency=afterok:','',1).split(':')]
+            if sbatch_argument.startswith('--array='):
+                self.array_task_ids[job_number] = get_array_task_ids(sbatch_argument.replace('--array=','',1))
+        self.submitted_jobs.append((dirpath, submission_filename, list(sbatch_arguments), list(script_arguments), job_number))
+
+        # Third, return the fake slurm job id.
+        return job_number
+
+def get_array_task_ids(task_ranges):
+    """
+    This method will convert the task ids given to sbatch --array into a list of task ids (i.e. '1-3,5' --> [1,2,3,5]).
+
+    Parameters
+    ----------
+    task_ranges : str.
+        These are the array task ids in the form that sbatch --array takes.
+
+    Returns
+    -------
+    task_ids : list of int
+        These are the array task ids.
+    """
+    task_ids = []
+    for task_range in task_ranges.split(','):
+        start, _, end = task_range.partition('-')
+        task_ids += list(range(int(start), int(end or start)+1))
+    return task_ids
+
+# =========================================================================================================================================
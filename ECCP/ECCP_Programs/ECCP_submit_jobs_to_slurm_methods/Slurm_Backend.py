@@ -0,0 +1,91 @@
+"""
+Slurm_Backend.py, Geoffrey Weal, 17/10/26
+
+This object is designed to communicate with slurm (via squeue and sbatch) for the slurm submission engine.
+"""
+import getpass
+from subprocess import Popen, PIPE, TimeoutExpired
+
+class Slurm_Backend:
+    """
+    This object is designed to take snapshots of the slurm queue and submit jobs to slurm.
+
+    Any object that has the get_queue_snapshot and submit methods can be given to the Slurm_Submission_Engine in place of this object (such as Fake_Slurm_Backend).
+
+    Parameters
+    ----------
+    username : str.
+        This is the username whose jobs will be looked at in the slurm queue. Default: the current user.
+    sbatch_timeout : float
+        This is the number of seconds to wait for sbatch before deciding that the submission has timed out. Default: 120 s.
+    """
+    def __init__(self, username=None, sbatch_timeout=2*60):
+        self.username = getpass.getuser() if (username is None) else username
+        self.sbatch_timeout = sbatch_timeout
+
+    def get_queue_snapshot(self):
+        """
+        This method will obtain all the jobs of the user that are currently in the slurm queue, using a single squeue call.
+
+        Returns
+        -------
+        queue_snapshot : list of (str., str.) or None
+            These are the (job id, state) of each job in the queue, where state is the compact slurm state (i.e. 'PD', 'R', 'CG'). None if squeue did not run successfully.
+        """
+
+        # First, obtain the jobs in the slurm queue.
+        check_queue_command = ['squeue', '-h', '-r', '-u', self.username, '-o', '%i %t']
+        process = Popen(check_queue_command, stdout=PIPE, stderr=PIPE)
+        out, err = process.communicate()
+        if not (process.returncode == 0):
+            return None
+
+        # Second, obtain the job id and state of each job.
+        queue_snapshot = []
+        for line in out.decode().splitlines():
+            line = line.split()
+            if len(line) < 2:
+                continue
+            queue_snapshot.append((line[0], line[1]))
+
+        # Third, return the snapshot of the queue.
+        return queue_snapshot
+
+    def submit(self, dirpath, submission_filename, sbatch_arguments=(), script_arguments=()):
+        """
+        This method will submit a submit script to slurm.
+
+        Parameters
+        ----------
+        dirpath : str.
+            This is the folder that the submit script is in. sbatch is run from this folder.
+        submission_filename : str.
+            This is the name of the submit script.
+        sbatch_arguments : list of str.
+            These are any extra arguments to give to sbatch (such as '--array=1-10' or '--dependency=afterok:1234'). Default: ()
+        script_arguments : list of str.
+            These are any arguments to give to the submit script itself. Default: ()
+
+        Returns
+        -------
+        job_number : int
+            This is the slurm job id of the submitted job.
+        """
+
+        # First, submit the job to slurm.
+        proc = Popen(['sbatch'] + list(sbatch_arguments) + [str(submission_filename)] + list(script_arguments), stdout=PIPE, stderr=PIPE, cwd=dirpath)
+        try:
+            stdout, stderr = proc.communicate(timeout=self.sbatch_timeout)
+        except TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise Exception('Error: sbatch timed-out after '+str(self.sbatch_timeout)+' seconds.')
+
+        # Second, check that the job submitted successfully.
+        if not (proc.returncode == 0):
+            raise Exception('Error: sbatch returned the following error: '+str(stderr.decode()))
+
+        # Third, return the slurm job id.
+        return int(stdout.decode("utf-8").replace('Submitted batch job',''))
+
+# =========================================================================================================================================
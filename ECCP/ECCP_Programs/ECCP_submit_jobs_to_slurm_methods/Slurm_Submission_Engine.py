@@ -0,0 +1,263 @@
+"""
+Slurm_Submission_Engine.py, Geoffrey Weal, 17/10/26
+
+This object is designed to submit jobs to slurm in batches, only looking at the slurm queue once per polling interval.
+
+This prevents the slurm controller from being swamped with a squeue call for every job that is submitted.
+"""
+import time
+from ECCP.ECCP.write_molecules_to_disk_methods.shared_methods import downstream_jobs_already_submitted_argument
+
+class Slurm_Submission_Engine:
+    """
+    This object is designed to submit jobs to slurm in batches.
+
+    Once per polling interval, one snapshot of the slurm queue is taken. From this, the engine works out how many jobs can be submitted without going over the queue limits, and submits that many jobs in one go.
+    The states of the jobs submitted by this engine are held in memory. Each task of an array job is counted as one job towards the queue limits.
+
+    Parameters
+    ----------
+    backend : Slurm_Backend or Fake_Slurm_Backend
+        This is the object used to take snapshots of the slurm queue and to submit jobs.
+    Max_jobs_in_queue_at_any_one_time : int
+        This is the maximum limit of jobs that can be in the user queue.
+    Max_jobs_pending_in_queue_from_ECCP_mass_submit : int
+        This is the maximum number of jobs (or array tasks) that we want in the pending queue that were submitted by this program.
+    Max_jobs_running_in_queue_from_ECCP_mass_submit : int
+        This is the maximum number of jobs (or array tasks) that we want in the running queue that were submitted by this program.
+    polling_interval : float
+        This is the time to wait (in seconds) between snapshots of the slurm queue.
+    number_of_consecutive_error_before_exitting : int
+        This is the number of consecutive failed submissions of a job before giving up on that job.
+    time_to_wait_before_next_submission_due_to_temp_submission_issue : float
+        This is the time to wait (in seconds) before resubmitting a job that failed to submit.
+    sleep : function
+        This is the method used to wait. Default: time.sleep
+    """
+    def __init__(self, backend, Max_jobs_in_queue_at_any_one_time, Max_jobs_pending_in_queue_from_ECCP_mass_submit, Max_jobs_running_in_queue_from_ECCP_mass_submit, polling_interval, number_of_consecutive_error_before_exitting, time_to_wait_before_next_submission_due_to_temp_submission_issue, sleep=time.sleep):
+
+        # First, save the input variables.
+        self.backend = backend
+        self.Max_jobs_in_queue_at_any_one_time = int(Max_jobs_in_queue_at_any_one_time)
+        self.Max_jobs_pending_in_queue_from_ECCP_mass_submit = int(Max_jobs_pending_in_queue_from_ECCP_mass_submit)
+        self.Max_jobs_running_in_queue_from_ECCP_mass_submit = int(Max_jobs_running_in_queue_from_ECCP_mass_submit)
+        self.polling_interval = polling_interval
+        self.number_of_consecutive_error_before_exitting = number_of_consecutive_error_before_exitting
+        self.time_to_wait_before_next_submission_due_to_temp_submission_issue = time_to_wait_before_next_submission_due_to_temp_submission_issue
+        self.sleep = sleep
+
+        # Second, initialise the in-memory record of the jobs submitted by this engine that are still in the slurm queue, and the number of their tasks that are pending and running.
+        self.jobs_in_queue = set()
+        self.number_of_pending_tasks = 0
+        self.number_of_running_tasks = 0
+        self.number_in_queue = 0
+
+    # -----------------------------------------------------------------------------------------------------------------------
+
+    def update_job_states(self):
+        """
+        This method will take one snapshot of the slurm queue, and update the states of the jobs submitted by this engine.
+        """
+
+        # First, obtain a snapshot of the slurm queue.
+        while True:
+            queue_snapshot = self.backend.get_queue_snapshot()
+            if queue_snapshot is not None:
+                break
+            print('Could not get the jobs in the slurm queue. Retrying to get the jobs in the slurm queue after '+str(self.time_to_wait_before_next_submission_due_to_temp_submission_issue)+' seconds.')
+            self.sleep(self.time_to_wait_before_next_submission_due_to_temp_submission_issue)
+
+        # Second, count the pending and running tasks of the jobs submitted by this engine.
+        #         * Tasks of job arrays (given as "jobid_index") are recorded under their job id.
+        #         * Jobs that are no longer in the queue have finished.
+        live_jobs = set()
+        self.number_of_pending_tasks = 0
+        self.number_of_running_tasks = 0
+        for job_id, state in queue_snapshot:
+            job_id = job_id.split('_')[0]
+            if not (job_id in self.jobs_in_queue):
+                continue
+            live_jobs.add(job_id)
+            if state == 'PD':
+                self.number_of_pending_tasks += 1
+            else:
+                self.number_of_running_tasks += 1
+
+        # Third, only keep the jobs submitted by this engine that are still in the queue.
+        self.jobs_in_queue = live_jobs
+
+        # Fourth, record the number of jobs in the user's queue.
+        self.number_in_queue = len(queue_snapshot)
+
+    def get_number_of_jobs_that_can_be_submitted(self):
+        """
+        This method will determine how many jobs can be submitted without going over the queue limits.
+
+        Returns
+        -------
+        number_of_jobs_that_can_be_submitted : int
+            This is the number of jobs (or array tasks) that can be submitted now.
+        """
+        if self.number_of_running_tasks >= self.Max_jobs_running_in_queue_from_ECCP_mass_submit:
+            return 0
+        number_of_jobs_that_can_be_submitted = min(self.Max_jobs_in_queue_at_any_one_time - self.number_in_queue, self.Max_jobs_pending_in_queue_from_ECCP_mass_submit - self.number_of_pending_tasks)
+        return max(number_of_jobs_that_can_be_submitted, 0)
+
+    def get_max_number_of_jobs_that_can_be_submitted_at_once(self):
+        """
+        This method will give the largest number of jobs (or array tasks) that can ever be submitted at once without going over the queue limits.
+
+        Returns
+        -------
+        max_number_of_jobs : int
+            This is the number of jobs that can be submitted when the queue is empty.
+        """
+        return min(self.Max_jobs_in_queue_at_any_one_time, self.Max_jobs_pending_in_queue_from_ECCP_mass_submit)
+
+    # -----------------------------------------------------------------------------------------------------------------------
+
+    def submit_jobs(self, jobs_to_submit, record_submission=None):
+        """
+        This method will submit all the jobs in jobs_to_submit to slurm in batches.
+
+        Parameters
+        ----------
+        jobs_to_submit : iterable of (str., str., str., list of str., int, list of str.)
+            These are the (folder, submit script name, name to print, extra sbatch arguments, number of slurm tasks, dependent submit script names) of each job to submit. The number of slurm tasks is greater than 1 for array jobs. The dependent submit scripts (in the same folder) are submitted straight after the job, and will only start once the job has completed successfully. This can be a generator, as jobs are only taken from it when they are about to be submitted.
+        record_submission : function
+            This method is called as record_submission(dirpath, submission_filename, job_number) after each successful submission. Default: None
+
+        Returns
+        -------
+        errors_list : list of str.
+            These are the folders that contain jobs that could not be submitted to slurm.
+        """
+
+        # First, obtain the first job to submit.
+        jobs_to_submit = iter(jobs_to_submit)
+        next_job = next(jobs_to_submit, None)
+        errors_list = []
+        was_waiting = False
+
+        # Second, submit jobs in batches until all jobs have been submitted.
+        while next_job is not None:
+
+            # 2.1: Take a snapshot of the slurm queue and determine how many jobs can be submitted.
+            self.update_job_states()
+            number_of_jobs_that_can_be_submitted = self.get_number_of_jobs_that_can_be_submitted()
+
+            # 2.2: If no jobs can be submitted, wait until the next polling interval.
+            if number_of_jobs_that_can_be_submitted == 0:
+                if not was_waiting:
+                    print('-----------------------------------------------------------------------------')
+                    print('The slurm queue is full (Number of Jobs in the queue = '+str(self.number_in_queue)+'; Pending: '+str(self.number_of_pending_tasks)+'; Running: '+str(self.number_of_running_tasks)+'). Will wait for jobs to move through the queue before submitting more jobs.')
+                    was_waiting = True
+                self.sleep(self.polling_interval)
+                continue
+            if was_waiting:
+                print('The slurm queue is now NOT full. Will continue submitting jobs.')
+                print('-----------------------------------------------------------------------------')
+                was_waiting = False
+
+            # 2.3: Submit a batch of jobs.
+            print('*****************************************************************************')
+            print('The number of jobs in the queue currently is: '+str(self.number_in_queue)+'. Will submit up to '+str(number_of_jobs_that_can_be_submitted)+' jobs.')
+            while (number_of_jobs_that_can_be_submitted > 0) and (next_job is not None):
+                dirpath, submission_filename, name, sbatch_arguments, number_of_tasks, dependent_submission_filenames = next_job
+
+                # 2.3.1: Array jobs add all of their tasks to the queue as pending jobs, so wait until there is space for all the tasks.
+                #        * Jobs with dependent jobs add the dependent jobs to the queue as well.
+                #        * If the job adds more jobs to the queue than the queue limits can ever allow, it will never fit, so do not submit it.
+                number_of_jobs_added_to_queue = number_of_tasks + len(dependent_submission_filenames)
+                max_number_of_jobs_that_can_be_submitted_at_once = self.get_max_number_of_jobs_that_can_be_submitted_at_once()
+                if number_of_jobs_added_to_queue > max_number_of_jobs_that_can_be_submitted_at_once:
+                    print('----------------------------------------------')
+                    print('Error: '+str(name)+' ('+str(submission_filename)+') would add '+str(number_of_jobs_added_to_queue)+' jobs to the slurm queue, but only '+str(max_number_of_jobs_that_can_be_submitted_at_once)+' jobs can be in the queue (or pending) at any one time. Will not submit this job.')
+                    print('----------------------------------------------')
+                    errors_list.append(dirpath)
+                    next_job = next(jobs_to_submit, None)
+                    continue
+                if number_of_jobs_added_to_queue > number_of_jobs_that_can_be_submitted:
+                    break
+
+                # 2.3.2: Submit the job. If the job has dependent jobs, tell the submit script that it does not need to submit them itself.
+                script_arguments = [downstream_jobs_already_submitted_argument] if (len(dependent_submission_filenames) > 0) else []
+                job_number = self.submit_job(dirpath, submission_filename, name, sbatch_arguments, script_arguments)
+                if job_number is None:
+                    errors_list.append(dirpath)
+                    next_job = next(jobs_to_submit, None)
+                    continue
+                self.jobs_in_queue.add(str(job_number))
+                self.number_of_pending_tasks += number_of_tasks
+                self.number_in_queue += number_of_tasks
+                number_of_jobs_that_can_be_submitted -= number_of_tasks
+                if record_submission is not None:
+                    record_submission(dirpath, submission_filename, job_number)
+
+                # 2.3.3: Submit the dependent jobs, which slurm will only start once the job has completed successfully.
+                #        * If the job fails, slurm removes the dependent jobs from the queue (--kill-on-invalid-dep=yes).
+                for dependent_submission_filename in dependent_submission_filenames:
+                    dependent_sbatch_arguments = ['--dependency=afterok:'+str(job_number), '--kill-on-invalid-dep=yes']
+                    dependent_job_number = self.submit_job(dirpath, dependent_submission_filename, name, dependent_sbatch_arguments)
+                    if dependent_job_number is None:
+                        errors_list.append(dirpath)
+                        continue
+                    self.jobs_in_queue.add(str(dependent_job_number))
+                    self.number_of_pending_tasks += 1
+                    self.number_in_queue += 1
+                    number_of_jobs_that_can_be_submitted -= 1
+                    if record_submission is not None:
+                        record_submission(dirpath, dependent_submission_filename, dependent_job_number)
+                next_job = next(jobs_to_submit, None)
+
+            # 2.4: Wait until the next polling interval before looking at the slurm queue again.
+            if next_job is not None:
+                self.sleep(self.polling_interval)
+
+        # Third, return the folders of jobs that could not be submitted.
+        return errors_list
+
+    def submit_job(self, dirpath, submission_filename, name, sbatch_arguments=(), script_arguments=()):
+        """
+        This method will submit a job to slurm, retrying if the submission fails.
+
+        Parameters
+        ----------
+        dirpath : str.
+            This is the folder that the submit script is in.
+        submission_filename : str.
+            This is the name of the submit script.
+        name : str.
+            This is the name of the job to print.
+        sbatch_arguments : list of str.
+            These are any extra arguments to give to sbatch. Default: ()
+        script_arguments : list of str.
+            These are any arguments to give to the submit script itself. Default: ()
+
+        Returns
+        -------
+        job_number : int or None
+            This is the slurm job id of the submitted job. None if the job could not be submitted.
+        """
+        print("Submitting " + str(name) + " to slurm (" + str(submission_filename) + ").")
+        for error_counter in range(1, self.number_of_consecutive_error_before_exitting+1):
+            try:
+                job_number = self.backend.submit(dirpath, submission_filename, sbatch_arguments, script_arguments)
+            except Exception as exception_message:
+                print('----------------------------------------------')
+                print('Error in submitting submit script to slurm. This error was:')
+                print(exception_message)
+                print('Number of consecutive errors: '+str(error_counter))
+                if error_counter == self.number_of_consecutive_error_before_exitting:
+                    print('I got '+str(self.number_of_consecutive_error_before_exitting)+" consecutive errors. Something must not be working right somewhere. Will not submit this job.")
+                    print('----------------------------------------------')
+                    break
+                print('Will retry submitting this job to slurm after '+str(self.time_to_wait_before_next_submission_due_to_temp_submission_issue)+' seconds of wait time')
+                print('----------------------------------------------')
+                self.sleep(self.time_to_wait_before_next_submission_due_to_temp_submission_issue)
+                continue
+            print("Submitted " + str(name) + " to slurm: "+str(job_number))
+            return job_number
+        return None
+
+# =========================================================================================================================================
@@ -0,0 +1,58 @@
+'''
+Geoffrey Weal, get_RE_dependent_submission_filenames.py, 17/10/26
+
+This program contains methods for determining which reorganisation energy submit scripts can be submitted to slurm straight after the main optimisation, as dependent jobs of the main optimisation.
+'''
+from ECCP.ECCP.write_molecules_to_disk_methods.shared_methods import downstream_jobs_already_submitted_argument
+
+# These are the jobs that follow on from each main optimisation job, given as {main optimisation name: [frequency name, single point name]}.
+RE_downstream_calculation_names = {'eGS_gGS_main_opt': ['eGS_gGS_freq', 'eES_gGS'], 'eES_gES_main_opt': ['eES_gES_freq', 'eGS_gES']}
+
+def get_RE_dependent_submission_filenames(dirpath, filenames, submission_filename):
+    """
+    This method will determine which frequency and single point submit scripts can be submitted to slurm as dependent jobs of a main optimisation submit script.
+
+    Dependent jobs are only given if:
+        * the main optimisation submit script knows to not submit the frequency and single point jobs itself when it is told they have already been submitted (i.e. it was made with this version of ECCP), and
+        * the main optimisation submit script will not perform a pre-optimisation first (as the pre-optimisation resubmits the main optimisation submit script itself).
+
+    Parameters
+    ----------
+    dirpath : str.
+        This is the folder that contains the submit scripts.
+    filenames : list of str.
+        These are the names of the files in dirpath.
+    submission_filename : str.
+        This is the name of the submit script that is about to be submitted to slurm.
+
+    Returns
+    -------
+    dependent_submission_filenames : list of str.
+        These are the names of the submit scripts to submit as dependent jobs of submission_filename.
+    """
+
+    # First, only main optimisation submit scripts have dependent jobs.
+    main_calculation_type_name = submission_filename.replace('_submit.sl', '')
+    if not (main_calculation_type_name in RE_downstream_calculation_names):
+        return []
+
+    # Second, if a pre-optimisation still needs to be performed, do not submit any dependent jobs.
+    if (main_calculation_type_name+'_preopt.gjf' in filenames) and (not (main_calculation_type_name+'_preopt.log' in filenames)):
+        return []
+
+    # Third, check that the main optimisation submit script will not submit the frequency and single point jobs itself.
+    with open(dirpath+'/'+submission_filename, 'r') as submitSL:
+        if not (downstream_jobs_already_submitted_argument in submitSL.read()):
+            return []
+
+    # Fourth, obtain the frequency and single point submit scripts that have not already begun.
+    dependent_submission_filenames = []
+    for downstream_calculation_name in RE_downstream_calculation_names[main_calculation_type_name]:
+        if not (downstream_calculation_name+'_submit.sl' in filenames):
+            continue
+        if (downstream_calculation_name+'.log' in filenames) or (downstream_calculation_name+'.out' in filenames):
+            continue
+        dependent_submission_filenames.append(downstream_calculation_name+'_submit.sl')
+
+    # Fifth, return the names of the dependent submit scripts.
+    return dependent_submission_filenames
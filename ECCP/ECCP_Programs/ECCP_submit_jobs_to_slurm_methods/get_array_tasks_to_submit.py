@@ -0,0 +1,110 @@
+'''
+Geoffrey Weal, get_array_tasks_to_submit.py, 17/10/26
+
+This program contains methods for determining which tasks of a slurm array script (made by ECCP with make_slurm_job_arrays=True) need to be submitted to slurm.
+'''
+import os
+
+from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm_methods.determine_quantum_computing_software_type import determine_quantum_computing_software_type
+from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm_methods.ECCP_submit_gaussian_jobs_to_slurm        import general_gaussian_submission
+from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm_methods.ECCP_submit_orca_jobs_to_slurm            import general_orca_submission
+
+def get_array_submission_filenames(filenames):
+    """
+    This method will obtain the names of the slurm array scripts in a folder.
+
+    Parameters
+    ----------
+    filenames : list of str.
+        These are all the filenames of files in the directory you want to look at.
+
+    Returns
+    -------
+    array_submission_filenames : list of str.
+        These are the names of the slurm array scripts in this folder.
+    """
+    return sorted([filename for filename in filenames if (filename.startswith('array_submit_') and filename.endswith('.sl'))])
+
+def get_array_index_filename(array_submission_filename):
+    """
+    This method will give the name of the index file that goes with a slurm array script.
+
+    Parameters
+    ----------
+    array_submission_filename : str.
+        This is the name of the slurm array script (array_submit_N.sl).
+
+    Returns
+    -------
+    array_index_filename : str.
+        This is the name of the index file (array_index_N.txt).
+    """
+    return array_submission_filename.replace('array_submit_', 'array_index_', 1)[:-len('.sl')]+'.txt'
+
+def get_array_tasks_to_submit(dirpath, array_submission_filename, are_RE_jobs_running_currently):
+    """
+    This method is designed to determine which tasks in a slurm array script need to be submitted to slurm.
+
+    A task is submitted if its submit.sl script would have been submitted if it was not part of the array.
+
+    Parameters
+    ----------
+    dirpath : str.
+        The path to the directory the slurm array script is in.
+    array_submission_filename : str.
+        This is the name of the slurm array script.
+    are_RE_jobs_running_currently : bool
+        Has the user already indicates these jobs may already be running on slurm.
+
+    Returns
+    -------
+    task_ids : list of int
+        These are the array task ids to submit to slurm.
+    job_folders : list of str.
+        These are the paths to all the job folders that are included in this slurm array script.
+    """
+
+    # First, read the index file for this slurm array script.
+    with open(dirpath+'/'+get_array_index_filename(array_submission_filename), 'r') as indexTXT:
+        job_folders = [os.path.join(dirpath, line.rstrip('\n')) for line in indexTXT if not (line.strip() == '')]
+
+    # Second, determine which of the job folders need their job to be submitted.
+    task_ids = []
+    for task_id, job_folder in enumerate(job_folders, start=1):
+        if not os.path.exists(job_folder):
+            continue
+        filenames = sorted(os.listdir(job_folder))
+        software_type = determine_quantum_computing_software_type(job_folder, filenames)
+        if software_type == 'Gaussian':
+            submission_filenames = general_gaussian_submission(filenames, are_RE_jobs_running_currently)
+        elif software_type == 'ORCA':
+            submission_filenames = general_orca_submission(filenames, are_RE_jobs_running_currently)
+        else:
+            raise Exception('ERROR: Could not determine what software will be used in this submission file. Path: '+str(job_folder))
+        if 'submit.sl' in submission_filenames:
+            task_ids.append(task_id)
+
+    # Third, return the task ids to submit and the job folders in this array.
+    return task_ids, job_folders
+
+def get_array_task_ranges(task_ids):
+    """
+    This method will convert a list of array task ids into the compact form that sbatch --array takes (i.e. [1,2,3,5,7,8] --> '1-3,5,7-8').
+
+    Parameters
+    ----------
+    task_ids : list of int
+        These are the array task ids.
+
+    Returns
+    -------
+    task_ranges : str.
+        These are the array task ids in the form that sbatch --array takes.
+    """
+    task_ranges = []
+    for task_id in sorted(task_ids):
+        if (len(task_ranges) > 0) and (task_ranges[-1][1] == task_id - 1):
+            task_ranges[-1][1] = task_id
+        else:
+            task_ranges.append([task_id, task_id])
+    return ','.join([(str(start) if (start == end) else (str(start)+'-'+str(end))) for start, end in task_ranges])
@@ -13,12 +13,9 @@ Max_jobs_pending_in_queue_from_ECCP_mass_submit_DEFAULT = 10
 Max_jobs_running_in_queue_from_ECCP_mass_submit_DEFAULT = Max_jobs_in_queue_at_any_one_time_DEFAULT - Max_jobs_pending_in_queue_from_ECCP_mass_submit_DEFAULT - 1
 
 time_to_wait_before_next_submission_DEFAULT = 20.0
-time_to_wait_max_queue_DEFAULT = 60.0
 
 time_to_wait_before_next_submission_due_to_temp_submission_issue_DEFAULT = 10.0
 number_of_consecutive_error_before_exitting_DEFAULT = 20
-
-time_to_wait_before_next_submission_due_to_not_waiting_between_submissions_DEFAULT = 60.0
 # =========================================================================================================================================
 
 def check_submit_settingsTXT(path_to_settings_txt_file):
@@ -64,10 +61,6 @@ def read_submit_settingsTXT_file(path_to_settings_txt_file):
                 line = line.rstrip().replace('time_to_wait_before_next_submission = ','')
                 time_to_wait_before_next_submission = float(line)
                 variables_found.append('time_to_wait_before_next_submission')
-            elif 'time_to_wait_max_queue = ' in line:
-                line = line.rstrip().replace('time_to_wait_max_queue = ','')
-                time_to_wait_max_queue = float(line)
-                variables_found.append('time_to_wait_max_queue')
             elif 'time_to_wait_before_next_submission_due_to_temp_submission_issue = ' in line:
                 line = line.rstrip().replace('time_to_wait_before_next_submission_due_to_temp_submission_issue = ','')
                 time_to_wait_before_next_submission_due_to_temp_submission_issue = float(line)
@@ -76,14 +69,10 @@ def read_submit_settingsTXT_file(path_to_settings_txt_file):
                 line = line.rstrip().replace('number_of_consecutive_error_before_exitting = ','')
                 number_of_consecutive_error_before_exitting = int(line)
                 variables_found.append('number_of_consecutive_error_before_exitting')
-            elif 'time_to_wait_before_next_submission_due_to_not_waiting_between_submissions = ' in line:
-                line = line.rstrip().replace('time_to_wait_before_next_submission_due_to_not_waiting_between_submissions = ','')
-                time_to_wait_before_next_submission_due_to_not_waiting_between_submissions = float(line)
-                variables_found.append('time_to_wait_before_next_submission_due_to_not_waiting_between_submissions')
 
     # Second, check that all the variables have been obtained from the settings file. 
     # 2.1: Determine which variables are contained in the settings file. 
-    variables_needed = ['Max_jobs_in_queue_at_any_one_time', 'Max_jobs_pending_in_queue_from_ECCP_mass_submit', 'Max_jobs_running_in_queue_from_ECCP_mass_submit', 'time_to_wait_before_next_submission', 'time_to_wait_max_queue', 'time_to_wait_before_next_submission_due_to_temp_submission_issue', 'number_of_consecutive_error_before_exitting', 'time_to_wait_before_next_submission_due_to_not_waiting_between_submissions']
+    variables_needed = ['Max_jobs_in_queue_at_any_one_time', 'Max_jobs_pending_in_queue_from_ECCP_mass_submit', 'Max_jobs_running_in_queue_from_ECCP_mass_submit', 'time_to_wait_before_next_submission', 'time_to_wait_before_next_submission_due_to_temp_submission_issue', 'number_of_consecutive_error_before_exitting']
     variables_you_do_not_have_in_settingsTXT = []
     for variable in variables_needed:
         if not variable in locals():
@@ -100,9 +89,9 @@ def read_submit_settingsTXT_file(path_to_settings_txt_file):
         exit('Error')
 
     # Fourth, return all the settings from the settings file.
-    return Max_jobs_in_queue_at_any_one_time, Max_jobs_pending_in_queue_from_ECCP_mass_submit, Max_jobs_running_in_queue_from_ECCP_mass_submit, time_to_wait_before_next_submission, time_to_wait_max_queue, time_to_wait_before_next_submission_due_to_temp_submission_issue, number_of_consecutive_error_before_exitting, time_to_wait_before_next_submission_due_to_not_waiting_between_submissions
+    return Max_jobs_in_queue_at_any_one_time, Max_jobs_pending_in_queue_from_ECCP_mass_submit, Max_jobs_running_in_queue_from_ECCP_mass_submit, time_to_wait_before_next_submission, time_to_wait_before_next_submission_due_to_temp_submission_issue, number_of_consecutive_error_before_exitting
 
-def write_submit_settingsTXT_file(path_to_settings_txt_file, Max_jobs_in_queue_at_any_one_time=Max_jobs_in_queue_at_any_one_time_DEFAULT, Max_jobs_pending_in_queue_from_ECCP_mass_submit=Max_jobs_pending_in_queue_from_ECCP_mass_submit_DEFAULT, Max_jobs_running_in_queue_from_ECCP_mass_submit=Max_jobs_running_in_queue_from_ECCP_mass_submit_DEFAULT, time_to_wait_before_next_submission=time_to_wait_before_next_submission_DEFAULT, time_to_wait_max_queue=time_to_wait_max_queue_DEFAULT, time_to_wait_before_next_submission_due_to_temp_submission_issue=time_to_wait_before_next_submission_due_to_temp_submission_issue_DEFAULT, number_of_consecutive_error_before_exitting=number_of_consecutive_error_before_exitting_DEFAULT, time_to_wait_before_next_submission_due_to_not_waiting_between_submissions=time_to_wait_before_next_submission_due_to_not_waiting_between_submissions_DEFAULT):
+def write_submit_settingsTXT_file(path_to_settings_txt_file, Max_jobs_in_queue_at_any_one_time=Max_jobs_in_queue_at_any_one_time_DEFAULT, Max_jobs_pending_in_queue_from_ECCP_mass_submit=Max_jobs_pending_in_queue_from_ECCP_mass_submit_DEFAULT, Max_jobs_running_in_queue_from_ECCP_mass_submit=Max_jobs_running_in_queue_from_ECCP_mass_submit_DEFAULT, time_to_wait_before_next_submission=time_to_wait_before_next_submission_DEFAULT, time_to_wait_before_next_submission_due_to_temp_submission_issue=time_to_wait_before_next_submission_due_to_temp_submission_issue_DEFAULT, number_of_consecutive_error_before_exitting=number_of_consecutive_error_before_exitting_DEFAULT):
     """
     This method will write the new settings to the settings file.
     """
@@ -111,10 +100,8 @@ def write_submit_settingsTXT_file(path_to_settings_txt_file, Max_jobs_in_queue_a
         submit_settingsTXT.write('Max_jobs_pending_in_queue_from_ECCP_mass_submit = '+str(Max_jobs_pending_in_queue_from_ECCP_mass_submit)+'\n')
         submit_settingsTXT.write('Max_jobs_running_in_queue_from_ECCP_mass_submit = '+str(Max_jobs_running_in_queue_from_ECCP_mass_submit)+'\n')
         submit_settingsTXT.write('time_to_wait_before_next_submission = '+str(time_to_wait_before_next_submission)+'\n')
-        submit_settingsTXT.write('time_to_wait_max_queue = '+str(time_to_wait_max_queue)+'\n')
         submit_settingsTXT.write('time_to_wait_before_next_submission_due_to_temp_submission_issue = '+str(time_to_wait_before_next_submission_due_to_temp_submission_issue)+'\n')
         submit_settingsTXT.write('number_of_consecutive_error_before_exitting = '+str(number_of_consecutive_error_before_exitting)+'\n')
-        submit_settingsTXT.write('time_to_wait_before_next_submission_due_to_not_waiting_between_submissions = '+str(time_to_wait_before_next_submission_due_to_not_waiting_between_submissions)+'\n')
 
 # =========================================================================================================================================
 
@@ -154,18 +141,6 @@ def change_settings(args):
         else:
             time_to_wait_before_next_submission = args[1]
         write_submit_settingsTXT_file(path_to_settings_txt_file,time_to_wait_before_next_submission)
-    elif args[0] == 'wait_max_queue':
-        if len(args) == 2:
-            print('Setting time_to_wait_max_queue to default ('+str(time_to_wait_max_queue_DEFAULT)+')')
-            time_to_wait_max_queue = time_to_wait_max_queue_DEFAULT
-        elif not instance(args[1],float):
-            print('Error in changing submit sertings:')
-            print('You need to enter a float if you want to change the settings for time_to_wait_max_queue')
-            print('Your input value is: '+str(args[1]))
-            exit('This program is closing without changing any settings')
-        else:
-            time_to_wait_max_queue = args[1]
-        write_submit_settingsTXT_file(path_to_settings_txt_file,time_to_wait_max_queue)
     elif args[0] == 'wait_error':
         if len(args) == 2:
             print('Setting time_to_wait_before_next_submission_due_to_temp_submission_issue to default ('+str(time_to_wait_before_next_submission_due_to_temp_submission_issue_DEFAULT)+')')
@@ -190,18 +165,6 @@ def change_settings(args):
         else:
             number_of_consecutive_error_before_exitting = args[1]
         write_submit_settingsTXT_file(path_to_settings_txt_file,number_of_consecutive_error_before_exitting)
-    elif args[0] == 'wait_mass':
-        if len(args) == 2:
-            print('Setting time_to_wait_before_next_submission_due_to_not_waiting_between_submissions to default ('+str(time_to_wait_before_next_submission_due_to_not_waiting_between_submissions_DEFAULT)+')')
-            time_to_wait_before_next_submission_due_to_not_waiting_between_submissions = time_to_wait_before_next_submission_due_to_not_waiting_between_submissions_DEFAULT
-        elif not instance(args[1],float):
-            print('Error in changing submit sertings:')
-            print('You need to enter a float if you want to change the settings for time_to_wait_before_next_submission_due_to_not_waiting_between_submissions')
-            print('Your input value is: '+str(args[1]))
-            exit('This program is closing without changing any settings')
-        else:
-            time_to_wait_before_next_submission_due_to_not_waiting_between_submissions = args[1]
-        write_submit_settingsTXT_file(path_to_settings_txt_file,time_to_wait_before_next_submission_due_to_not_waiting_between_submissions)
     elif args[0] == 'reset':
         write_submit_settingsTXT_file(path_to_settings_txt_file)
     else:
@@ -7,7 +7,8 @@ import os, shutil
 
 from ECCP.ECCP_Programs.shared_general_methods.shared_gaussian_methods import folder_contains_RE_files
 from ECCP.ECCP_Programs.shared_general_methods.shared_gaussian_methods import found_a_gaussian_job_that_has_run
-from ECCP.ECCP_Programs.shared_general_methods.shared_gaussian_methods import did_gaussian_job_complete
+from ECCP.ECCP_Programs.shared_general_methods.shared_gaussian_methods import did_gaussian_job_complete as did_gaussian_job_complete_uncached
+from ECCP.ECCP_Programs.shared_general_methods.ECCP_Job_Index          import ECCP_Job_Index
 from ECCP.ECCP_Programs.shared_general_methods.shared_gaussian_methods import gaussian_temp_files_to_remove
 from ECCP.ECCP_Programs.shared_general_methods.shared_gaussian_methods import remove_slurm_output_files
 
@@ -37,68 +38,71 @@ def Run_method():
     did_not_tidy_jobs = []
 
     # Second, go through each subdirectory in the parent directory. 
-    for root, dirs, files in os.walk(current_path):
+    #         * The job index is used to avoid re-reading log files that have not changed since they were last checked.
+    with ECCP_Job_Index(current_path) as job_index:
+        did_gaussian_job_complete = job_index.cache_log_check(did_gaussian_job_complete_uncached)
+        for root, dirs, files in job_index.walk(current_path):
+
+            # 2.1: sort the directory just to make tidying happen in alphabetical order.
+            dirs.sort()
+
+            # 2.2: What type of calculation type are we dealing with
+            contains_RE_files, RE_type = folder_contains_RE_files(root)
+            if contains_RE_files:
+
+                # 2.2.1: We are looking at a reorganisation energy calculation
+                did_find_job = True
+                if RE_type == 'GS':
+
+                    # 2.2.1.1: Determine which of these ground state reorganisation energy jobs has finished.
+                    #has_GS_GS_main_preopt_completed = did_gaussian_job_complete(root+'/GS_GS_main_opt_preopt.log')
+                    has_GS_GS_main_opt_completed    = did_gaussian_job_complete(root+'/GS_GS_main_opt.log')
+                    has_GS_GS_freq_completed        = did_gaussian_job_complete(root+'/GS_GS_freq.log')
+                    has_GS_ES_completed             = did_gaussian_job_complete(root+'/GS_ES.log')
+
+                    # 2.2.1.2: Did this ground state reorganisation energy finish?
+                    if has_GS_GS_main_opt_completed and has_GS_GS_freq_completed and has_GS_ES_completed:
+                        gaussian_temp_files_to_remove(root, files, remove_chk_file=True, remove_fort7_file=True) 
+                        remove_slurm_output_files(root)
+                    else:
+                        did_not_tidy_jobs.append(root)
+
+                elif RE_type == 'ES':
+
+                    # 2.2.2.1: Determine which of these excited state reorganisation energy jobs has finished.
+                    #has_ES_ES_main_preopt_completed = did_gaussian_job_complete(root+'/ES_ES_main_opt_preopt.log')
+                    has_ES_ES_main_opt_completed    = did_gaussian_job_complete(root+'/ES_ES_main_opt.log')
+                    has_ES_ES_freq_completed        = did_gaussian_job_complete(root+'/ES_ES_freq.log')
+                    has_ES_GS_completed             = did_gaussian_job_complete(root+'/ES_GS.log')
+
+                    # 2.2.2.2: Did this excited state reorganisation energy finish?
+                    if has_ES_ES_main_opt_completed and has_ES_ES_freq_completed and has_ES_GS_completed:
+                        gaussian_temp_files_to_remove(root, files, remove_chk_file=True, remove_fort7_file=True) 
+                        remove_slurm_output_files(root)
+                    else:
+                        did_not_tidy_jobs.append(root)
 
-        # 2.1: sort the directory just to make tidying happen in alphabetical order.
-        dirs.sort()
-
-        # 2.2: What type of calculation type are we dealing with
-        contains_RE_files, RE_type = folder_contains_RE_files(root)
-        if contains_RE_files:
-
-            # 2.2.1: We are looking at a reorganisation energy calculation
-            did_find_job = True
-            if RE_type == 'GS':
-
-                # 2.2.1.1: Determine which of these ground state reorganisation energy jobs has finished.
-                #has_GS_GS_main_preopt_completed = did_gaussian_job_complete(root+'/GS_GS_main_opt_preopt.log')
-                has_GS_GS_main_opt_completed    = did_gaussian_job_complete(root+'/GS_GS_main_opt.log')
-                has_GS_GS_freq_completed        = did_gaussian_job_complete(root+'/GS_GS_freq.log')
-                has_GS_ES_completed             = did_gaussian_job_complete(root+'/GS_ES.log')
-
-                # 2.2.1.2: Did this ground state reorganisation energy finish?
-                if has_GS_GS_main_opt_completed and has_GS_GS_freq_completed and has_GS_ES_completed:
-                    gaussian_temp_files_to_remove(root, files, remove_chk_file=True, remove_fort7_file=True) 
-                    remove_slurm_output_files(root)
                 else:
-                    did_not_tidy_jobs.append(root)
+                    raise Exception('huh?')
 
-            elif RE_type == 'ES':
+                # 2.2.2: Do not need to move further down the subdirectories anymore, remove all dirs and files lists.
+                dirs[:] = []
+                files[:] = []
 
-                # 2.2.2.1: Determine which of these excited state reorganisation energy jobs has finished.
-                #has_ES_ES_main_preopt_completed = did_gaussian_job_complete(root+'/ES_ES_main_opt_preopt.log')
-                has_ES_ES_main_opt_completed    = did_gaussian_job_complete(root+'/ES_ES_main_opt.log')
-                has_ES_ES_freq_completed        = did_gaussian_job_complete(root+'/ES_ES_freq.log')
-                has_ES_GS_completed             = did_gaussian_job_complete(root+'/ES_GS.log')
+            elif found_a_gaussian_job_that_has_run(root, files): 
 
-                # 2.2.2.2: Did this excited state reorganisation energy finish?
-                if has_ES_ES_main_opt_completed and has_ES_ES_freq_completed and has_ES_GS_completed:
-                    gaussian_temp_files_to_remove(root, files, remove_chk_file=True, remove_fort7_file=True) 
+                # 2.3.1: We are looking at a non-reorganisation energy ECCP Gaussian calculation.
+                #        If the output.log file shows that the program finished successfully, remove all temp files. 
+                did_find_job = True
+                if did_gaussian_job_complete(root+'/output.log'):
+                    gaussian_temp_files_to_remove(root, files, remove_chk_file=True, remove_fort7_file=True) # Check this for ICT calcs.
                     remove_slurm_output_files(root)
                 else:
                     did_not_tidy_jobs.append(root)
 
-            else:
-                raise Exception('huh?')
-
-            # 2.2.2: Do not need to move further down the subdirectories anymore, remove all dirs and files lists.
-            dirs[:] = []
-            files[:] = []
-
-        elif found_a_gaussian_job_that_has_run(root, files): 
-
-            # 2.3.1: We are looking at a non-reorganisation energy ECCP Gaussian calculation.
-            #        If the output.log file shows that the program finished successfully, remove all temp files. 
-            did_find_job = True
-            if did_gaussian_job_complete(root+'/output.log'):
-                gaussian_temp_files_to_remove(root, files, remove_chk_file=True, remove_fort7_file=True) # Check this for ICT calcs.
-                remove_slurm_output_files(root)
-            else:
-                did_not_tidy_jobs.append(root)
-
-            # 2.3.2: Do not need to move further down the subdirectories anymore, remove all dirs and files lists.
-            dirs[:] = []
-            files[:] = []
+                # 2.3.2: Do not need to move further down the subdirectories anymore, remove all dirs and files lists.
+                dirs[:] = []
+                files[:] = []
             
     # Third, print information about this tidying run.
     if not did_find_job:
@@ -0,0 +1,107 @@
+'''
+Geoffrey Weal, benchmark_pipeline.py, 17/10/26
+
+This script is designed to time the stages of the ECCP preparation pipeline on a crystal.
+
+The stages are run in the same order and with the same inputs as in Electronic_Crystal_Calculation_Prep.py, but without the stage cache, the ECCP_Information folder or any calc files, so that every stage is calculated and only xyz files are written.
+'''
+from ECCP.ECCP.get_neighbouring_molecules                                            import get_neighbouring_molecules
+from ECCP.ECCP.check_dimer_duplication                                               import check_dimer_duplication
+from ECCP.ECCP.get_neighbouring_molecules_about_system                               import get_neighbouring_molecules_about_molecules, get_neighbouring_molecules_about_dimers
+from ECCP.ECCP.get_simple_molecule_graphs                                            import get_simple_molecule_graphs
+from ECCP.ECCP.get_unique_molecules                                                  import get_unique_molecules
+from ECCP.ECCP.get_dimers                                                            import get_dimers
+from ECCP.ECCP.utilities.add_dimer_name_to_neighbourhood_molecules_for_dimer_method import add_dimer_name_to_neighbourhood_molecules_for_dimer_method
+from ECCP.ECCP.get_unique_dimers                                                     import get_unique_dimers
+from ECCP.ECCP.write_molecules_to_disk                                               import write_molecules_to_disk
+from ECCP.ECCP.write_dimers_to_disk                                                  import write_dimers_to_disk
+from ECCP.ECCP.stage_profiler_methods.Stage_Profiler                                 import Stage_Profiler
+
+def benchmark_pipeline(crystal, molecules, molecule_graphs, crystal_name, path_to_write_folder, make_dimer_method, molecule_equivalence_method={'method': 'invariance_method', 'type': 'combination'}, dimer_equivalence_method={'method': 'invariance_method', 'type': 'combination'}, environment_settings={'include_environment_where_possible': False, 'environment_radius': 8.0}, write_files=True, no_of_cpus=1):
+    """
+    This method will time the stages of the ECCP preparation pipeline on a crystal.
+
+    Parameters
+    ----------
+    crystal : ase.Atoms
+        This is the crystal.
+    molecules : dict. of ase.Atoms
+        These are the molecules in the crystal.
+    molecule_graphs : dict. of networkx.Graph
+        These are the graphs of the molecules in the crystal.
+    crystal_name : str.
+        This is the name of the crystal.
+    path_to_write_folder : str.
+        This is the folder to write the molecule and dimer xyz files to.
+    make_dimer_method : dict.
+        This is the information required for obtaining the dimers in the crystal.
+    molecule_equivalence_method : dict.
+        This is the information required for determining which molecules are equivalent.
+    dimer_equivalence_method : dict.
+        This is the information required for determining which dimers are equivalent.
+    environment_settings : dict.
+        This is the information about the environment to include about molecules and dimers.
+    write_files : bool.
+        This tag indicates if the molecules and dimers should be written to disk. Default: True
+    no_of_cpus : int
+        This is the number of cpus to use. Default: 1
+
+    Returns
+    -------
+    stages : list of dict.
+        This is the time, memory and number of items processed for each stage, as recorded by Stage_Profiler.
+    """
+
+    # First, create the profiler for recording each stage. The profile is not written to disk, it is returned.
+    stage_profiler = Stage_Profiler(None, crystal_name, no_of_cpus)
+
+    # Second, obtain the neighbouring molecules in the crystal.
+    stage_profiler.start_stage('get_neighbouring_molecules')
+    neighbourhood_molecules_for_dimer_method, neighbourhood_molecules_for_environment_method = get_neighbouring_molecules(molecules, molecule_graphs, make_dimer_method=make_dimer_method, environment_settings=environment_settings, include_hydrogens_in_neighbour_analysis=False, no_of_cpus=no_of_cpus)
+    check_dimer_duplication(neighbourhood_molecules_for_dimer_method)
+    neighbourhood_molecules_for_dimer_method.sort(key=lambda x: (x[4], x[0], x[1], x[2][0], x[2][1], x[2][2]))
+    stage_profiler.end_stage('get_neighbouring_molecules', no_of_molecules=len(molecules), no_of_neighbouring_pairs_for_dimers=len(neighbourhood_molecules_for_dimer_method), no_of_neighbouring_pairs_for_environment=len(neighbourhood_molecules_for_environment_method))
+    neighbouring_molecules_about_molecules = get_neighbouring_molecules_about_molecules(environment_settings, neighbourhood_molecules_for_environment_method)
+
+    # Third, write all the molecules to disk.
+    all_molecules_names = list(molecules.keys())
+    if write_files:
+        stage_profiler.start_stage('write_all_molecules')
+        write_molecules_to_disk(all_molecules_names, all_molecules_names, molecules, molecule_graphs, neighbouring_molecules_about_molecules, [], path_to_write_folder+'/'+'All_Molecules', path_to_write_folder+'/'+'All_Molecules_with_environment', None, None, None, None, None, None, None, None, None, None, None, get_molecule_atcs=False, get_molecule_res=False, get_molecule_fcs=False, no_of_cpus=no_of_cpus)
+        stage_profiler.end_stage('write_all_molecules', no_of_molecules=len(all_molecules_names))
+
+    # Fourth, obtain the unique molecules in the crystal.
+    simple_molecule_graphs = get_simple_molecule_graphs(molecule_graphs)
+    stage_profiler.start_stage('get_unique_molecules')
+    structurally_unique_molecules_names, structurally_equivalent_molecule_groups, conformationally_unique_molecules_names, conformationally_equivalent_molecule_groups, structurally_equivalent_molecule_pairs = get_unique_molecules(molecules, simple_molecule_graphs, crystal, molecule_equivalence_method=molecule_equivalence_method, neighbouring_molecules_about_molecules=neighbouring_molecules_about_molecules, include_hydrogens_in_uniqueness_analysis=False, no_of_cpus=no_of_cpus)
+    stage_profiler.end_stage('get_unique_molecules', no_of_molecules=len(molecules), no_of_structurally_unique_molecules=len(structurally_unique_molecules_names), no_of_conformationally_unique_molecules=len(conformationally_unique_molecules_names), no_of_structurally_equivalent_molecule_pairs=len(structurally_equivalent_molecule_pairs))
+
+    # Fifth, obtain all the dimers in the crystal.
+    stage_profiler.start_stage('get_dimers')
+    all_dimers_info = get_dimers(molecules, molecule_graphs, neighbourhood_molecules_for_dimer_method=neighbourhood_molecules_for_dimer_method, no_of_cpus=no_of_cpus)
+    neighbourhood_molecules_for_dimer_method = add_dimer_name_to_neighbourhood_molecules_for_dimer_method(neighbourhood_molecules_for_dimer_method)
+    stage_profiler.end_stage('get_dimers', no_of_neighbouring_pairs=len(neighbourhood_molecules_for_dimer_method), no_of_dimers=len(all_dimers_info))
+    neighbouring_molecules_about_dimers = get_neighbouring_molecules_about_dimers(environment_settings, neighbourhood_molecules_for_dimer_method, neighbourhood_molecules_for_environment_method)
+
+    # Sixth, write all the dimers to disk.
+    all_dimers_info_names = list(all_dimers_info.keys())
+    if write_files:
+        stage_profiler.start_stage('write_all_dimers')
+        write_dimers_to_disk(all_dimers_info_names, all_dimers_info, molecules, molecule_graphs, neighbouring_molecules_about_dimers, [], path_to_write_folder+'/'+'All_Dimers', path_to_write_folder+'/'+'All_Dimers_with_environment', None, None, get_dimer_eets=False, get_dimer_icts=False, no_of_cpus=no_of_cpus)
+        stage_profiler.end_stage('write_all_dimers', no_of_dimers=len(all_dimers_info_names))
+
+    # Seventh, obtain the unique dimers in the crystal.
+    stage_profiler.start_stage('get_unique_dimers')
+    unique_dimers_names, structurally_equivalent_dimer_groups, structurally_equivalent_dimer_pairs = get_unique_dimers(all_dimers_info, molecules, simple_molecule_graphs, dimer_equivalence_method=dimer_equivalence_method, neighbouring_molecules_about_dimers=neighbouring_molecules_about_dimers, include_hydrogens_in_uniqueness_analysis=False, crystal=crystal, no_of_cpus=no_of_cpus)
+    stage_profiler.end_stage('get_unique_dimers', no_of_dimers=len(all_dimers_info), no_of_unique_dimers=len(unique_dimers_names), no_of_structurally_equivalent_dimer_pairs=len(structurally_equivalent_dimer_pairs))
+
+    # Eighth, write the unique dimers to disk.
+    if write_files:
+        stage_profiler.start_stage('write_unique_dimers')
+        write_dimers_to_disk(unique_dimers_names, all_dimers_info, molecules, molecule_graphs, neighbouring_molecules_about_dimers, [], path_to_write_folder+'/'+'Unique_Dimers', path_to_write_folder+'/'+'Unique_Dimers_with_environment', None, None, get_dimer_eets=False, get_dimer_icts=False, no_of_cpus=no_of_cpus)
+        stage_profiler.end_stage('write_unique_dimers', no_of_unique_dimers=len(unique_dimers_names))
+
+    # Ninth, return the information about each stage.
+    return stage_profiler.profile['stages']
+
+# =========================================================================================================================================
@@ -0,0 +1,188 @@
+'''
+Geoffrey Weal, make_synthetic_crystal.py, 17/10/26
+
+This script is designed to make synthetic molecular crystals for benchmarking the ECCP preparation pipeline.
+
+Each crystal is made of zig-zag hydrocarbon chains (C_nH_{n+2}) placed on a grid of sites within the unit cell. The number of molecules in the unit cell, the number of atoms in each molecule and how each molecule is orientated (which controls how many molecules and dimers are unique) can all be set.
+'''
+import numpy as np
+from math import ceil
+from ase import Atoms
+from networkx import Graph
+
+# These are the ways that molecules can be orientated on the sites of the synthetic crystal.
+#    * translation: All molecules have the same orientation, so all molecules and most dimers are equivalent.
+#    * inversion:   Every second molecule is inverted through the centre of its site.
+#    * herringbone: Every second molecule is rotated about its long axis, like the herringbone packing found in many organic semiconductors.
+#    * random:      Every molecule is given a random orientation, so nearly all dimers are unique.
+symmetry_types = ['translation', 'inversion', 'herringbone', 'random']
+
+# These are the bond lengths (in Å) used to make the synthetic molecules.
+CC_bond_length = 1.40
+CH_bond_length = 1.09
+
+# This is the smallest gap (in Å) between the atoms of molecules on neighbouring sites.
+gap_between_molecules = 2.5
+
+def make_synthetic_crystal(no_of_molecules_per_cell, no_of_atoms_per_molecule, symmetry='translation', random_seed=0):
+    """
+    This method will make a synthetic molecular crystal, along with the molecules and molecule graphs in the crystal.
+
+    Parameters
+    ----------
+    no_of_molecules_per_cell : int
+        This is the number of molecules to place in the unit cell.
+    no_of_atoms_per_molecule : int
+        This is the number of atoms wanted in each molecule. The molecules will have this number of atoms, rounded down to the nearest C_nH_{n+2} molecule (with at least 2 carbons).
+    symmetry : str.
+        This is how the molecules are orientated in the crystal. See symmetry_types for the options. Default: 'translation'
+    random_seed : int
+        This is the seed used to orientate molecules if symmetry is 'random'. Default: 0
+
+    Returns
+    -------
+    crystal : ase.Atoms
+        This is the synthetic crystal.
+    molecules : dict. of ase.Atoms
+        These are the molecules in the crystal, given as --> molecule name: molecule.
+    molecule_graphs : dict. of networkx.Graph
+        These are the graphs of the molecules in the crystal, given as --> molecule name: molecule graph.
+    """
+
+    # First, check the settings given to this method.
+    if not (symmetry in symmetry_types):
+        raise Exception('Error: symmetry must be one of: '+str(symmetry_types)+'. symmetry given: '+str(symmetry))
+    if no_of_molecules_per_cell < 1:
+        raise Exception('Error: There must be at least 1 molecule in the unit cell. no_of_molecules_per_cell given: '+str(no_of_molecules_per_cell))
+
+    # Second, make the molecule that will be placed on each site, with its centre at the origin.
+    symbols, positions, bonds = make_synthetic_molecule(no_of_atoms_per_molecule)
+
+    # Third, obtain the size of each site, and the number of sites along each cell vector.
+    #        * If molecules are randomly orientated, each site must fit the molecule in any orientation.
+    molecule_lengths = positions.max(axis=0) - positions.min(axis=0)
+    if symmetry == 'random':
+        site_lengths = np.array([2.0 * np.linalg.norm(positions, axis=1).max()] * 3) + gap_between_molecules
+    else:
+        site_lengths = np.array([molecule_lengths[0], molecule_lengths[1], 0.0]) + np.array([gap_between_molecules, gap_between_molecules, 3.7])
+    no_of_sites_per_side = int(ceil(no_of_molecules_per_cell ** (1.0/3.0) - 1e-9))
+    no_of_sites = [no_of_sites_per_side, no_of_sites_per_side, int(ceil(float(no_of_molecules_per_cell) / (no_of_sites_per_side ** 2)))]
+    cell = np.diag(site_lengths * np.array(no_of_sites))
+
+    # Fourth, place a molecule on each site until the unit cell contains no_of_molecules_per_cell molecules.
+    random_generator = np.random.default_rng(random_seed)
+    molecules = {}
+    molecule_graphs = {}
+    for mol_name, (ii, jj, kk) in enumerate(np.ndindex(*no_of_sites)):
+
+        # 4.1: Stop once all the molecules have been placed.
+        if mol_name >= no_of_molecules_per_cell:
+            break
+
+        # 4.2: Orientate the molecule on this site.
+        rotation = get_site_rotation(symmetry, (ii + jj + kk) % 2, random_generator)
+
+        # 4.3: Move the molecule to the centre of this site.
+        site_centre = (np.array([ii, jj, kk]) + 0.5) * site_lengths
+        molecule_positions = np.matmul(positions, rotation.T) + site_centre
+
+        # 4.4: Make the molecule and its graph.
+        molecules[mol_name] = Atoms(symbols=symbols, positions=molecule_positions, cell=cell, pbc=True)
+        molecule_graph = Graph(name=mol_name)
+        molecule_graph.add_nodes_from([(index, {'E': symbol}) for index, symbol in enumerate(symbols)])
+        molecule_graph.add_edges_from(bonds)
+        molecule_graphs[mol_name] = molecule_graph
+
+    # Fifth, make the crystal from all the molecules.
+    crystal = Atoms(cell=cell, pbc=True)
+    for mol_name in sorted(molecules.keys()):
+        crystal += molecules[mol_name]
+
+    # Sixth, return the crystal, molecules and molecule graphs.
+    return crystal, molecules, molecule_graphs
+
+def make_synthetic_molecule(no_of_atoms_per_molecule):
+    """
+    This method will make a planar zig-zag hydrocarbon chain (C_nH_{n+2}) in the xy plane, centred at the origin.
+
+    Parameters
+    ----------
+    no_of_atoms_per_molecule : int
+        This is the number of atoms wanted in the molecule. The molecule will have this number of atoms, rounded down to the nearest C_nH_{n+2} molecule (with at least 2 carbons).
+
+    Returns
+    -------
+    symbols : list of str.
+        These are the elements of the atoms in the molecule.
+    positions : numpy.array
+        These are the positions of the atoms in the molecule.
+    bonds : list of tuples
+        These are the bonds in the molecule, given as pairs of atom indices.
+    """
+
+    # First, obtain the number of carbons in the chain.
+    no_of_carbons = max(2, (no_of_atoms_per_molecule - 2) // 2)
+
+    # Second, place the carbons in a zig-zag along the x axis.
+    bond_x = CC_bond_length * np.cos(np.radians(30.0))
+    bond_y = CC_bond_length * np.sin(np.radians(30.0))
+    carbon_positions = [np.array([index * bond_x, (index % 2) * bond_y, 0.0]) for index in range(no_of_carbons)]
+
+    # Third, add a hydrogen to each carbon pointing away from the chain, and an extra hydrogen to each end of the chain.
+    #        * Each carbon has three bonds at 120 degrees to each other, so the last bond points in the opposite direction to the sum of the other two.
+    symbols   = ['C'] * no_of_carbons
+    positions = list(carbon_positions)
+    bonds     = [(index, index+1) for index in range(no_of_carbons-1)]
+    for index, carbon_position in enumerate(carbon_positions):
+        hydrogen_direction = np.array([0.0, (1.0 if (index % 2 == 1) else -1.0), 0.0])
+        bond_directions = [hydrogen_direction]
+        if index in [0, no_of_carbons-1]:
+            neighbour_index = 1 if (index == 0) else (no_of_carbons-2)
+            carbon_direction = (carbon_positions[neighbour_index] - carbon_position) / CC_bond_length
+            bond_directions.append(-(carbon_direction + hydrogen_direction))
+        for bond_direction in bond_directions:
+            symbols.append('H')
+            positions.append(carbon_position + CH_bond_length * bond_direction)
+            bonds.append((index, len(positions)-1))
+
+    # Fourth, centre the molecule at the origin.
+    positions = np.array(positions)
+    positions -= positions.mean(axis=0)
+
+    # Fifth, return the molecule.
+    return symbols, positions, bonds
+
+def get_site_rotation(symmetry, site_parity, random_generator):
+    """
+    This method will obtain the rotation matrix for the molecule on a site.
+
+    Parameters
+    ----------
+    symmetry : str.
+        This is how the molecules are orientated in the crystal. See symmetry_types for the options.
+    site_parity : int
+        This is 0 or 1, and alternates between neighbouring sites.
+    random_generator : numpy.random.Generator
+        This is used to obtain random orientations if symmetry is 'random'.
+
+    Returns
+    -------
+    rotation : numpy.array
+        This is the 3x3 rotation (or inversion) matrix for the molecule on this site.
+    """
+    if (symmetry == 'translation') or (site_parity == 0 and symmetry != 'random'):
+        return np.eye(3)
+    elif symmetry == 'inversion':
+        return -np.eye(3)
+    elif symmetry == 'herringbone':
+        angle = np.radians(50.0)
+        return np.array([[1.0, 0.0, 0.0], [0.0, np.cos(angle), -np.sin(angle)], [0.0, np.sin(angle), np.cos(angle)]])
+    else:
+        # Obtain a random rotation from a random unit quaternion.
+        qw, qx, qy, qz = random_generator.normal(size=4)
+        qw, qx, qy, qz = np.array([qw, qx, qy, qz]) / np.linalg.norm([qw, qx, qy, qz])
+        return np.array([[1-2*(qy*qy+qz*qz), 2*(qx*qy-qz*qw),   2*(qx*qz+qy*qw)  ],
+                         [2*(qx*qy+qz*qw),   1-2*(qx*qx+qz*qz), 2*(qy*qz-qx*qw)  ],
+                         [2*(qx*qz-qy*qw),   2*(qy*qz+qx*qw),   1-2*(qx*qx+qy*qy)]])
+
+# =========================================================================================================================================
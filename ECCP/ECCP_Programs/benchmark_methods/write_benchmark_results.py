@@ -0,0 +1,102 @@
+'''
+Geoffrey Weal, write_benchmark_results.py, 17/10/26
+
+This script is designed to write the results of benchmarking the ECCP preparation pipeline to disk.
+
+Each benchmark run is added to a json file, so that the scaling of each stage can be compared between versions of ECCP. A csv file with one row for each stage of each crystal is also written for plotting scaling curves.
+'''
+import os, json, csv
+from subprocess import Popen, PIPE
+
+from ECCP.ECCP.utilities.write_file_atomically import write_file_atomically
+
+results_version = 2
+
+def get_ECCP_version_information():
+    """
+    This method will obtain the version of ECCP being benchmarked, including the git commit if ECCP is being run from a git repository.
+
+    Returns
+    -------
+    version_information : dict.
+        This is the version of ECCP, and the git commit (or None if this could not be obtained).
+    """
+    from ECCP import __version__
+    path_to_ECCP = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        process = Popen(['git', 'rev-parse', '--short', 'HEAD'], cwd=path_to_ECCP, stdout=PIPE, stderr=PIPE)
+        stdout, stderr = process.communicate()
+        git_commit = stdout.decode().strip() if (process.returncode == 0) else None
+    except OSError:
+        git_commit = None
+    return {'version': __version__, 'git_commit': git_commit}
+
+def write_benchmark_results(path_to_results_file, benchmark_run):
+    """
+    This method will add a benchmark run to the results file, and write the csv file of all the runs in the results file.
+
+    Parameters
+    ----------
+    path_to_results_file : str.
+        This is the path to the json results file. The csv file is written next to this with the same name.
+    benchmark_run : dict.
+        This is the information about this benchmark run.
+
+    Returns
+    -------
+    previous_benchmark_run : dict. or None
+        This is the last run in the results file before this one that used the same settings, for comparing against. None if there is no such run.
+    """
+
+    # First, read the runs that are already in the results file.
+    benchmark_results = {'version': results_version, 'runs': []}
+    if os.path.exists(path_to_results_file):
+        with open(path_to_results_file, 'r') as results_file:
+            benchmark_results = json.load(results_file)
+        if benchmark_results.get('version') != results_version:
+            raise Exception('Error: The benchmark results file '+str(path_to_results_file)+' was made with a different version of the benchmark (version '+str(benchmark_results.get('version'))+', this version is '+str(results_version)+'). Give a different results file and try again.')
+
+    # Second, find the last run that used the same settings as this run.
+    previous_benchmark_runs = [run for run in benchmark_results['runs'] if (run['settings'] == benchmark_run['settings'])]
+    previous_benchmark_run  = previous_benchmark_runs[-1] if (len(previous_benchmark_runs) > 0) else None
+
+    # Third, add this run to the results and write them to disk.
+    benchmark_results['runs'].append(benchmark_run)
+    with write_file_atomically(path_to_results_file) as results_file:
+        json.dump(benchmark_results, results_file, indent=4)
+
+    # Fourth, write all the runs as a csv file, with one row for each stage of each crystal.
+    csv_filepath = os.path.splitext(path_to_results_file)[0]+'.csv'
+    with open(csv_filepath, 'w', newline='') as csv_file:
+        csv_writer = csv.writer(csv_file)
+        csv_writer.writerow(['date', 'version', 'git_commit', 'no_of_cpus', 'no_of_molecules_per_cell', 'no_of_atoms_per_molecule', 'symmetry', 'max_dimer_distance', 'repeat', 'no_of_atoms_in_crystal', 'stage', 'wall_time_s', 'cpu_time_s', 'children_cpu_time_s', 'peak_rss_MB', 'process_peak_rss_so_far_MB', 'counts'])
+        for run in benchmark_results['runs']:
+            for crystal_result in run['crystals']:
+                for stage in crystal_result['stages']:
+                    csv_writer.writerow([run['date'], run['version'], run['git_commit'], run['settings']['no_of_cpus'], crystal_result['no_of_molecules_per_cell'], crystal_result['no_of_atoms_per_molecule'], crystal_result['symmetry'], crystal_result['max_dimer_distance'], crystal_result['repeat'], crystal_result['no_of_atoms_in_crystal'], stage['stage'], stage['wall_time_s'], stage['cpu_time_s'], stage['children_cpu_time_s'], stage['peak_rss_MB'], stage['process_peak_rss_so_far_MB'], ' '.join([str(count_name)+'='+str(count) for count_name, count in sorted(stage['counts'].items())])])
+
+    # Fifth, return the previous run with the same settings.
+    return previous_benchmark_run
+
+def get_stage_wall_times(benchmark_run):
+    """
+    This method will obtain the fastest wall time of each stage for each crystal in a benchmark run (the fastest over repeats).
+
+    Parameters
+    ----------
+    benchmark_run : dict.
+        This is the information about the benchmark run.
+
+    Returns
+    -------
+    stage_wall_times : dict.
+        These are the wall times, given as --> (no_of_molecules_per_cell, no_of_atoms_per_molecule, symmetry, max_dimer_distance, stage): wall time (in seconds).
+    """
+    stage_wall_times = {}
+    for crystal_result in benchmark_run['crystals']:
+        for stage in crystal_result['stages']:
+            key = (crystal_result['no_of_molecules_per_cell'], crystal_result['no_of_atoms_per_molecule'], crystal_result['symmetry'], crystal_result['max_dimer_distance'], stage['stage'])
+            stage_wall_times[key] = min(stage_wall_times.get(key, float('inf')), stage['wall_time_s'])
+    return stage_wall_times
+
+# =========================================================================================================================================
@@ -7,8 +7,10 @@ import os, time
 from datetime import datetime, timedelta
 from ECCP.ECCP_Programs.shared_general_methods.shared_gaussian_methods     import found_a_gaussian_job_that_has_run, did_gaussian_job_complete, gaussian_temp_files_to_remove
 from ECCP.ECCP_Programs.processing_EET_methods.processing_EET_data_methods import is_this_calc_an_eet_calc, get_electronic_coupling_of_lowest_TD_state
+from ECCP.ECCP_Programs.shared_general_methods.ECCP_Job_Index import ECCP_Job_Index
+from ECCP.ECCP_Programs.shared_general_methods.process_jobs_in_parallel import process_jobs_in_parallel
 
-def get_EET_data(overall_path, log_filename, start_time):
+def get_EET_data(overall_path, log_filename, start_time, no_of_cpus=1):
     """
     This method will write txt files that contains the coupling energies for the dimers for a crystal.
 
@@ -20,6 +22,8 @@ def get_EET_data(overall_path, log_filename, start_time):
         This is the name of the output.log file for EET calculations. 
     start_time : float
         This is the start time for the process.
+    no_of_cpus : int
+        This is the number of cpus to use to process the EET jobs. Default: 1
 
     Returns
     -------
@@ -29,36 +33,69 @@ def get_EET_data(overall_path, log_filename, start_time):
         These are the list of paths of EET data that had an issue for one reason or another. 
     """
     print('Gathering Gaussian EET data')
+
+    # First, find all the Gaussian jobs that have run.
+    jobs = []
+    with ECCP_Job_Index(overall_path) as job_index:
+        for root, dirs, files in job_index.walk(overall_path):
+            dirs.sort()
+            # Determine if their is a Gaussian job that has run.
+            if found_a_gaussian_job_that_has_run(root, files):
+                dirs[:] = []
+                jobs.append((root, list(files), log_filename, start_time))
+
+    # Second, process the EET data from each Gaussian job.
+    results = process_jobs_in_parallel(get_EET_datum, jobs, no_of_cpus=no_of_cpus)
+
+    # Third, gather the EET data and issues from each job, in the order the jobs were found.
     electronic_coupling_data = {}
     issues = []
-    for root, dirs, files in os.walk(overall_path):
-        dirs.sort()
-        # Determine if their is a Gaussian job that has run.
-        if found_a_gaussian_job_that_has_run(root, files):
-            dirs[:] = []
-            path_to_log_file = root+'/'+log_filename
-            if not is_this_calc_an_eet_calc(path_to_log_file):
-                continue
-            print('------------------------------------------------')
-            print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': Found a Gaussian job.')
-            # Determine if the job completed or not. 
-            if did_gaussian_job_complete(path_to_log_file):
-                print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': Processing: '+str(root))
-                electronic_coupling_datum = get_electronic_coupling_of_lowest_TD_state(path_to_log_file)
-                # If error is returned, report this Gaussian job as an issue. 
-                if electronic_coupling_datum == 'error':
-                    print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': Their was an issue with this job. Path: '+str(root))
-                    issues.append(root)
-                    continue
-                # Record data, and remove temp Gaussian files.
-                calculation_details = tuple(root.split('/')[-3:]) # This tuple contains (crystal_name, Dimer_name, Functional_and_Basis_Set_name)
-                electronic_coupling_data[calculation_details] = (root, electronic_coupling_datum)
-                print('Processed EET data in (HH:MM:SS): '+str(timedelta(seconds=time.time() - start_time)))
-                # Remove unnecessary files.
-                gaussian_temp_files_to_remove(root, files, remove_fort7_file=True)
-            else:
-                # Report this Gaussian job.
-                print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': Their was an issue with this job. Path: '+str(root))
-                issues.append(root)
+    for root, calculation_details, electronic_coupling_datum in results:
+        if calculation_details is not None:
+            electronic_coupling_data[calculation_details] = (root, electronic_coupling_datum)
+        elif root is not None:
+            issues.append(root)
     return electronic_coupling_data, issues
 
+def get_EET_datum(job):
+    """
+    This method will obtain the EET data from a Gaussian job.
+
+    Parameters
+    ----------
+    job : (str., list of str., str., float)
+        This is the path to the Gaussian job, the files in this folder, the name of the output.log file, and the start time for the process.
+
+    Returns
+    -------
+    root : str. or None
+        This is the path to the Gaussian job. None if this is not an EET job.
+    calculation_details : tuple of str. or None
+        This is the (crystal_name, Dimer_name, Functional_and_Basis_Set_name) of the EET job. None if there was an issue with this job.
+    electronic_coupling_datum : tuple or None
+        This is the EET data for this job. None if there was an issue with this job.
+    """
+    root, files, log_filename, start_time = job
+    path_to_log_file = root+'/'+log_filename
+    if not is_this_calc_an_eet_calc(path_to_log_file):
+        return None, None, None
+    print('------------------------------------------------')
+    print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': Found a Gaussian job.')
+    # Determine if the job completed or not. 
+    if did_gaussian_job_complete(path_to_log_file):
+        print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': Processing: '+str(root))
+        electronic_coupling_datum = get_electronic_coupling_of_lowest_TD_state(path_to_log_file)
+        # If error is returned, report this Gaussian job as an issue. 
+        if electronic_coupling_datum == 'error':
+            print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': Their was an issue with this job. Path: '+str(root))
+            return root, None, None
+        # Record data, and remove temp Gaussian files.
+        calculation_details = tuple(root.split('/')[-3:]) # This tuple contains (crystal_name, Dimer_name, Functional_and_Basis_Set_name)
+        print('Processed EET data in (HH:MM:SS): '+str(timedelta(seconds=time.time() - start_time)))
+        # Remove unnecessary files.
+        gaussian_temp_files_to_remove(root, files, remove_fort7_file=True)
+        return root, calculation_details, electronic_coupling_datum
+    else:
+        # Report this Gaussian job.
+        print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': Their was an issue with this job. Path: '+str(root))
+        return root, None, None
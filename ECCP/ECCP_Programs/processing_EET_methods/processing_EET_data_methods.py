@@ -6,7 +6,7 @@ This script contains methods for processing_OPV_Dimer_data.py
 '''
 import os
 
-from ECCP.ECCP_Programs.shared_general_methods.shared_general_methods import reverse_readline
+from ECCP.ECCP_Programs.shared_general_methods.Gaussian_Log_Parser import parse_gaussian_log
 
 # Constants and conversions that are useful for processing data.
 planks_constant = 4.135667696 * (10.0 ** -15.0) #eVs
@@ -32,14 +32,7 @@ def is_this_calc_an_eet_calc(path_to_outputLOG):
     True if this calc is an eet calc, False if not.
     """
 
-    looking_at_EET_output = False
-    with open(path_to_outputLOG,'r') as outputLOG:
-        for line in outputLOG:
-            if 'eet' in line:
-                looking_at_EET_output = True
-                break
-            if 'Input orientation:' in line:
-                break
+    looking_at_EET_output = parse_gaussian_log(path_to_outputLOG).state['eet_in_header']
     return looking_at_EET_output
 
 # -----------------------------------------------------------------
@@ -58,41 +51,8 @@ def get_electronic_coupling_of_lowest_TD_state(log_filepath):
     True if both the input .gjf file and the output .log files are found. 
     '''
 
-    # all values to obtain
-    delta_w_value = None
-    coulomb_value = None
-    exact_exchange_value = None
-    exchange_correlation_value = None
-    overlap_value = None
-    w_avg_value = None
-    w_avg_times_Overlap_value = None
-    total_coupling_value = None
-
-    for line in reverse_readline(log_filepath):
-        if 'Electronic Coupling for Excitation Energy' in line:
-            break # if this line is found, all electronic coupling calcs have been found, so dont need to read the file anymore.
-        elif line.startswith('   delta-w'):
-            line = line.rstrip().replace('=','').split()
-            delta_w_value = float(line[1]) # eV
-        elif line.startswith('   Coulomb'):
-            line = line.rstrip().replace('=','').split()
-            coulomb_value = float(line[1]) # eV
-        elif line.startswith('   Exact-exchange'):
-            line = line.rstrip().replace('=','').split()
-            exact_exchange_value = float(line[1]) # eV
-        elif line.startswith('   Exchange-correlation'):
-            line = line.rstrip().replace('=','').split()
-            exchange_correlation_value = float(line[1]) # eV
-        elif line.startswith('   w-avg*Overlap'):
-            line1 = line.rstrip().replace('   w-avg*Overlap             =','').lstrip().split()
-            w_avg_times_Overlap_value = float(line1[0]) # eV
-            line2 = line.rstrip().replace('   w-avg*Overlap             =','').lstrip().split('(')[1].replace(')','')
-            w_avg_value, overlap_value = line2.split(',')
-            w_avg_value   = float(w_avg_value.replace('w-avg=','').replace('eV','')) # eV
-            overlap_value = float(overlap_value.replace('Ovlp=','').replace('D','E').replace('eV',''))
-        elif line.startswith('   Total coupling'):
-            line = line.rstrip().replace('=','').split()
-            total_coupling_value = float(line[2]) # eV
+    # First, obtain all the electronic coupling values after the last electronic coupling header in the log file.
+    delta_w_value, coulomb_value, exact_exchange_value, exchange_correlation_value, w_avg_times_Overlap_value, w_avg_value, overlap_value, total_coupling_value = parse_gaussian_log(log_filepath).get_electronic_coupling()
 
     # If this was a Hartree-Fock calculation, there will be no Excharge Correlation component to this analysis
     # In this case, set this to 0.0 eV
@@ -126,15 +86,7 @@ def is_a_HF_calculation(log_filepath):
     Returns True if this is a Hartree-Fock calculation, False if not. 
     """
 
-    LOGfile = open(log_filepath,'r')
-    for line in LOGfile:
-        if line.startswith(' #') and ('HF' in line):
-            LOGfile.close()
-            return True
-        if 'Population analysis using the SCF Density.' in line:
-            break
-    LOGfile.close()
-    return False
+    return parse_gaussian_log(log_filepath).state['is_HF']
 
 # -----------------------------------------------------------------
 
@@ -6,11 +6,37 @@ This script provides methods for determining if the Eigendata process has comple
 
 import os
 
-MO_coefficients_filename  = 'MO_coefficients.txt'
-MO_orbital_names_filename = 'MO_orbital_names.txt'
-MO_occupancies_filename   = 'MO_occupancies.txt'
+orbital_overlap_matrix_filename = 'orbital_overlap_matrix.npy'
+MO_energies_filename            = 'MO_energies.npy'
+MO_coefficients_filename        = 'MO_coefficients.npy'
+MO_orbital_names_filename       = 'MO_orbital_names.txt'
+MO_occupancies_filename         = 'MO_occupancies.txt'
 fort_7_filename = 'fort.7'
 
+def found_eigendata_file(path_to_eigendata, filename):
+    """
+    This method is designed to determine if an eigendata file has been obtained. 
+
+    Matrices are saved as binary numpy (.npy) files. Older versions of ECCP saved these as txt files, so these are also accepted. 
+
+    Parameters
+    ----------
+    path_to_eigendata : str.
+        This is the path to the eigendata files
+    filename : str.
+        This is the name of the eigendata file. 
+
+    Returns
+    -------
+    True if this eigendata file has been found, False if not. 
+    """
+    files_in_folder = os.listdir(path_to_eigendata)
+    if filename in files_in_folder:
+        return True
+    if filename.endswith('.npy') and (filename.replace('.npy','.txt') in files_in_folder):
+        return True
+    return False
+
 def found_eigendata_files(path_to_eigendata):
     """
     This method is designed to determine if the files that contain eigendata have been obtained.
@@ -25,15 +51,15 @@ def found_eigendata_files(path_to_eigendata):
     Returns
     -------
     found_MO_coefficients : bool.
-        This boolean indicates if the MO_coefficients.txt has been found.
+        This boolean indicates if the MO_coefficients.npy (or MO_coefficients.txt) has been found.
     found_MO_orbital_names : bool.
         This boolean indicates if the MO_orbital_names.txt has been found.
     found_MO_occupancies : bool.
         This boolean indicates if the MO_occupancies.txt has been found.
     """
-    found_MO_coefficients  = MO_coefficients_filename  in os.listdir(path_to_eigendata)
-    found_MO_orbital_names = MO_orbital_names_filename in os.listdir(path_to_eigendata)
-    found_MO_occupancies   = MO_occupancies_filename   in os.listdir(path_to_eigendata)
+    found_MO_coefficients  = found_eigendata_file(path_to_eigendata, MO_coefficients_filename)
+    found_MO_orbital_names = found_eigendata_file(path_to_eigendata, MO_orbital_names_filename)
+    found_MO_occupancies   = found_eigendata_file(path_to_eigendata, MO_occupancies_filename)
     return (found_MO_coefficients, found_MO_orbital_names, found_MO_occupancies)
 
 def should_this_calc_contain_eigendata(path_to_eigendata, log_filename):
@@ -10,11 +10,15 @@ from datetime import datetime, timedelta
 from ECCP.ECCP_Programs.shared_general_methods.get_eigenfiles_methods import get_matrix_data, get_eigenvalue_and_MO_coefficients_data, remove_eigenfile_data_from_outputLOG_file
 from ECCP.ECCP_Programs.shared_general_methods.get_eigenfiles_methods import process_MO_data_from_fort7_file, remove_fort7_file
 from ECCP.ECCP_Programs.shared_general_methods.get_eigenfiles_methods import write_1D_matrix, write_2D_matrix, write_orbital_names, write_MO_occupancies
+from ECCP.ECCP_Programs.processing_Eigendata_methods.found_data        import found_eigendata_file
+from ECCP.ECCP_Programs.processing_Eigendata_methods.found_data        import orbital_overlap_matrix_filename, MO_energies_filename, MO_coefficients_filename, MO_orbital_names_filename, MO_occupancies_filename
 
 def get_eigenfiles(path_to_log_file, log_filename, remove_eigendata_from_outputLOG_file=False, get_MO_data_from_fort7_file=True):
     """
     This method is designed to extract eigen-information from the output.log and fort.7 file. This includes orbital overlaps, MO energies and MO coefficients.
 
+    The orbital overlap matrix, MO energies and MO coefficients are saved as binary numpy (.npy) files.
+
     Parameters
     ----------
     path_to_log_file : str
@@ -22,13 +26,13 @@ def get_eigenfiles(path_to_log_file, log_filename, remove_eigendata_from_outputL
     log_filename : str
         This is the name of the log file (likely called output.log).
     remove_eigendata_from_outputLOG_file : bool.
-        If true, remove eigendata, such as orbital overlaps, MO energies and MO coefficients, from the output file once you have created text files of this. This is useful to turn a file that is GBs in size into KBs.
+        If true, remove eigendata, such as orbital overlaps, MO energies and MO coefficients, from the output file once you have created files of this. This is useful to turn a file that is GBs in size into KBs.
     """
 
-    # First, if the following text files have already been created, we probably dont need to do this again, especially since the output.log file may not contain this information anymore.
-    main_2D_matrices = ['orbital_overlap_matrix.txt', 'MO_orbital_names.txt', 'MO_occupancies.txt', 'MO_energies.txt', 'MO_coefficients.txt'] 
+    # First, if the following files have already been created, we probably dont need to do this again, especially since the output.log file may not contain this information anymore.
+    main_2D_matrices = [orbital_overlap_matrix_filename, MO_orbital_names_filename, MO_occupancies_filename, MO_energies_filename, MO_coefficients_filename] 
     if check_files_have_been_made(path_to_log_file, main_2D_matrices):
-        print('Will not obtain eigenfiles, have already obtained all the necessary eigendata in text files.')
+        print('Will not obtain eigenfiles, have already obtained all the necessary eigendata in files.')
         return
 
     # Second, obtain the matrix data from the output.log file and save it to txt files
@@ -38,11 +42,11 @@ def get_eigenfiles(path_to_log_file, log_filename, remove_eigendata_from_outputL
     if get_MO_data_from_fort7_file:
         orbital_energies_data_heap, MO_coefficients_data_heap = process_MO_data_from_fort7_file(path_to_log_file+'/fort.7')
         if not orbital_energies_data_heap == {}:
-            write_1D_matrix(orbital_energies_data_heap, filename=path_to_log_file+'/'+'MO_energies.txt')
-            print('Made MO_energies.txt file')
+            write_1D_matrix(orbital_energies_data_heap, filename=path_to_log_file+'/'+MO_energies_filename)
+            print('Made '+str(MO_energies_filename)+' file')
         if not MO_coefficients_data_heap == {}:
-            write_2D_matrix(MO_coefficients_data_heap, filename=path_to_log_file+'/'+'MO_coefficients.txt', symmetric_matrix=False)
-            print('Made MO_coefficients.txt file')
+            write_2D_matrix(MO_coefficients_data_heap, filename=path_to_log_file+'/'+MO_coefficients_filename, symmetric_matrix=False)
+            print('Made '+str(MO_coefficients_filename)+' file')
     
     # Fourth, remove the matrices from the output.log file, and remove the fort.7 file.
     if remove_eigendata_from_outputLOG_file and check_files_have_been_made(path_to_log_file, main_2D_matrices):
@@ -55,10 +59,10 @@ def get_eigenfiles(path_to_log_file, log_filename, remove_eigendata_from_outputL
 
 def check_files_have_been_made(path_to_log_file, main_2D_matrices):
     """
-    This method will check that all the txt files made by this program exist before removals occur. 
+    This method will check that all the files made by this program exist before removals occur. 
     """
     for check_file in main_2D_matrices:
-        if not (check_file in os.listdir(path_to_log_file)):
+        if not found_eigendata_file(path_to_log_file, check_file):
             return False
     return True
 
@@ -190,9 +194,9 @@ def get_eigenfiles_from_outputLOG_file(path_to_log_file, filename, get_MO_data_f
                     max_row, max_col, current_max_col, current_cols, found_overlap = get_matrix_data(line, max_row, max_col, current_max_col, current_cols, overlap_data_heap)
                     if not found_overlap:
                         # Save 2D matrix files.
-                        print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': * Making orbital_overlap_matrix.txt file')
-                        write_2D_matrix(overlap_data_heap, filename=path_to_log_file+'/'+'orbital_overlap_matrix.txt', symmetric_matrix=True)
-                        print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': * Made orbital_overlap_matrix.txt file.')
+                        print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': * Making '+str(orbital_overlap_matrix_filename)+' file')
+                        write_2D_matrix(overlap_data_heap, filename=path_to_log_file+'/'+orbital_overlap_matrix_filename, symmetric_matrix=True)
+                        print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': * Made '+str(orbital_overlap_matrix_filename)+' file.')
                         del overlap_data_heap
                         made_orbital_overlap_matrix_txt_file = True
                 else:
@@ -228,18 +232,18 @@ def get_eigenfiles_from_outputLOG_file(path_to_log_file, filename, get_MO_data_f
                     # Save MO files
                     if not made_MO_files:
                         print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': * Making Molecular Orbtial (MO) files')
-                        write_orbital_names(MO_coefficients_orbital_names_heap, filename=path_to_log_file+'/'+'MO_orbital_names.txt')
-                        print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': * Made MO_orbital_names.txt file')
-                        write_MO_occupancies(MO_occupancies, filename=path_to_log_file+'/'+'MO_occupancies.txt')
-                        print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': * Made MO_occupancies.txt file')
+                        write_orbital_names(MO_coefficients_orbital_names_heap, filename=path_to_log_file+'/'+MO_orbital_names_filename)
+                        print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': * Made '+str(MO_orbital_names_filename)+' file')
+                        write_MO_occupancies(MO_occupancies, filename=path_to_log_file+'/'+MO_occupancies_filename)
+                        print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': * Made '+str(MO_occupancies_filename)+' file')
                         del MO_coefficients_orbital_names_heap
                         del MO_occupancies
 
                         if not get_MO_data_from_fort7_file:
-                            write_1D_matrix(orbital_energies_data_heap, filename=path_to_log_file+'/'+'MO_energies.txt')
-                            print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': * Made MO_energies.txt file')
-                            write_2D_matrix(MO_coefficients_data_heap, filename=path_to_log_file+'/'+'MO_coefficients.txt', symmetric_matrix=False)
-                            print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': * Made MO_coefficients.txt file')
+                            write_1D_matrix(orbital_energies_data_heap, filename=path_to_log_file+'/'+MO_energies_filename)
+                            print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': * Made '+str(MO_energies_filename)+' file')
+                            write_2D_matrix(MO_coefficients_data_heap, filename=path_to_log_file+'/'+MO_coefficients_filename, symmetric_matrix=False)
+                            print(str(datetime.now().strftime("%d/%m/%Y %H:%M:%S"))+': * Made '+str(MO_coefficients_filename)+' file')
                             del orbital_energies_data_heap
                             del MO_coefficients_data_heap
 
@@ -20,6 +20,29 @@ def get_folder_list(path_to_folder):
 
 # ---------------------------------------------------------------------------------------------------
 
+def get_eigendata_matrix(path_to_matrices, filename):
+	"""
+	This method will return an eigendata matrix as a numpy array.
+
+	Matrices are read from binary numpy (.npy) files as memory-mapped arrays, so only the parts of the matrix that are used are read from disk. 
+	If only a txt file of the matrix is found (from older versions of ECCP), this is read in instead.
+
+	Parameters
+	----------
+	path_to_matrices : str.
+		This is the path to the folder containing the matrix files.
+	filename : str.
+		This is the name of the .npy file of the matrix to read.
+
+	Returns
+	-------
+	matrix : numpy.array
+		This is the matrix that is contained in the file.
+	"""
+	if os.path.exists(path_to_matrices+'/'+filename):
+		return np.load(path_to_matrices+'/'+filename, mmap_mode='r')
+	return get_matrix_from_file(path_to_matrices+'/'+filename.replace('.npy','.txt'))
+
 def get_matrix_from_file(filename):
 	"""
 	This method will return the matrix from a text file as a numpy array
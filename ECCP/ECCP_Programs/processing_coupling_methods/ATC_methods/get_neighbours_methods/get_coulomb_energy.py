@@ -5,21 +5,27 @@ get_coulomb_energy contains a method designed to obtain the coulomb energy betwe
 """
 import numpy as np
 
-from SUMELF import get_distance
-
 coulomb_constant = 14.3996454784878811182 # units of eV·Å·e−2
+max_number_of_pairwise_distances_in_memory = 2**22 # Number of atom-atom distances evaluated at once when evaluating many displacements together. Two arrays of this size are held in memory at once (~64 MB).
+
 def get_coulomb_energy(positions_1, positions_2, charges_1, charges_2, displacement_vector, relative_permittivity=1.0):
     """
     get_coulomb_energy contains a method designed to obtain the coulomb energy between two molecules in eV.
 
     Parameters
     ----------
-    molecule1 : ase.Atoms
-        This is the atoms object for molecule 1.
-    molecule2 : ase.Atoms
-        This is the atoms object for molecule 2.
+    positions_1 : numpy.array
+        These are the positions of the atoms in molecule 1.
+    positions_2 : numpy.array
+        These are the positions of the atoms in molecule 2.
+    charges_1 : numpy.array
+        These are the ATC charges of the atoms in molecule 1.
+    charges_2 : numpy.array
+        These are the ATC charges of the atoms in molecule 2.
     displacement_vector : numpy.array
         This is the vector that describes the position of the unit cell that molecule 2 is in compared to the ijk=000 centre unit cell.
+    relative_permittivity : float
+        This is the relative permittivity of the medium between the molecules. Default: 1.0
 
     Returns
     -------
@@ -27,20 +33,101 @@ def get_coulomb_energy(positions_1, positions_2, charges_1, charges_2, displacem
         This is the coulomb energy between molecule 1 and molecule 2 (in a unit cell described by displacement_vector). This value is given in eV.
     """
 
-    # First, move molecule 2 into the ijk unit cell described by the displacement_vector vector.
-    positions_2_with_disp_vec = positions_2 + displacement_vector
+    # First, get the Coulomb energy between molecule 1 and molecule 2 (in a unit cell described by displacement_vector)
+    energies = get_coulomb_energies(positions_1, positions_2, charges_1, charges_2, [displacement_vector], relative_permittivity=relative_permittivity)
+
+    # Second, return the ATC-based energy value between molecule1 and molecule2 with a difference in cell of displacement_vector
+    return float(energies[0])
+
+def get_coulomb_energies(positions_1, positions_2, charges_1, charges_2, displacement_vectors, relative_permittivity=1.0, max_number_of_pairwise_distances=max_number_of_pairwise_distances_in_memory):
+    """
+    get_coulomb_energies will obtain the coulomb energy between molecule 1 and many copies of molecule 2, each displaced by one of the displacement_vectors, in eV.
+
+    The displacements are processed in chunks, so that no more than max_number_of_pairwise_distances atom-atom distances are evaluated at once. The distances are built up one x, y, z component at a time, so that the (D,N,M,3) array of vectors between atoms is never made.
+
+    Parameters
+    ----------
+    positions_1 : numpy.array
+        These are the positions of the atoms in molecule 1, given as a (N,3) array.
+    positions_2 : numpy.array
+        These are the positions of the atoms in molecule 2, given as a (M,3) array.
+    charges_1 : numpy.array
+        These are the ATC charges of the atoms in molecule 1, given as a (N,) array.
+    charges_2 : numpy.array
+        These are the ATC charges of the atoms in molecule 2, given as a (M,) array.
+    displacement_vectors : numpy.array
+        These are the vectors to displace molecule 2 by, given as a (D,3) array.
+    relative_permittivity : float
+        This is the relative permittivity of the medium between the molecules. Default: 1.0
+    max_number_of_pairwise_distances : int
+        This is the maximum number of atom-atom distances to evaluate at once. Up to two arrays of this size are held in memory at once. Default: max_number_of_pairwise_distances_in_memory
+
+    Returns
+    -------
+    energies : numpy.array
+        These are the coulomb energies between molecule 1 and molecule 2 for each displacement vector, given as a (D,) array. These values are given in eV.
+    """
+
+    # First, convert the inputs into numpy arrays.
+    positions_1          = np.asarray(positions_1,          dtype=float).reshape(-1,3)
+    positions_2          = np.asarray(positions_2,          dtype=float).reshape(-1,3)
+    charges_1            = np.asarray(charges_1,            dtype=float).reshape(-1)
+    charges_2            = np.asarray(charges_2,            dtype=float).reshape(-1)
+    displacement_vectors = np.asarray(displacement_vectors, dtype=float).reshape(-1,3)
+
+    # Second, obtain the charge products between each atom in molecule 1 and each atom in molecule 2. These are the same for every displacement.
+    charge_products = np.outer(charges_1, charges_2)
+
+    # Third, obtain the vectors between each atom in molecule 1 and each atom in molecule 2 (before molecule 2 is displaced).
+    pairwise_vectors = positions_2[np.newaxis,:,:] - positions_1[:,np.newaxis,:]
+
+    # Fourth, determine how many displacements can be processed together.
+    number_of_pairwise_distances_per_displacement = max(charge_products.size, 1)
+    chunk_size = max(int(max_number_of_pairwise_distances) // number_of_pairwise_distances_per_displacement, 1)
+
+    # Fifth, get the Coulomb energy between molecule 1 and molecule 2 for each displacement, a chunk of displacements at a time.
+    #        The total coulomb values are given in e^2/Å
+    total_coulomb_values = np.empty(len(displacement_vectors), dtype=float)
+    for start_index in range(0, len(displacement_vectors), chunk_size):
+        total_coulomb_values[start_index:start_index+chunk_size] = get_total_coulomb_values(pairwise_vectors, charge_products, displacement_vectors[start_index:start_index+chunk_size])
+
+    # Sixth, multiply total_coulomb_values by the coulomb constant, which is given in eV·Å·e−2. This will give your energies in eV
+    energies = (coulomb_constant/relative_permittivity) * total_coulomb_values
+
+    # Seventh, return the ATC-based energy values between molecule1 and molecule2 for each displacement vector.
+    return energies
+
+def get_total_coulomb_values(pairwise_vectors, charge_products, displacement_vectors):
+    """
+    get_total_coulomb_values will obtain the sum of q1*q2/r between molecule 1 and molecule 2 for each displacement vector.
+
+    The distances between atoms are built up one x, y, z component at a time, so that at most two (D,N,M) arrays are held in memory at once.
+
+    Parameters
+    ----------
+    pairwise_vectors : numpy.array
+        These are the vectors between each atom in molecule 1 and each atom in molecule 2 (before molecule 2 is displaced), given as a (N,M,3) array.
+    charge_products : numpy.array
+        These are the charge products between each atom in molecule 1 and each atom in molecule 2, given as a (N,M) array.
+    displacement_vectors : numpy.array
+        These are the vectors to displace molecule 2 by, given as a (D,3) array.
+
+    Returns
+    -------
+    total_coulomb_values : numpy.array
+        These are the total coulomb values for each displacement vector, given as a (D,) array. These values are given in e^2/Å.
+    """
 
-    # Second, get the Coulomb energy between molecule 1 and molecule 2 (in a unit cell described by displacement_vector)
-    # The total_coulomb_value is given in e^2/Å
-    total_coulomb_value = 0.0 
-    for charge_1, position_1 in zip(charges_1,positions_1):
-        for charge_2, position_2 in zip(charges_2,positions_2_with_disp_vec):
-            distance = get_distance(position_1,position_2)
-            coulomb_value = (charge_1*charge_2)/distance
-            total_coulomb_value += coulomb_value
+    # First, obtain the squared distances between atoms, one x, y, z component at a time.
+    squared_distances   = np.zeros((len(displacement_vectors),)+charge_products.shape, dtype=float)
+    component_distances = np.empty_like(squared_distances)
+    for component in range(3):
+        np.add(pairwise_vectors[np.newaxis,:,:,component], displacement_vectors[:,np.newaxis,np.newaxis,component], out=component_distances)
+        squared_distances += np.square(component_distances, out=component_distances)
+    del component_distances
 
-    # Third, multiply total_coulomb_value by the coulomb constant, which is given in eV·Å·e−2. This will give your energy in eV
-    energy = (coulomb_constant/relative_permittivity) * total_coulomb_value
+    # Second, convert the squared distances into inverse distances in place.
+    inverse_distances = np.reciprocal(np.sqrt(squared_distances, out=squared_distances), out=squared_distances)
 
-    # Fourth, return the ATC-based energy value between molecule1 and molecule2 with a difference in cell of displacement_vector
-    return energy
+    # Third, return the sum of the charge products divided by the distances for each displacement vector.
+    return np.einsum('dij,ij->d', inverse_distances, charge_products)
@@ -0,0 +1,354 @@
+'''
+Geoffrey Weal, ECCP_Job_Index.py, 17/10/26
+
+This script contains the persistent job index that is shared between the submit, did_complete, reset, tidy and process programs.
+
+The job index is a local SQLite database that records the contents of each folder in your job tree, as well as the state of each job folder (job type, submit state, slurm id, log size/mtime and completion status).
+Each program will only re-inspect folders whose files have changed since the job index was last updated.
+'''
+import os, time, json, sqlite3
+
+job_index_filename = '.ECCP_job_index.sqlite'
+
+# If a folder was modified within this many seconds of being recorded, its listing is not trusted (as some filesystems only record mtimes to the nearest second or two).
+mtime_resolution = 2.0
+
+# This is the number of changes to make to the job index before committing them to disk.
+commit_every = 1000
+
+class ECCP_Job_Index:
+    """
+    This object is designed to hold the persistent job index for the job tree given by path.
+
+    Parameters
+    ----------
+    path : str.
+        This is the root directory of the job tree. The job index database is placed in this folder. Default: the current working directory.
+    """
+    def __init__(self, path=None):
+
+        # First, determine where the job index database is.
+        if path is None:
+            path = os.getcwd()
+        self.path_to_database = os.path.join(os.path.abspath(path), job_index_filename)
+
+        # Second, open the job index database.
+        #         * A long timeout is given so that multiple ECCP programs can use the job index at the same time.
+        self.connection = sqlite3.connect(self.path_to_database, timeout=60.0)
+        self.connection.execute('CREATE TABLE IF NOT EXISTS folders (path TEXT PRIMARY KEY, dir_mtime INTEGER, recorded_at REAL, dirnames TEXT, linknames TEXT, filenames TEXT)')
+        self.connection.execute('CREATE TABLE IF NOT EXISTS jobs (path TEXT PRIMARY KEY, job_type TEXT, submit_state TEXT, slurm_id INTEGER, log_size INTEGER, log_mtime INTEGER, files_signature TEXT, completion_status TEXT, updated_at REAL)')
+        self.connection.execute('CREATE TABLE IF NOT EXISTS log_results (path TEXT, method TEXT, log_size INTEGER, log_mtime INTEGER, result TEXT, PRIMARY KEY (path, method))')
+        self.connection.commit()
+
+        # Third, record the number of changes that have not been committed to disk yet.
+        self.number_of_uncommitted_changes = 0
+
+    # -----------------------------------------------------------------------------------------------------------------------
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def commit(self):
+        """
+        This method will commit any changes made to the job index to disk.
+        """
+        self.connection.commit()
+        self.number_of_uncommitted_changes = 0
+
+    def close(self):
+        """
+        This method will commit any changes made to the job index to disk and close the job index.
+        """
+        self.commit()
+        self.connection.close()
+
+    def execute(self, sql_command, values):
+        """
+        This method will make a change to the job index, committing changes to disk every commit_every changes.
+
+        Parameters
+        ----------
+        sql_command : str.
+            This is the SQL command to execute.
+        values : tuple
+            These are the values to give to sql_command.
+        """
+        self.connection.execute(sql_command, values)
+        self.number_of_uncommitted_changes += 1
+        if self.number_of_uncommitted_changes >= commit_every:
+            self.commit()
+
+    # -----------------------------------------------------------------------------------------------------------------------
+
+    def walk(self, top):
+        """
+        This method is a drop-in replacement for os.walk (topdown=True, followlinks=False).
+
+        The listing of each folder is taken from the job index if the folder has not been modified since it was last recorded, otherwise the folder is scanned and the job index is updated.
+        As with os.walk, you can prevent this method from moving into subdirectories by removing them from dirnames (i.e. dirnames[:] = []).
+
+        Parameters
+        ----------
+        top : str.
+            This is the directory to walk through.
+
+        Yields
+        ------
+        dirpath : str.
+            This is the path to the folder.
+        dirnames : list of str.
+            These are the names of the subdirectories in dirpath.
+        filenames : list of str.
+            These are the names of the files in dirpath.
+        """
+
+        # First, walk through the folders in top.
+        yield from self.walk_folder(top)
+
+        # Second, commit the changes made to the job index once the whole job tree has been walked through.
+        self.commit()
+
+    def walk_folder(self, top):
+        """
+        This method will walk through the folders in top, yielding the contents of each folder as in os.walk.
+
+        Parameters
+        ----------
+        top : str.
+            This is the directory to walk through.
+
+        Yields
+        ------
+        dirpath : str.
+            This is the path to the folder.
+        dirnames : list of str.
+            These are the names of the subdirectories in dirpath.
+        filenames : list of str.
+            These are the names of the files in dirpath.
+        """
+
+        # First, obtain the names of the subdirectories and files in this folder.
+        listing = self.get_folder_listing(top)
+        if listing is None:
+            return
+        dirnames, linknames, filenames = listing
+
+        # Second, yield the contents of this folder.
+        yield top, dirnames, filenames
+
+        # Third, move through the subdirectories that are remaining in dirnames (like os.walk, symbolic links to folders are not followed).
+        for dirname in dirnames:
+            if dirname in linknames:
+                continue
+            yield from self.walk_folder(os.path.join(top, dirname))
+
+    def get_folder_listing(self, dirpath):
+        """
+        This method will obtain the names of the subdirectories and files in dirpath, either from the job index or by scanning the folder.
+
+        Parameters
+        ----------
+        dirpath : str.
+            This is the path to the folder.
+
+        Returns
+        -------
+        dirnames : list of str.
+            These are the names of the subdirectories in dirpath.
+        linknames : list of str.
+            These are the names of the subdirectories in dirpath that are symbolic links.
+        filenames : list of str.
+            These are the names of the files in dirpath.
+        """
+
+        # First, obtain the time that this folder was last modified.
+        try:
+            dir_mtime = os.stat(dirpath).st_mtime_ns
+        except OSError:
+            return None
+        abs_dirpath = os.path.abspath(dirpath)
+
+        # Second, if this folder has not changed since it was recorded in the job index, use the recorded listing.
+        row = self.connection.execute('SELECT dir_mtime, recorded_at, dirnames, linknames, filenames FROM folders WHERE path = ?', (abs_dirpath,)).fetchone()
+        if (row is not None) and (row[0] == dir_mtime) and ((row[1] - (dir_mtime * 1e-9)) > mtime_resolution):
+            return json.loads(row[2]), json.loads(row[3]), json.loads(row[4])
+
+        # Third, scan the folder.
+        dirnames = []; linknames = []; filenames = []
+        try:
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        dirnames.append(entry.name)
+                        if entry.is_symlink():
+                            linknames.append(entry.name)
+                    else:
+                        filenames.append(entry.name)
+        except OSError:
+            return None
+
+        # Fourth, record the listing of this folder in the job index.
+        self.execute('INSERT OR REPLACE INTO folders (path, dir_mtime, recorded_at, dirnames, linknames, filenames) VALUES (?, ?, ?, ?, ?, ?)', (abs_dirpath, dir_mtime, time.time(), json.dumps(dirnames), json.dumps(linknames), json.dumps(filenames)))
+
+        # Fifth, return the listing of this folder.
+        return dirnames, linknames, filenames
+
+    # -----------------------------------------------------------------------------------------------------------------------
+
+    def get_job_completion_status(self, dirpath, filenames, output_file_name, get_completion_status):
+        """
+        This method will obtain the completion status of the job in dirpath.
+
+        The completion status is taken from the job index if none of the files in dirpath have changed since it was recorded, otherwise get_completion_status is run and the job index is updated.
+
+        Parameters
+        ----------
+        dirpath : str.
+            This is the path to the job folder.
+        filenames : list of str.
+            These are the names of the files in dirpath.
+        output_file_name : str.
+            This is the name of the main output file for this job.
+        get_completion_status : function
+            This is the method that will determine the completion status of this job if needed. This must return (job_type, completion_stage, details).
+
+        Returns
+        -------
+        job_type : str.
+            This is the type of job in dirpath.
+        completion_stage : str.
+            This is the completion stage of the job in dirpath.
+        details : tuple or None
+            These are any other details about the job.
+        """
+
+        # First, obtain the signature of the files in this folder.
+        abs_dirpath = os.path.abspath(dirpath)
+        files_signature = get_files_signature(dirpath, filenames)
+
+        # Second, if none of the files in this folder have changed, use the completion status recorded in the job index.
+        row = self.connection.execute('SELECT files_signature, completion_status FROM jobs WHERE path = ?', (abs_dirpath,)).fetchone()
+        if (row is not None) and (row[0] == files_signature) and (row[1] is not None):
+            job_type, completion_stage, details = json.loads(row[1])
+            return job_type, completion_stage, (tuple(details) if isinstance(details, list) else details)
+
+        # Third, determine the completion status of this job.
+        job_type, completion_stage, details = get_completion_status()
+
+        # Fourth, record the completion status of this job in the job index.
+        log_size, log_mtime = get_file_size_and_mtime(os.path.join(dirpath, output_file_name))
+        self.execute('INSERT INTO jobs (path, job_type, log_size, log_mtime, files_signature, completion_status, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT(path) DO UPDATE SET job_type=excluded.job_type, log_size=excluded.log_size, log_mtime=excluded.log_mtime, files_signature=excluded.files_signature, completion_status=excluded.completion_status, updated_at=excluded.updated_at', (abs_dirpath, job_type, log_size, log_mtime, files_signature, json.dumps((job_type, completion_stage, details)), time.time()))
+
+        # Fifth, return the completion status of this job.
+        return job_type, completion_stage, details
+
+    def record_submission(self, dirpath, submission_filename, slurm_id):
+        """
+        This method will record that a job has been submitted to slurm.
+
+        Parameters
+        ----------
+        dirpath : str.
+            This is the path to the job folder.
+        submission_filename : str.
+            This is the name of the submit script that was submitted.
+        slurm_id : int
+            This is the slurm id of the submitted job.
+        """
+        self.execute('INSERT INTO jobs (path, submit_state, slurm_id, updated_at) VALUES (?, ?, ?, ?) ON CONFLICT(path) DO UPDATE SET submit_state=excluded.submit_state, slurm_id=excluded.slurm_id, updated_at=excluded.updated_at', (os.path.abspath(dirpath), 'submitted: '+str(submission_filename), slurm_id, time.time()))
+        self.commit()
+
+    # -----------------------------------------------------------------------------------------------------------------------
+
+    def cache_log_check(self, log_check_method):
+        """
+        This method will wrap a method that analyses a log file (such as did_gaussian_job_complete) so that its results are stored in the job index.
+
+        The log file is only re-read if its size or mtime has changed since it was last analysed. The results of log_check_method must be JSON serialisable.
+
+        Parameters
+        ----------
+        log_check_method : function
+            This is the method that analyses a log file, given as log_check_method(path_to_log_file).
+
+        Returns
+        -------
+        cached_log_check_method : function
+            This is log_check_method, where results are taken from the job index where possible.
+        """
+        method_name = log_check_method.__name__
+        def cached_log_check_method(path_to_log_file):
+
+            # First, obtain the size and mtime of the log file. If it does not exist, do not use the job index.
+            log_size, log_mtime = get_file_size_and_mtime(path_to_log_file)
+            if log_size is None:
+                return log_check_method(path_to_log_file)
+            abs_path_to_log_file = os.path.abspath(path_to_log_file)
+
+            # Second, if the log file has not changed, use the result recorded in the job index.
+            row = self.connection.execute('SELECT log_size, log_mtime, result FROM log_results WHERE path = ? AND method = ?', (abs_path_to_log_file, method_name)).fetchone()
+            if (row is not None) and (row[0] == log_size) and (row[1] == log_mtime):
+                result = json.loads(row[2])
+                return tuple(result) if isinstance(result, list) else result
+
+            # Third, analyse the log file and record the result in the job index.
+            result = log_check_method(path_to_log_file)
+            self.execute('INSERT OR REPLACE INTO log_results (path, method, log_size, log_mtime, result) VALUES (?, ?, ?, ?, ?)', (abs_path_to_log_file, method_name, log_size, log_mtime, json.dumps(result)))
+            return result
+
+        return cached_log_check_method
+
+# ---------------------------------------------------------------------------------------------------------------------------
+
+def get_file_size_and_mtime(path_to_file):
+    """
+    This method will return the size and mtime (in ns) of a file.
+
+    Parameters
+    ----------
+    path_to_file : str.
+        This is the path to the file.
+
+    Returns
+    -------
+    size : int or None
+        This is the size of the file. None if the file does not exist.
+    mtime : int or None
+        This is the mtime of the file in ns. None if the file does not exist.
+    """
+    try:
+        file_stat = os.stat(path_to_file)
+    except OSError:
+        return None, None
+    return file_stat.st_size, file_stat.st_mtime_ns
+
+def get_files_signature(dirpath, filenames):
+    """
+    This method will return a signature of the files in a folder, based on the name, size and mtime of each file.
+
+    Parameters
+    ----------
+    dirpath : str.
+        This is the path to the folder.
+    filenames : list of str.
+        These are the names of the files in dirpath.
+
+    Returns
+    -------
+    files_signature : str.
+        This is the signature of the files in dirpath.
+    """
+    files_signature = []
+    for filename in sorted(filenames):
+        size, mtime = get_file_size_and_mtime(os.path.join(dirpath, filename))
+        files_signature.append((filename, size, mtime))
+    return json.dumps(files_signature)
+
+# ---------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,539 @@
+'''
+Geoffrey Weal, Gaussian_Log_Parser.py, 17/10/26
+
+This script contains a streaming parser for Gaussian log files.
+
+The parser reads a Gaussian log file once, from top to bottom, and records every piece of information that ECCP needs from it (termination, job type, energies, force convergence, frequencies and EET couplings).
+The parser for each log file is kept in memory along with the byte offset that it got to, so that the next time the log file is looked at only the newly appended output needs to be read.
+Nothing is written next to the log files.
+'''
+import os
+from collections import OrderedDict
+
+# These are the number of bytes from the start of the log file, and from just before the offset the parser got to, used to check that the log file has only been appended to since the parser last read it.
+number_of_head_bytes = 4096
+number_of_tail_bytes = 256
+
+# This is the number of non-empty lines from the end of the log file that "Normal termination of Gaussian" must be within for the job to have terminated normally.
+#    * This is the same as the reverse_readline check this parser replaces, which skips empty lines and checks the last line plus the 20 lines before it.
+normal_termination_line_window = 20
+
+# This is multiplied to force values before they are compared to their convergence thresholds.
+multiplier = 1.0
+
+# These are the lines in the log file that indicate the optimisation has finished.
+opt_finished_lines    = ['Normal termination of Gaussian', 'Stationary point found', 'Optimization completed']
+opt_converged_lines   = ['Optimization completed.', '-- Stationary point found']
+
+# These are the lines that hold the convergence table for each image in an optimisation, given as {line in log file: name in parser}.
+convergence_table_lines = {'Maximum Force': 'maximum_force_converged', 'RMS     Force': 'rms_force_converged', 'Maximum Displacement': 'maximum_distance_converged', 'RMS     Displacement': 'rms_distance_converged'}
+
+# These are the lines that give the frequencies of a frequency job.
+frequency_start_line = 'Harmonic frequencies (cm**-1), IR intensities (KM/Mole), Raman scattering'
+frequency_line       = 'Frequencies ---'
+
+# These are the components of the electronic coupling given by an EET job, given in the order they are returned.
+electronic_coupling_header = 'Electronic Coupling for Excitation Energy'
+electronic_coupling_names  = ['delta_w', 'coulomb', 'exact_exchange', 'exchange_correlation', 'w_avg_times_Overlap', 'w_avg', 'overlap', 'total_coupling']
+
+# This is the line that the header of a log file (used to determine the job type) ends on.
+header_break_string = 'Input orientation:'
+
+# This is the cache of the parsers that have been used most recently in this python session, given as {path to log file: parser}.
+#    * Only the max_number_of_parsers_in_memory most recently used parsers are kept, so the cache does not keep growing when looking through large job trees.
+parsers_in_memory = OrderedDict()
+max_number_of_parsers_in_memory = 1000
+
+class Gaussian_Log_Parser:
+    """
+    This object is designed to read a Gaussian log file in one pass, and to keep reading it from where it got to last time.
+
+    Parameters
+    ----------
+    log_filepath : str.
+        This is the path to the Gaussian log file.
+    """
+    def __init__(self, log_filepath):
+
+        # First, save the input variables.
+        self.log_filepath = log_filepath
+
+        # Second, start from the beginning of the log file.
+        self.reset()
+
+    def reset(self):
+        """
+        This method will reset the parser to the beginning of the log file.
+        """
+
+        # First, record where the parser is up to in the log file.
+        self.offset = 0
+        self.inode  = None
+        self.head   = ''
+        self.tail   = ''
+        self.size_read  = None
+        self.mtime_read = None
+
+        # Second, record the last line of the log file if Gaussian is part way through writing it. This line is read again once it is complete.
+        self.unfinished_line = ''
+
+        # Third, initialise the information obtained from the log file.
+        self.state = {
+            # Termination
+            'number_of_lines': 0, 'last_normal_termination_line': None,
+            # Header (used to determine the job type)
+            'header_finished': False, 'path_including_hash': False, 'current_line': '', 'job_type': None, 'eet_in_header': False, 'input_orientation_found': False,
+            'is_HF': False, 'HF_search_finished': False,
+            # Energies
+            'scf_energy': None, 'cis_energy': None,
+            # Force convergence
+            'maximum_force_converged': None, 'rms_force_converged': None, 'maximum_distance_converged': None, 'rms_distance_converged': None, 'opt_converged_line_found': False,
+            # Images of the optimisation (images are numbered from 1)
+            'total_no_of_images': 0, 'images_at_last_opt_finished_line': None, 'pending_image': None, 'latest_converged_image': None, 'most_converged_image': None,
+            # Frequencies
+            'frequency_block': 0, 'frequencies': [],
+            # EET couplings
+            'electronic_coupling': dict([(name, None) for name in electronic_coupling_names]),
+        }
+
+    # -----------------------------------------------------------------------------------------------------------------------
+
+    def is_same_log_file(self, inode, offset, head, tail):
+        """
+        This method will determine if the log file is the same file that the parser last read, and has only been appended to since.
+
+        Parameters
+        ----------
+        inode : int
+            This is the inode of the log file when the parser last read it.
+        offset : int
+            This is the byte offset that the parser got to.
+        head : str.
+            These are the first bytes of the log file when the parser last read it.
+        tail : str.
+            These are the bytes just before offset when the parser last read it.
+
+        Returns
+        -------
+        True if the log file has only been appended to since the parser last read it, False if not.
+        """
+        try:
+            if not (os.stat(self.log_filepath).st_ino == inode):
+                return False
+            with open(self.log_filepath, 'rb') as logFILE:
+                if not (logFILE.read(len(head.encode('latin-1'))).decode('latin-1') == head):
+                    return False
+                tail_start = max(offset - number_of_tail_bytes, 0)
+                logFILE.seek(tail_start)
+                return logFILE.read(offset - tail_start).decode('latin-1') == tail
+        except OSError:
+            return False
+
+    # -----------------------------------------------------------------------------------------------------------------------
+
+    def update(self):
+        """
+        This method will read any output that has been appended to the log file since the parser last read it.
+
+        Only complete lines are read, so a line that Gaussian is part way through writing will be read next time.
+
+        Returns
+        -------
+        has_changed : bool.
+            True if new output was read from the log file, False if not.
+        """
+
+        # First, check if the log file has changed since it was last read. If not, there is nothing to do.
+        try:
+            log_stat = os.stat(self.log_filepath)
+        except OSError:
+            self.reset()
+            return False
+        if (log_stat.st_size == self.size_read) and (log_stat.st_mtime_ns == self.mtime_read) and (log_stat.st_ino == self.inode):
+            return False
+
+        # Second, if the log file has been replaced or rewritten since it was last read, start reading it from the beginning again.
+        if (self.offset > 0) and not self.is_same_log_file(self.inode, self.offset, self.head, self.tail):
+            self.reset()
+
+        # Third, read the new lines in the log file.
+        start_offset = self.offset
+        with open(self.log_filepath, 'rb') as logFILE:
+            if len(self.head) < number_of_head_bytes:
+                self.head = logFILE.read(number_of_head_bytes).decode('latin-1')
+            logFILE.seek(self.offset)
+            self.unfinished_line = ''
+            for line in logFILE:
+                if not line.endswith(b'\n'):
+                    self.unfinished_line = line.decode('utf-8', errors='replace').rstrip('\r')
+                    break
+                self.offset += len(line)
+                self.parse_line(line.decode('utf-8', errors='replace').rstrip('\r\n'))
+            tail_start = max(self.offset - number_of_tail_bytes, 0)
+            logFILE.seek(tail_start)
+            self.tail = logFILE.read(self.offset - tail_start).decode('latin-1')
+
+        # Fourth, record the log file that was read.
+        self.inode      = log_stat.st_ino
+        self.size_read  = log_stat.st_size
+        self.mtime_read = log_stat.st_mtime_ns
+
+        # Fifth, return if new lines were read.
+        return not (self.offset == start_offset)
+
+    def parse_line(self, line):
+        """
+        This method will record any information that ECCP needs from a line in the log file.
+
+        Parameters
+        ----------
+        line : str.
+            This is the line from the log file, without the newline.
+        """
+        state = self.state
+
+        # First, record if this line indicates that Gaussian has terminated normally.
+        if line:
+            if 'Normal termination of Gaussian' in line:
+                state['last_normal_termination_line'] = state['number_of_lines']
+            state['number_of_lines'] += 1
+
+        # Second, look through the header of the log file for the job type.
+        if not state['input_orientation_found']:
+            if 'eet' in line:
+                state['eet_in_header'] = True
+            if header_break_string in line:
+                state['input_orientation_found'] = True
+        if not state['header_finished']:
+            self.parse_header_line(line)
+        if not state['HF_search_finished']:
+            if line.startswith(' #') and ('HF' in line):
+                state['is_HF'] = True
+                state['HF_search_finished'] = True
+            elif 'Population analysis using the SCF Density.' in line:
+                state['HF_search_finished'] = True
+
+        # Third, record the energies.
+        if 'SCF Done:' in line:
+            state['scf_energy'] = float(line.split()[4]) # Hartrees
+        elif 'Total Energy, E(CIS/TDA)' in line:
+            state['cis_energy'] = float(line.split()[4]) # Hartrees
+
+        # Fourth, record the force convergence of the optimisation.
+        if any([(opt_finished_line in line) for opt_finished_line in opt_finished_lines]):
+            state['images_at_last_opt_finished_line'] = state['total_no_of_images']
+            state['pending_image']          = None
+            state['latest_converged_image'] = None
+            state['most_converged_image']   = None
+        if any([(opt_converged_line in line) for opt_converged_line in opt_converged_lines]):
+            state['opt_converged_line_found'] = True
+        for convergence_table_line, name in convergence_table_lines.items():
+            if convergence_table_line in line:
+                self.parse_convergence_table_line(line, name)
+                break
+
+        # Fifth, record the frequencies from the first frequency block.
+        if state['frequency_block'] < 2:
+            if frequency_start_line in line:
+                state['frequency_block'] += 1
+            elif frequency_line in line:
+                for recorded_frequency in line.replace(frequency_line,'').split():
+                    try:
+                        state['frequencies'].append(float(recorded_frequency))
+                    except ValueError:
+                        pass
+
+        # Sixth, record the EET couplings after the last electronic coupling header.
+        if electronic_coupling_header in line:
+            state['electronic_coupling'] = dict([(name, None) for name in electronic_coupling_names])
+        elif line.startswith('   '):
+            self.parse_electronic_coupling_line(line)
+
+    def parse_header_line(self, line):
+        """
+        This method will look through a line in the header of the log file to determine the job type.
+
+        Parameters
+        ----------
+        line : str.
+            This is the line from the log file, without the newline.
+        """
+        state = self.state
+
+        # First, obtain the input of the line, where the route section (given over several lines from the '#') is given as one line.
+        if state['path_including_hash']:
+            if '----------------------' in line:
+                state['path_including_hash'] = False
+            else:
+                state['current_line'] += line+'\n'
+                return
+        elif '#' in line:
+            state['current_line'] = line+'\n'
+            state['path_including_hash'] = True
+            return
+        else:
+            state['current_line'] = line+'\n'
+
+        # Second, determine the job type from the input.
+        if 'density=(transition=1)' in state['current_line']:
+            state['job_type'] = 'ATC'
+        elif 'eet' in state['current_line']:
+            state['job_type'] = 'EET'
+        if (state['job_type'] is not None) or (header_break_string in state['current_line']):
+            state['header_finished'] = True
+            state['current_line'] = ''
+
+    def parse_convergence_table_line(self, line, name):
+        """
+        This method will record a line from the convergence table of an optimisation image.
+
+        Parameters
+        ----------
+        line : str.
+            This is the line from the log file, without the newline.
+        name : str.
+            This is the name of the convergence criterion given on this line.
+        """
+        state = self.state
+        line = line.split()
+        if len(line) < 2:
+            return
+
+        # First, record if this convergence criterion has been met.
+        state[name] = (line[-1] == 'YES')
+
+        # Second, record the forces on the image, to determine if the forces have converged to the degree I (Geoff) am happy with.
+        if name in ['maximum_force_converged', 'rms_force_converged']:
+            if not (len(line) == 5):
+                return
+            value = float('inf') if (line[2] == '********') else float(line[2])
+            is_converged = (value*multiplier < float(line[3]))
+            if name == 'maximum_force_converged':
+                self.finalise_pending_image()
+                state['total_no_of_images'] += 1
+                state['pending_image'] = [state['total_no_of_images'], value if (value < float('inf')) else None, is_converged, False]
+            elif (state['pending_image'] is not None) and is_converged:
+                state['pending_image'][3] = True
+
+    def finalise_pending_image(self):
+        """
+        This method will record the last image in the optimisation once both its maximum and RMS forces have been read.
+        """
+        state = self.state
+        state['latest_converged_image'], state['most_converged_image'] = include_image(state['latest_converged_image'], state['most_converged_image'], state['pending_image'])
+        state['pending_image'] = None
+
+    def parse_electronic_coupling_line(self, line):
+        """
+        This method will record a line that gives a component of the EET coupling.
+
+        Parameters
+        ----------
+        line : str.
+            This is the line from the log file, without the newline.
+        """
+        electronic_coupling = self.state['electronic_coupling']
+        if line.startswith('   delta-w') and (electronic_coupling['delta_w'] is None):
+            electronic_coupling['delta_w'] = float(line.rstrip().replace('=','').split()[1]) # eV
+        elif line.startswith('   Coulomb') and (electronic_coupling['coulomb'] is None):
+            electronic_coupling['coulomb'] = float(line.rstrip().replace('=','').split()[1]) # eV
+        elif line.startswith('   Exact-exchange') and (electronic_coupling['exact_exchange'] is None):
+            electronic_coupling['exact_exchange'] = float(line.rstrip().replace('=','').split()[1]) # eV
+        elif line.startswith('   Exchange-correlation') and (electronic_coupling['exchange_correlation'] is None):
+            electronic_coupling['exchange_correlation'] = float(line.rstrip().replace('=','').split()[1]) # eV
+        elif line.startswith('   w-avg*Overlap') and (electronic_coupling['w_avg_times_Overlap'] is None):
+            line1 = line.rstrip().replace('   w-avg*Overlap             =','').lstrip().split()
+            electronic_coupling['w_avg_times_Overlap'] = float(line1[0]) # eV
+            line2 = line.rstrip().replace('   w-avg*Overlap             =','').lstrip().split('(')[1].replace(')','')
+            w_avg_value, overlap_value = line2.split(',')
+            electronic_coupling['w_avg']   = float(w_avg_value.replace('w-avg=','').replace('eV','')) # eV
+            electronic_coupling['overlap'] = float(overlap_value.replace('Ovlp=','').replace('D','E').replace('eV',''))
+        elif line.startswith('   Total coupling') and (electronic_coupling['total_coupling'] is None):
+            electronic_coupling['total_coupling'] = float(line.rstrip().replace('=','').split()[2]) # eV
+
+    # -----------------------------------------------------------------------------------------------------------------------
+
+    def did_terminate_normally(self):
+        """
+        This method will determine if the Gaussian job terminated normally.
+
+        Returns
+        -------
+        True if "Normal termination of Gaussian" is within the last few lines of the log file, False if not.
+        """
+
+        # First, the last line of the log file counts as a line even if Gaussian is part way through writing it.
+        number_of_lines = self.state['number_of_lines']
+        if self.unfinished_line:
+            if 'Normal termination of Gaussian' in self.unfinished_line:
+                return True
+            number_of_lines += 1
+
+        # Second, check if "Normal termination of Gaussian" is within the last few lines of the log file.
+        if self.state['last_normal_termination_line'] is None:
+            return False
+        return (number_of_lines - 1 - self.state['last_normal_termination_line']) <= normal_termination_line_window
+
+    def get_opt_results(self, get_most_converged_image=False, get_total_no_of_images=False):
+        """
+        This method will determine if the Gaussian optimisation job has completed successfully.
+
+        Images are given as negative indices, where -1 is the last image in the log file.
+
+        Parameters
+        ----------
+        get_most_converged_image : bool
+            This tag indicates if you want to get the most converged image. If True, Yes. If False, just the most recently converged image.
+        get_total_no_of_images : bool
+            This tag will indicate if you want to obtain the total number of images that have been created during this optimisation
+
+        Returns
+        -------
+        The same results as did_gaussian_opt_job_complete.
+        """
+        state = self.state
+        total_no_of_images = state['total_no_of_images']
+        def to_reverse_image_index(image_number):
+            return image_number - total_no_of_images - 1
+
+        # First, include the last image in the log file.
+        latest_converged_image, most_converged_image = include_image(state['latest_converged_image'], state['most_converged_image'], state['pending_image'])
+
+        # Second, obtain the image to use and whether the optimisation has fully converged.
+        opt_finished_image_index = None
+        if state['images_at_last_opt_finished_line'] is not None:
+            opt_finished_image_index = to_reverse_image_index(state['images_at_last_opt_finished_line'])
+        if get_most_converged_image:
+            if opt_finished_image_index is not None:
+                to_return = [True, True, opt_finished_image_index]
+            elif most_converged_image is not None:
+                to_return = [True, False, to_reverse_image_index(most_converged_image[0])]
+            else:
+                to_return = [False, False, None]
+        else:
+            if (latest_converged_image is not None) and not get_total_no_of_images:
+                to_return = [True, False, to_reverse_image_index(latest_converged_image)]
+            elif opt_finished_image_index is not None:
+                to_return = [True, True, opt_finished_image_index]
+            elif latest_converged_image is not None:
+                to_return = [True, False, to_reverse_image_index(latest_converged_image)]
+            else:
+                to_return = [False, False, None]
+
+        # Third, add info for returning about the total number of images
+        if get_total_no_of_images:
+            to_return.append(total_no_of_images)
+        return tuple(to_return)
+
+    def get_force_convergence(self):
+        """
+        This method will give the convergence criteria from the last convergence table in the optimisation.
+
+        If no maximum or RMS force was given in the log file but the optimisation completed, these are given as converged.
+
+        Returns
+        -------
+        maximum_force_converged, rms_force_converged, maximum_distance_converged, rms_distance_converged : bool or None
+            These indicate if each convergence criteria was met. None if it was not found in the log file.
+        """
+        state = self.state
+        maximum_force_converged = state['maximum_force_converged']
+        rms_force_converged     = state['rms_force_converged']
+        if state['opt_converged_line_found']:
+            maximum_force_converged = True if (maximum_force_converged is None) else maximum_force_converged
+            rms_force_converged     = True if (rms_force_converged     is None) else rms_force_converged
+        return maximum_force_converged, rms_force_converged, state['maximum_distance_converged'], state['rms_distance_converged']
+
+    def get_frequencies(self):
+        """
+        This method will give the frequencies from the first frequency block in the log file, sorted from lowest to highest.
+
+        Returns
+        -------
+        all_frequencies : list of float
+            These are the frequencies (in cm-1) from the log file.
+        """
+        return sorted(self.state['frequencies'])
+
+    def get_electronic_coupling(self):
+        """
+        This method will give the components of the EET coupling after the last electronic coupling header in the log file.
+
+        Returns
+        -------
+        electronic_coupling_datum : list of float or None
+            These are the components of the EET coupling, given in the order of electronic_coupling_names. None if a component was not found.
+        """
+        return [self.state['electronic_coupling'][name] for name in electronic_coupling_names]
+
+# ---------------------------------------------------------------------------------------------------------------------------
+
+def include_image(latest_converged_image, most_converged_image, image):
+    """
+    This method will include an image in the record of the converged images of an optimisation.
+
+    Parameters
+    ----------
+    latest_converged_image : int or None
+        This is the number of the latest image that has converged.
+    most_converged_image : [int, float] or None
+        This is the number and maximum force of the image with the lowest maximum force that has converged. The latest image is taken if there is a tie.
+    image : [int, float or None, bool, bool] or None
+        This is the number, maximum force (None if infinite), and whether the maximum force and RMS force have converged for the image to include.
+
+    Returns
+    -------
+    latest_converged_image : int or None
+        This is the number of the latest image that has converged.
+    most_converged_image : [int, float] or None
+        This is the number and maximum force of the image with the lowest maximum force that has converged.
+    """
+    if image is None:
+        return latest_converged_image, most_converged_image
+    image_number, value, has_max_force_converged, has_RMS_force_converged = image
+    if not (has_max_force_converged and has_RMS_force_converged):
+        return latest_converged_image, most_converged_image
+    value = float('inf') if (value is None) else value
+    if (most_converged_image is None) or (value <= most_converged_image[1]):
+        most_converged_image = [image_number, value]
+    return image_number, most_converged_image
+
+def parse_gaussian_log(log_filepath):
+    """
+    This method will return the parser for a Gaussian log file, having read any new output in the log file.
+
+    The most recently used parsers are kept in memory, so looking at the same log file again only involves a stat of the log file.
+
+    Parameters
+    ----------
+    log_filepath : str.
+        This is the path to the Gaussian log file.
+
+    Returns
+    -------
+    parser : Gaussian_Log_Parser
+        This is the parser for the log file, which is up to date with the log file.
+    """
+    abs_log_filepath = os.path.abspath(log_filepath)
+    if abs_log_filepath in parsers_in_memory:
+        parsers_in_memory.move_to_end(abs_log_filepath)
+    else:
+        parsers_in_memory[abs_log_filepath] = Gaussian_Log_Parser(abs_log_filepath)
+        if len(parsers_in_memory) > max_number_of_parsers_in_memory:
+            parsers_in_memory.popitem(last=False)
+    parser = parsers_in_memory[abs_log_filepath]
+    parser.update()
+    return parser
+
+def forget_parser(log_filepath):
+    """
+    This method will remove the parser for a Gaussian log file from memory, so that the log file is read from the beginning the next time it is looked at.
+
+    Parameters
+    ----------
+    log_filepath : str.
+        This is the path to the Gaussian log file.
+    """
+    parsers_in_memory.pop(os.path.abspath(log_filepath), None)
+
+# ---------------------------------------------------------------------------------------------------------------------------
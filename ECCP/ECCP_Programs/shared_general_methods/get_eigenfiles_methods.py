@@ -5,6 +5,8 @@ This script provides the methods required for processing output.log files for ov
 
 '''
 import os
+import numpy as np
+from ECCP.ECCP.utilities.write_file_atomically import write_file_atomically
 
 # ----------------------------------------------------------------------------------------------------------------------------------
 # ----------------------------------------------------------------------------------------------------------------------------------
@@ -354,41 +356,44 @@ def write_MO_occupancies(MO_occupancies, filename):
 
 def write_1D_matrix(data_heap, filename):
     """
-    This method is designed to save a 1D matrix as simple as possible to a txt file.
+    This method is designed to save a 1D matrix as a binary numpy (.npy) file.
+
+    The matrix is saved as a column (N x 1) so that it has the same shape as the 1D matrices that were previously read in from txt files.
 
     Parameters
     ----------
     data_heap : dict
         This is the data heap that contains all the information about the 1D matrix
     filename : str
-        This is the path to save this data to.
+        This is the path to save this data to. This should end with ".npy".
     """
+
     # First, get the max row for this matrix.
-    max_row = 0
-    for row in data_heap.keys():
-        if row > max_row:
-            max_row = row
-    
-    # Second, save the data to disk.
-    with open(filename, 'w') as filenameTXT:
-        for row in range(1,max_row+1):
-            value = data_heap[row]
-            filenameTXT.write(str(value))
-            filenameTXT.write('\n')
+    max_row = max(data_heap.keys())
+
+    # Second, create the matrix from the data heap. 
+    matrix = np.empty((max_row, 1), dtype=float)
+    for row in range(1,max_row+1):
+        matrix[row-1,0] = float(data_heap[row])
+
+    # Third, save the data to disk.
+    save_matrix(matrix, filename)
 
 def write_2D_matrix(data_heap, filename, symmetric_matrix=False):
     """
-    This method is designed to save a 2D matrix as simple as possible to a txt file.
+    This method is designed to save a 2D matrix as a binary numpy (.npy) file.
 
     Parameters
     ----------
     data_heap : dict
-        This is the data heap that contains all the information about the 1D matrix.
+        This is the data heap that contains all the information about the 2D matrix.
     filename : str
-        This is the path to save this data to.
+        This is the path to save this data to. This should end with ".npy".
     symmetric_matrix : bool.
-        True if this is a symmetric matrix, False if not.
+        True if this is a symmetric matrix, False if not. 
+        * If True, data_heap only contains the lower triangle of the matrix, and the full matrix will be saved.
     """
+
     # First, get the max row and max column for this matrix.
     max_row = 0
     max_col = 0
@@ -397,64 +402,35 @@ def write_2D_matrix(data_heap, filename, symmetric_matrix=False):
             max_row = row
         if col > max_col:
             max_col = col
-    
-    # Second, save the data to disk.
-    filenameTXT = open(filename, 'w')
+
+    # Second, obtain the indices and values of the matrix from the data heap. 
+    no_of_entries = len(data_heap)
+    rows   = np.fromiter((row-1        for (row, col) in data_heap.keys()),   dtype=int,   count=no_of_entries)
+    cols   = np.fromiter((col-1        for (row, col) in data_heap.keys()),   dtype=int,   count=no_of_entries)
+    values = np.fromiter((float(value) for value      in data_heap.values()), dtype=float, count=no_of_entries)
+
+    # Third, create the matrix.
+    matrix = np.zeros((max_row, max_col), dtype=float)
+    matrix[rows, cols] = values
     if symmetric_matrix:
-        write_symmetric_2D_matrix(max_row, max_col, data_heap, filenameTXT)
-    else:
-        write_non_symmetric_2D_matrix(max_row, max_col, data_heap, filenameTXT)
-    filenameTXT.close()
+        matrix[cols, rows] = values
 
-def write_symmetric_2D_matrix(max_row, max_col, data_heap, filenameTXT):
-    """
-    This method will write a symmetric 2D matrix.
+    # Fourth, save the data to disk.
+    save_matrix(matrix, filename)
 
-    Parameters
-    ----------
-    max_row : int
-        This is the maximum row in this matrix
-    max_col : int
-        This is the maximum column in this matrix
-    data_heap : dict
-        This is the data heap that contains all the information about the 1D matrix.
-    filenameTXT : TXTFILE
-        This is the text file to write data to.
+def save_matrix(matrix, filename):
     """
-    for row in range(1,max_row+1):
-        for col in range(1,row+1):
-            index1 = row if (row >= col) else col
-            index2 = col if (row >= col) else row
-            value = data_heap[(index1,index2)]
-            filenameTXT.write(str(value))
-            if col < max_col:
-                filenameTXT.write('\t')
-        filenameTXT.write('\n')
-
-def write_non_symmetric_2D_matrix(max_row, max_col, data_heap, filenameTXT):
-    """
-    This method will write a non-symmetric 2D matrix.
+    This method will save a matrix to disk as a binary numpy (.npy) file, so that a partially written matrix file is never left on disk.
 
     Parameters
     ----------
-    max_row : int
-        This is the maximum row in this matrix
-    max_col : int
-        This is the maximum column in this matrix
-    data_heap : dict
-        This is the data heap that contains all the information about the 1D matrix.
-    filenameTXT : TXTFILE
-        This is the text file to write data to.
+    matrix : numpy.array
+        This is the matrix to save.
+    filename : str
+        This is the path to save this data to. This should end with ".npy".
     """
-    for row in range(1,max_row+1):
-        for col in range(1,max_col+1):
-            index1 = row
-            index2 = col
-            value = data_heap[(index1,index2)]
-            filenameTXT.write(str(value))
-            if col < max_col:
-                filenameTXT.write('\t')
-        filenameTXT.write('\n')
+    with write_file_atomically(filename, mode='wb') as filenameNPY:
+        np.save(filenameNPY, matrix)
 
 # ----------------------------------------------------------------------------------------------------------------------------------
 # ----------------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,131 @@
+'''
+Geoffrey Weal, process_jobs_in_parallel.py, 17/10/26
+
+This script contains methods for processing the jobs found by the process programs (process_EET, process_RE, process_ICT) over multiple cpus.
+
+The process programs first walk through the job tree to find all the jobs to process. These jobs are then processed over a pool of workers, and the results are returned in the same order the jobs were found in, so that the results are merged in the same way regardless of the number of cpus used.
+
+The information that is shared by all jobs (such as when writing the files of molecules and dimers) can also be given. This is only sent to each worker once when it starts, rather than with every job.
+'''
+import multiprocessing as mp
+from tqdm import tqdm
+
+def process_jobs_in_parallel(process_job_method, jobs, no_of_cpus=1, shared_inputs=None, desc=None, unit='job'):
+    """
+    This method will process all the jobs given in jobs, using a pool of no_of_cpus workers.
+
+    Parameters
+    ----------
+    process_job_method : function
+        This is the method used to process each job, given as process_job_method(job), or process_job_method(job, shared_inputs) if shared_inputs is given. This method must be defined at the top level of a module so that it can be sent to the workers.
+    jobs : list
+        These are the jobs to process.
+    no_of_cpus : int
+        This is the number of cpus to use to process jobs. If 1, jobs are processed one after the other without making any workers. Default: 1
+    shared_inputs : dict. or None
+        This is the information that is shared by all the jobs. This is given to each worker once when the worker starts. Default: None
+    desc : str. or None
+        This is the description given in the progress bar when jobs are processed over the pool of workers. If None, no progress bar is shown. Default: None
+    unit : str.
+        This is the unit given in the progress bar. Default: 'job'
+
+    Returns
+    -------
+    results : list
+        These are the results of process_job_method for each job, in the same order as jobs.
+    """
+
+    # First, if only one cpu is being used (or there is only one job), process the jobs one after the other.
+    no_of_cpus = min(no_of_cpus, len(jobs))
+    if no_of_cpus <= 1:
+        return [process_job(process_job_method, job, shared_inputs) for job in jobs]
+
+    # Second, process the jobs over the pool of workers.
+    #         * The method and the shared inputs are given to each worker once when it starts.
+    #         * imap returns results in the same order as jobs, so results are deterministic and any error is raised for the first job that failed.
+    #         * Each worker is given one job at a time, as jobs can take very different amounts of time to process.
+    with mp.Pool(processes=no_of_cpus, initializer=set_job_inputs_for_worker, initargs=(process_job_method, shared_inputs)) as pool:
+        results = pool.imap(process_job_for_worker, jobs, chunksize=1)
+        if desc is not None:
+            results = tqdm(results, total=len(jobs), desc=desc, unit=unit)
+        results = list(results)
+
+    # Third, return the results of each job.
+    return results
+
+def process_job(process_job_method, job, shared_inputs):
+    """
+    This method will process a job, giving the shared inputs to process_job_method if there are any.
+
+    Parameters
+    ----------
+    process_job_method : function
+        This is the method used to process the job.
+    job : object
+        This is the job to process.
+    shared_inputs : dict. or None
+        This is the information that is shared by all the jobs.
+
+    Returns
+    -------
+    The result of process_job_method for this job.
+    """
+    if shared_inputs is None:
+        return process_job_method(job)
+    return process_job_method(job, shared_inputs)
+
+# This holds the method used to process jobs and the shared inputs for each worker. This is set when each worker starts by set_job_inputs_for_worker.
+worker_job_inputs = {}
+
+def set_job_inputs_for_worker(process_job_method, shared_inputs):
+    """
+    This method is run when each worker starts, and gives the worker the method used to process jobs and the information that is shared by all the jobs.
+
+    Parameters
+    ----------
+    process_job_method : function
+        This is the method used to process each job.
+    shared_inputs : dict. or None
+        This is the information that is shared by all the jobs.
+    """
+    worker_job_inputs['process_job_method'] = process_job_method
+    worker_job_inputs['shared_inputs']      = shared_inputs
+
+def process_job_for_worker(job):
+    """
+    This method will process a job on a worker.
+
+    Parameters
+    ----------
+    job : object
+        This is the job to process.
+
+    Returns
+    -------
+    The result of processing the job.
+    """
+    return process_job(worker_job_inputs['process_job_method'], job, worker_job_inputs['shared_inputs'])
+
+def get_no_of_cpus(no_of_cpus):
+    """
+    This method will check the number of cpus given by the user with the --cpus argument.
+
+    Parameters
+    ----------
+    no_of_cpus : str. or int or None
+        This is the number of cpus given by the user. If None, 1 cpu is used.
+
+    Returns
+    -------
+    no_of_cpus : int
+        This is the number of cpus to use.
+    """
+    if no_of_cpus is None:
+        return 1
+    try:
+        no_of_cpus = int(no_of_cpus)
+    except ValueError:
+        raise Exception('Error: --cpus must be a whole number. --cpus = '+str(no_of_cpus))
+    if no_of_cpus < 1:
+        raise Exception('Error: --cpus must be 1 or greater. --cpus = '+str(no_of_cpus))
+    return no_of_cpus
@@ -6,6 +6,7 @@ This script contains methods for processing_OPV_Dimer_data.py
 '''
 import os
 from ECCP.ECCP_Programs.shared_general_methods.shared_general_methods import get_lastline, reverse_readline
+from ECCP.ECCP_Programs.shared_general_methods.Gaussian_Log_Parser    import parse_gaussian_log
 
 # -----------------------------------------------------------------
 
@@ -85,28 +86,16 @@ def did_gaussian_job_complete(log_filepath):
     -------
     True if the log file indicates the Gaussian log file indicates that their has been normal termination, otherwise return False
     """
-    did_gaussian_job_terminate_normally = False
-
-    if os.path.exists(log_filepath):
-        counter = 0
-        for line in reverse_readline(log_filepath):
-            # Check if the gaussian file has terminated normally
-            if 'Normal termination of Gaussian' in line:
-                did_gaussian_job_terminate_normally = True
-            # If not found the termination signal after 20 lines from the end of file, 
-            # the job probably did not terminate properly
-            if counter >= 20 and not did_gaussian_job_terminate_normally:
-                break
-            # If these tags are true, finish
-            if did_gaussian_job_terminate_normally:
-                break
-            counter += 1
-
-    return did_gaussian_job_terminate_normally
+
+    # First, if the log file does not exist, the job has not completed.
+    if not os.path.exists(log_filepath):
+        return False
+
+    # Second, check if the gaussian file has terminated normally within the last 20 lines of the log file.
+    return parse_gaussian_log(log_filepath).did_terminate_normally()
 
 # -----------------------------------------------------------------
 
-multiplier = 1.0
 def did_gaussian_opt_job_complete(log_filepath, get_most_converged_image=False, get_total_no_of_images=False):
     """
     This method will check to see if the gaussian optimisation job has completed successfully. 
@@ -138,104 +127,8 @@ def did_gaussian_opt_job_complete(log_filepath, get_most_converged_image=False,
         else:
             return False, None, None
 
-    # First, create some settings for determining if a image has force converged
-    has_fully_converged                 = False
-    has_max_force_converged             = False
-    has_RMS_force_converged             = False
-    most_recently_converged_image_index = None
-
-    # Second, create variables if you want to find the most converged image in the optimisation.
-    if get_most_converged_image:
-        lowest_maximum_force = float('inf')
-        most_converged_image = None
-
-    # Third, create variables for if you want to obtain the number of images in the optimisation output file. 
-    if get_total_no_of_images:
-        normal_termination = False
-        total_no_of_images = 0
-
-    # Fourth, go through the output file of the gaussian job backward to determine if the job finished or not
-    reverse_image_index = -1
-    for line in reverse_readline(log_filepath):
-        # Check if the gaussian file has terminated normally, or if EET header is found:
-        if ('Normal termination of Gaussian' in line) or (('Stationary point found' in line) or ('Optimization completed' in line)):
-            most_recently_converged_image_index = reverse_image_index
-            most_converged_image = reverse_image_index
-            has_fully_converged = True
-            if get_total_no_of_images:
-                normal_termination = True
-            break
-        # Indicate if the optimisation have force converged to the degree I (Geoff) is happy with.
-        if 'Maximum Force' in line:
-            _, _, value, threshold, congerved = line.rstrip().split()
-            if value == '********':
-                value = float('inf')
-            else:
-                value = float(value)
-            threshold = float(threshold)
-            if value*multiplier < threshold:
-                has_max_force_converged = True
-            # ==============================================================================
-            # If both the max force and RMS force has converged, indicate this
-            if (has_max_force_converged and has_RMS_force_converged):
-                # If most recently converged image index has not been given, give it
-                if most_recently_converged_image_index is None:
-                    most_recently_converged_image_index = reverse_image_index
-                # If you want to get the most converged image index, perform the following
-                if get_most_converged_image:
-                    if value < lowest_maximum_force:
-                        lowest_maximum_force = value
-                        most_converged_image = reverse_image_index
-                # If you are not recording the get_most_converged_image or get_total_no_of_images, we dont need to do anything more, so break out of loop
-                if not (get_most_converged_image or get_total_no_of_images):
-                    break
-            # Reset the convergence booleans
-            has_max_force_converged = False
-            has_RMS_force_converged = False
-            # move down the image index as we are on two the next (previous) image in the optimisation. 
-            reverse_image_index += -1
-            if get_total_no_of_images:
-                total_no_of_images  +=  1
-            # ==============================================================================
-        if 'RMS     Force' in line:
-            _, _, value, threshold, congerved = line.rstrip().split()
-            if value == '********':
-                value = float('inf')
-            else:
-                value = float(value)
-            threshold = float(threshold)
-            if value*multiplier < threshold:
-                has_RMS_force_converged = True
-
-    # Fourth, if you want to get the total no of images but you had a normal termination, use this method to count the number of images you had
-    if get_total_no_of_images and normal_termination:
-        total_no_of_images = 0
-        for line in reverse_readline(log_filepath):
-            if 'Maximum Force' in line:
-                total_no_of_images += 1
-
-    # Fifth, record data to return about the results about either the most converged result, or the most recently converged result
-    if get_most_converged_image:
-        # Return most converged result
-        # If most_converged_image is None, no converged image was found, job has not completed
-        if most_converged_image is None:
-            to_return = [False, False, None]
-        else:
-            to_return = [True, has_fully_converged, most_converged_image]
-    else:
-        # Return most recently converged result
-        # If most_converged_image is None, no converged image was found, job has not completed
-        if most_recently_converged_image_index is None:
-            to_return = [False, False, None]
-        else:
-            to_return = [True, has_fully_converged, most_recently_converged_image_index]
-
-    # Sixth, add info for returning about the total number of images
-    if get_total_no_of_images:
-        to_return.append(total_no_of_images)
-
-    # Seventh, return result as a tuple
-    return tuple(to_return)
+    # First, obtain the results of the optimisation from the log file.
+    return parse_gaussian_log(log_filepath).get_opt_results(get_most_converged_image=get_most_converged_image, get_total_no_of_images=get_total_no_of_images)
 
 # -----------------------------------------------------------------
 
@@ -262,28 +155,10 @@ def did_freq_gaussian_job_complete(freq_log_filepath):
     if not is_freq_force_convergence_good:
         return did_gaussian_job_terminate_normally, is_freq_force_convergence_good, None
 
-    # Second, obtain the frequencies from the output file.
-    frequency_start_line = 'Harmonic frequencies (cm**-1), IR intensities (KM/Mole), Raman scattering'
-    frequency_end_line   = ''
-    start_recording = False
-    all_frequencies = []
-    with open(freq_log_filepath) as logFILE:
-        for line in logFILE:
-            # 2.1: Check if to start frequency finding or finishing looking for frequencies
-            if frequency_start_line in line:
-                if start_recording:
-                    break
-                else:
-                    start_recording = True
-                    continue
-            # 2.2: Look and record freqencies from file.
-            if 'Frequencies ---' in line:
-                recorded_frequencies = line.replace('Frequencies ---','')
-                for recorded_frequency in recorded_frequencies.split():
-                    all_frequencies.append(float(recorded_frequency))
-    all_frequencies.sort()
-
-    # Third, determine the number of frequencies are negative
+    # Third, obtain the frequencies from the output file.
+    all_frequencies = parse_gaussian_log(freq_log_filepath).get_frequencies()
+
+    # Fourth, determine the number of frequencies are negative
     no_of_negative_frequencies = sum([int(frequency < 0.0) for frequency in all_frequencies])
 
     return did_gaussian_job_terminate_normally, is_freq_force_convergence_good, no_of_negative_frequencies
@@ -7,78 +7,235 @@ This program is designed to read the output file from Gaussian every-so-often an
 Once Gaussian has done this EET calculation, this program will write a message to the end of the Gaussian output fiole saying we have finished doing what we want to do in Gaussian and cancel the job.
 """
 
-import os, sys
+import os, sys, select, ctypes, ctypes.util
 from time import time, sleep
 
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - 
 
-def gaussian_has_completed_FRAG2STATE1_to_FRAG1STATE1_EET_calc(path_to_gaussian_log_filename):
-
-	# 
-	EET_Begun                       = False
-	performed_F2S1_to_F1S1_EET_calc = False
-	got_delta_w                     = False
-	got_Coulomb                     = False
-	got_Exact_exchange              = False
-	got_Exchange_correlation        = False
-	got_w_avg_times_Overlap         = False
-	got_Total_coupling              = False
-
-	if not os.path.exists(path_to_gaussian_log_filename):
-		return 'Not Begun EET Calc'
-
-	#
-	with open(path_to_gaussian_log_filename, 'r') as Gaussian_Log_File:
-
-		for line in Gaussian_Log_File:
-
-			line = line.rstrip()
-
-			if 'Electronic Coupling for Excitation Energy Tranfer' in line:
-				EET_Begun = True
-				continue
-
-			if EET_Begun:
-
-				if ('Frag=  2 State=  1' in line) and ('Frag=  1 State=  1' in line):
-					performed_F2S1_to_F1S1_EET_calc = True
-					continue
-
-				if ('delta-w                   =' in line):
-					got_delta_w = True
-					continue
-
-				if ('Coulomb                   =' in line):
-					got_Coulomb = True
-					continue
+class EET_Log_Follower:
+	"""
+	This object is designed to follow the Gaussian output file as it is written, and check if the Frag 2 State 1 <=> Frag 1 State 1 EET calculation has completed.
+
+	The byte offset that has been read up to is kept, so that only the output that Gaussian has appended since the last check is read.
+
+	Parameters
+	----------
+	path_to_gaussian_log_filename : str.
+		This is the path to the Gaussian output file.
+	"""
+	def __init__(self, path_to_gaussian_log_filename):
+		self.path_to_gaussian_log_filename = path_to_gaussian_log_filename
+		self.reset()
+
+	def reset(self):
+		"""
+		This method will start reading the Gaussian output file from the beginning.
+		"""
+		self.offset = 0
+		self.inode  = None
+		self.EET_Begun                       = False
+		self.performed_F2S1_to_F1S1_EET_calc = False
+		self.got_delta_w                     = False
+		self.got_Coulomb                     = False
+		self.got_Exact_exchange              = False
+		self.got_Exchange_correlation        = False
+		self.got_w_avg_times_Overlap         = False
+		self.got_Total_coupling              = False
+
+	def update(self):
+		"""
+		This method will read any complete lines that Gaussian has appended to the output file since it was last read.
+
+		Returns
+		-------
+		has_changed : bool.
+			True if new lines were read from the Gaussian output file, False if not.
+		"""
+
+		# First, if the output file does not exist yet, Gaussian has not begun.
+		try:
+			log_stat = os.stat(self.path_to_gaussian_log_filename)
+		except OSError:
+			return False
+
+		# Second, if the output file has been replaced or made smaller, start reading from the beginning again.
+		if (not (log_stat.st_ino == self.inode)) or (log_stat.st_size < self.offset):
+			self.reset()
+			self.inode = log_stat.st_ino
+		if log_stat.st_size == self.offset:
+			return False
+
+		# Third, read the new lines from the output file. Lines that Gaussian has not finished writing are read next time.
+		start_offset = self.offset
+		with open(self.path_to_gaussian_log_filename, 'rb') as Gaussian_Log_File:
+			Gaussian_Log_File.seek(self.offset)
+			for line in Gaussian_Log_File:
+				if not line.endswith(b'\n'):
+					break
+				self.offset += len(line)
+				self.check_line(line.decode('utf-8', errors='replace').rstrip())
+		return not (self.offset == start_offset)
+
+	def check_line(self, line):
+		"""
+		This method will check a line from the Gaussian output file for the Frag 2 State 1 <=> Frag 1 State 1 EET results.
+
+		Parameters
+		----------
+		line : str.
+			This is the line from the Gaussian output file.
+		"""
+
+		if 'Electronic Coupling for Excitation Energy Tranfer' in line:
+			self.EET_Begun = True
+			return
+
+		if not self.EET_Begun:
+			return
+
+		if ('Frag=  2 State=  1' in line) and ('Frag=  1 State=  1' in line):
+			self.performed_F2S1_to_F1S1_EET_calc = True
+		elif ('delta-w                   =' in line):
+			self.got_delta_w = True
+		elif ('Coulomb                   =' in line):
+			self.got_Coulomb = True
+		elif ('Exact-exchange            =' in line):
+			self.got_Exact_exchange = True
+		elif ('Exchange-correlation      =' in line):
+			self.got_Exchange_correlation = True
+		elif ('w-avg*Overlap             =' in line) and ('w-avg=' in line) and ('Ovlp=' in line):
+			self.got_w_avg_times_Overlap = True
+		elif ('Total coupling            =' in line):
+			self.got_Total_coupling = True
+
+	def get_status(self):
+		"""
+		This method will determine how far Gaussian has got with the Frag 2 State 1 <=> Frag 1 State 1 EET calculation.
+
+		Returns
+		-------
+		status : str.
+			'Done' if the EET calculation is finished, 'Check later' if it has begun, 'Not Begun EET Calc' otherwise.
+		"""
+		likely_calculated_job = [self.EET_Begun, self.performed_F2S1_to_F1S1_EET_calc]
+		definitely_calculated_job = likely_calculated_job + [self.got_delta_w, self.got_Coulomb, self.got_Exact_exchange, self.got_Exchange_correlation, self.got_w_avg_times_Overlap, self.got_Total_coupling]
+
+		if all(definitely_calculated_job): 
+			return 'Done'
+		elif all(likely_calculated_job):
+			return 'Check later'
+		else:
+			return 'Not Begun EET Calc'
 
-				if ('Exact-exchange            =' in line):
-					got_Exact_exchange = True
-					continue
-
-				if ('Exchange-correlation      =' in line):
-					got_Exchange_correlation = True
-					continue
-
-				if ('w-avg*Overlap             =' in line) and ('w-avg=' in line) and ('Ovlp=' in line):
-					got_w_avg_times_Overlap = True
-					continue
-
-				if ('Total coupling            =' in line):
-					got_Total_coupling = True
-					continue
-
-	likely_calculated_job = [EET_Begun, performed_F2S1_to_F1S1_EET_calc]
-	definitely_calculated_job = likely_calculated_job + [got_delta_w, got_Coulomb, got_Exact_exchange, got_Exchange_correlation, got_w_avg_times_Overlap, got_Total_coupling]
-
-	if all(definitely_calculated_job): 
-		return 'Done'
-	elif all(likely_calculated_job):
-		return 'Check later'
-	else:
-		return 'Not Begun EET Calc'
+def gaussian_has_completed_FRAG2STATE1_to_FRAG1STATE1_EET_calc(path_to_gaussian_log_filename):
+	"""
+	This method will read the whole Gaussian output file and check if the Frag 2 State 1 <=> Frag 1 State 1 EET calculation has completed.
+
+	Parameters
+	----------
+	path_to_gaussian_log_filename : str.
+		This is the path to the Gaussian output file.
+
+	Returns
+	-------
+	status : str.
+		'Done' if the EET calculation is finished, 'Check later' if it has begun, 'Not Begun EET Calc' otherwise.
+	"""
+	eet_log_follower = EET_Log_Follower(path_to_gaussian_log_filename)
+	eet_log_follower.update()
+	return eet_log_follower.get_status()
 
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - 
 
+# These are the inotify events used to watch the folder that the Gaussian output file is in (IN_CREATE, IN_MOVED_TO) and the Gaussian output file itself (IN_MODIFY).
+inotify_folder_events = 0x00000100 | 0x00000080
+inotify_file_events   = 0x00000002
+
+def load_libc():
+	"""
+	This method will load the C library, which gives access to inotify.
+
+	Returns
+	-------
+	libc : ctypes.CDLL or None
+		This is the C library. None if it could not be loaded.
+	"""
+	try:
+		return ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+	except OSError:
+		return None
+
+def get_inotify_watcher(libc, dirpath):
+	"""
+	This method will set up inotify to watch the folder that the Gaussian output file is in, if inotify is available.
+
+	The folder is only watched for new files, so that this program knows when Gaussian has made the output file. 
+	The output file itself is watched once it exists (see add_inotify_file_watch), as watching the folder for changes would also pick up every write to Gaussian's scratch files.
+
+	Parameters
+	----------
+	libc : ctypes.CDLL or None
+		This is the C library.
+	dirpath : str.
+		This is the folder that the Gaussian output file is in.
+
+	Returns
+	-------
+	inotify_fd : int or None
+		This is the file descriptor that inotify events can be read from. None if inotify is not available.
+	"""
+	try:
+		inotify_fd = libc.inotify_init1(os.O_NONBLOCK)
+		if inotify_fd < 0:
+			return None
+		if libc.inotify_add_watch(inotify_fd, os.fsencode(dirpath), inotify_folder_events) < 0:
+			os.close(inotify_fd)
+			return None
+	except AttributeError:
+		return None
+	return inotify_fd
+
+def add_inotify_file_watch(libc, inotify_fd, path_to_gaussian_log_filename):
+	"""
+	This method will add a watch on the Gaussian output file, so that inotify reports whenever Gaussian writes to it.
+
+	Parameters
+	----------
+	libc : ctypes.CDLL
+		This is the C library.
+	inotify_fd : int
+		This is the inotify file descriptor.
+	path_to_gaussian_log_filename : str.
+		This is the path to the Gaussian output file.
+
+	Returns
+	-------
+	True if the output file is now being watched, False if not.
+	"""
+	return libc.inotify_add_watch(inotify_fd, os.fsencode(path_to_gaussian_log_filename), inotify_file_events) >= 0
+
+def wait_for_log_file_change(inotify_fd, timeout):
+	"""
+	This method will wait until the Gaussian output file may have changed, or until timeout seconds have passed.
+
+	Parameters
+	----------
+	inotify_fd : int or None
+		This is the inotify file descriptor. If None, just wait for timeout seconds.
+	timeout : float
+		This is the longest time to wait (in seconds).
+	"""
+	if inotify_fd is None:
+		sleep(timeout)
+		return
+	readable, _, _ = select.select([inotify_fd], [], [], timeout)
+	if readable:
+		# Remove the events that have been recorded, as we only need to know that something changed.
+		try:
+			while os.read(inotify_fd, 65536):
+				pass
+		except BlockingIOError:
+			pass
 
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - 
 
@@ -86,33 +243,52 @@ def gaussian_has_completed_FRAG2STATE1_to_FRAG1STATE1_EET_calc(path_to_gaussian_
 dirpath = os.getcwd()
 gaussian_log_filename = str(sys.argv[1])
 job_id = str(sys.argv[2])
-no_of_cpus = int(sys.argv[3])
+no_of_cpus = int(sys.argv[3]) if (len(sys.argv) > 3) else int(os.environ.get('SLURM_CPUS_PER_TASK', 1))
 
 # Second, set other variables for this script.
-check_log_file_interval_seconds = 1 * 60 # 20 minutes
+#         * The time between checks of the log file starts at the minimum interval, and doubles each time Gaussian has not written anything new, up to the maximum interval.
+#         * If inotify is available, this program will also wake up as soon as Gaussian writes to the log file.
+minimum_check_log_file_interval_seconds = 1
+maximum_check_log_file_interval_seconds = 1 * 60 # 1 minute
+check_log_file_interval_seconds = minimum_check_log_file_interval_seconds
 
 start_time = time()
 
-# Third, 
+# Third, follow the log file until Gaussian has performed the Frag 2 State 1 <=> Frag 1 State 1 EET calculation.
+path_to_gaussian_log_filename = dirpath+'/'+gaussian_log_filename
+eet_log_follower = EET_Log_Follower(path_to_gaussian_log_filename)
+libc = load_libc()
+inotify_fd = None if (libc is None) else get_inotify_watcher(libc, dirpath)
+is_watching_log_file = False
 while True:
 
-	command = gaussian_has_completed_FRAG2STATE1_to_FRAG1STATE1_EET_calc(dirpath+'/'+gaussian_log_filename)
+	# 3.1: If the log file has been made, tell inotify to watch it.
+	if (inotify_fd is not None) and (not is_watching_log_file) and os.path.exists(path_to_gaussian_log_filename):
+		is_watching_log_file = add_inotify_file_watch(libc, inotify_fd, path_to_gaussian_log_filename)
+
+	# 3.2: Read any new lines that Gaussian has written to the log file.
+	has_changed = eet_log_follower.update()
+	command = eet_log_follower.get_status()
 		
 	if command == 'Done':
 		break
 
-	elif command == 'Check later':
-		sleep(60)
+	elif command in ['Check later', 'Not Begun EET Calc']:
 
-	elif command == 'Not Begun EET Calc':
-
-		# 3.1: 
-		sleep(check_log_file_interval_seconds)
+		# 3.3: Wait for Gaussian to write more to the log file. 
+		if has_changed:
+			check_log_file_interval_seconds = minimum_check_log_file_interval_seconds
+		else:
+			check_log_file_interval_seconds = min(2 * check_log_file_interval_seconds, maximum_check_log_file_interval_seconds)
+		wait_for_log_file_change(inotify_fd, check_log_file_interval_seconds)
 
 	else:
 
 		raise Exception('huh?')
 
+if inotify_fd is not None:
+	os.close(inotify_fd)
+
 start_end = time()
 
 elapsed_time = start_end - start_time
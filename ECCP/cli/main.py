@@ -20,7 +20,8 @@ commands = [
     ('process_Eigendata', 'ECCP.ECCP_Programs.ECCP_processing_Eigendata_data'),
     ('process_RE',        'ECCP.ECCP_Programs.ECCP_processing_RE_data'),
     ('tidy',              'ECCP.ECCP_Programs.ECCP_tidy_data'),
-    ('remove',            'ECCP.ECCP_Programs.ECCP_remove_data')
+    ('remove',            'ECCP.ECCP_Programs.ECCP_remove_data'),
+    ('benchmark',         'ECCP.ECCP_Programs.ECCP_benchmark')
 ]
 
 def main(prog='ECCP', description='ECCP command line tool.',version=__version__, commands=commands, hook=None, args=None):
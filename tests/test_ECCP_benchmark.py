@@ -0,0 +1,35 @@
+'''
+Geoffrey Weal, test_ECCP_benchmark.py, 17/10/26
+
+These tests run "ECCP benchmark" on the smallest synthetic crystal, to check that the benchmark runs from start to finish and records the results of each stage.
+'''
+import json
+import argparse
+import pytest
+
+pytest.importorskip('SUMELF')
+
+from ECCP.ECCP_Programs.ECCP_benchmark import CLICommand
+
+def parse_arguments(arguments):
+    parser = argparse.ArgumentParser()
+    CLICommand.add_arguments(parser)
+    return parser.parse_args(arguments)
+
+def test_repeats_must_be_given_a_number():
+    assert parse_arguments(['--repeats', '2']).repeats == 2
+    with pytest.raises(SystemExit):
+        parse_arguments(['--repeats'])
+
+def test_benchmark_of_smallest_crystal(tmp_path):
+    path_to_results_file = str(tmp_path/'ECCP_benchmark_results.json')
+    for _ in range(2):
+        CLICommand.run(parse_arguments(['--molecules', '2', '--atoms', '14', '--symmetry', 'translation', '--results', path_to_results_file]))
+
+    with open(path_to_results_file, 'r') as results_file:
+        benchmark_results = json.load(results_file)
+    assert len(benchmark_results['runs']) == 2
+    crystal_result, = benchmark_results['runs'][-1]['crystals']
+    assert (crystal_result['no_of_molecules_per_cell'], crystal_result['no_of_atoms_per_molecule'], crystal_result['symmetry']) == (2, 14, 'translation')
+    assert [stage['stage'] for stage in crystal_result['stages']] == ['get_neighbouring_molecules', 'write_all_molecules', 'get_unique_molecules', 'get_dimers', 'write_all_dimers', 'get_unique_dimers', 'write_unique_dimers']
+    assert (tmp_path/'ECCP_benchmark_results.csv').exists()
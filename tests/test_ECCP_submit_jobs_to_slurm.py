@@ -0,0 +1,37 @@
+'''
+Geoffrey Weal, test_ECCP_submit_jobs_to_slurm.py, 17/10/26
+
+These tests check that solvent jobs are not submitted to slurm when the user does not want to run solvents, whether or not the jobs are part of a slurm array.
+'''
+import pytest
+
+pytest.importorskip('SUMELF')
+
+from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm             import get_jobs_to_submit
+from ECCP.ECCP_Programs.shared_general_methods.ECCP_Job_Index import ECCP_Job_Index
+
+def make_job_folder(job_folder):
+    job_folder.mkdir(parents=True)
+    (job_folder/'input.gjf').write_text('')
+    (job_folder/'submit.sl').write_text('')
+
+def make_jobs(path, use_array):
+    for molecule_name in ('molecule_1', 'molecule_2S'):
+        make_job_folder(path/'ATC_Gaussian'/molecule_name/'gaussian'/'job')
+    if use_array:
+        (path/'ATC_Gaussian'/'array_submit_1.sl').write_text('')
+        (path/'ATC_Gaussian'/'array_index_1.txt').write_text('molecule_1/gaussian/job\nmolecule_2S/gaussian/job\n')
+
+@pytest.mark.parametrize('run_solvents, expected_jobs', [(True, ['ATC_Gaussian_molecule_1_gaussian_job', 'ATC_Gaussian_molecule_2S_gaussian_job']), (False, ['ATC_Gaussian_molecule_1_gaussian_job'])])
+def test_solvent_jobs_are_only_submitted_if_asked_for(tmp_path, run_solvents, expected_jobs):
+    make_jobs(tmp_path, use_array=False)
+    with ECCP_Job_Index(str(tmp_path)) as job_index:
+        jobs_to_submit = list(get_jobs_to_submit(str(tmp_path), job_index, False, run_solvents))
+    assert [name for dirpath, submission_filename, name, sbatch_arguments, number_of_tasks, dependent_submission_filenames in jobs_to_submit] == expected_jobs
+
+@pytest.mark.parametrize('run_solvents, expected_array', [(True, ['--array=1-2']), (False, ['--array=1'])])
+def test_solvent_array_tasks_are_only_submitted_if_asked_for(tmp_path, run_solvents, expected_array):
+    make_jobs(tmp_path, use_array=True)
+    with ECCP_Job_Index(str(tmp_path)) as job_index:
+        jobs_to_submit = list(get_jobs_to_submit(str(tmp_path), job_index, False, run_solvents))
+    assert [(submission_filename, sbatch_arguments) for dirpath, submission_filename, name, sbatch_arguments, number_of_tasks, dependent_submission_filenames in jobs_to_submit] == [('array_submit_1.sl', expected_array)]
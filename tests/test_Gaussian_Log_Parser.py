@@ -0,0 +1,60 @@
+'''
+Geoffrey Weal, test_Gaussian_Log_Parser.py, 17/10/26
+
+These tests check that the Gaussian log parser only keeps a limited number of parsers in memory, that it does not write any files next to the log files, and that it checks for normal termination in the same way as the reverse_readline check it replaced.
+'''
+import os
+import pytest
+
+pytest.importorskip('SUMELF')
+
+from ECCP.ECCP_Programs.shared_general_methods                        import Gaussian_Log_Parser
+from ECCP.ECCP_Programs.shared_general_methods.Gaussian_Log_Parser    import parse_gaussian_log, forget_parser
+from ECCP.ECCP_Programs.shared_general_methods.shared_general_methods import reverse_readline
+
+def write_log_file(path_to_log_file, text=' #p b3lyp/6-31g(d)\n SCF Done:  E(RB3LYP) =  -100.0\n Normal termination of Gaussian 16\n'):
+    with open(path_to_log_file, 'w') as logFILE:
+        logFILE.write(text)
+
+def did_gaussian_job_complete_with_reverse_readline(log_filepath):
+    did_gaussian_job_terminate_normally = False
+    counter = 0
+    for line in reverse_readline(log_filepath):
+        if 'Normal termination of Gaussian' in line:
+            did_gaussian_job_terminate_normally = True
+        if counter >= 20 and not did_gaussian_job_terminate_normally:
+            break
+        if did_gaussian_job_terminate_normally:
+            break
+        counter += 1
+    return did_gaussian_job_terminate_normally
+
+def test_parsers_in_memory_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(Gaussian_Log_Parser, 'parsers_in_memory', Gaussian_Log_Parser.OrderedDict())
+    monkeypatch.setattr(Gaussian_Log_Parser, 'max_number_of_parsers_in_memory', 2)
+    for index in range(3):
+        write_log_file(str(tmp_path/('output_'+str(index)+'.log')))
+        assert parse_gaussian_log(str(tmp_path/('output_'+str(index)+'.log'))).did_terminate_normally()
+    assert list(Gaussian_Log_Parser.parsers_in_memory.keys()) == [str(tmp_path/'output_1.log'), str(tmp_path/'output_2.log')]
+
+def test_no_files_are_written_next_to_the_log_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(Gaussian_Log_Parser, 'parsers_in_memory', Gaussian_Log_Parser.OrderedDict())
+    write_log_file(str(tmp_path/'output.log'))
+    parse_gaussian_log(str(tmp_path/'output.log'))
+    assert os.listdir(tmp_path) == ['output.log']
+    forget_parser(str(tmp_path/'output.log'))
+    assert Gaussian_Log_Parser.parsers_in_memory == {}
+
+@pytest.mark.parametrize('no_of_lines_after_termination', [19, 20, 21])
+@pytest.mark.parametrize('blank_lines', [False, True])
+@pytest.mark.parametrize('unfinished_last_line', ['', ' Job cpu time', ' Normal termination of Gaussian 16'])
+def test_termination_window_matches_reverse_readline(tmp_path, monkeypatch, no_of_lines_after_termination, blank_lines, unfinished_last_line):
+    monkeypatch.setattr(Gaussian_Log_Parser, 'parsers_in_memory', Gaussian_Log_Parser.OrderedDict())
+    lines = [' #p b3lyp/6-31g(d)', ' Normal termination of Gaussian 16']
+    for index in range(no_of_lines_after_termination):
+        lines.append(' Line '+str(index))
+        if blank_lines:
+            lines.append('')
+    write_log_file(str(tmp_path/'output.log'), '\n'.join(lines)+'\n'+unfinished_last_line)
+    did_terminate_normally = parse_gaussian_log(str(tmp_path/'output.log')).did_terminate_normally()
+    assert did_terminate_normally == did_gaussian_job_complete_with_reverse_readline(str(tmp_path/'output.log'))
@@ -0,0 +1,119 @@
+'''
+Geoffrey Weal, test_Slurm_Submission_Engine.py, 17/10/26
+
+These tests check that the slurm submission engine keeps to the queue limits (counting each array task as a job), retries submissions that fail, gives up on jobs that can not be submitted, and chains the reorganisation energy jobs together, using the fake slurm backend.
+'''
+import pytest
+
+pytest.importorskip('SUMELF')
+
+from ECCP.ECCP.write_molecules_to_disk_methods.shared_methods                                   import submit_downstream_jobs, downstream_jobs_already_submitted_argument
+from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm_methods.Fake_Slurm_Backend                    import Fake_Slurm_Backend
+from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm_methods.Slurm_Submission_Engine               import Slurm_Submission_Engine
+from ECCP.ECCP_Programs.ECCP_submit_jobs_to_slurm_methods.get_RE_dependent_submission_filenames import get_RE_dependent_submission_filenames
+
+def make_engine(backend, Max_jobs_in_queue_at_any_one_time=100, Max_jobs_pending_in_queue_from_ECCP_mass_submit=100, Max_jobs_running_in_queue_from_ECCP_mass_submit=100, number_of_consecutive_error_before_exitting=3):
+    waits = []
+    def sleep(time_to_wait):
+        waits.append(time_to_wait)
+        if len(waits) > 1000:
+            raise AssertionError('The submission engine is waiting forever.')
+    submission_engine = Slurm_Submission_Engine(backend, Max_jobs_in_queue_at_any_one_time, Max_jobs_pending_in_queue_from_ECCP_mass_submit, Max_jobs_running_in_queue_from_ECCP_mass_submit, 20.0, number_of_consecutive_error_before_exitting, 10.0, sleep=sleep)
+    return submission_engine, waits
+
+def make_jobs(number_of_jobs):
+    return [('job_'+str(index), 'submit.sl', 'job_'+str(index), [], 1, []) for index in range(number_of_jobs)]
+
+def test_queue_limits_are_not_exceeded():
+    backend = Fake_Slurm_Backend(number_of_intervals_pending=2, number_of_intervals_running=3, number_of_other_jobs_in_queue=1)
+    submission_engine, waits = make_engine(backend, Max_jobs_in_queue_at_any_one_time=4, Max_jobs_pending_in_queue_from_ECCP_mass_submit=2)
+    number_of_jobs_in_queue = []
+    submit = backend.submit
+    def record_submit(*args, **kwargs):
+        job_number = submit(*args, **kwargs)
+        number_of_jobs_in_queue.append(len(backend.queue) + backend.number_of_other_jobs_in_queue)
+        return job_number
+    backend.submit = record_submit
+
+    errors_list = submission_engine.submit_jobs(make_jobs(10))
+
+    assert errors_list == []
+    assert len(backend.submitted_jobs) == 10
+    assert max(number_of_jobs_in_queue) <= 4
+    assert set(waits) == {20.0}
+    assert backend.number_of_squeue_calls == len(waits) + 1
+
+def test_failed_submissions_are_retried():
+    backend = Fake_Slurm_Backend(failed_submission_numbers=[1, 2])
+    submission_engine, waits = make_engine(backend, number_of_consecutive_error_before_exitting=3)
+    recorded = []
+
+    errors_list = submission_engine.submit_jobs(make_jobs(2), record_submission=lambda dirpath, submission_filename, job_number: recorded.append((dirpath, job_number)))
+
+    assert errors_list == []
+    assert backend.number_of_sbatch_calls == 4
+    assert waits == [10.0, 10.0]
+    assert recorded == [('job_0', 1), ('job_1', 2)]
+
+def test_job_is_given_up_on_after_too_many_consecutive_errors():
+    backend = Fake_Slurm_Backend(failed_submission_numbers=[1, 2, 3])
+    submission_engine, waits = make_engine(backend, number_of_consecutive_error_before_exitting=3)
+
+    errors_list = submission_engine.submit_jobs(make_jobs(2))
+
+    assert errors_list == ['job_0']
+    assert backend.number_of_sbatch_calls == 4
+    assert [submitted_job[0] for submitted_job in backend.submitted_jobs] == ['job_1']
+
+def test_array_larger_than_the_queue_is_not_waited_on_forever():
+    backend = Fake_Slurm_Backend(number_of_other_jobs_in_queue=1)
+    submission_engine, waits = make_engine(backend, Max_jobs_in_queue_at_any_one_time=5)
+    jobs_to_submit = [('array_job', 'array_submit_1.sl', 'array_job', ['--array=1-10'], 10, [])] + make_jobs(1)
+
+    errors_list = submission_engine.submit_jobs(jobs_to_submit)
+
+    assert errors_list == ['array_job']
+    assert [submitted_job[0] for submitted_job in backend.submitted_jobs] == ['job_0']
+
+def test_array_tasks_count_towards_the_pending_limit():
+    backend = Fake_Slurm_Backend(number_of_intervals_pending=2, number_of_intervals_running=1)
+    submission_engine, waits = make_engine(backend, Max_jobs_pending_in_queue_from_ECCP_mass_submit=3)
+    number_of_pending_tasks = []
+    submit = backend.submit
+    def record_submit(*args, **kwargs):
+        job_number = submit(*args, **kwargs)
+        number_of_pending_tasks.append(sum([len(backend.array_task_ids.get(job_number, [1])) for job_number, number_of_intervals in backend.queue.items() if (number_of_intervals < backend.number_of_intervals_pending)]))
+        return job_number
+    backend.submit = record_submit
+    jobs_to_submit = [('array_job_'+str(index), 'array_submit_1.sl', 'array_job_'+str(index), ['--array=1-2'], 2, []) for index in range(4)]
+
+    errors_list = submission_engine.submit_jobs(jobs_to_submit)
+
+    assert errors_list == []
+    assert len(backend.submitted_jobs) == 4
+    assert max(number_of_pending_tasks) <= 3
+
+def test_frequency_and_single_point_jobs_start_after_the_main_optimisation(tmp_path):
+    filenames = ['eGS_gGS_main_opt.gjf', 'eGS_gGS_main_opt_submit.sl', 'eGS_gGS_freq.gjf', 'eGS_gGS_freq_submit.sl', 'eES_gGS.gjf', 'eES_gGS_submit.sl']
+    for filename in filenames:
+        (tmp_path/filename).write_text('')
+    with open(tmp_path/'eGS_gGS_main_opt_submit.sl', 'w') as submitSL:
+        submit_downstream_jobs(submitSL, ['eGS_gGS_freq_submit.sl', 'eES_gGS_submit.sl'])
+    dependent_submission_filenames = get_RE_dependent_submission_filenames(str(tmp_path), filenames, 'eGS_gGS_main_opt_submit.sl')
+    assert dependent_submission_filenames == ['eGS_gGS_freq_submit.sl', 'eES_gGS_submit.sl']
+
+    backend = Fake_Slurm_Backend(number_of_intervals_pending=1, number_of_intervals_running=2)
+    submission_engine, waits = make_engine(backend)
+    errors_list = submission_engine.submit_jobs([(str(tmp_path), 'eGS_gGS_main_opt_submit.sl', 'RE_job', [], 1, dependent_submission_filenames)])
+    for _ in range(10):
+        backend.get_queue_snapshot()
+
+    assert errors_list == []
+    main_opt_job, freq_job, single_point_job = backend.submitted_jobs
+    assert (main_opt_job[1], main_opt_job[3]) == ('eGS_gGS_main_opt_submit.sl', [downstream_jobs_already_submitted_argument])
+    for dependent_job, submission_filename in ((freq_job, 'eGS_gGS_freq_submit.sl'), (single_point_job, 'eES_gGS_submit.sl')):
+        assert dependent_job[1] == submission_filename
+        assert ('--dependency=afterok:'+str(main_opt_job[4])) in dependent_job[2]
+        assert dependent_job[3] == []
+    assert backend.start_order[0] == main_opt_job[4]
+    assert sorted(backend.start_order[1:]) == [freq_job[4], single_point_job[4]]
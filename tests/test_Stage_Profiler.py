@@ -0,0 +1,38 @@
+'''
+Geoffrey Weal, test_Stage_Profiler.py, 17/10/26
+
+These tests check that the stage profiler gives the peak memory of each stage rather than the peak memory of the whole process, and only gives the peak memory of the whole process where the peak memory can not be reset.
+'''
+import os
+import numpy as np
+import pytest
+
+pytest.importorskip('SUMELF')
+
+from ECCP.ECCP.stage_profiler_methods import Stage_Profiler as Stage_Profiler_module
+from ECCP.ECCP.stage_profiler_methods.Stage_Profiler import Stage_Profiler
+
+def run_stages(stage_profiler):
+    stage_profiler.start_stage('whole_run')
+    stage_profiler.start_stage('large_stage')
+    large_array = np.ones(200 * 1024 * 1024 // 8)
+    del large_array
+    stage_profiler.end_stage('large_stage')
+    stage_profiler.start_stage('small_stage')
+    stage_profiler.end_stage('small_stage')
+    stage_profiler.end_stage('whole_run')
+    return {stage['stage']: stage for stage in stage_profiler.profile['stages']}
+
+@pytest.mark.skipif(not os.access(Stage_Profiler_module.path_to_clear_refs, os.W_OK), reason='The peak memory can only be reset on Linux.')
+def test_peak_memory_is_obtained_for_each_stage():
+    stages = run_stages(Stage_Profiler(None, 'crystal', 1))
+    assert stages['large_stage']['peak_rss_MB'] > stages['small_stage']['peak_rss_MB'] + 150.0
+    assert stages['whole_run']['peak_rss_MB'] >= stages['large_stage']['peak_rss_MB']
+    assert stages['small_stage']['process_peak_rss_so_far_MB'] >= stages['large_stage']['peak_rss_MB']
+
+def test_only_process_peak_memory_is_given_if_it_can_not_be_reset(tmp_path, monkeypatch):
+    monkeypatch.setattr(Stage_Profiler_module, 'path_to_clear_refs', str(tmp_path/'missing'/'clear_refs'))
+    stages = run_stages(Stage_Profiler(None, 'crystal', 1))
+    for stage in stages.values():
+        assert stage['peak_rss_MB'] is None
+        assert stage['process_peak_rss_so_far_MB'] is not None
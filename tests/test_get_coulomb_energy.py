@@ -0,0 +1,41 @@
+'''
+Geoffrey Weal, test_get_coulomb_energy.py, 17/10/26
+
+These tests check that the vectorised coulomb energies give the same energies as summing q1*q2/r over every pair of atoms one at a time.
+'''
+import numpy as np
+import pytest
+
+pytest.importorskip('SUMELF')
+
+from ECCP.ECCP_Programs.processing_coupling_methods.ATC_methods.get_neighbours_methods.get_coulomb_energy import get_coulomb_energy, get_coulomb_energies, coulomb_constant
+
+def get_coulomb_energy_one_pair_at_a_time(positions_1, positions_2, charges_1, charges_2, displacement_vector, relative_permittivity=1.0):
+    total_coulomb_value = 0.0
+    for charge_1, position_1 in zip(charges_1, positions_1):
+        for charge_2, position_2 in zip(charges_2, positions_2 + displacement_vector):
+            total_coulomb_value += (charge_1*charge_2)/np.linalg.norm(position_2 - position_1)
+    return (coulomb_constant/relative_permittivity) * total_coulomb_value
+
+def get_small_system():
+    random_generator = np.random.default_rng(0)
+    positions_1 = random_generator.uniform(0.0, 3.0, (4,3))
+    positions_2 = random_generator.uniform(0.0, 3.0, (3,3))
+    charges_1   = random_generator.uniform(-0.5, 0.5, 4)
+    charges_2   = random_generator.uniform(-0.5, 0.5, 3)
+    displacement_vectors = np.array([[5.0, 0.0, 0.0], [0.0, 6.0, 0.0], [4.0, 4.0, -5.0], [-7.0, 1.0, 2.0], [0.0, 0.0, 8.0]])
+    return positions_1, positions_2, charges_1, charges_2, displacement_vectors
+
+@pytest.mark.parametrize('max_number_of_pairwise_distances', [1, 12, 25, 2**22])
+def test_get_coulomb_energies_matches_pair_loop(max_number_of_pairwise_distances):
+    positions_1, positions_2, charges_1, charges_2, displacement_vectors = get_small_system()
+    energies = get_coulomb_energies(positions_1, positions_2, charges_1, charges_2, displacement_vectors, relative_permittivity=2.5, max_number_of_pairwise_distances=max_number_of_pairwise_distances)
+    expected_energies = [get_coulomb_energy_one_pair_at_a_time(positions_1, positions_2, charges_1, charges_2, displacement_vector, relative_permittivity=2.5) for displacement_vector in displacement_vectors]
+    assert energies.shape == (len(displacement_vectors),)
+    assert np.allclose(energies, expected_energies, rtol=1e-12, atol=0.0)
+
+def test_get_coulomb_energy_matches_pair_loop():
+    positions_1, positions_2, charges_1, charges_2, displacement_vectors = get_small_system()
+    for displacement_vector in displacement_vectors:
+        energy = get_coulomb_energy(positions_1, positions_2, charges_1, charges_2, displacement_vector)
+        assert energy == pytest.approx(get_coulomb_energy_one_pair_at_a_time(positions_1, positions_2, charges_1, charges_2, displacement_vector), rel=1e-12)
@@ -0,0 +1,49 @@
+'''
+Geoffrey Weal, test_get_unique_dimers.py, 17/10/26
+
+These tests check that the space group pre-grouping of dimers in get_unique_dimers is only used when asked for, so that the default output of get_unique_dimers is unchanged.
+'''
+import pytest
+
+pytest.importorskip('SUMELF')
+
+from ECCP.ECCP import get_unique_dimers as get_unique_dimers_module
+from ECCP.ECCP.get_unique_dimers import get_unique_dimers
+
+all_dimers_info = {1: (1, 2, (0, 0, 0)), 2: (1, 2, (1, 0, 0)), 3: (2, 1, (0, 1, 0))}
+
+def record_dimers_compared(recorded):
+    def remove_equivalent_dimers_invariance_method(invariance_method_type, dimers, molecules, molecule_graphs, **kwargs):
+        recorded['dimers']                 = sorted(dimers.keys())
+        recorded['max_distance_disparity'] = kwargs.get('max_distance_disparity')
+        return [(1, 2)]
+    return remove_equivalent_dimers_invariance_method
+
+def test_spacegroup_symmetry_is_off_by_default(monkeypatch):
+    recorded = {}
+    def get_spacegroup_equivalent_dimers(*args, **kwargs):
+        raise AssertionError('Space group symmetry should not be used by default.')
+    monkeypatch.setattr(get_unique_dimers_module, 'get_spacegroup_equivalent_dimers', get_spacegroup_equivalent_dimers)
+    monkeypatch.setattr(get_unique_dimers_module, 'remove_equivalent_dimers_invariance_method', record_dimers_compared(recorded))
+
+    unique_dimers, dimer_groups, dimer_pairs = get_unique_dimers(all_dimers_info, {}, {}, dimer_equivalence_method={'method': 'invariance_method', 'type': 'combination'}, crystal=object())
+
+    assert recorded['dimers'] == [1, 2, 3]
+    assert unique_dimers == [1, 3]
+    assert dimer_groups == {1: (2,), 3: ()}
+    assert dimer_pairs == [(1, 2)]
+
+def test_spacegroup_symmetry_uses_the_tolerance_of_the_equivalence_method(monkeypatch):
+    recorded = {}
+    def get_spacegroup_equivalent_dimers(all_dimers_info, molecules, crystal, symprec):
+        recorded['symprec'] = symprec
+        return {1: [1, 3], 2: [2]}
+    monkeypatch.setattr(get_unique_dimers_module, 'get_spacegroup_equivalent_dimers', get_spacegroup_equivalent_dimers)
+    monkeypatch.setattr(get_unique_dimers_module, 'remove_equivalent_dimers_invariance_method', record_dimers_compared(recorded))
+
+    unique_dimers, dimer_groups, dimer_pairs = get_unique_dimers(all_dimers_info, {}, {}, dimer_equivalence_method={'method': 'invariance_method', 'type': 'combination', 'use_spacegroup_symmetry': True, 'max_distance_disparity': 0.005}, crystal=object())
+
+    assert recorded['symprec'] == 0.005
+    assert recorded['dimers'] == [1, 2]
+    assert unique_dimers == [1]
+    assert dimer_groups == {1: (2, 3)}
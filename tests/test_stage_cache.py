@@ -0,0 +1,33 @@
+'''
+Geoffrey Weal, test_stage_cache.py, 17/10/26
+
+These tests check that the stage cache is not used after ECCP or SUMELF are upgraded, and that only unreadable cache files are treated as cache misses.
+'''
+import pytest
+
+pytest.importorskip('SUMELF')
+
+from ECCP.ECCP.stage_cache_methods import stage_cache
+from ECCP.ECCP.stage_cache_methods.stage_cache import get_stage_key, load_stage_from_cache, save_stage_to_cache
+
+def test_stage_key_changes_when_software_is_upgraded(monkeypatch):
+    stage_key = get_stage_key('dimers', 'previous_stage_key', {'max_dimer_distance': 8.0})
+    monkeypatch.setattr(stage_cache, 'get_software_versions', lambda: {'ECCP': 'upgraded', 'SUMELF': 'upgraded'})
+    assert get_stage_key('dimers', 'previous_stage_key', {'max_dimer_distance': 8.0}) != stage_key
+
+def test_stage_is_loaded_with_the_same_key(tmp_path):
+    save_stage_to_cache(str(tmp_path), 'dimers', 'key', {1: 'dimer'})
+    assert load_stage_from_cache(str(tmp_path), 'dimers', 'key') == (True, {1: 'dimer'})
+    assert load_stage_from_cache(str(tmp_path), 'dimers', 'other_key') == (False, None)
+
+def test_unreadable_stage_file_is_a_cache_miss(tmp_path):
+    (tmp_path/'dimers.pickle').write_bytes(b'not a pickle file')
+    assert load_stage_from_cache(str(tmp_path), 'dimers', 'key') == (False, None)
+
+def test_other_errors_are_not_hidden(tmp_path, monkeypatch):
+    save_stage_to_cache(str(tmp_path), 'dimers', 'key', {1: 'dimer'})
+    def load(stage_file):
+        raise RuntimeError('programming error')
+    monkeypatch.setattr(stage_cache.pickle, 'load', load)
+    with pytest.raises(RuntimeError):
+        load_stage_from_cache(str(tmp_path), 'dimers', 'key')
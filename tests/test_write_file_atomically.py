@@ -0,0 +1,29 @@
+'''
+Geoffrey Weal, test_write_file_atomically.py, 17/10/26
+
+These tests check that write_file_atomically only replaces a file once it has been completely written.
+'''
+import os
+import pytest
+
+pytest.importorskip('SUMELF')
+
+from ECCP.ECCP.utilities.write_file_atomically import write_file_atomically
+
+def test_file_is_written(tmp_path):
+    with write_file_atomically(str(tmp_path/'results.json')) as results_file:
+        results_file.write('{}')
+    with write_file_atomically(str(tmp_path/'results.npy'), mode='wb') as results_file:
+        results_file.write(b'data')
+    assert (tmp_path/'results.json').read_text() == '{}'
+    assert (tmp_path/'results.npy').read_bytes() == b'data'
+    assert sorted(os.listdir(tmp_path)) == ['results.json', 'results.npy']
+
+def test_file_is_left_as_it_was_if_writing_fails(tmp_path):
+    (tmp_path/'results.json').write_text('old results')
+    with pytest.raises(RuntimeError):
+        with write_file_atomically(str(tmp_path/'results.json')) as results_file:
+            results_file.write('half written results')
+            raise RuntimeError('stopped while writing')
+    assert (tmp_path/'results.json').read_text() == 'old results'
+    assert os.listdir(tmp_path) == ['results.json']